@@ -142,25 +142,14 @@ for transaction in transactions_connection.entities:
             )
 print("")
 
-# Fetch transactions using pagination
-page_size = 10
-iterations = 0
-has_next = True
-after = None
-while has_next and iterations < 30:
-    iterations += 1
-    transactions_connection = account.get_transactions(
-        first=page_size, bitcoin_network=lightspark.BitcoinNetwork.REGTEST, after=after
-    )
-    num = len(transactions_connection.entities)
-    print(f"We got {num} transactions for the page (iteration #{iterations})")
-    if transactions_connection.page_info.has_next_page:
-        has_next = True
-        after = transactions_connection.page_info.end_cursor
-        print("  And we have another page!")
-    else:
-        has_next = False
-        print("  And we're done!")
+# Fetch transactions using pagination. The next page is fetched in the background
+# while the current one is being processed.
+num = 0
+for transaction in account.iter_transactions(
+    bitcoin_network=lightspark.BitcoinNetwork.REGTEST, page_size=10, prefetch=2
+):
+    num += 1
+print(f"We got {num} transactions across all the pages")
 print("")
 
 
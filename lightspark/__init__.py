@@ -1,231 +1,609 @@
 # Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
 
-import lightspark.utils
-from lightspark.lightspark_client import *
-from lightspark.objects.Account import Account
-from lightspark.objects.AccountToApiTokensConnection import AccountToApiTokensConnection
-from lightspark.objects.AccountToChannelsConnection import AccountToChannelsConnection
-from lightspark.objects.AccountToNodesConnection import AccountToNodesConnection
-from lightspark.objects.AccountToPaymentRequestsConnection import (
-    AccountToPaymentRequestsConnection,
-)
-from lightspark.objects.AccountToTransactionsConnection import (
-    AccountToTransactionsConnection,
-)
-from lightspark.objects.AccountToWalletsConnection import AccountToWalletsConnection
-from lightspark.objects.AccountToWithdrawalRequestsConnection import (
-    AccountToWithdrawalRequestsConnection,
-)
-from lightspark.objects.ApiToken import ApiToken
-from lightspark.objects.AuditLogActor import AuditLogActor
-from lightspark.objects.Balances import Balances
-from lightspark.objects.BitcoinNetwork import BitcoinNetwork
-from lightspark.objects.BlockchainBalance import BlockchainBalance
-from lightspark.objects.CancelInvoiceInput import CancelInvoiceInput
-from lightspark.objects.CancelInvoiceOutput import CancelInvoiceOutput
-from lightspark.objects.Channel import Channel
-from lightspark.objects.ChannelClosingTransaction import ChannelClosingTransaction
-from lightspark.objects.ChannelFees import ChannelFees
-from lightspark.objects.ChannelOpeningTransaction import ChannelOpeningTransaction
-from lightspark.objects.ChannelSnapshot import ChannelSnapshot
-from lightspark.objects.ChannelStatus import ChannelStatus
-from lightspark.objects.ChannelToTransactionsConnection import (
-    ChannelToTransactionsConnection,
-)
-from lightspark.objects.ClaimUmaInvitationInput import ClaimUmaInvitationInput
-from lightspark.objects.ClaimUmaInvitationOutput import ClaimUmaInvitationOutput
-from lightspark.objects.ClaimUmaInvitationWithIncentivesInput import (
-    ClaimUmaInvitationWithIncentivesInput,
-)
-from lightspark.objects.ClaimUmaInvitationWithIncentivesOutput import (
-    ClaimUmaInvitationWithIncentivesOutput,
-)
-from lightspark.objects.ComplianceProvider import ComplianceProvider
-from lightspark.objects.Connection import Connection
-from lightspark.objects.CreateApiTokenInput import CreateApiTokenInput
-from lightspark.objects.CreateApiTokenOutput import CreateApiTokenOutput
-from lightspark.objects.CreateInvitationWithIncentivesInput import (
-    CreateInvitationWithIncentivesInput,
-)
-from lightspark.objects.CreateInvitationWithIncentivesOutput import (
-    CreateInvitationWithIncentivesOutput,
-)
-from lightspark.objects.CreateInvoiceInput import CreateInvoiceInput
-from lightspark.objects.CreateInvoiceOutput import CreateInvoiceOutput
-from lightspark.objects.CreateLnurlInvoiceInput import CreateLnurlInvoiceInput
-from lightspark.objects.CreateNodeWalletAddressInput import CreateNodeWalletAddressInput
-from lightspark.objects.CreateNodeWalletAddressOutput import (
-    CreateNodeWalletAddressOutput,
-)
-from lightspark.objects.CreateTestModeInvoiceInput import CreateTestModeInvoiceInput
-from lightspark.objects.CreateTestModeInvoiceOutput import CreateTestModeInvoiceOutput
-from lightspark.objects.CreateTestModePaymentInput import CreateTestModePaymentInput
-from lightspark.objects.CreateTestModePaymentoutput import CreateTestModePaymentoutput
-from lightspark.objects.CreateUmaInvitationInput import CreateUmaInvitationInput
-from lightspark.objects.CreateUmaInvitationOutput import CreateUmaInvitationOutput
-from lightspark.objects.CreateUmaInvoiceInput import CreateUmaInvoiceInput
-from lightspark.objects.CurrencyAmount import CurrencyAmount
-from lightspark.objects.CurrencyUnit import CurrencyUnit
-from lightspark.objects.DailyLiquidityForecast import DailyLiquidityForecast
-from lightspark.objects.DeclineToSignMessagesInput import DeclineToSignMessagesInput
-from lightspark.objects.DeclineToSignMessagesOutput import DeclineToSignMessagesOutput
-from lightspark.objects.DeleteApiTokenInput import DeleteApiTokenInput
-from lightspark.objects.DeleteApiTokenOutput import DeleteApiTokenOutput
-from lightspark.objects.Deposit import Deposit
-from lightspark.objects.Entity import Entity
-from lightspark.objects.FeeEstimate import FeeEstimate
-from lightspark.objects.FundNodeInput import FundNodeInput
-from lightspark.objects.FundNodeOutput import FundNodeOutput
-from lightspark.objects.GraphNode import GraphNode
-from lightspark.objects.Hop import Hop
-from lightspark.objects.HtlcAttemptFailureCode import HtlcAttemptFailureCode
-from lightspark.objects.IdAndSignature import IdAndSignature
-from lightspark.objects.IncentivesIneligibilityReason import (
-    IncentivesIneligibilityReason,
-)
-from lightspark.objects.IncentivesStatus import IncentivesStatus
-from lightspark.objects.IncomingPayment import IncomingPayment
-from lightspark.objects.IncomingPaymentAttempt import IncomingPaymentAttempt
-from lightspark.objects.IncomingPaymentAttemptStatus import IncomingPaymentAttemptStatus
-from lightspark.objects.IncomingPaymentsForInvoiceQueryInput import (
-    IncomingPaymentsForInvoiceQueryInput,
-)
-from lightspark.objects.IncomingPaymentsForInvoiceQueryOutput import (
-    IncomingPaymentsForInvoiceQueryOutput,
-)
-from lightspark.objects.IncomingPaymentToAttemptsConnection import (
-    IncomingPaymentToAttemptsConnection,
-)
-from lightspark.objects.Invoice import Invoice
-from lightspark.objects.InvoiceData import InvoiceData
-from lightspark.objects.InvoiceType import InvoiceType
-from lightspark.objects.LightningFeeEstimateForInvoiceInput import (
-    LightningFeeEstimateForInvoiceInput,
-)
-from lightspark.objects.LightningFeeEstimateForNodeInput import (
-    LightningFeeEstimateForNodeInput,
-)
-from lightspark.objects.LightningFeeEstimateOutput import LightningFeeEstimateOutput
-from lightspark.objects.LightningPaymentDirection import LightningPaymentDirection
-from lightspark.objects.LightningTransaction import LightningTransaction
-from lightspark.objects.LightsparkNode import LightsparkNode
-from lightspark.objects.LightsparkNodeOwner import LightsparkNodeOwner
-from lightspark.objects.LightsparkNodeStatus import LightsparkNodeStatus
-from lightspark.objects.LightsparkNodeToChannelsConnection import (
-    LightsparkNodeToChannelsConnection,
-)
-from lightspark.objects.LightsparkNodeToDailyLiquidityForecastsConnection import (
-    LightsparkNodeToDailyLiquidityForecastsConnection,
-)
-from lightspark.objects.LightsparkNodeWithOSK import LightsparkNodeWithOSK
-from lightspark.objects.LightsparkNodeWithRemoteSigning import (
-    LightsparkNodeWithRemoteSigning,
-)
-from lightspark.objects.MultiSigAddressValidationParameters import (
-    MultiSigAddressValidationParameters,
-)
-from lightspark.objects.Node import Node
-from lightspark.objects.NodeAddress import NodeAddress
-from lightspark.objects.NodeAddressType import NodeAddressType
-from lightspark.objects.NodeToAddressesConnection import NodeToAddressesConnection
-from lightspark.objects.OnChainTransaction import OnChainTransaction
-from lightspark.objects.OutgoingPayment import OutgoingPayment
-from lightspark.objects.OutgoingPaymentAttempt import OutgoingPaymentAttempt
-from lightspark.objects.OutgoingPaymentAttemptStatus import OutgoingPaymentAttemptStatus
-from lightspark.objects.OutgoingPaymentAttemptToHopsConnection import (
-    OutgoingPaymentAttemptToHopsConnection,
-)
-from lightspark.objects.OutgoingPaymentsForInvoiceQueryInput import (
-    OutgoingPaymentsForInvoiceQueryInput,
-)
-from lightspark.objects.OutgoingPaymentsForInvoiceQueryOutput import (
-    OutgoingPaymentsForInvoiceQueryOutput,
-)
-from lightspark.objects.OutgoingPaymentToAttemptsConnection import (
-    OutgoingPaymentToAttemptsConnection,
-)
-from lightspark.objects.PageInfo import PageInfo
-from lightspark.objects.PayInvoiceInput import PayInvoiceInput
-from lightspark.objects.PayInvoiceOutput import PayInvoiceOutput
-from lightspark.objects.PaymentDirection import PaymentDirection
-from lightspark.objects.PaymentFailureReason import PaymentFailureReason
-from lightspark.objects.PaymentRequest import PaymentRequest
-from lightspark.objects.PaymentRequestData import PaymentRequestData
-from lightspark.objects.PaymentRequestStatus import PaymentRequestStatus
-from lightspark.objects.PayUmaInvoiceInput import PayUmaInvoiceInput
-from lightspark.objects.Permission import Permission
-from lightspark.objects.PostTransactionData import PostTransactionData
-from lightspark.objects.RegionCode import RegionCode
-from lightspark.objects.RegisterPaymentInput import RegisterPaymentInput
-from lightspark.objects.RegisterPaymentOutput import RegisterPaymentOutput
-from lightspark.objects.ReleaseChannelPerCommitmentSecretInput import (
-    ReleaseChannelPerCommitmentSecretInput,
-)
-from lightspark.objects.ReleaseChannelPerCommitmentSecretOutput import (
-    ReleaseChannelPerCommitmentSecretOutput,
-)
-from lightspark.objects.ReleasePaymentPreimageInput import ReleasePaymentPreimageInput
-from lightspark.objects.ReleasePaymentPreimageOutput import ReleasePaymentPreimageOutput
-from lightspark.objects.RemoteSigningSubEventType import RemoteSigningSubEventType
-from lightspark.objects.RequestWithdrawalInput import RequestWithdrawalInput
-from lightspark.objects.RequestWithdrawalOutput import RequestWithdrawalOutput
-from lightspark.objects.RichText import RichText
-from lightspark.objects.RiskRating import RiskRating
-from lightspark.objects.RoutingTransaction import RoutingTransaction
-from lightspark.objects.RoutingTransactionFailureReason import (
-    RoutingTransactionFailureReason,
-)
-from lightspark.objects.ScreenNodeInput import ScreenNodeInput
-from lightspark.objects.ScreenNodeOutput import ScreenNodeOutput
-from lightspark.objects.Secret import Secret
-from lightspark.objects.SendPaymentInput import SendPaymentInput
-from lightspark.objects.SendPaymentOutput import SendPaymentOutput
-from lightspark.objects.SetInvoicePaymentHashInput import SetInvoicePaymentHashInput
-from lightspark.objects.SetInvoicePaymentHashOutput import SetInvoicePaymentHashOutput
-from lightspark.objects.Signable import Signable
-from lightspark.objects.SignablePayload import SignablePayload
-from lightspark.objects.SignablePayloadStatus import SignablePayloadStatus
-from lightspark.objects.SignInvoiceInput import SignInvoiceInput
-from lightspark.objects.SignInvoiceOutput import SignInvoiceOutput
-from lightspark.objects.SignMessagesInput import SignMessagesInput
-from lightspark.objects.SignMessagesOutput import SignMessagesOutput
-from lightspark.objects.Transaction import Transaction
-from lightspark.objects.TransactionFailures import TransactionFailures
-from lightspark.objects.TransactionStatus import TransactionStatus
-from lightspark.objects.TransactionType import TransactionType
-from lightspark.objects.UmaInvitation import UmaInvitation
-from lightspark.objects.UpdateChannelPerCommitmentPointInput import (
-    UpdateChannelPerCommitmentPointInput,
-)
-from lightspark.objects.UpdateChannelPerCommitmentPointOutput import (
-    UpdateChannelPerCommitmentPointOutput,
-)
-from lightspark.objects.UpdateNodeSharedSecretInput import UpdateNodeSharedSecretInput
-from lightspark.objects.UpdateNodeSharedSecretOutput import UpdateNodeSharedSecretOutput
-from lightspark.objects.Wallet import Wallet
-from lightspark.objects.WalletStatus import WalletStatus
-from lightspark.objects.WalletToPaymentRequestsConnection import (
-    WalletToPaymentRequestsConnection,
-)
-from lightspark.objects.WalletToTransactionsConnection import (
-    WalletToTransactionsConnection,
-)
-from lightspark.objects.WalletToWithdrawalRequestsConnection import (
-    WalletToWithdrawalRequestsConnection,
-)
-from lightspark.objects.WebhookEventType import WebhookEventType
-from lightspark.objects.Withdrawal import Withdrawal
-from lightspark.objects.WithdrawalFeeEstimateInput import WithdrawalFeeEstimateInput
-from lightspark.objects.WithdrawalFeeEstimateOutput import WithdrawalFeeEstimateOutput
-from lightspark.objects.WithdrawalMode import WithdrawalMode
-from lightspark.objects.WithdrawalRequest import WithdrawalRequest
-from lightspark.objects.WithdrawalRequestStatus import WithdrawalRequestStatus
-from lightspark.objects.WithdrawalRequestToChannelClosingTransactionsConnection import (
-    WithdrawalRequestToChannelClosingTransactionsConnection,
-)
-from lightspark.objects.WithdrawalRequestToChannelOpeningTransactionsConnection import (
-    WithdrawalRequestToChannelOpeningTransactionsConnection,
-)
-from lightspark.remote_signing import *
+# The names of the package are loaded lazily (PEP 562): `import lightspark` does not import
+# the client and the object modules until one of their names is accessed.
+
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING, Any, Dict, List
+
 from lightspark.version import __version__
-from lightspark.webhooks import SIGNATURE_HEADER, WebhookEvent
+
+if TYPE_CHECKING:
+    import lightspark.utils
+    from lightspark.lightspark_client import *
+    from lightspark.objects.Account import Account
+    from lightspark.objects.Account import from_json as Account_from_json
+    from lightspark.objects.AccountToApiTokensConnection import (
+        AccountToApiTokensConnection,
+    )
+    from lightspark.objects.AccountToChannelsConnection import (
+        AccountToChannelsConnection,
+    )
+    from lightspark.objects.AccountToNodesConnection import AccountToNodesConnection
+    from lightspark.objects.AccountToPaymentRequestsConnection import (
+        AccountToPaymentRequestsConnection,
+    )
+    from lightspark.objects.AccountToTransactionsConnection import (
+        AccountToTransactionsConnection,
+    )
+    from lightspark.objects.AccountToWalletsConnection import AccountToWalletsConnection
+    from lightspark.objects.AccountToWithdrawalRequestsConnection import (
+        AccountToWithdrawalRequestsConnection,
+    )
+    from lightspark.objects.all_entities import get_entity
+    from lightspark.objects.ApiToken import ApiToken
+    from lightspark.objects.ApiToken import from_json as ApiToken_from_json
+    from lightspark.objects.AuditLogActor import AuditLogActor
+    from lightspark.objects.Balances import Balances
+    from lightspark.objects.BitcoinNetwork import BitcoinNetwork
+    from lightspark.objects.BlockchainBalance import BlockchainBalance
+    from lightspark.objects.CancelInvoiceInput import CancelInvoiceInput
+    from lightspark.objects.CancelInvoiceOutput import CancelInvoiceOutput
+    from lightspark.objects.Channel import Channel
+    from lightspark.objects.ChannelClosingTransaction import ChannelClosingTransaction
+    from lightspark.objects.ChannelFees import ChannelFees
+    from lightspark.objects.ChannelOpeningTransaction import ChannelOpeningTransaction
+    from lightspark.objects.ChannelSnapshot import ChannelSnapshot
+    from lightspark.objects.ChannelStatus import ChannelStatus
+    from lightspark.objects.ChannelToTransactionsConnection import (
+        ChannelToTransactionsConnection,
+    )
+    from lightspark.objects.ClaimUmaInvitationInput import ClaimUmaInvitationInput
+    from lightspark.objects.ClaimUmaInvitationOutput import ClaimUmaInvitationOutput
+    from lightspark.objects.ClaimUmaInvitationWithIncentivesInput import (
+        ClaimUmaInvitationWithIncentivesInput,
+    )
+    from lightspark.objects.ClaimUmaInvitationWithIncentivesOutput import (
+        ClaimUmaInvitationWithIncentivesOutput,
+    )
+    from lightspark.objects.ComplianceProvider import ComplianceProvider
+    from lightspark.objects.Connection import Connection
+    from lightspark.objects.CreateApiTokenInput import CreateApiTokenInput
+    from lightspark.objects.CreateApiTokenOutput import CreateApiTokenOutput
+    from lightspark.objects.CreateInvitationWithIncentivesInput import (
+        CreateInvitationWithIncentivesInput,
+    )
+    from lightspark.objects.CreateInvitationWithIncentivesOutput import (
+        CreateInvitationWithIncentivesOutput,
+    )
+    from lightspark.objects.CreateInvoiceInput import CreateInvoiceInput
+    from lightspark.objects.CreateInvoiceOutput import CreateInvoiceOutput
+    from lightspark.objects.CreateLnurlInvoiceInput import CreateLnurlInvoiceInput
+    from lightspark.objects.CreateNodeWalletAddressInput import (
+        CreateNodeWalletAddressInput,
+    )
+    from lightspark.objects.CreateNodeWalletAddressOutput import (
+        CreateNodeWalletAddressOutput,
+    )
+    from lightspark.objects.CreateTestModeInvoiceInput import CreateTestModeInvoiceInput
+    from lightspark.objects.CreateTestModeInvoiceOutput import (
+        CreateTestModeInvoiceOutput,
+    )
+    from lightspark.objects.CreateTestModePaymentInput import CreateTestModePaymentInput
+    from lightspark.objects.CreateTestModePaymentoutput import (
+        CreateTestModePaymentoutput,
+    )
+    from lightspark.objects.CreateUmaInvitationInput import CreateUmaInvitationInput
+    from lightspark.objects.CreateUmaInvitationOutput import CreateUmaInvitationOutput
+    from lightspark.objects.CreateUmaInvoiceInput import CreateUmaInvoiceInput
+    from lightspark.objects.CurrencyAmount import CurrencyAmount
+    from lightspark.objects.CurrencyAmount import from_json as CurrencyAmount_from_json
+    from lightspark.objects.CurrencyUnit import CurrencyUnit
+    from lightspark.objects.DailyLiquidityForecast import DailyLiquidityForecast
+    from lightspark.objects.DeclineToSignMessagesInput import DeclineToSignMessagesInput
+    from lightspark.objects.DeclineToSignMessagesOutput import (
+        DeclineToSignMessagesOutput,
+    )
+    from lightspark.objects.DeleteApiTokenInput import DeleteApiTokenInput
+    from lightspark.objects.DeleteApiTokenOutput import DeleteApiTokenOutput
+    from lightspark.objects.Deposit import Deposit
+    from lightspark.objects.Entity import Entity
+    from lightspark.objects.FeeEstimate import FeeEstimate
+    from lightspark.objects.FeeEstimate import from_json as FeeEstimate_from_json
+    from lightspark.objects.FundNodeInput import FundNodeInput
+    from lightspark.objects.FundNodeOutput import FundNodeOutput
+    from lightspark.objects.GraphNode import GraphNode
+    from lightspark.objects.Hop import Hop
+    from lightspark.objects.HtlcAttemptFailureCode import HtlcAttemptFailureCode
+    from lightspark.objects.IdAndSignature import IdAndSignature
+    from lightspark.objects.IncentivesIneligibilityReason import (
+        IncentivesIneligibilityReason,
+    )
+    from lightspark.objects.IncentivesStatus import IncentivesStatus
+    from lightspark.objects.IncomingPayment import IncomingPayment
+    from lightspark.objects.IncomingPayment import (
+        from_json as IncomingPayment_from_json,
+    )
+    from lightspark.objects.IncomingPaymentAttempt import IncomingPaymentAttempt
+    from lightspark.objects.IncomingPaymentAttemptStatus import (
+        IncomingPaymentAttemptStatus,
+    )
+    from lightspark.objects.IncomingPaymentsForInvoiceQueryInput import (
+        IncomingPaymentsForInvoiceQueryInput,
+    )
+    from lightspark.objects.IncomingPaymentsForInvoiceQueryOutput import (
+        IncomingPaymentsForInvoiceQueryOutput,
+    )
+    from lightspark.objects.IncomingPaymentsForInvoiceQueryOutput import (
+        from_json as IncomingPaymentsForInvoiceQueryOutput_from_json,
+    )
+    from lightspark.objects.IncomingPaymentToAttemptsConnection import (
+        IncomingPaymentToAttemptsConnection,
+    )
+    from lightspark.objects.Invoice import Invoice
+    from lightspark.objects.Invoice import from_json as Invoice_from_json
+    from lightspark.objects.InvoiceData import InvoiceData
+    from lightspark.objects.InvoiceData import from_json as InvoiceData_from_json
+    from lightspark.objects.InvoiceType import InvoiceType
+    from lightspark.objects.LightningFeeEstimateForInvoiceInput import (
+        LightningFeeEstimateForInvoiceInput,
+    )
+    from lightspark.objects.LightningFeeEstimateForNodeInput import (
+        LightningFeeEstimateForNodeInput,
+    )
+    from lightspark.objects.LightningFeeEstimateOutput import LightningFeeEstimateOutput
+    from lightspark.objects.LightningFeeEstimateOutput import (
+        from_json as LightningFeeEstimateOutput_from_json,
+    )
+    from lightspark.objects.LightningPaymentDirection import LightningPaymentDirection
+    from lightspark.objects.LightningTransaction import LightningTransaction
+    from lightspark.objects.LightningTransaction import (
+        from_json as LightningTransaction_from_json,
+    )
+    from lightspark.objects.LightsparkNode import LightsparkNode
+    from lightspark.objects.LightsparkNodeOwner import LightsparkNodeOwner
+    from lightspark.objects.LightsparkNodeStatus import LightsparkNodeStatus
+    from lightspark.objects.LightsparkNodeToChannelsConnection import (
+        LightsparkNodeToChannelsConnection,
+    )
+    from lightspark.objects.LightsparkNodeToDailyLiquidityForecastsConnection import (
+        LightsparkNodeToDailyLiquidityForecastsConnection,
+    )
+    from lightspark.objects.LightsparkNodeWithOSK import LightsparkNodeWithOSK
+    from lightspark.objects.LightsparkNodeWithRemoteSigning import (
+        LightsparkNodeWithRemoteSigning,
+    )
+    from lightspark.objects.MultiSigAddressValidationParameters import (
+        MultiSigAddressValidationParameters,
+    )
+    from lightspark.objects.Node import Node
+    from lightspark.objects.NodeAddress import NodeAddress
+    from lightspark.objects.NodeAddressType import NodeAddressType
+    from lightspark.objects.NodeToAddressesConnection import NodeToAddressesConnection
+    from lightspark.objects.OnChainTransaction import OnChainTransaction
+    from lightspark.objects.OutgoingPayment import OutgoingPayment
+    from lightspark.objects.OutgoingPayment import (
+        from_json as OutgoingPayment_from_json,
+    )
+    from lightspark.objects.OutgoingPaymentAttempt import OutgoingPaymentAttempt
+    from lightspark.objects.OutgoingPaymentAttemptStatus import (
+        OutgoingPaymentAttemptStatus,
+    )
+    from lightspark.objects.OutgoingPaymentAttemptToHopsConnection import (
+        OutgoingPaymentAttemptToHopsConnection,
+    )
+    from lightspark.objects.OutgoingPaymentsForInvoiceQueryInput import (
+        OutgoingPaymentsForInvoiceQueryInput,
+    )
+    from lightspark.objects.OutgoingPaymentsForInvoiceQueryOutput import (
+        OutgoingPaymentsForInvoiceQueryOutput,
+    )
+    from lightspark.objects.OutgoingPaymentToAttemptsConnection import (
+        OutgoingPaymentToAttemptsConnection,
+    )
+    from lightspark.objects.PageInfo import PageInfo
+    from lightspark.objects.PayInvoiceInput import PayInvoiceInput
+    from lightspark.objects.PayInvoiceOutput import PayInvoiceOutput
+    from lightspark.objects.PaymentDirection import PaymentDirection
+    from lightspark.objects.PaymentFailureReason import PaymentFailureReason
+    from lightspark.objects.PaymentRequest import PaymentRequest
+    from lightspark.objects.PaymentRequestData import PaymentRequestData
+    from lightspark.objects.PaymentRequestStatus import PaymentRequestStatus
+    from lightspark.objects.PayUmaInvoiceInput import PayUmaInvoiceInput
+    from lightspark.objects.Permission import Permission
+    from lightspark.objects.PostTransactionData import PostTransactionData
+    from lightspark.objects.RegionCode import RegionCode
+    from lightspark.objects.RegisterPaymentInput import RegisterPaymentInput
+    from lightspark.objects.RegisterPaymentOutput import RegisterPaymentOutput
+    from lightspark.objects.ReleaseChannelPerCommitmentSecretInput import (
+        ReleaseChannelPerCommitmentSecretInput,
+    )
+    from lightspark.objects.ReleaseChannelPerCommitmentSecretOutput import (
+        ReleaseChannelPerCommitmentSecretOutput,
+    )
+    from lightspark.objects.ReleasePaymentPreimageInput import (
+        ReleasePaymentPreimageInput,
+    )
+    from lightspark.objects.ReleasePaymentPreimageOutput import (
+        ReleasePaymentPreimageOutput,
+    )
+    from lightspark.objects.RemoteSigningSubEventType import RemoteSigningSubEventType
+    from lightspark.objects.RequestWithdrawalInput import RequestWithdrawalInput
+    from lightspark.objects.RequestWithdrawalOutput import RequestWithdrawalOutput
+    from lightspark.objects.RichText import RichText
+    from lightspark.objects.RiskRating import RiskRating
+    from lightspark.objects.RoutingTransaction import RoutingTransaction
+    from lightspark.objects.RoutingTransactionFailureReason import (
+        RoutingTransactionFailureReason,
+    )
+    from lightspark.objects.ScreenNodeInput import ScreenNodeInput
+    from lightspark.objects.ScreenNodeOutput import ScreenNodeOutput
+    from lightspark.objects.Secret import Secret
+    from lightspark.objects.SendPaymentInput import SendPaymentInput
+    from lightspark.objects.SendPaymentOutput import SendPaymentOutput
+    from lightspark.objects.SetInvoicePaymentHashInput import SetInvoicePaymentHashInput
+    from lightspark.objects.SetInvoicePaymentHashOutput import (
+        SetInvoicePaymentHashOutput,
+    )
+    from lightspark.objects.Signable import Signable
+    from lightspark.objects.SignablePayload import SignablePayload
+    from lightspark.objects.SignablePayloadStatus import SignablePayloadStatus
+    from lightspark.objects.SignInvoiceInput import SignInvoiceInput
+    from lightspark.objects.SignInvoiceOutput import SignInvoiceOutput
+    from lightspark.objects.SignMessagesInput import SignMessagesInput
+    from lightspark.objects.SignMessagesOutput import SignMessagesOutput
+    from lightspark.objects.Transaction import Transaction
+    from lightspark.objects.TransactionFailures import TransactionFailures
+    from lightspark.objects.TransactionStatus import TransactionStatus
+    from lightspark.objects.TransactionType import TransactionType
+    from lightspark.objects.UmaInvitation import UmaInvitation
+    from lightspark.objects.UmaInvitation import from_json as UmaInvitation_from_json
+    from lightspark.objects.UpdateChannelPerCommitmentPointInput import (
+        UpdateChannelPerCommitmentPointInput,
+    )
+    from lightspark.objects.UpdateChannelPerCommitmentPointOutput import (
+        UpdateChannelPerCommitmentPointOutput,
+    )
+    from lightspark.objects.UpdateNodeSharedSecretInput import (
+        UpdateNodeSharedSecretInput,
+    )
+    from lightspark.objects.UpdateNodeSharedSecretOutput import (
+        UpdateNodeSharedSecretOutput,
+    )
+    from lightspark.objects.Wallet import Wallet
+    from lightspark.objects.WalletStatus import WalletStatus
+    from lightspark.objects.WalletToPaymentRequestsConnection import (
+        WalletToPaymentRequestsConnection,
+    )
+    from lightspark.objects.WalletToTransactionsConnection import (
+        WalletToTransactionsConnection,
+    )
+    from lightspark.objects.WalletToWithdrawalRequestsConnection import (
+        WalletToWithdrawalRequestsConnection,
+    )
+    from lightspark.objects.WebhookEventType import WebhookEventType
+    from lightspark.objects.Withdrawal import Withdrawal
+    from lightspark.objects.WithdrawalFeeEstimateInput import WithdrawalFeeEstimateInput
+    from lightspark.objects.WithdrawalFeeEstimateOutput import (
+        WithdrawalFeeEstimateOutput,
+    )
+    from lightspark.objects.WithdrawalMode import WithdrawalMode
+    from lightspark.objects.WithdrawalRequest import WithdrawalRequest
+    from lightspark.objects.WithdrawalRequest import (
+        from_json as WithdrawalRequest_from_json,
+    )
+    from lightspark.objects.WithdrawalRequestStatus import WithdrawalRequestStatus
+    from lightspark.objects.WithdrawalRequestToChannelClosingTransactionsConnection import (
+        WithdrawalRequestToChannelClosingTransactionsConnection,
+    )
+    from lightspark.objects.WithdrawalRequestToChannelOpeningTransactionsConnection import (
+        WithdrawalRequestToChannelOpeningTransactionsConnection,
+    )
+    from lightspark.remote_signing import *
+    from lightspark.scripts.bitcoin_fee_estimate import BITCOIN_FEE_ESTIMATE_QUERY
+    from lightspark.scripts.cancel_invoice import CANCEL_INVOICE_MUTATION
+    from lightspark.scripts.claim_uma_invitation import (
+        CLAIM_UMA_INVITATION_MUTATION,
+        CLAIM_UMA_INVITATION_WITH_INCENTIVES_MUTATION,
+    )
+    from lightspark.scripts.create_api_token import CREATE_API_TOKEN_MUTATION
+    from lightspark.scripts.create_invoice import CREATE_INVOICE_MUTATION
+    from lightspark.scripts.create_lnurl_invoice import CREATE_LNURL_INVOICE_MUTATION
+    from lightspark.scripts.create_node_address import CREATE_NODE_ADDRESS_MUTATION
+    from lightspark.scripts.create_test_mode_invoice import (
+        CREATE_TEST_MODE_INVOICE_MUTATION,
+    )
+    from lightspark.scripts.create_test_mode_payment import (
+        CREATE_TEST_MODE_PAYMENT_MUTATION,
+    )
+    from lightspark.scripts.create_uma_invitation import (
+        CREATE_UMA_INVITATION_MUTATION,
+        CREATE_UMA_INVITATION_WITH_INCENTIVES_MUTATION,
+    )
+    from lightspark.scripts.create_uma_invoice import CREATE_UMA_INVOICE_MUTATION
+    from lightspark.scripts.current_account import CURRENT_ACCOUNT_QUERY
+    from lightspark.scripts.decoded_payment_request import DECODED_PAYMENT_REQUEST_QUERY
+    from lightspark.scripts.delete_api_token import DELETE_API_TOKEN_MUTATION
+    from lightspark.scripts.fetch_uma_invitation import FETCH_UMA_INVITATION_QUERY
+    from lightspark.scripts.fund_node import FUND_NODE_MUTATION
+    from lightspark.scripts.incoming_payments_for_invoice import (
+        INCOMING_PAYMENTS_FOR_INVOICE_QUERY,
+    )
+    from lightspark.scripts.lightning_fee_estimate_for_invoice import (
+        LIGHTNING_FEE_ESTIMATE_FOR_INVOICE_QUERY,
+    )
+    from lightspark.scripts.lightning_fee_estimate_for_node import (
+        LIGHTNING_FEE_ESTIMATE_FOR_NODE_QUERY,
+    )
+    from lightspark.scripts.outgoing_payments_for_invoice import (
+        OUTGOING_PAYMENTS_FOR_INVOICE_QUERY,
+    )
+    from lightspark.scripts.pay_invoice import PAY_INVOICE_MUTATION
+    from lightspark.scripts.pay_uma_invoice import PAY_UMA_INVOICE_MUTATION
+    from lightspark.scripts.recover_node_signing_key import (
+        RECOVER_NODE_SIGNING_KEY_QUERY,
+    )
+    from lightspark.scripts.register_payment import REGISTER_PAYMENT_MUTATION
+    from lightspark.scripts.request_withdrawal import REQUEST_WITHDRAWAL_MUTATION
+    from lightspark.scripts.screen_node import SCREEN_NODE_MUTATION
+    from lightspark.scripts.send_payment import SEND_PAYMENT_MUTATION
+    from lightspark.webhooks import SIGNATURE_HEADER, WebhookEvent
+
+# Names re-exported from the module of the same name in `lightspark.objects`.
+_OBJECTS = (
+    "Account",
+    "AccountToApiTokensConnection",
+    "AccountToChannelsConnection",
+    "AccountToNodesConnection",
+    "AccountToPaymentRequestsConnection",
+    "AccountToTransactionsConnection",
+    "AccountToWalletsConnection",
+    "AccountToWithdrawalRequestsConnection",
+    "ApiToken",
+    "AuditLogActor",
+    "Balances",
+    "BitcoinNetwork",
+    "BlockchainBalance",
+    "CancelInvoiceInput",
+    "CancelInvoiceOutput",
+    "Channel",
+    "ChannelClosingTransaction",
+    "ChannelFees",
+    "ChannelOpeningTransaction",
+    "ChannelSnapshot",
+    "ChannelStatus",
+    "ChannelToTransactionsConnection",
+    "ClaimUmaInvitationInput",
+    "ClaimUmaInvitationOutput",
+    "ClaimUmaInvitationWithIncentivesInput",
+    "ClaimUmaInvitationWithIncentivesOutput",
+    "ComplianceProvider",
+    "Connection",
+    "CreateApiTokenInput",
+    "CreateApiTokenOutput",
+    "CreateInvitationWithIncentivesInput",
+    "CreateInvitationWithIncentivesOutput",
+    "CreateInvoiceInput",
+    "CreateInvoiceOutput",
+    "CreateLnurlInvoiceInput",
+    "CreateNodeWalletAddressInput",
+    "CreateNodeWalletAddressOutput",
+    "CreateTestModeInvoiceInput",
+    "CreateTestModeInvoiceOutput",
+    "CreateTestModePaymentInput",
+    "CreateTestModePaymentoutput",
+    "CreateUmaInvitationInput",
+    "CreateUmaInvitationOutput",
+    "CreateUmaInvoiceInput",
+    "CurrencyAmount",
+    "CurrencyUnit",
+    "DailyLiquidityForecast",
+    "DeclineToSignMessagesInput",
+    "DeclineToSignMessagesOutput",
+    "DeleteApiTokenInput",
+    "DeleteApiTokenOutput",
+    "Deposit",
+    "Entity",
+    "FeeEstimate",
+    "FundNodeInput",
+    "FundNodeOutput",
+    "GraphNode",
+    "Hop",
+    "HtlcAttemptFailureCode",
+    "IdAndSignature",
+    "IncentivesIneligibilityReason",
+    "IncentivesStatus",
+    "IncomingPayment",
+    "IncomingPaymentAttempt",
+    "IncomingPaymentAttemptStatus",
+    "IncomingPaymentsForInvoiceQueryInput",
+    "IncomingPaymentsForInvoiceQueryOutput",
+    "IncomingPaymentToAttemptsConnection",
+    "Invoice",
+    "InvoiceData",
+    "InvoiceType",
+    "LightningFeeEstimateForInvoiceInput",
+    "LightningFeeEstimateForNodeInput",
+    "LightningFeeEstimateOutput",
+    "LightningPaymentDirection",
+    "LightningTransaction",
+    "LightsparkNode",
+    "LightsparkNodeOwner",
+    "LightsparkNodeStatus",
+    "LightsparkNodeToChannelsConnection",
+    "LightsparkNodeToDailyLiquidityForecastsConnection",
+    "LightsparkNodeWithOSK",
+    "LightsparkNodeWithRemoteSigning",
+    "MultiSigAddressValidationParameters",
+    "Node",
+    "NodeAddress",
+    "NodeAddressType",
+    "NodeToAddressesConnection",
+    "OnChainTransaction",
+    "OutgoingPayment",
+    "OutgoingPaymentAttempt",
+    "OutgoingPaymentAttemptStatus",
+    "OutgoingPaymentAttemptToHopsConnection",
+    "OutgoingPaymentsForInvoiceQueryInput",
+    "OutgoingPaymentsForInvoiceQueryOutput",
+    "OutgoingPaymentToAttemptsConnection",
+    "PageInfo",
+    "PayInvoiceInput",
+    "PayInvoiceOutput",
+    "PaymentDirection",
+    "PaymentFailureReason",
+    "PaymentRequest",
+    "PaymentRequestData",
+    "PaymentRequestStatus",
+    "PayUmaInvoiceInput",
+    "Permission",
+    "PostTransactionData",
+    "RegionCode",
+    "RegisterPaymentInput",
+    "RegisterPaymentOutput",
+    "ReleaseChannelPerCommitmentSecretInput",
+    "ReleaseChannelPerCommitmentSecretOutput",
+    "ReleasePaymentPreimageInput",
+    "ReleasePaymentPreimageOutput",
+    "RemoteSigningSubEventType",
+    "RequestWithdrawalInput",
+    "RequestWithdrawalOutput",
+    "RichText",
+    "RiskRating",
+    "RoutingTransaction",
+    "RoutingTransactionFailureReason",
+    "ScreenNodeInput",
+    "ScreenNodeOutput",
+    "Secret",
+    "SendPaymentInput",
+    "SendPaymentOutput",
+    "SetInvoicePaymentHashInput",
+    "SetInvoicePaymentHashOutput",
+    "Signable",
+    "SignablePayload",
+    "SignablePayloadStatus",
+    "SignInvoiceInput",
+    "SignInvoiceOutput",
+    "SignMessagesInput",
+    "SignMessagesOutput",
+    "Transaction",
+    "TransactionFailures",
+    "TransactionStatus",
+    "TransactionType",
+    "UmaInvitation",
+    "UpdateChannelPerCommitmentPointInput",
+    "UpdateChannelPerCommitmentPointOutput",
+    "UpdateNodeSharedSecretInput",
+    "UpdateNodeSharedSecretOutput",
+    "Wallet",
+    "WalletStatus",
+    "WalletToPaymentRequestsConnection",
+    "WalletToTransactionsConnection",
+    "WalletToWithdrawalRequestsConnection",
+    "WebhookEventType",
+    "Withdrawal",
+    "WithdrawalFeeEstimateInput",
+    "WithdrawalFeeEstimateOutput",
+    "WithdrawalMode",
+    "WithdrawalRequest",
+    "WithdrawalRequestStatus",
+    "WithdrawalRequestToChannelClosingTransactionsConnection",
+    "WithdrawalRequestToChannelOpeningTransactionsConnection",
+)
+
+# The loaders of the objects which the client used to import, re-exported as
+# `<Object>_from_json`.
+_FROM_JSON: Dict[str, str] = {
+    f"{name}_from_json": f"lightspark.objects.{name}"
+    for name in (
+        "Account",
+        "ApiToken",
+        "CurrencyAmount",
+        "FeeEstimate",
+        "IncomingPayment",
+        "IncomingPaymentsForInvoiceQueryOutput",
+        "Invoice",
+        "InvoiceData",
+        "LightningFeeEstimateOutput",
+        "LightningTransaction",
+        "OutgoingPayment",
+        "UmaInvitation",
+        "WithdrawalRequest",
+    )
+}
+
+# Queries re-exported from the module of `lightspark.scripts` which defines them.
+_SCRIPTS = {
+    "BITCOIN_FEE_ESTIMATE_QUERY": "bitcoin_fee_estimate",
+    "CANCEL_INVOICE_MUTATION": "cancel_invoice",
+    "CLAIM_UMA_INVITATION_MUTATION": "claim_uma_invitation",
+    "CLAIM_UMA_INVITATION_WITH_INCENTIVES_MUTATION": "claim_uma_invitation",
+    "CREATE_API_TOKEN_MUTATION": "create_api_token",
+    "CREATE_INVOICE_MUTATION": "create_invoice",
+    "CREATE_LNURL_INVOICE_MUTATION": "create_lnurl_invoice",
+    "CREATE_NODE_ADDRESS_MUTATION": "create_node_address",
+    "CREATE_TEST_MODE_INVOICE_MUTATION": "create_test_mode_invoice",
+    "CREATE_TEST_MODE_PAYMENT_MUTATION": "create_test_mode_payment",
+    "CREATE_UMA_INVITATION_MUTATION": "create_uma_invitation",
+    "CREATE_UMA_INVITATION_WITH_INCENTIVES_MUTATION": "create_uma_invitation",
+    "CREATE_UMA_INVOICE_MUTATION": "create_uma_invoice",
+    "CURRENT_ACCOUNT_QUERY": "current_account",
+    "DECODED_PAYMENT_REQUEST_QUERY": "decoded_payment_request",
+    "DELETE_API_TOKEN_MUTATION": "delete_api_token",
+    "FETCH_UMA_INVITATION_QUERY": "fetch_uma_invitation",
+    "FUND_NODE_MUTATION": "fund_node",
+    "INCOMING_PAYMENTS_FOR_INVOICE_QUERY": "incoming_payments_for_invoice",
+    "LIGHTNING_FEE_ESTIMATE_FOR_INVOICE_QUERY": "lightning_fee_estimate_for_invoice",
+    "LIGHTNING_FEE_ESTIMATE_FOR_NODE_QUERY": "lightning_fee_estimate_for_node",
+    "OUTGOING_PAYMENTS_FOR_INVOICE_QUERY": "outgoing_payments_for_invoice",
+    "PAY_INVOICE_MUTATION": "pay_invoice",
+    "PAY_UMA_INVOICE_MUTATION": "pay_uma_invoice",
+    "RECOVER_NODE_SIGNING_KEY_QUERY": "recover_node_signing_key",
+    "REGISTER_PAYMENT_MUTATION": "register_payment",
+    "REQUEST_WITHDRAWAL_MUTATION": "request_withdrawal",
+    "SCREEN_NODE_MUTATION": "screen_node",
+    "SEND_PAYMENT_MUTATION": "send_payment",
+}
+
+_ATTRIBUTES: Dict[str, str] = {
+    "LightsparkAsyncClient": "lightspark.lightspark_client",
+    "LightsparkSyncClient": "lightspark.lightspark_client",
+    "PositiveValidator": "lightspark.remote_signing",
+    "RemoteSigningWebhookEventHandler": "lightspark.remote_signing",
+    "SIGNATURE_HEADER": "lightspark.webhooks",
+    "WebhookEvent": "lightspark.webhooks",
+    "get_entity": "lightspark.objects.all_entities",
+    **{name: f"lightspark.objects.{name}" for name in _OBJECTS},
+    **{name: f"lightspark.scripts.{module}" for name, module in _SCRIPTS.items()},
+}
+
+# Modules whose public names are all re-exported, as with `import *`.
+_STAR_MODULES = ("lightspark.lightspark_client", "lightspark.remote_signing")
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__all__":
+        value: Any = _all_names()
+    elif name.startswith("_"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    elif name in _ATTRIBUTES:
+        value = getattr(importlib.import_module(_ATTRIBUTES[name]), name)
+    elif name in _FROM_JSON:
+        value = importlib.import_module(_FROM_JSON[name]).from_json
+    else:
+        value = _find(name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_ATTRIBUTES) | set(_FROM_JSON))
+
+
+def _find(name: str) -> Any:
+    if importlib.util.find_spec(f"{__name__}.{name}") is not None:
+        return importlib.import_module(f"{__name__}.{name}")
+    for module_name in _STAR_MODULES:
+        module = importlib.import_module(module_name)
+        if hasattr(module, name):
+            return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _all_names() -> List[str]:
+    names = set(_ATTRIBUTES) | set(_FROM_JSON)
+    for module_name in _STAR_MODULES:
+        module = importlib.import_module(module_name)
+        names.update(name for name in vars(module) if not name.startswith("_"))
+    return sorted(names)
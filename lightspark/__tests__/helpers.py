@@ -0,0 +1,131 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Mapping, Optional, TypeVar
+
+from lightspark.requests.requester import Requester
+from lightspark.utils.signing_key import SigningKey
+
+ACCOUNT = {
+    "__typename": "Account",
+    "account_id": "Account:1",
+    "account_created_at": "2023-07-30T06:18:07.162759+00:00",
+    "account_updated_at": "2023-11-04T12:01:04.015414+00:00",
+    "account_name": "Test account",
+}
+
+
+class StaticSigningKey(SigningKey):
+    def __init__(self) -> None:
+        self.key = b""
+
+    def sign_payload(self, payload: bytes) -> str:
+        return "signature"
+
+
+def graph_node(entity_id: str) -> Mapping[str, Any]:
+    return {
+        "__typename": "GraphNode",
+        "graph_node_id": entity_id,
+        "graph_node_created_at": "2023-07-30T06:18:07.162759+00:00",
+        "graph_node_updated_at": "2023-11-04T12:01:04.015414+00:00",
+        "graph_node_alias": None,
+        "graph_node_bitcoin_network": "REGTEST",
+        "graph_node_color": None,
+        "graph_node_conductivity": None,
+        "graph_node_display_name": entity_id,
+        "graph_node_public_key": None,
+    }
+
+
+def entity_response(variables: Mapping[str, Any]) -> Mapping[str, Any]:
+    """The data of the response to an entity query, or to an aliased batch of them,
+    where `GraphNode:missing` does not exist."""
+    return {
+        name[: -len("id")] + "entity": graph_node(value)
+        if value != "GraphNode:missing"
+        else None
+        for name, value in variables.items()
+    }
+
+
+def mock_requester(requester: Requester) -> List[Mapping[str, Any]]:
+    """Answers the entity queries of `requester` with `entity_response`, and returns the
+    list to which the variables of each call are appended."""
+    calls = []
+
+    def execute_graphql(
+        query: str,
+        variables: Mapping[str, Any],
+        signing_key: Optional[Any] = None,
+        timeout=None,
+    ) -> Mapping[str, Any]:
+        calls.append(variables)
+        return entity_response(variables)
+
+    async def execute_graphql_async(
+        query: str,
+        variables: Mapping[str, Any],
+        signing_key: Optional[Any] = None,
+        timeout=None,
+    ) -> Mapping[str, Any]:
+        return execute_graphql(query, variables, signing_key)
+
+    requester.execute_graphql = execute_graphql
+    requester.execute_graphql_async = execute_graphql_async
+    return calls
+
+
+class GraphQLHandler(BaseHTTPRequestHandler):
+    server: "GraphQLServer"
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        self.body = self.rfile.read(int(self.headers["Content-Length"]))
+        request = json.loads(self.body)
+        with self.server.lock:
+            self.server.requests.append(request)
+        self.server.respond(self, request)
+
+    def send_json(self, response: Mapping[str, Any], status: int = 200) -> None:
+        content = json.dumps(response).encode("utf8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+class GraphQLServer(ThreadingHTTPServer):
+    """A local GraphQL server which records the requests it receives and replies to them
+    with `respond`, by default with the current account."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), GraphQLHandler)
+        self.lock = threading.Lock()
+        self.requests: List[Dict[str, Any]] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/graphql/server/2023-09-13"
+
+    def respond(self, handler: GraphQLHandler, request: Dict[str, Any]) -> None:
+        handler.send_json({"data": {"current_account": ACCOUNT}})
+
+
+SERVER = TypeVar("SERVER", bound=GraphQLServer)
+
+
+def serve(server: SERVER) -> Iterator[SERVER]:
+    """Runs `server` in a background thread until the generator is closed, for fixtures
+    to `yield from`."""
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,59 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import json
+
+import httpx
+import pytest
+
+from lightspark import LightsparkAsyncClient, LightsparkSyncClient
+from lightspark.exceptions import LightsparkException
+
+ACCOUNT = {
+    "__typename": "Account",
+    "account_id": "Account:0189a572-6dba-cf00-0000-ac0908d34ea6",
+    "account_created_at": "2023-07-30T06:18:07.162759+00:00",
+    "account_updated_at": "2023-11-04T12:01:04.015414+00:00",
+    "account_name": "Test account",
+}
+
+
+def mock_transport(client: LightsparkAsyncClient, responses, requests) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append((request, body))
+        return httpx.Response(200, json={"data": responses[body["operationName"]]})
+
+    client._requester.graphql_async_session = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+
+
+class TestAsyncClient:
+    async def test_client_and_entity_methods(self) -> None:
+        requests = []
+        async with LightsparkAsyncClient("client_id", "client_secret") as client:
+            mock_transport(
+                client,
+                {
+                    "GetCurrentAccount": {"current_account": ACCOUNT},
+                    "FetchAccountConductivity": {"entity": {"conductivity": 7}},
+                },
+                requests,
+            )
+            account = await client.get_current_account()
+            assert account.id == ACCOUNT["account_id"]
+            assert await account.get_conductivity_async() == 7
+
+        assert [r.headers["X-GraphQL-Operation"] for r, _ in requests] == [
+            "GetCurrentAccount",
+            "FetchAccountConductivity",
+        ]
+        assert requests[1][1]["variables"]["entity_id"] == ACCOUNT["account_id"]
+        assert "X-Lightspark-Signing" not in requests[0][0].headers
+
+    async def test_sync_client_objects_are_blocking_only(self) -> None:
+        client = LightsparkSyncClient("client_id", "client_secret")
+        query = client.get_current_account_query()
+        account = query.construct_object({"current_account": ACCOUNT})
+        with pytest.raises(LightsparkException):
+            await account.get_conductivity_async()
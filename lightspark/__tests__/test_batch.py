@@ -0,0 +1,84 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+from typing import Any, List, Mapping, Optional
+
+import pytest
+
+from lightspark import LightsparkSyncClient
+from lightspark.__tests__.helpers import ACCOUNT
+from lightspark.exceptions import LightsparkException
+from lightspark.objects.Account import from_json as Account_from_json
+from lightspark.objects.GraphNode import GraphNode
+
+
+def mock_requester(client: LightsparkSyncClient, data: Mapping[str, Any]) -> List:
+    calls = []
+
+    def execute_graphql(
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key=None,
+        timeout=None,
+    ) -> Mapping[str, Any]:
+        calls.append((query, variables))
+        return data
+
+    client._requester.execute_graphql = execute_graphql
+    return calls
+
+
+class TestQueryBatch:
+    def test_merges_queries_into_one_request(self) -> None:
+        client = LightsparkSyncClient("", "")
+        account = Account_from_json(client._requester, ACCOUNT)
+        calls = mock_requester(
+            client,
+            {"b0_entity": {"conductivity": 7}, "b1_entity": {"uptime_percentage": 99}},
+        )
+
+        with client.batch() as batch:
+            conductivity = batch.add(account.get_conductivity_query())
+            uptime = batch.add(account.get_uptime_percentage_query())
+            assert not conductivity.done()
+
+        assert conductivity.result() == 7
+        assert uptime.result() == 99
+        assert len(calls) == 1
+        document, variables = calls[0]
+        assert document.startswith("query Batch($b0_entity_id: ID!")
+        assert "b0_entity: entity(id: $b0_entity_id)" in document
+        assert "b1_entity: entity(id: $b1_entity_id)" in document
+        assert variables["b0_entity_id"] == variables["b1_entity_id"] == "Account:1"
+
+    def test_shared_fragments_are_sent_once(self) -> None:
+        client = LightsparkSyncClient("", "")
+        calls = mock_requester(client, {"b0_entity": None, "b1_entity": None})
+
+        with client.batch() as batch:
+            first = batch.add(client.get_entity_query("GraphNode:1", GraphNode))
+            second = batch.add(client.get_entity_query("GraphNode:2", GraphNode))
+
+        assert first.result() is None and second.result() is None
+        assert calls[0][0].count("fragment GraphNodeFragment on GraphNode") == 1
+
+    def test_single_query_is_sent_unchanged(self) -> None:
+        client = LightsparkSyncClient("", "")
+        calls = mock_requester(client, {"current_account": ACCOUNT})
+
+        with client.batch() as batch:
+            account = batch.add(client.get_current_account_query())
+
+        assert account.result().name == "Test account"
+        assert calls[0][0] == client.get_current_account_query().query
+
+    def test_rejects_mixed_operation_types(self) -> None:
+        client = LightsparkSyncClient("", "")
+        mock_requester(client, {})
+
+        batch = client.batch()
+        pending = batch.add(client.get_current_account_query())
+        batch.add(client.create_node_wallet_address_query("LightsparkNode:1"))
+        with pytest.raises(LightsparkException):
+            batch.execute()
+        with pytest.raises(LightsparkException):
+            pending.result()
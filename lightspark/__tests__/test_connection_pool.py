@@ -0,0 +1,128 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import gc
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, Set
+
+import pytest
+import requests
+
+from lightspark import LightsparkSyncClient
+from lightspark.__tests__.helpers import GraphQLHandler, GraphQLServer, serve
+from lightspark.requests.pool import PoolConfig, PooledHTTPAdapter, PoolStats
+from lightspark.requests.requester import HTTPSAdapter
+
+
+class KeepAliveServer(GraphQLServer):
+    """A GraphQL server keeping its connections open, which records the client ports
+    they come from."""
+
+    def __init__(self, delay_secs: float = 0.0) -> None:
+        super().__init__()
+        self.delay_secs = delay_secs
+        self.ports: Set[int] = set()
+
+    def respond(self, handler: GraphQLHandler, request: Dict[str, Any]) -> None:
+        with self.lock:
+            self.ports.add(handler.client_address[1])
+        time.sleep(self.delay_secs)
+        super().respond(handler, request)
+
+
+@pytest.fixture
+def server() -> Iterator[KeepAliveServer]:
+    yield from serve(KeepAliveServer())
+
+
+@pytest.fixture
+def slow_server() -> Iterator[KeepAliveServer]:
+    yield from serve(KeepAliveServer(delay_secs=0.05))
+
+
+class TestConnectionPool:
+    def test_reuses_connections(self, server: KeepAliveServer) -> None:
+        client = LightsparkSyncClient("id", "secret", server.url)
+        for _ in range(5):
+            assert client.get_current_account().name == "Test account"
+
+        assert client.pool_stats() == PoolStats(in_use=0, idle=1, created=1, reused=4)
+        assert len(server.ports) == 1
+
+    def test_pool_size_bounds_the_connections_kept_open(
+        self, slow_server: KeepAliveServer
+    ) -> None:
+        client = LightsparkSyncClient(
+            "id",
+            "secret",
+            slow_server.url,
+            pool_config=PoolConfig(max_connections_per_host=8),
+        )
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in range(3):
+                list(executor.map(lambda _: client.get_current_account(), range(8)))
+
+        stats = client.pool_stats()
+        assert stats.in_use == 0
+        assert stats.idle == 8
+        assert stats.created + stats.reused == 24
+        assert stats.created == len(slow_server.ports) <= 16
+
+    def test_blocking_pool(self, slow_server: KeepAliveServer) -> None:
+        client = LightsparkSyncClient(
+            "id",
+            "secret",
+            slow_server.url,
+            pool_config=PoolConfig(max_connections_per_host=2, block=True),
+        )
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: client.get_current_account(), range(8)))
+
+        # The threads waited for one of the two connections instead of opening more.
+        assert client.pool_stats() == PoolStats(in_use=0, idle=2, created=2, reused=6)
+        assert len(slow_server.ports) == 2
+
+    def test_idle_timeout(self, server: KeepAliveServer) -> None:
+        client = LightsparkSyncClient(
+            "id",
+            "secret",
+            server.url,
+            pool_config=PoolConfig(idle_timeout_secs=0.05),
+        )
+        client.get_current_account()
+        client.get_current_account()
+        time.sleep(0.1)
+        client.get_current_account()
+
+        assert client.pool_stats() == PoolStats(in_use=0, idle=1, created=2, reused=1)
+        assert len(server.ports) == 2
+
+    def test_http_host_adapter_is_pooled(self) -> None:
+        client = LightsparkSyncClient(
+            "id",
+            "secret",
+            http_host="api.example.com",
+            pool_config=PoolConfig(max_connections_per_host=32, max_hosts=2),
+        )
+        adapter = client._requester.graphql_session.get_adapter("https://")
+        assert isinstance(adapter, HTTPSAdapter)
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+        assert adapter.poolmanager.pools._maxsize == 2
+
+    def test_adapter_arguments_are_forwarded(self) -> None:
+        adapter = HTTPSAdapter("api.example.com", 4, 8, 3, pool_config=PoolConfig())
+        assert adapter.poolmanager.pools._maxsize == 4
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 8
+        assert adapter.max_retries.total == 3
+
+    def test_evicted_pools_are_released(self, server: KeepAliveServer) -> None:
+        adapter = PooledHTTPAdapter(pool_config=PoolConfig(max_hosts=1))
+        session = requests.Session()
+        session.mount("http://", adapter)
+        port = server.server_address[1]
+        for host in ["127.0.0.1", "localhost", "127.0.0.1"]:
+            session.post(f"http://{host}:{port}/graphql", data=b"{}").close()
+        gc.collect()
+
+        assert len(adapter._tracker.pools) == 1
+        assert adapter.pool_stats() == PoolStats(in_use=0, idle=1, created=3, reused=0)
@@ -0,0 +1,228 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import dataclasses
+import importlib
+import pkgutil
+import timeit
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Tuple, Union, get_type_hints
+
+import pytest
+
+import lightspark.objects
+from lightspark.decoders import compile_decoder, compile_lazy_decoder, parse_fragment
+from lightspark.exceptions import LightsparkException
+from lightspark.objects.AccountToTransactionsConnection import (
+    AccountToTransactionsConnection,
+)
+from lightspark.objects.AccountToTransactionsConnection import (
+    from_json as AccountToTransactionsConnection_from_json,
+)
+from lightspark.objects.Transaction import Transaction
+from lightspark.objects.Transaction import from_json as Transaction_from_json
+from lightspark.utils.timestamps import cached, epoch_micros
+
+# 0: every field set, 1: optional fields null and unknown enum values, 2: falsy values.
+VARIANTS = (0, 1, 2)
+
+
+def loadable_types() -> List[Tuple[type, Any]]:
+    types = []
+    for module_info in pkgutil.iter_modules(lightspark.objects.__path__):
+        module = importlib.import_module(f"lightspark.objects.{module_info.name}")
+        if hasattr(module, "FRAGMENT") and hasattr(module, "from_json"):
+            types.append((getattr(module, module_info.name), module.from_json))
+    return types
+
+
+def unwrap_optional(hint: Any) -> Tuple[bool, Any]:
+    if getattr(hint, "__origin__", None) is Union:
+        return True, [arg for arg in hint.__args__ if arg is not type(None)][0]
+    return False, hint
+
+
+def sample_value(hint: Any, selection: Any, variant: int, index: int) -> Any:
+    optional, hint = unwrap_optional(hint)
+    if optional and variant == 1:
+        return None
+    if getattr(hint, "__origin__", None) in (list, List):
+        if variant == 2:
+            return []
+        return [sample_value(hint.__args__[0], selection, variant, i) for i in (0, 1)]
+    if hint is datetime:
+        return f"2023-01-0{index + 1}T03:04:05.123456+00:00"
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        if variant == 1:
+            return "SOME_FUTURE_VALUE"
+        return list(hint.__members__)[1 + index % (len(hint.__members__) - 1)]
+    if dataclasses.is_dataclass(hint):
+        if selection is None or [field.name for field in selection.fields] == ["id"]:
+            module = importlib.import_module(hint.__module__)
+            selection = parse_fragment(module.FRAGMENT)
+        if selection.fragments:
+            typename, selection = selection.fragments[
+                (variant + index) % len(selection.fragments)
+            ]
+            module = importlib.import_module(f"lightspark.objects.{typename}")
+            hint = getattr(module, typename)
+        return sample_object(hint, selection, variant)
+    if hint is bool:
+        return variant != 2
+    if hint is int:
+        return 0 if variant == 2 else 7 + index
+    if hint is float:
+        return 1.5
+    return "" if variant == 2 else f"value {index}"
+
+
+def sample_object(cls: type, selection: Any, variant: int) -> Dict[str, Any]:
+    hints = get_type_hints(cls)
+    obj: Dict[str, Any] = {"__typename": cls.__name__}
+    for field in selection.fields:
+        if field.name == "__typename":
+            continue
+        reference = f"{field.name}_id"
+        if reference in hints and field.selection is not None:
+            optional, _ = unwrap_optional(hints[reference])
+            obj[field.key] = (
+                None if optional and variant == 1 else {"id": f"{field.name}:1"}
+            )
+        else:
+            obj[field.key] = sample_value(
+                hints[field.name], field.selection, variant, 0
+            )
+    return obj
+
+
+def samples(cls: type) -> List[Dict[str, Any]]:
+    selection = parse_fragment(importlib.import_module(cls.__module__).FRAGMENT)
+    if not selection.fragments:
+        return [sample_object(cls, selection, variant) for variant in VARIANTS]
+    return [
+        sample_object(
+            getattr(
+                importlib.import_module(f"lightspark.objects.{typename}"), typename
+            ),
+            concrete_selection,
+            variant,
+        )
+        for typename, concrete_selection in selection.fragments
+        for variant in VARIANTS
+    ]
+
+
+class TestDecoders:
+    @pytest.mark.parametrize(
+        "cls,from_json",
+        loadable_types(),
+        ids=lambda value: getattr(value, "__name__", ""),
+    )
+    def test_matches_the_generated_loader(self, cls: type, from_json: Any) -> None:
+        decode = compile_decoder(cls)
+        for obj in samples(cls):
+            assert decode(None, obj) == from_json(None, obj)
+
+    @pytest.mark.parametrize(
+        "cls,from_json",
+        loadable_types(),
+        ids=lambda value: getattr(value, "__name__", ""),
+    )
+    def test_lazy_matches_the_generated_loader(self, cls: type, from_json: Any) -> None:
+        decode = compile_lazy_decoder(cls)
+        for obj in samples(cls):
+            lazy = decode(None, obj)
+            assert isinstance(lazy, cls)
+            assert lazy == from_json(None, obj)
+            assert repr(lazy) == repr(from_json(None, obj))
+
+    def test_lazy_attributes_are_decoded_once(self) -> None:
+        connection = samples(AccountToTransactionsConnection)[0]
+        decoded = compile_lazy_decoder(AccountToTransactionsConnection)(
+            None, connection
+        )
+        transaction = decoded.entities[0]
+        assert transaction.id == "value 0"
+        assert "created_at" not in vars(transaction)
+        assert transaction.amount is transaction.amount
+        assert transaction.created_at == datetime.fromisoformat(
+            "2023-01-01T03:04:05.123456+00:00"
+        )
+        assert "created_at" in vars(transaction)
+        assert decoded == AccountToTransactionsConnection_from_json(None, connection)
+
+    def test_timestamp_codecs(self) -> None:
+        connection = samples(AccountToTransactionsConnection)[0]
+        expected = AccountToTransactionsConnection_from_json(None, connection)
+        codec = cached(epoch_micros)
+        for decoder in (compile_decoder, compile_lazy_decoder):
+            decoded = decoder(AccountToTransactionsConnection, codec)(None, connection)
+            assert decoded.entities[0].created_at == 1672542245123456
+            assert decoded.entities[0].id == expected.entities[0].id
+        assert codec.cache_info().hits > 0
+        assert compile_decoder(AccountToTransactionsConnection)(None, connection) == (
+            expected
+        )
+
+    def test_every_type_is_compiled(self) -> None:
+        assert [
+            cls.__name__
+            for cls, from_json in loadable_types()
+            if compile_decoder(cls) is from_json
+        ] == []
+
+    def test_unknown_typename(self) -> None:
+        with pytest.raises(LightsparkException):
+            compile_decoder(Transaction)(None, {"__typename": "Unknown"})
+
+    @pytest.mark.benchmark
+    def test_decoding_cost(self) -> None:
+        page = samples(Transaction) * 100
+        decode = compile_decoder(Transaction)
+
+        def per_row_micros(loader) -> float:
+            seconds = min(
+                timeit.repeat(
+                    lambda: [loader(None, row) for row in page], number=3, repeat=5
+                )
+            )
+            return seconds / 3 / len(page) * 1e6
+
+        timings = [
+            (per_row_micros(Transaction_from_json), per_row_micros(decode))
+            for _ in range(3)
+        ]
+        loader = min(timing[0] for timing in timings)
+        compiled = min(timing[1] for timing in timings)
+        assert compiled < loader, (compiled, loader)
+
+    @pytest.mark.benchmark
+    def test_lazy_decoding_cost(self) -> None:
+        connection = dict(samples(AccountToTransactionsConnection)[0])
+        connection["account_to_transactions_connection_entities"] = (
+            samples(Transaction) * 100
+        )
+        decode = compile_lazy_decoder(AccountToTransactionsConnection)
+
+        def narrow_read_seconds(loader) -> float:
+            return min(
+                timeit.repeat(
+                    lambda: [
+                        (transaction.id, transaction.status)
+                        for transaction in loader(None, connection).entities
+                    ],
+                    number=3,
+                    repeat=5,
+                )
+            )
+
+        timings = [
+            (
+                narrow_read_seconds(AccountToTransactionsConnection_from_json),
+                narrow_read_seconds(decode),
+            )
+            for _ in range(3)
+        ]
+        loader = min(timing[0] for timing in timings)
+        lazy = min(timing[1] for timing in timings)
+        assert lazy * 2 < loader, (lazy, loader)
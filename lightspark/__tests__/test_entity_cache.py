@@ -0,0 +1,84 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+from lightspark import LightsparkAsyncClient, LightsparkSyncClient
+from lightspark.__tests__.helpers import graph_node, mock_requester
+from lightspark.entity_cache import EntityCache
+from lightspark.objects.Account import Account
+from lightspark.objects.GraphNode import GraphNode
+from lightspark.objects.GraphNode import from_json as GraphNode_from_json
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestEntityCache:
+    def test_ttl_per_type(self) -> None:
+        clock = FakeClock()
+        cache = EntityCache(
+            default_ttl_secs=10, ttl_secs={GraphNode: 1, Account: 0}, clock=clock
+        )
+        node = GraphNode_from_json(None, graph_node("GraphNode:1"))
+
+        assert cache.put(node) is node
+        assert cache.get("GraphNode:1", GraphNode) is node
+        assert cache.get("GraphNode:1", Account) is None
+        clock.now = 1
+        assert cache.get("GraphNode:1") is None
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.evictions) == (
+            1,
+            2,
+            1,
+        )
+
+    def test_lru_bound_and_invalidate(self) -> None:
+        cache = EntityCache(max_size=2)
+        nodes = [
+            GraphNode_from_json(None, graph_node(f"GraphNode:{i}")) for i in range(3)
+        ]
+        cache.put(nodes[0])
+        cache.put(nodes[1])
+        cache.get("GraphNode:0")
+        cache.put(nodes[2])
+
+        assert "GraphNode:0" in cache
+        assert "GraphNode:1" not in cache
+        assert cache.invalidate("GraphNode:2")
+        assert not cache.invalidate("GraphNode:2")
+        assert len(cache) == 1
+
+    def test_client_get_entity(self) -> None:
+        cache = EntityCache()
+        client = LightsparkSyncClient("", "", entity_cache=cache)
+        calls = mock_requester(client._requester)
+
+        node = client.get_entity("GraphNode:1", GraphNode)
+        assert client.get_entity("GraphNode:1", GraphNode) is node
+        assert len(calls) == 1
+
+        client.entity_cache.invalidate("GraphNode:1")
+        assert client.get_entity("GraphNode:1", GraphNode) is not node
+        assert len(calls) == 2
+
+    def test_loader_uses_the_cache(self) -> None:
+        client = LightsparkSyncClient("", "", entity_cache=EntityCache())
+        calls = mock_requester(client._requester)
+        client.get_entity("GraphNode:1", GraphNode)
+
+        loader = client.entity_loader()
+        nodes = loader.load_many(["GraphNode:1", "GraphNode:2"], GraphNode)
+        assert [node.id for node in nodes] == ["GraphNode:1", "GraphNode:2"]
+        assert calls[1] == {"id": "GraphNode:2"}
+        assert loader.load("GraphNode:2", GraphNode) is nodes[1]
+        assert len(calls) == 2
+
+    async def test_async_client_get_entity(self) -> None:
+        async with LightsparkAsyncClient("", "", entity_cache=EntityCache()) as client:
+            calls = mock_requester(client._requester)
+            node = await client.get_entity("GraphNode:1", GraphNode)
+            assert await client.get_entity("GraphNode:1", GraphNode) is node
+            assert len(calls) == 1
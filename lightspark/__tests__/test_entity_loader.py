@@ -0,0 +1,95 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
+
+from lightspark import LightsparkSyncClient
+from lightspark.__tests__.helpers import mock_requester
+from lightspark.entity_cache import EntityCache
+from lightspark.entity_loader import AsyncEntityLoader, EntityLoader
+from lightspark.objects.GraphNode import GraphNode
+from lightspark.requests.requester import Requester
+
+
+def load_in_thread(loader: EntityLoader, entity_id: str) -> Any:
+    """Loads `entity_id` in a daemon thread, so that a lookup which is never dispatched
+    fails the test instead of hanging it."""
+    nodes: List[Any] = []
+    thread = threading.Thread(
+        target=lambda: nodes.append(loader.load(entity_id, GraphNode)), daemon=True
+    )
+    thread.start()
+    thread.join(timeout=5)
+    assert nodes, "the lookup was never dispatched"
+    return nodes[0]
+
+
+class TestEntityLoader:
+    def test_coalesces_lookups_from_threads(self) -> None:
+        client = LightsparkSyncClient("", "")
+        calls = mock_requester(client._requester)
+        loader = client.entity_loader(window_secs=0.2)
+        ids = ["GraphNode:1", "GraphNode:2", "GraphNode:1", "GraphNode:missing"]
+
+        with ThreadPoolExecutor(max_workers=len(ids)) as executor:
+            nodes = list(executor.map(lambda i: loader.load(i, GraphNode), ids))
+
+        assert [node.id if node else None for node in nodes] == [
+            "GraphNode:1",
+            "GraphNode:2",
+            "GraphNode:1",
+            None,
+        ]
+        assert len(calls) == 1
+        assert sorted(calls[0].values()) == sorted(set(ids))
+
+    def test_load_many_respects_max_batch_size(self) -> None:
+        client = LightsparkSyncClient("", "")
+        calls = mock_requester(client._requester)
+        loader = client.entity_loader(max_batch_size=2)
+
+        nodes = loader.load_many(
+            ["GraphNode:1", "GraphNode:2", "GraphNode:3"], GraphNode
+        )
+
+        assert [node.id for node in nodes] == [
+            "GraphNode:1",
+            "GraphNode:2",
+            "GraphNode:3",
+        ]
+        assert [len(call) for call in calls] == [2, 1]
+
+    def test_load_after_empty_load_many(self) -> None:
+        client = LightsparkSyncClient("", "")
+        calls = mock_requester(client._requester)
+        loader = client.entity_loader()
+
+        assert loader.load_many([], GraphNode) == []
+        assert load_in_thread(loader, "GraphNode:1").id == "GraphNode:1"
+        assert len(calls) == 1
+
+    def test_load_after_cached_load_many(self) -> None:
+        client = LightsparkSyncClient("", "", entity_cache=EntityCache())
+        calls = mock_requester(client._requester)
+        node = client.get_entity("GraphNode:1", GraphNode)
+        loader = client.entity_loader()
+
+        assert loader.load_many(["GraphNode:1"], GraphNode) == [node]
+        assert load_in_thread(loader, "GraphNode:2").id == "GraphNode:2"
+        assert len(calls) == 2
+
+    async def test_coalesces_lookups_from_coroutines(self) -> None:
+        requester = Requester("", "")
+        calls = mock_requester(requester)
+        loader = AsyncEntityLoader(requester)
+        first, second, again = await asyncio.gather(
+            loader.load("GraphNode:1", GraphNode),
+            loader.load("GraphNode:2", GraphNode),
+            loader.load("GraphNode:1", GraphNode),
+        )
+
+        assert first is again
+        assert second.id == "GraphNode:2"
+        assert len(calls) == 1
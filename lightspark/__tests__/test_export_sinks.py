@@ -0,0 +1,92 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Mapping
+
+import pytest
+
+from lightspark import LightsparkSyncClient
+from lightspark.export import CsvSink, NdjsonSink, ParquetSink
+from lightspark.objects.Transaction import Transaction
+from lightspark.objects.Transaction import from_json as Transaction_from_json
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def deposit(index: int) -> Mapping[str, Any]:
+    created_at = (START + timedelta(seconds=index)).isoformat()
+    return {
+        "__typename": "Deposit",
+        "deposit_id": f"Deposit:{index}",
+        "deposit_created_at": created_at,
+        "deposit_updated_at": created_at,
+        "deposit_status": "SUCCESS",
+        "deposit_resolved_at": created_at,
+        "deposit_amount": {
+            "currency_amount_original_value": 1000,
+            "currency_amount_original_unit": "SATOSHI",
+            "currency_amount_preferred_currency_unit": "USD",
+            "currency_amount_preferred_currency_value_rounded": 1,
+            "currency_amount_preferred_currency_value_approx": 1.0,
+        },
+        "deposit_transaction_hash": None,
+        "deposit_fees": None,
+        "deposit_block_hash": "hash",
+        "deposit_block_height": 1,
+        "deposit_destination_addresses": [],
+        "deposit_num_confirmations": 1,
+        "deposit_destination": {"id": "LightsparkNode:1"},
+    }
+
+
+def transactions(count: int) -> List[Transaction]:
+    requester = LightsparkSyncClient("", "")._requester
+    return [Transaction_from_json(requester, deposit(i)) for i in range(count)]
+
+
+class TestExportSinks:
+    def test_ndjson(self) -> None:
+        output = io.StringIO()
+        with NdjsonSink(output, row_group_size=2) as sink:
+            assert sink.write_all(transactions(5)) == 5
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert len(records) == 5
+        assert records[1]["id"] == "Deposit:1"
+        assert records[1]["typename"] == "Deposit"
+        assert records[1]["status"] == "SUCCESS"
+        assert records[1]["amount_msats"] == 1_000_000
+        assert records[1]["fees_msats"] is None
+        assert records[1]["created_at"] == "2023-01-01T00:00:01+00:00"
+        assert records[1]["origin_id"] is None
+
+    def test_csv(self) -> None:
+        output = io.StringIO(newline="")
+        with CsvSink(output, row_group_size=2) as sink:
+            for transaction in transactions(3):
+                sink.write(transaction)
+            # Only the complete row groups have been written so far.
+            assert sink.rows_written == 2
+
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+        assert [row["id"] for row in rows] == ["Deposit:0", "Deposit:1", "Deposit:2"]
+        assert rows[0]["amount_msats"] == "1000000"
+        assert rows[0]["destination_id"] == "LightsparkNode:1"
+
+    def test_parquet(self) -> None:
+        parquet = pytest.importorskip("pyarrow.parquet")
+        output = io.BytesIO()
+        with ParquetSink(output, row_group_size=4) as sink:
+            sink.write_all(transactions(10))
+
+        output.seek(0)
+        file = parquet.ParquetFile(output)
+        assert file.metadata.num_row_groups == 3
+        table = file.read()
+        assert table.column("amount_msats").to_pylist() == [1_000_000] * 10
+        assert table.column("created_at")[0].as_py() == datetime(
+            2023, 1, 1, tzinfo=timezone.utc
+        )
@@ -0,0 +1,228 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import datetime
+import importlib.util
+import json
+import socket
+import ssl
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from lightspark import LightsparkAsyncClient, LightsparkSyncClient
+from lightspark.__tests__.helpers import ACCOUNT, StaticSigningKey
+from lightspark.exceptions import LightsparkException
+from lightspark.requests.transport import HttpxTransport, RequestsTransport, Transport
+
+pytestmark = pytest.mark.skipif(
+    importlib.util.find_spec("h2") is None or importlib.util.find_spec("httpx") is None,
+    reason="httpx and h2 are not installed",
+)
+
+HTTP_HOST = "api.lightspark.test"
+
+
+def write_certificate(directory: Path) -> Path:
+    """Writes a self-signed certificate for HTTP_HOST and its key to a PEM file."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, HTTP_HOST)])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([x509.DNSName(HTTP_HOST)]), False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), True)
+        .add_extension(
+            x509.SubjectKeyIdentifier.from_public_key(key.public_key()), False
+        )
+        .add_extension(
+            x509.AuthorityKeyIdentifier.from_issuer_public_key(key.public_key()), False
+        )
+        .sign(key, hashes.SHA256())
+    )
+    path = directory / "certificate.pem"
+    path.write_bytes(
+        certificate.public_bytes(serialization.Encoding.PEM)
+        + key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return path
+
+
+class H2Server:
+    """A GraphQL server speaking HTTP/2 over TLS, which records the connections it
+    accepts, the server names they asked for and the headers of each request."""
+
+    def __init__(self, certificate: Path) -> None:
+        self.context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        self.context.load_cert_chain(certificate)
+        self.context.set_alpn_protocols(["h2"])
+        self.context.sni_callback = self._record_server_name
+        self.socket = socket.create_server(("127.0.0.1", 0))
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.server_names: List[Optional[str]] = []
+        self.requests: List[Dict[str, str]] = []
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    @property
+    def url(self) -> str:
+        return f"https://127.0.0.1:{self.socket.getsockname()[1]}/graphql/server/2023-09-13"
+
+    def _record_server_name(self, _: Any, server_name: Optional[str], __: Any) -> None:
+        with self.lock:
+            self.server_names.append(server_name)
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                sock, _ = self.socket.accept()
+            except OSError:
+                return
+            with self.lock:
+                self.connections += 1
+            threading.Thread(target=self._serve, args=(sock,), daemon=True).start()
+
+    def _serve(self, sock: socket.socket) -> None:
+        # pylint: disable=import-outside-toplevel
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        try:
+            sock = self.context.wrap_socket(sock, server_side=True)
+            connection = h2.connection.H2Connection(
+                h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+            )
+            connection.initiate_connection()
+            sock.sendall(connection.data_to_send())
+            headers: Dict[int, Dict[str, str]] = {}
+            while True:
+                data = sock.recv(65535)
+                if not data:
+                    return
+                for event in connection.receive_data(data):
+                    if isinstance(event, h2.events.RequestReceived):
+                        headers[event.stream_id] = dict(event.headers)
+                    elif isinstance(event, h2.events.DataReceived):
+                        connection.acknowledge_received_data(
+                            event.flow_controlled_length, event.stream_id
+                        )
+                    elif isinstance(event, h2.events.StreamEnded):
+                        with self.lock:
+                            self.requests.append(headers.pop(event.stream_id))
+                        self._reply(connection, event.stream_id)
+                sock.sendall(connection.data_to_send())
+        except (OSError, ssl.SSLError):
+            return
+        finally:
+            sock.close()
+
+    def _reply(self, connection: Any, stream_id: int) -> None:
+        content = json.dumps({"data": {"current_account": ACCOUNT}}).encode("utf8")
+        connection.send_headers(
+            stream_id,
+            [
+                (":status", "200"),
+                ("content-type", "application/json"),
+                ("content-length", str(len(content))),
+            ],
+        )
+        connection.send_data(stream_id, content, end_stream=True)
+
+    def close(self) -> None:
+        self.socket.close()
+
+
+@pytest.fixture
+def certificate(tmp_path: Path) -> Path:
+    return write_certificate(tmp_path)
+
+
+@pytest.fixture
+def server(certificate: Path) -> Iterator[H2Server]:
+    server = H2Server(certificate)
+    yield server
+    server.close()
+
+
+def http2_transport(certificate: Path) -> HttpxTransport:
+    return HttpxTransport(
+        auth=("id", "secret"),
+        http_host=HTTP_HOST,
+        verify=ssl.create_default_context(cafile=str(certificate)),
+    )
+
+
+class TestHttp2Transport:
+    def test_multiplexes_requests_over_one_connection(
+        self, server: H2Server, certificate: Path
+    ) -> None:
+        client = LightsparkSyncClient(
+            "id", "secret", server.url, transport=http2_transport(certificate)
+        )
+        assert client.get_current_account().name == "Test account"
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            accounts = list(
+                executor.map(lambda _: client.get_current_account(), range(64))
+            )
+
+        assert all(account.name == "Test account" for account in accounts)
+        assert len(server.requests) == 65
+        assert server.connections == 1
+
+    def test_keeps_the_host_and_the_signature(
+        self, server: H2Server, certificate: Path
+    ) -> None:
+        client = LightsparkSyncClient(
+            "id", "secret", server.url, transport=http2_transport(certificate)
+        )
+        client._requester.execute_graphql(
+            "mutation PayInvoice { pay_invoice }", {}, StaticSigningKey()
+        )
+
+        request = server.requests[0]
+        assert server.server_names == [HTTP_HOST]
+        assert request[":authority"] == HTTP_HOST
+        assert request["x-lightspark-signing"] == "signature"
+        assert request["x-graphql-operation"] == "PayInvoice"
+        assert request["authorization"].startswith("Basic ")
+
+    async def test_async_client(self, server: H2Server, certificate: Path) -> None:
+        async with LightsparkAsyncClient(
+            "id", "secret", server.url, transport=http2_transport(certificate)
+        ) as client:
+            account = await client.get_current_account()
+        assert account.name == "Test account"
+        assert server.connections == 1
+
+    def test_transport_selection(self) -> None:
+        client = LightsparkSyncClient("id", "secret")
+        assert isinstance(client._requester.transport, RequestsTransport)
+        client = LightsparkSyncClient("id", "secret", transport="http2")
+        assert isinstance(client._requester.transport, HttpxTransport)
+        with pytest.raises(LightsparkException):
+            LightsparkSyncClient("id", "secret", transport="http3")
+
+    def test_incomplete_transport(self) -> None:
+        class CloseOnlyTransport(Transport):
+            def close(self) -> None:
+                pass
+
+        with pytest.raises(TypeError):
+            CloseOnlyTransport()  # pylint: disable=abstract-class-instantiated
@@ -0,0 +1,79 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import timeit
+
+import pytest
+
+from lightspark.exceptions import LightsparkException
+from lightspark.objects.Account import from_json as Account_from_json
+from lightspark.objects.LightsparkNodeOwner import (
+    from_json as LightsparkNodeOwner_from_json,
+)
+from lightspark.objects.OnChainTransaction import (
+    from_json as OnChainTransaction_from_json,
+)
+from lightspark.objects.Transaction import from_json as Transaction_from_json
+from lightspark.objects.Withdrawal import Withdrawal
+from lightspark.objects.Withdrawal import from_json as Withdrawal_from_json
+
+WITHDRAWAL = {
+    "__typename": "Withdrawal",
+    "withdrawal_id": "Withdrawal:1",
+    "withdrawal_created_at": "2023-01-01T00:00:00+00:00",
+    "withdrawal_updated_at": "2023-01-01T00:00:05+00:00",
+    "withdrawal_status": "SUCCESS",
+    "withdrawal_resolved_at": None,
+    "withdrawal_amount": {
+        "currency_amount_original_value": 1000,
+        "currency_amount_original_unit": "SATOSHI",
+        "currency_amount_preferred_currency_unit": "USD",
+        "currency_amount_preferred_currency_value_rounded": 30,
+        "currency_amount_preferred_currency_value_approx": 30.5,
+    },
+    "withdrawal_transaction_hash": None,
+    "withdrawal_fees": None,
+    "withdrawal_block_hash": None,
+    "withdrawal_block_height": 800000,
+    "withdrawal_destination_addresses": ["bcrt1qexample"],
+    "withdrawal_num_confirmations": None,
+    "withdrawal_origin": {"id": "Wallet:1"},
+}
+
+ACCOUNT = {
+    "__typename": "Account",
+    "account_id": "Account:1",
+    "account_created_at": "2023-01-01T00:00:00+00:00",
+    "account_updated_at": "2023-01-01T00:00:00+00:00",
+    "account_name": "Test account",
+}
+
+
+class TestInterfaceLoader:
+    def test_loads_the_concrete_type(self) -> None:
+        withdrawal = Withdrawal_from_json(None, WITHDRAWAL)
+        assert isinstance(withdrawal, Withdrawal)
+        assert Transaction_from_json(None, WITHDRAWAL) == withdrawal
+        assert OnChainTransaction_from_json(None, WITHDRAWAL) == withdrawal
+        assert LightsparkNodeOwner_from_json(None, ACCOUNT) == Account_from_json(
+            None, ACCOUNT
+        )
+
+    def test_unknown_typename(self) -> None:
+        with pytest.raises(LightsparkException):
+            OnChainTransaction_from_json(None, ACCOUNT)
+
+    @pytest.mark.benchmark
+    def test_dispatch_cost(self) -> None:
+        # Withdrawal was the last branch of Transaction.from_json, which made decoding it
+        # through the interface about twice as slow as through its own loader.
+        page = [WITHDRAWAL] * 1000
+
+        def per_row_micros(loader) -> float:
+            seconds = min(
+                timeit.repeat(lambda: [loader(None, row) for row in page], number=3)
+            )
+            return seconds / 3 / len(page) * 1e6
+
+        concrete = min(per_row_micros(Withdrawal_from_json) for _ in range(2))
+        interface = min(per_row_micros(Transaction_from_json) for _ in range(2))
+        assert interface < concrete * 1.5, (interface, concrete)
@@ -0,0 +1,167 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import importlib.util
+import json
+import timeit
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import pytest
+
+from lightspark.exceptions import LightsparkException
+from lightspark.objects.TransactionStatus import TransactionStatus
+from lightspark.objects.TransactionType import TransactionType
+from lightspark.requests.encoder import Encoder
+from lightspark.requests.json_backend import get_json_backend
+from lightspark.requests.requester import Requester
+from lightspark.utils.signing_key import SigningKey
+from lightspark.webhooks import WebhookEvent
+
+BACKENDS = [
+    pytest.param(
+        name,
+        marks=pytest.mark.skipif(
+            importlib.util.find_spec(name) is None, reason=f"{name} is not installed"
+        ),
+    )
+    for name in ("json", "orjson", "ujson", "simdjson")
+]
+
+VARIABLES = {
+    "entity_id": "Account:1",
+    "first": 500,
+    "types": [TransactionType.OUTGOING_PAYMENT, TransactionType.INCOMING_PAYMENT],
+    "statuses": [TransactionStatus.SUCCESS],
+    "after_date": datetime(2023, 7, 30, 6, 18, 7, 162759),
+    "before_date": datetime(2023, 8, 1, tzinfo=timezone(timedelta(hours=2))),
+    "memo": "Café ☕ / <b>",
+}
+
+
+class RecordingSigningKey(SigningKey):
+    def __init__(self) -> None:
+        self.key = b""
+        self.payloads: List[bytes] = []
+
+    def sign_payload(self, payload: bytes) -> str:
+        self.payloads.append(payload)
+        return "signature"
+
+
+def transactions_response(rows: int) -> bytes:
+    """A FetchAccountToTransactionsConnection response with `rows` transactions."""
+
+    def amount(value: int) -> Dict[str, Any]:
+        return {
+            "__typename": "CurrencyAmount",
+            "currency_amount_original_value": value,
+            "currency_amount_original_unit": "MILLISATOSHI",
+            "currency_amount_preferred_currency_unit": "USD",
+            "currency_amount_preferred_currency_value_rounded": value // 3000,
+            "currency_amount_preferred_currency_value_approx": value / 3000,
+        }
+
+    entities: List[Dict[str, Any]] = [
+        {
+            "__typename": "OutgoingPayment",
+            "outgoing_payment_id": f"OutgoingPayment:{i}",
+            "outgoing_payment_created_at": f"2023-07-30T06:{i % 60:02}:07.162759+00:00",
+            "outgoing_payment_updated_at": f"2023-07-30T06:{i % 60:02}:09.000001+00:00",
+            "outgoing_payment_status": "SUCCESS",
+            "outgoing_payment_resolved_at": "2023-07-30T06:18:09+00:00",
+            "outgoing_payment_amount": amount(1000 * i),
+            "outgoing_payment_transaction_hash": f"{i:064x}",
+            "outgoing_payment_is_uma": False,
+            "outgoing_payment_origin": {"id": "LightsparkNodeWithOSK:1"},
+            "outgoing_payment_destination": {"id": f"GraphNode:{i}"},
+            "outgoing_payment_fees": amount(i),
+            "outgoing_payment_payment_request_data": None,
+            "outgoing_payment_failure_reason": None,
+            "outgoing_payment_failure_message": None,
+            "outgoing_payment_uma_post_transaction_data": None,
+            "outgoing_payment_payment_preimage": f"{i:064x}",
+            "outgoing_payment_is_internal_payment": False,
+        }
+        for i in range(rows)
+    ]
+    return json.dumps(
+        {
+            "data": {
+                "entity": {
+                    "transactions": {
+                        "__typename": "AccountToTransactionsConnection",
+                        "account_to_transactions_connection_count": rows,
+                        "account_to_transactions_connection_entities": entities,
+                    }
+                }
+            }
+        }
+    ).encode("utf8")
+
+
+def micros(function: Any) -> float:
+    return min(timeit.repeat(function, number=5, repeat=5)) / 5 * 1e6
+
+
+class TestJsonBackend:
+    @pytest.mark.parametrize("name", BACKENDS)
+    def test_encodes_like_the_encoder(self, name: str) -> None:
+        backend = get_json_backend(name)
+        encoded = backend.dumps(VARIABLES)
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == json.loads(json.dumps(VARIABLES, cls=Encoder))
+        assert backend.loads(encoded) == backend.loads(encoded.decode("utf8"))
+
+    @pytest.mark.parametrize("name", BACKENDS)
+    def test_signed_requests(self, name: str) -> None:
+        requester = Requester("", "", json_backend=name)
+        signing_key = RecordingSigningKey()
+        payload, headers = requester._build_request(
+            "mutation PayInvoice($node_id: ID!) { pay_invoice }", VARIABLES, signing_key
+        )
+        # The signature covers the exact bytes which are sent.
+        assert signing_key.payloads == [payload]
+        assert headers["X-Lightspark-Signing"] == "signature"
+        body = json.loads(payload)
+        assert body["operationName"] == "PayInvoice"
+        assert body["variables"]["after_date"] == "2023-07-30T06:18:07.162759+00:00"
+        assert body["variables"]["types"] == ["OUTGOING_PAYMENT", "INCOMING_PAYMENT"]
+        assert isinstance(body["nonce"], int)
+
+    @pytest.mark.parametrize("name", BACKENDS)
+    def test_parses_responses(self, name: str) -> None:
+        backend = get_json_backend(name)
+        response = transactions_response(3)
+        assert backend.loads(response) == json.loads(response)
+
+    def test_webhook_event(self) -> None:
+        event = WebhookEvent.parse(
+            b'{"event_type": "NODE_STATUS", "event_id": "1", "timestamp":'
+            + b' "2023-07-30T06:18:07+00:00", "entity_id": "Node:1"}'
+        )
+        assert event.entity_id == "Node:1"
+        assert event.wallet_id is None
+
+    def test_backend_selection(self) -> None:
+        assert get_json_backend("json").name == "json"
+        if importlib.util.find_spec("orjson") is not None:
+            assert get_json_backend().name == "orjson"
+        with pytest.raises(LightsparkException):
+            get_json_backend("yaml")
+
+    @pytest.mark.benchmark
+    @pytest.mark.skipif(
+        importlib.util.find_spec("orjson") is None, reason="orjson is not installed"
+    )
+    def test_cost(self) -> None:
+        # A 500-row page of transactions, and the variables of a request for it.
+        response = transactions_response(500)
+        variables = {**VARIABLES, "entity_ids": [f"Account:{i}" for i in range(500)]}
+        stdlib, fast = get_json_backend("json"), get_json_backend("orjson")
+
+        assert micros(lambda: fast.loads(response)) * 1.3 < micros(
+            lambda: stdlib.loads(response)
+        )
+        assert micros(lambda: fast.dumps(variables)) * 1.3 < micros(
+            lambda: stdlib.dumps(variables)
+        )
@@ -0,0 +1,92 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import json
+import subprocess
+import sys
+from typing import Any, List
+
+import pytest
+
+import lightspark
+from lightspark.objects.all_entities import ALL_FRAGMENTS, ALL_JSON_LOADERS
+from lightspark.objects.Entity import Entity
+from lightspark.objects.Wallet import FRAGMENT as WalletFragment
+from lightspark.objects.Wallet import Wallet
+
+
+def run(code: str) -> Any:
+    """Runs `code` in a fresh interpreter and returns the JSON it prints."""
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def loaded_modules(statement: str) -> List[str]:
+    return run(
+        "import json, sys\n"
+        + f"{statement}\n"
+        + "print(json.dumps([m for m in sys.modules if m.startswith('lightspark')]))"
+    )
+
+
+def import_time_micros(statement: str) -> int:
+    """The best of 3 wall times of `statement` in a fresh interpreter."""
+    return min(
+        run(
+            "import json, time\n"
+            + "start = time.perf_counter()\n"
+            + f"{statement}\n"
+            + "print(json.dumps(int((time.perf_counter() - start) * 1e6)))"
+        )
+        for _ in range(3)
+    )
+
+
+class TestLazyImports:
+    def test_import_does_not_load_objects(self) -> None:
+        modules = loaded_modules("import lightspark")
+        assert not [m for m in modules if m.startswith("lightspark.objects.")]
+        assert "lightspark.lightspark_client" not in modules
+
+    def test_client_does_not_load_every_entity(self) -> None:
+        modules = loaded_modules("from lightspark import LightsparkSyncClient")
+        assert "lightspark.objects.RegionCode" not in modules
+        assert "lightspark.objects.RoutingTransaction" not in modules
+        # The objects returned by the client and the queries which fetch them are
+        # loaded when they are first used.
+        assert "lightspark.objects.Account" not in modules
+        assert "lightspark.scripts.pay_invoice" not in modules
+        assert len([m for m in modules if m.startswith("lightspark.objects.")]) < 10
+
+    @pytest.mark.benchmark
+    def test_import_time(self) -> None:
+        # Importing the package must stay much cheaper than loading all of its names.
+        lazy = import_time_micros("import lightspark")
+        eager = import_time_micros("import lightspark; lightspark.__all__")
+        assert lazy * 5 < eager, (lazy, eager)
+
+    def test_public_names(self) -> None:
+        assert lightspark.Wallet is Wallet
+        assert lightspark.LightsparkSyncClient.__module__ == (
+            "lightspark.lightspark_client"
+        )
+        assert lightspark.PAY_INVOICE_MUTATION
+        assert lightspark.Invoice_from_json is lightspark.objects.Invoice.from_json
+        assert {"CURRENT_ACCOUNT_QUERY", "Account_from_json", "get_entity"} <= set(
+            lightspark.__all__
+        )
+        assert lightspark.objects.Wallet.Wallet is Wallet
+        assert {"Wallet", "RegionCode", "WebhookEvent", "LightsparkAsyncClient"} <= set(
+            lightspark.__all__
+        )
+        assert run(
+            "import json\nfrom lightspark import *\n"
+            + "print(json.dumps([RegionCode.US.value, SIGNATURE_HEADER]))"
+        ) == ["US", "lightspark-signature"]
+
+    def test_entity_registry(self) -> None:
+        assert ALL_FRAGMENTS[Wallet] == WalletFragment
+        assert Entity in ALL_FRAGMENTS
+        assert Entity not in ALL_JSON_LOADERS
+        assert len(list(ALL_JSON_LOADERS)) == len(ALL_JSON_LOADERS) == 31
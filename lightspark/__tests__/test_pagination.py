@@ -0,0 +1,127 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import threading
+from typing import Any, Dict, List, Mapping
+
+import pytest
+
+from lightspark import LightsparkSyncClient
+from lightspark.__tests__.helpers import ACCOUNT
+from lightspark.objects.Account import Account
+from lightspark.objects.Account import from_json as Account_from_json
+
+
+def api_tokens_page(page: int, last_page: int) -> Mapping[str, Any]:
+    return {
+        "entity": {
+            "api_tokens": {
+                "__typename": "AccountToApiTokensConnection",
+                "account_to_api_tokens_connection_count": 2 * (last_page + 1),
+                "account_to_api_tokens_connection_page_info": {
+                    "__typename": "PageInfo",
+                    "page_info_has_next_page": page < last_page,
+                    "page_info_has_previous_page": page > 0,
+                    "page_info_start_cursor": f"cursor{page}a",
+                    "page_info_end_cursor": f"cursor{page}b",
+                },
+                "account_to_api_tokens_connection_entities": [
+                    {
+                        "__typename": "ApiToken",
+                        "api_token_id": f"ApiToken:{page}{suffix}",
+                        "api_token_created_at": "2023-07-30T06:18:07+00:00",
+                        "api_token_updated_at": "2023-07-30T06:18:07+00:00",
+                        "api_token_client_id": "client",
+                        "api_token_name": f"Token {page}{suffix}",
+                        "api_token_permissions": ["ALL"],
+                        "api_token_is_deleted": False,
+                    }
+                    for suffix in "ab"
+                ],
+            }
+        }
+    }
+
+
+def page_of(variables: Mapping[str, Any]) -> int:
+    after = variables["after"]
+    return 0 if after is None else int(after[len("cursor") : -1]) + 1
+
+
+class MockAccount:
+    def __init__(self, last_page: int) -> None:
+        self.client = LightsparkSyncClient("", "")
+        self.account: Account = Account_from_json(self.client._requester, ACCOUNT)
+        self.variables: List[Dict[str, Any]] = []
+        self.fetched = threading.Semaphore(0)
+
+        def execute_graphql(
+            query: str, variables: Mapping[str, Any], signing_key=None, timeout=None
+        ) -> Mapping[str, Any]:
+            self.variables.append(dict(variables))
+            self.fetched.release()
+            return api_tokens_page(page_of(variables), last_page)
+
+        async def execute_graphql_async(
+            query: str, variables: Mapping[str, Any], signing_key=None, timeout=None
+        ) -> Mapping[str, Any]:
+            return execute_graphql(query, variables, signing_key)
+
+        self.client._requester.execute_graphql = execute_graphql
+        self.client._requester.execute_graphql_async = execute_graphql_async
+
+
+class TestPagination:
+    @pytest.mark.parametrize("prefetch", [0, 1, 3])
+    def test_iterates_over_every_page(self, prefetch: int) -> None:
+        mock = MockAccount(last_page=3)
+
+        names = [
+            token.name
+            for token in mock.account.iter_api_tokens(page_size=2, prefetch=prefetch)
+        ]
+
+        assert names == [
+            f"Token {page}{suffix}" for page in range(4) for suffix in "ab"
+        ]
+        assert [v["after"] for v in mock.variables] == [
+            None,
+            "cursor0b",
+            "cursor1b",
+            "cursor2b",
+        ]
+        assert all(v["first"] == 2 for v in mock.variables)
+
+    def test_prefetches_the_next_page(self) -> None:
+        mock = MockAccount(last_page=10)
+
+        tokens = mock.account.iter_api_tokens(prefetch=2)
+        next(tokens)
+        # While the first page is consumed, the two following pages are fetched.
+        for _ in range(3):
+            assert mock.fetched.acquire(timeout=5)
+        assert not mock.fetched.acquire(timeout=0.1)
+        tokens.close()
+
+    def test_propagates_errors(self) -> None:
+        mock = MockAccount(last_page=3)
+
+        def fail(*args: Any, **kwargs: Any) -> Mapping[str, Any]:
+            raise RuntimeError("boom")
+
+        mock.client._requester.execute_graphql = fail
+        with pytest.raises(RuntimeError):
+            list(mock.account.iter_api_tokens())
+
+    @pytest.mark.parametrize("prefetch", [0, 2])
+    async def test_async_iterates_over_every_page(self, prefetch: int) -> None:
+        mock = MockAccount(last_page=2)
+
+        names = [
+            token.name
+            async for token in mock.account.iter_api_tokens_async(prefetch=prefetch)
+        ]
+
+        assert names == [
+            f"Token {page}{suffix}" for page in range(3) for suffix in "ab"
+        ]
+        assert len(mock.variables) == 3
@@ -0,0 +1,114 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+from hashlib import sha256
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from lightspark import LightsparkAsyncClient, LightsparkSyncClient
+from lightspark.__tests__.helpers import GraphQLHandler, GraphQLServer, serve
+
+
+class PersistedQueriesServer(GraphQLServer):
+    """A GraphQL server implementing the automatic persisted queries protocol."""
+
+    def __init__(self, supported: bool = True) -> None:
+        super().__init__()
+        self.supported = supported
+        self.documents: Dict[str, str] = {}
+        self.request_sizes: List[int] = []
+
+    def respond(self, handler: GraphQLHandler, request: Dict[str, Any]) -> None:
+        self.request_sizes.append(len(handler.body))
+        persisted = request.get("extensions", {}).get("persistedQuery")
+        document = request.get("query")
+        if persisted and not self.supported:
+            return handler.send_json(
+                {"errors": [{"message": "PersistedQueryNotSupported"}]}, 400
+            )
+        if persisted:
+            sha256_hash = persisted["sha256Hash"]
+            if document is None:
+                document = self.documents.get(sha256_hash)
+                if document is None:
+                    return handler.send_json(
+                        {
+                            "errors": [
+                                {
+                                    "message": "PersistedQueryNotFound",
+                                    "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+                                }
+                            ]
+                        }
+                    )
+            elif sha256(document.encode("utf8")).hexdigest() != sha256_hash:
+                return handler.send_json(
+                    {"errors": [{"message": "Hash mismatch"}]}, 400
+                )
+            else:
+                self.documents[sha256_hash] = document
+
+        assert "GetCurrentAccount" in document
+        return super().respond(handler, request)
+
+
+@pytest.fixture
+def server() -> Iterator[PersistedQueriesServer]:
+    yield from serve(PersistedQueriesServer())
+
+
+@pytest.fixture
+def unsupported_server() -> Iterator[PersistedQueriesServer]:
+    yield from serve(PersistedQueriesServer(supported=False))
+
+
+class TestPersistedQueries:
+    def test_sends_the_document_only_when_the_hash_is_unknown(
+        self, server: PersistedQueriesServer
+    ) -> None:
+        client = LightsparkSyncClient(
+            "id", "secret", server.url, persisted_queries=True
+        )
+
+        assert client.get_current_account().name == "Test account"
+        assert [("query" in request) for request in server.requests] == [False, True]
+
+        assert client.get_current_account().name == "Test account"
+        assert len(server.requests) == 3
+        assert "query" not in server.requests[2]
+        assert server.request_sizes[2] < 250
+
+    def test_disabled_by_default(self, server: PersistedQueriesServer) -> None:
+        client = LightsparkSyncClient("id", "secret", server.url)
+
+        client.get_current_account()
+        assert len(server.requests) == 1
+        assert "query" in server.requests[0]
+        assert "extensions" not in server.requests[0]
+
+    def test_falls_back_when_the_server_does_not_support_it(
+        self, unsupported_server: PersistedQueriesServer
+    ) -> None:
+        client = LightsparkSyncClient(
+            "id", "secret", unsupported_server.url, persisted_queries=True
+        )
+
+        client.get_current_account()
+        client.get_current_account()
+        assert [("extensions" in r) for r in unsupported_server.requests] == [
+            True,
+            False,
+            False,
+        ]
+
+    async def test_async_client(self, server: PersistedQueriesServer) -> None:
+        async with LightsparkAsyncClient(
+            "id", "secret", server.url, persisted_queries=True
+        ) as client:
+            await client.get_current_account()
+            await client.get_current_account()
+        assert [("query" in request) for request in server.requests] == [
+            False,
+            True,
+            False,
+        ]
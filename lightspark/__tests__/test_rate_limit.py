@@ -0,0 +1,194 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List
+
+import pytest
+
+from lightspark import LightsparkSyncClient
+from lightspark.__tests__.helpers import ACCOUNT, GraphQLHandler, GraphQLServer, serve
+from lightspark.exceptions import LightsparkTimeoutException
+from lightspark.objects.Account import from_json as Account_from_json
+from lightspark.requests.rate_limit import (
+    ALL_OPERATIONS,
+    OperationLimit,
+    Priority,
+    RateLimiter,
+    priority_scope,
+)
+
+
+class ConcurrencyServer(GraphQLServer):
+    """A GraphQL server which records how many requests it handles at the same time."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def respond(self, handler: GraphQLHandler, request: Dict[str, Any]) -> None:
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        super().respond(handler, request)
+
+
+@pytest.fixture
+def server() -> Iterator[ConcurrencyServer]:
+    yield from serve(ConcurrencyServer())
+
+
+class ApiTokensServer(GraphQLServer):
+    """A GraphQL server replying to the requests for the API tokens of an account with a
+    single empty page."""
+
+    def respond(self, handler: GraphQLHandler, request: Dict[str, Any]) -> None:
+        if request["operationName"] != "FetchAccountToApiTokensConnection":
+            return super().respond(handler, request)
+        connection = {
+            "__typename": "AccountToApiTokensConnection",
+            "account_to_api_tokens_connection_count": 0,
+            "account_to_api_tokens_connection_page_info": {
+                "__typename": "PageInfo",
+                "page_info_has_next_page": False,
+                "page_info_has_previous_page": False,
+                "page_info_start_cursor": None,
+                "page_info_end_cursor": None,
+            },
+            "account_to_api_tokens_connection_entities": [],
+        }
+        return handler.send_json({"data": {"entity": {"api_tokens": connection}}})
+
+
+@pytest.fixture
+def api_tokens_server() -> Iterator[ApiTokensServer]:
+    yield from serve(ApiTokensServer())
+
+
+def wait_until(condition: Callable[[], bool]) -> None:
+    for _ in range(500):
+        if condition():
+            return
+        time.sleep(0.002)
+    raise AssertionError("Timed out")
+
+
+class TestRateLimit:
+    def test_max_in_flight(self, server: ConcurrencyServer) -> None:
+        client = LightsparkSyncClient(
+            "id",
+            "secret",
+            server.url,
+            rate_limiter=RateLimiter(
+                {"GetCurrentAccount": OperationLimit(max_in_flight=2)}
+            ),
+        )
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: client.get_current_account(), range(16)))
+
+        assert server.max_in_flight == 2
+        stats = client.rate_limit_stats()["GetCurrentAccount"]
+        assert (stats.calls, stats.in_flight, stats.waiting) == (16, 0, 0)
+        assert stats.max_wait_secs > 0.02
+        assert 0 < stats.mean_wait_secs <= stats.max_wait_secs
+
+    def test_rate(self) -> None:
+        limiter = RateLimiter({ALL_OPERATIONS: OperationLimit(rate=100, burst=5)})
+        start = time.monotonic()
+        for _ in range(15):
+            limiter.acquire("GetCurrentAccount")()
+        # A burst of 5 calls, then 10 more at 100 per second.
+        assert 0.09 <= time.monotonic() - start < 1
+        assert limiter.stats()[ALL_OPERATIONS].calls == 15
+
+    def test_interactive_calls_go_first(self) -> None:
+        limiter = RateLimiter({"Export": OperationLimit(max_in_flight=1)})
+        stats = limiter.stats
+        release = limiter.acquire("Export")
+        order: List[str] = []
+
+        def call(name: str, priority: Priority) -> None:
+            with priority_scope(priority):
+                limiter.acquire("Export")()
+            order.append(name)
+
+        threads = []
+        for name, priority in [
+            ("batch 1", Priority.BATCH),
+            ("batch 2", Priority.BATCH),
+            ("interactive", Priority.INTERACTIVE),
+        ]:
+            thread = threading.Thread(target=call, args=(name, priority))
+            thread.start()
+            threads.append(thread)
+            wait_until(lambda: stats()["Export"].waiting == len(threads))
+        release()
+        for thread in threads:
+            thread.join()
+
+        assert order == ["interactive", "batch 1", "batch 2"]
+
+    def test_iterators_keep_the_priority_of_the_caller(
+        self, api_tokens_server: ApiTokensServer
+    ) -> None:
+        limiter = RateLimiter({ALL_OPERATIONS: OperationLimit(max_in_flight=1)})
+        client = LightsparkSyncClient(
+            "id", "secret", api_tokens_server.url, rate_limiter=limiter
+        )
+        account = Account_from_json(client._requester, ACCOUNT)
+        release = limiter.acquire(None)
+
+        def iterate() -> None:
+            with client.priority(Priority.BATCH):
+                list(account.iter_api_tokens())
+
+        threads = []
+        for target in [iterate, client.get_current_account]:
+            thread = threading.Thread(target=target)
+            thread.start()
+            threads.append(thread)
+            wait_until(lambda: limiter.stats()[ALL_OPERATIONS].waiting == len(threads))
+        release()
+        for thread in threads:
+            thread.join()
+
+        # The page prefetched by the iterator waited behind the interactive call.
+        assert [r["operationName"] for r in api_tokens_server.requests] == [
+            "GetCurrentAccount",
+            "FetchAccountToApiTokensConnection",
+        ]
+
+    async def test_async_interactive_calls_go_first(self) -> None:
+        limiter = RateLimiter({ALL_OPERATIONS: OperationLimit(rate=100, burst=1)})
+        order: List[str] = []
+
+        async def call(name: str, priority: Priority) -> None:
+            with priority_scope(priority):
+                (await limiter.acquire_async("FetchTransactions"))()
+            order.append(name)
+
+        # The first call takes the only token, and the others wait for the next ones.
+        await call("first", Priority.BATCH)
+        await asyncio.gather(
+            call("batch", Priority.BATCH),
+            call("interactive", Priority.INTERACTIVE),
+        )
+        assert order == ["first", "interactive", "batch"]
+
+    def test_deadline_bounds_the_wait(self, server: ConcurrencyServer) -> None:
+        limiter = RateLimiter({ALL_OPERATIONS: OperationLimit(max_in_flight=1)})
+        client = LightsparkSyncClient("id", "secret", server.url, rate_limiter=limiter)
+        release = limiter.acquire(None)
+        with pytest.raises(LightsparkTimeoutException):
+            with client.timeout(total=0.1):
+                client.get_current_account()
+        release()
+
+        assert limiter.stats()[ALL_OPERATIONS].waiting == 0
+        assert client.get_current_account().name == "Test account"
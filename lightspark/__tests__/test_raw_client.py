@@ -0,0 +1,104 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+from typing import Any, Dict, List, Mapping
+
+from lightspark import LightsparkAsyncClient, LightsparkSyncClient
+from lightspark.__tests__.helpers import ACCOUNT
+from lightspark.entity_cache import EntityCache
+from lightspark.objects.Account import Account
+from lightspark.objects.Account import from_json as Account_from_json
+
+
+def api_tokens_page(after: Any) -> Mapping[str, Any]:
+    page = 0 if after is None else 1
+    return {
+        "entity": {
+            "api_tokens": {
+                "__typename": "AccountToApiTokensConnection",
+                "account_to_api_tokens_connection_count": 2,
+                "account_to_api_tokens_connection_page_info": {
+                    "__typename": "PageInfo",
+                    "page_info_has_next_page": page == 0,
+                    "page_info_has_previous_page": page == 1,
+                    "page_info_start_cursor": f"cursor{page}",
+                    "page_info_end_cursor": f"cursor{page}",
+                },
+                "account_to_api_tokens_connection_entities": [
+                    {"__typename": "ApiToken", "api_token_id": f"ApiToken:{page}"}
+                ],
+            }
+        }
+    }
+
+
+def mock_requester(client: Any) -> List[Dict[str, Any]]:
+    calls: List[Dict[str, Any]] = []
+
+    def execute_graphql(
+        query: str, variables: Mapping[str, Any], signing_key=None, timeout=None
+    ) -> Mapping[str, Any]:
+        calls.append(dict(variables))
+        if "current_account" in query:
+            return {"current_account": ACCOUNT}
+        if "GetEntity" in query:
+            return {"entity": ACCOUNT}
+        return api_tokens_page(variables["after"])
+
+    async def execute_graphql_async(
+        query: str, variables: Mapping[str, Any], signing_key=None, timeout=None
+    ) -> Mapping[str, Any]:
+        return execute_graphql(query, variables, signing_key)
+
+    client._requester.execute_graphql = execute_graphql
+    client._requester.execute_graphql_async = execute_graphql_async
+    return calls
+
+
+class TestRawClient:
+    def test_returns_the_data_of_the_response(self) -> None:
+        client = LightsparkSyncClient("", "", raw=True)
+        mock_requester(client)
+
+        assert client.get_current_account() == {"current_account": ACCOUNT}
+
+    def test_bound_entities_return_raw_pages(self) -> None:
+        client = LightsparkSyncClient("", "", raw=True)
+        calls = mock_requester(client)
+        account = client.bind(Account_from_json(None, ACCOUNT))
+
+        assert account.get_api_tokens(first=1) == api_tokens_page(None)
+        assert [token["api_token_id"] for token in account.iter_api_tokens()] == [
+            "ApiToken:0",
+            "ApiToken:1",
+        ]
+        assert [call["after"] for call in calls] == [None, None, "cursor0"]
+
+    def test_batches_return_raw_results(self) -> None:
+        client = LightsparkSyncClient("", "", raw=True)
+        mock_requester(client)
+
+        with client.batch() as batch:
+            account = batch.add(client.get_current_account_query())
+
+        assert account.result() == {"current_account": ACCOUNT}
+
+    def test_skips_the_entity_cache(self) -> None:
+        cache = EntityCache()
+        client = LightsparkSyncClient("", "", entity_cache=cache, raw=True)
+        calls = mock_requester(client)
+
+        assert client.get_entity("Account:1", Account) == {"entity": ACCOUNT}
+        assert client.get_entity("Account:1", Account) == {"entity": ACCOUNT}
+        assert len(calls) == 2
+        assert "Account:1" not in cache
+
+    async def test_async_client(self) -> None:
+        async with LightsparkAsyncClient("", "", raw=True) as client:
+            mock_requester(client)
+            account = client.bind(Account_from_json(None, ACCOUNT))
+
+            assert await client.get_current_account() == {"current_account": ACCOUNT}
+            assert [
+                token["api_token_id"]
+                async for token in account.iter_api_tokens_async(prefetch=0)
+            ] == ["ApiToken:0", "ApiToken:1"]
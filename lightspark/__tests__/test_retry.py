@@ -0,0 +1,233 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+import pytest
+
+from lightspark import LightsparkAsyncClient, LightsparkSyncClient
+from lightspark.__tests__.helpers import (
+    ACCOUNT,
+    GraphQLHandler,
+    GraphQLServer,
+    StaticSigningKey,
+    serve,
+)
+from lightspark.exceptions import LightsparkConnectionException, LightsparkHTTPException
+from lightspark.requests.retry import Retrier, RetryPolicy
+
+# Retries without waiting.
+POLICY = RetryPolicy(initial_backoff_secs=0.001, jitter=0)
+
+# Closes the connection without responding.
+RESET = "RESET"
+
+
+def payment(status: str) -> Dict[str, Any]:
+    amount = {
+        "__typename": "CurrencyAmount",
+        "currency_amount_original_value": 1000,
+        "currency_amount_original_unit": "MILLISATOSHI",
+        "currency_amount_preferred_currency_unit": "USD",
+        "currency_amount_preferred_currency_value_rounded": 0,
+        "currency_amount_preferred_currency_value_approx": 0.03,
+    }
+    return {
+        "__typename": "OutgoingPayment",
+        "outgoing_payment_id": f"OutgoingPayment:{status}",
+        "outgoing_payment_created_at": "2023-07-30T06:18:07.162759+00:00",
+        "outgoing_payment_updated_at": "2023-07-30T06:18:09.000001+00:00",
+        "outgoing_payment_status": status,
+        "outgoing_payment_resolved_at": None,
+        "outgoing_payment_amount": amount,
+        "outgoing_payment_transaction_hash": None,
+        "outgoing_payment_is_uma": False,
+        "outgoing_payment_origin": {"id": "LightsparkNodeWithOSK:1"},
+        "outgoing_payment_destination": None,
+        "outgoing_payment_fees": amount,
+        "outgoing_payment_payment_request_data": None,
+        "outgoing_payment_failure_reason": None,
+        "outgoing_payment_failure_message": None,
+        "outgoing_payment_uma_post_transaction_data": None,
+        "outgoing_payment_payment_preimage": None,
+        "outgoing_payment_is_internal_payment": False,
+    }
+
+
+def payments(*statuses: str) -> Dict[str, Any]:
+    return {
+        "outgoing_payments_for_invoice": {
+            "payments": [payment(status) for status in statuses]
+        }
+    }
+
+
+class ScriptedServer(GraphQLServer):
+    """A GraphQL server which replies to each operation with the next response of its
+    script: an HTTP status, RESET, or the `data` of the response."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.script: Dict[str, List[Any]] = {}
+        self.operations: List[str] = []
+
+    def respond(self, handler: GraphQLHandler, request: Dict[str, Any]) -> None:
+        operation = request["operationName"]
+        self.operations.append(operation)
+        response = self.script[operation].pop(0)
+        if response == RESET:
+            handler.close_connection = True
+        elif isinstance(response, int):
+            handler.send_json({}, response)
+        else:
+            handler.send_json({"data": response})
+
+
+@pytest.fixture
+def server() -> Iterator[ScriptedServer]:
+    yield from serve(ScriptedServer())
+
+
+def client(
+    server: ScriptedServer, retry_policy: Optional[RetryPolicy] = POLICY
+) -> LightsparkSyncClient:
+    client = LightsparkSyncClient("id", "secret", server.url, retry_policy=retry_policy)
+    client.load_node_signing_key("LightsparkNode:1", StaticSigningKey())
+    return client
+
+
+def pay(client: LightsparkSyncClient) -> Any:
+    return client.pay_invoice(
+        "LightsparkNode:1", "lnbc1", timeout_secs=60, maximum_fees_msats=100
+    )
+
+
+class TestRetry:
+    def test_retries_transient_query_errors(self, server: ScriptedServer) -> None:
+        server.script["GetCurrentAccount"] = [503, RESET, {"current_account": ACCOUNT}]
+        assert client(server).get_current_account().name == "Test account"
+        assert len(server.operations) == 3
+
+    def test_gives_up_after_max_attempts(self, server: ScriptedServer) -> None:
+        server.script["GetCurrentAccount"] = [502, 503, 504]
+        with pytest.raises(LightsparkHTTPException):
+            client(server).get_current_account()
+        assert len(server.operations) == 3
+
+    def test_does_not_retry_other_errors(self, server: ScriptedServer) -> None:
+        server.script["GetCurrentAccount"] = [500, {"current_account": ACCOUNT}]
+        with pytest.raises(LightsparkHTTPException):
+            client(server).get_current_account()
+        assert len(server.operations) == 1
+
+    def test_disabled(self, server: ScriptedServer) -> None:
+        server.script["GetCurrentAccount"] = [RESET]
+        with pytest.raises(LightsparkConnectionException):
+            client(server, retry_policy=None).get_current_account()
+
+    def test_does_not_retry_unchecked_mutations(self, server: ScriptedServer) -> None:
+        server.script["SendPayment"] = [503]
+        with pytest.raises(LightsparkHTTPException):
+            client(server).send_payment(
+                "LightsparkNode:1", "02abcd", 1000, 60, maximum_fees_msats=100
+            )
+        assert server.operations == ["SendPayment"]
+
+    def test_pay_invoice_returns_the_payment_in_flight(
+        self, server: ScriptedServer
+    ) -> None:
+        server.script["PayInvoice"] = [RESET]
+        server.script["OutgoingPaymentsForInvoice"] = [payments("FAILED", "PENDING")]
+        assert pay(client(server)).id == "OutgoingPayment:PENDING"
+        assert server.operations == ["PayInvoice", "OutgoingPaymentsForInvoice"]
+
+    def test_pay_invoice_is_resent_without_payment(
+        self, server: ScriptedServer
+    ) -> None:
+        server.script["PayInvoice"] = [
+            502,
+            {"pay_invoice": {"payment": payment("PENDING")}},
+        ]
+        server.script["OutgoingPaymentsForInvoice"] = [payments("FAILED")]
+        assert pay(client(server)).id == "OutgoingPayment:PENDING"
+        assert server.operations == [
+            "PayInvoice",
+            "OutgoingPaymentsForInvoice",
+            "PayInvoice",
+        ]
+
+    async def test_async_client(self, server: ScriptedServer) -> None:
+        server.script["GetCurrentAccount"] = [503, {"current_account": ACCOUNT}]
+        server.script["PayInvoice"] = [503]
+        server.script["OutgoingPaymentsForInvoice"] = [payments("SUCCESS")]
+        async with LightsparkAsyncClient(
+            "id", "secret", server.url, retry_policy=POLICY
+        ) as async_client:
+            async_client.load_node_signing_key("LightsparkNode:1", StaticSigningKey())
+            account = await async_client.get_current_account()
+            payment_ = await async_client.pay_invoice(
+                "LightsparkNode:1", "lnbc1", timeout_secs=60, maximum_fees_msats=100
+            )
+        assert account.name == "Test account"
+        assert payment_.id == "OutgoingPayment:SUCCESS"
+
+    def test_pay_invoice_retries_spend_the_budget(self, server: ScriptedServer) -> None:
+        server.script["PayInvoice"] = [503, 503, 503]
+        server.script["OutgoingPaymentsForInvoice"] = [payments("FAILED")]
+        policy = RetryPolicy(
+            max_attempts=3,
+            initial_backoff_secs=0.001,
+            jitter=0,
+            budget_ratio=1,
+            budget_max_tokens=1,
+        )
+        with pytest.raises(LightsparkHTTPException):
+            pay(client(server, retry_policy=policy))
+        # The call earned a single retry, which the check did not refill.
+        assert server.operations == [
+            "PayInvoice",
+            "OutgoingPaymentsForInvoice",
+            "PayInvoice",
+        ]
+
+    def test_pay_invoice_retries_stop_at_the_deadline(
+        self, server: ScriptedServer
+    ) -> None:
+        server.script["PayInvoice"] = [503]
+        slow_client = client(
+            server, retry_policy=RetryPolicy(initial_backoff_secs=1, jitter=0)
+        )
+        start = time.monotonic()
+        with pytest.raises(LightsparkHTTPException):
+            with slow_client.timeout(total=0.5):
+                pay(slow_client)
+        assert time.monotonic() - start < 1
+        assert server.operations == ["PayInvoice"]
+
+    def test_budget(self) -> None:
+        retrier = Retrier(RetryPolicy(budget_max_tokens=2, budget_ratio=0.5))
+        error = LightsparkHTTPException(503, "Service unavailable")
+        assert retrier.delay(error, 0) is not None
+        assert retrier.delay(error, 0) is not None
+        # The budget is spent, until calls refill it.
+        assert retrier.delay(error, 0) is None
+        retrier.record_call()
+        retrier.record_call()
+        assert retrier.delay(error, 0) is not None
+
+    def test_backoff(self) -> None:
+        retrier = Retrier(
+            RetryPolicy(
+                max_attempts=10,
+                initial_backoff_secs=0.1,
+                max_backoff_secs=0.5,
+                jitter=0.5,
+                budget_max_tokens=100,
+            )
+        )
+        error = LightsparkConnectionException("Connection reset")
+        for attempt, backoff in enumerate([0.1, 0.2, 0.4, 0.5, 0.5]):
+            delay = retrier.delay(error, attempt)
+            assert delay is not None
+            assert backoff / 2 <= delay <= backoff
+        assert retrier.delay(error, 9) is None
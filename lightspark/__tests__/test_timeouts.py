@@ -0,0 +1,198 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import json
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional
+
+import pytest
+
+from lightspark import LightsparkAsyncClient, LightsparkSyncClient
+from lightspark.__tests__.helpers import (
+    ACCOUNT,
+    GraphQLHandler,
+    GraphQLServer,
+    StaticSigningKey,
+    serve,
+)
+from lightspark.exceptions import LightsparkTimeoutException
+from lightspark.objects.Account import from_json as Account_from_json
+from lightspark.requests.timeouts import Deadline, Timeout
+from lightspark.requests.transport import HttpxTransport, Transport
+
+
+class StallingServer(GraphQLServer):
+    """A GraphQL server which waits `delay_secs` before replying, either before sending
+    the headers of the response or in the middle of its body. With `trickle_secs`, the
+    rest of the body is sent one byte at a time, every `trickle_secs`."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.delay_secs = 0.0
+        self.stall_body = False
+        self.trickle_secs = 0.0
+        self.released = threading.Event()
+
+    def respond(self, handler: GraphQLHandler, request: Dict[str, Any]) -> None:
+        content = json.dumps({"data": {"current_account": ACCOUNT}}).encode("utf8")
+        if not self.stall_body:
+            self.released.wait(self.delay_secs)
+        handler.send_response(200)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(content)))
+        handler.end_headers()
+        handler.wfile.write(content[:10])
+        handler.wfile.flush()
+        if self.stall_body:
+            self.released.wait(self.delay_secs)
+        if self.trickle_secs:
+            for i in range(10, len(content)):
+                if self.released.wait(self.trickle_secs):
+                    return
+                handler.wfile.write(content[i : i + 1])
+                handler.wfile.flush()
+        handler.wfile.write(content[10:])
+
+    def shutdown(self) -> None:
+        self.released.set()
+        super().shutdown()
+
+
+@pytest.fixture
+def server() -> Iterator[StallingServer]:
+    yield from serve(StallingServer())
+
+
+class SlowPagesServer(GraphQLServer):
+    """A GraphQL server replying to each request for a page of transactions after
+    `delay_secs`, with an empty page followed by another one, up to `pages`."""
+
+    def __init__(self, delay_secs: float, pages: int) -> None:
+        super().__init__()
+        self.delay_secs = delay_secs
+        self.pages = pages
+
+    def respond(self, handler: GraphQLHandler, request: Dict[str, Any]) -> None:
+        time.sleep(self.delay_secs)
+        after = request["variables"].get("after")
+        page = 0 if after is None else int(after) + 1
+        connection = {
+            "__typename": "AccountToTransactionsConnection",
+            "account_to_transactions_connection_count": 0,
+            "account_to_transactions_connection_page_info": {
+                "__typename": "PageInfo",
+                "page_info_has_next_page": page + 1 < self.pages,
+                "page_info_has_previous_page": page > 0,
+                "page_info_start_cursor": str(page),
+                "page_info_end_cursor": str(page),
+            },
+            "account_to_transactions_connection_profit_loss": None,
+            "account_to_transactions_connection_average_fee_earned": None,
+            "account_to_transactions_connection_total_amount_transacted": None,
+            "account_to_transactions_connection_entities": [],
+        }
+        handler.send_json({"data": {"entity": {"transactions": connection}}})
+
+
+@pytest.fixture
+def pages_server() -> Iterator[SlowPagesServer]:
+    yield from serve(SlowPagesServer(delay_secs=0.1, pages=10))
+
+
+class TestTimeouts:
+    def test_no_timeout_by_default(self, server: StallingServer) -> None:
+        server.delay_secs = 0.2
+        client = LightsparkSyncClient("id", "secret", server.url)
+        assert client.get_current_account().name == "Test account"
+
+    def test_client_default_read_timeout(self, server: StallingServer) -> None:
+        server.delay_secs = 5
+        client = LightsparkSyncClient(
+            "id", "secret", server.url, timeout=Timeout(read=0.1)
+        )
+        start = time.monotonic()
+        with pytest.raises(LightsparkTimeoutException):
+            client.get_current_account()
+        assert time.monotonic() - start < 2
+
+    def test_stalled_response_body(self, server: StallingServer) -> None:
+        server.delay_secs = 5
+        server.stall_body = True
+        client = LightsparkSyncClient(
+            "id", "secret", server.url, timeout=Timeout(read=0.1)
+        )
+        with pytest.raises(LightsparkTimeoutException):
+            client.get_current_account()
+
+    @pytest.mark.parametrize("httpx_transport", [False, True])
+    def test_block_deadline_covers_trickled_body(
+        self, server: StallingServer, httpx_transport: bool
+    ) -> None:
+        # Every byte arrives within the read timeout, but not the whole body.
+        server.trickle_secs = 0.02
+        transport: Optional[Transport] = (
+            HttpxTransport(http2=False) if httpx_transport else None
+        )
+        client = LightsparkSyncClient(
+            "id", "secret", server.url, timeout=Timeout(read=1), transport=transport
+        )
+        start = time.monotonic()
+        with pytest.raises(LightsparkTimeoutException):
+            with client.timeout(total=0.3):
+                client.get_current_account()
+        assert time.monotonic() - start < 2
+
+    def test_block_deadline_covers_every_call(self, server: StallingServer) -> None:
+        server.delay_secs = 0.15
+        client = LightsparkSyncClient("id", "secret", server.url)
+        start = time.monotonic()
+        with pytest.raises(LightsparkTimeoutException):
+            with client.timeout(total=0.4):
+                for _ in range(5):
+                    client.get_current_account()
+        assert time.monotonic() - start < 2
+
+    def test_nested_blocks_cannot_extend_the_deadline(self) -> None:
+        client = LightsparkSyncClient("id", "secret")
+        with client.timeout(connect=1, total=2):
+            with client.timeout(read=3, total=60):
+                deadline = Deadline.start(None, None)
+        assert (deadline.connect, deadline.read) == (1, 3)
+        assert deadline.expires_at is not None
+        assert deadline.expires_at - time.monotonic() < 2
+
+    def test_payments_wait_past_their_timeout(self) -> None:
+        client = LightsparkSyncClient(
+            "id", "secret", timeout=Timeout(connect=2, read=1, total=1)
+        )
+        client.load_node_signing_key("LightsparkNode:1", StaticSigningKey())
+        query = client.pay_invoice_query(
+            "LightsparkNode:1", "lnbc1", timeout_secs=60, maximum_fees_msats=100
+        )
+        assert query.timeout == Timeout(read=65, total=65)
+
+        deadline = Deadline.start(query.timeout, client._requester.timeout)
+        assert deadline.connect == 2
+        assert deadline.read == 65
+        expires_at = deadline.expires_at
+        assert expires_at is not None
+        assert 64 < expires_at - time.monotonic() <= 65
+
+    def test_block_deadline_covers_prefetched_pages(
+        self, pages_server: SlowPagesServer
+    ) -> None:
+        client = LightsparkSyncClient("id", "secret", pages_server.url)
+        account = Account_from_json(client._requester, ACCOUNT)
+        with pytest.raises(LightsparkTimeoutException):
+            with client.timeout(total=0.35):
+                list(account.iter_transactions())
+        assert len(pages_server.requests) < 10
+
+    async def test_async_client(self, server: StallingServer) -> None:
+        server.delay_secs = 5
+        async with LightsparkAsyncClient("id", "secret", server.url) as client:
+            start = time.monotonic()
+            with pytest.raises(LightsparkTimeoutException):
+                with client.timeout(total=0.2):
+                    await client.get_current_account()
+            assert time.monotonic() - start < 2
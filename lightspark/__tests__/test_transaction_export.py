@@ -0,0 +1,177 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Mapping, Tuple
+
+import pytest
+
+from lightspark import LightsparkSyncClient
+from lightspark.exceptions import LightsparkException
+from lightspark.export import export_transactions
+from lightspark.objects.Account import from_json as Account_from_json
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+ACCOUNT = {
+    "__typename": "Account",
+    "account_id": "Account:1",
+    "account_created_at": START.isoformat(),
+    "account_updated_at": START.isoformat(),
+    "account_name": "Test account",
+}
+
+
+def deposit(index: int) -> Mapping[str, Any]:
+    created_at = (START + timedelta(seconds=index)).isoformat()
+    return {
+        "__typename": "Deposit",
+        "deposit_id": f"Deposit:{index}",
+        "deposit_created_at": created_at,
+        "deposit_updated_at": created_at,
+        "deposit_status": "SUCCESS",
+        "deposit_resolved_at": created_at,
+        "deposit_amount": {
+            "currency_amount_original_value": 1000,
+            "currency_amount_original_unit": "SATOSHI",
+            "currency_amount_preferred_currency_unit": "USD",
+            "currency_amount_preferred_currency_value_rounded": 1,
+            "currency_amount_preferred_currency_value_approx": 1.0,
+        },
+        "deposit_transaction_hash": None,
+        "deposit_fees": None,
+        "deposit_block_hash": "hash",
+        "deposit_block_height": 1,
+        "deposit_destination_addresses": [],
+        "deposit_num_confirmations": 1,
+        "deposit_destination": {"id": "LightsparkNode:1"},
+    }
+
+
+class MockServer:
+    """Serves the transactions of an account, filtering on both dates inclusively."""
+
+    def __init__(self, num_transactions: int) -> None:
+        self.transactions = [deposit(i) for i in range(num_transactions)]
+        self.lock = threading.Lock()
+        self.ranges: List[Tuple[datetime, datetime]] = []
+
+    def execute_graphql(
+        self, query: str, variables: Mapping[str, Any], signing_key=None, timeout=None
+    ) -> Mapping[str, Any]:
+        after_date, before_date = variables["after_date"], variables["before_date"]
+        with self.lock:
+            self.ranges.append((after_date, before_date))
+        matching = [
+            t
+            for t in self.transactions
+            if after_date
+            <= datetime.fromisoformat(t["deposit_created_at"])
+            <= before_date
+        ]
+        # Like the API, return the most recent transactions first.
+        matching.reverse()
+        offset = int(variables["after"] or 0)
+        end = offset + variables["first"]
+        return {
+            "entity": {
+                "transactions": {
+                    "__typename": "AccountToTransactionsConnection",
+                    "account_to_transactions_connection_count": len(matching),
+                    "account_to_transactions_connection_page_info": {
+                        "__typename": "PageInfo",
+                        "page_info_has_next_page": end < len(matching),
+                        "page_info_has_previous_page": offset > 0,
+                        "page_info_start_cursor": str(offset),
+                        "page_info_end_cursor": str(end),
+                    },
+                    "account_to_transactions_connection_profit_loss": None,
+                    "account_to_transactions_connection_average_fee_earned": None,
+                    "account_to_transactions_connection_total_amount_transacted": None,
+                    "account_to_transactions_connection_entities": matching[offset:end],
+                }
+            }
+        }
+
+
+class TestTransactionExport:
+    def test_exports_every_transaction_once_in_order(self) -> None:
+        client = LightsparkSyncClient("", "")
+        server = MockServer(num_transactions=1000)
+        client._requester.execute_graphql = server.execute_graphql
+        account = Account_from_json(client._requester, ACCOUNT)
+
+        transactions = list(
+            export_transactions(
+                account,
+                before_date=START + timedelta(seconds=1000),
+                shard_size=250,
+                page_size=50,
+            )
+        )
+
+        assert [t.id for t in transactions] == [f"Deposit:{i}" for i in range(1000)]
+        # The range was split in shards, some of them starting on a transaction.
+        assert len(set(server.ranges)) > 4
+
+    def test_small_ranges_are_not_split(self) -> None:
+        client = LightsparkSyncClient("", "")
+        server = MockServer(num_transactions=100)
+        client._requester.execute_graphql = server.execute_graphql
+        account = Account_from_json(client._requester, ACCOUNT)
+
+        transactions = list(
+            export_transactions(
+                account,
+                before_date=START + timedelta(seconds=100),
+                shard_size=1000,
+                page_size=30,
+            )
+        )
+
+        assert len(transactions) == 100
+        assert len(set(server.ranges)) == 1
+        assert len(server.ranges) == 4
+
+    def test_compiled_decoders(self) -> None:
+        client = LightsparkSyncClient("", "")
+        server = MockServer(num_transactions=100)
+        client._requester.execute_graphql = server.execute_graphql
+        account = Account_from_json(client._requester, ACCOUNT)
+
+        def export(**options: bool) -> List[Any]:
+            return list(
+                export_transactions(
+                    account,
+                    before_date=START + timedelta(seconds=100),
+                    page_size=30,
+                    **options,
+                )
+            )
+
+        transactions = export()
+        assert export(compiled_decoders=True) == transactions
+        assert export(lazy_decoders=True) == transactions
+
+    def test_dates_without_timezone_are_utc(self) -> None:
+        client = LightsparkSyncClient("", "")
+        server = MockServer(num_transactions=100)
+        client._requester.execute_graphql = server.execute_graphql
+        account = Account_from_json(client._requester, ACCOUNT)
+
+        transactions = list(
+            export_transactions(
+                account,
+                after_date=datetime(2023, 1, 1, 0, 0, 10),
+                before_date=datetime(2023, 1, 1, 0, 0, 20),
+            )
+        )
+
+        assert [t.id for t in transactions] == [f"Deposit:{i}" for i in range(10, 21)]
+
+    def test_raw_clients_are_refused(self) -> None:
+        client = LightsparkSyncClient("", "", raw=True)
+        account = Account_from_json(client._requester, ACCOUNT)
+
+        with pytest.raises(LightsparkException):
+            export_transactions(account)
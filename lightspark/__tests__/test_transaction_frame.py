@@ -0,0 +1,134 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Mapping, Optional
+
+import pytest
+
+import lightspark.transaction_frame
+from lightspark import LightsparkSyncClient
+from lightspark.objects.Account import from_json as Account_from_json
+from lightspark.objects.TransactionStatus import TransactionStatus
+from lightspark.transaction_frame import TransactionFrame
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+ACCOUNT = {
+    "__typename": "Account",
+    "account_id": "Account:1",
+    "account_created_at": START.isoformat(),
+    "account_updated_at": START.isoformat(),
+    "account_name": "Test account",
+}
+
+
+def transaction(
+    index: int, typename: str, status: str, sats: int, fee_sats: Optional[int]
+) -> Mapping[str, Any]:
+    prefix = "outgoing_payment" if typename == "OutgoingPayment" else "deposit"
+    return {
+        "__typename": typename,
+        f"{prefix}_id": f"{typename}:{index}",
+        f"{prefix}_created_at": (START + timedelta(hours=index)).isoformat(),
+        f"{prefix}_status": status,
+        f"{prefix}_amount": {
+            "currency_amount_original_value": sats,
+            "currency_amount_original_unit": "SATOSHI",
+        },
+        f"{prefix}_fees": None
+        if fee_sats is None
+        else {
+            "currency_amount_original_value": fee_sats * 1000,
+            "currency_amount_original_unit": "MILLISATOSHI",
+        },
+    }
+
+
+ENTITIES: List[Mapping[str, Any]] = [
+    transaction(0, "Deposit", "SUCCESS", 100, None),
+    transaction(1, "OutgoingPayment", "SUCCESS", 10, 1),
+    transaction(25, "OutgoingPayment", "FAILED", 20, 2),
+    transaction(26, "OutgoingPayment", "SUCCESS", 30, 3),
+    transaction(50, "Deposit", "SOMETHING_NEW", 5, None),
+]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def vectorized(request, monkeypatch) -> None:
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(lightspark.transaction_frame, "numpy", None)
+
+
+@pytest.mark.usefixtures("vectorized")
+class TestTransactionFrame:
+    def test_columns(self) -> None:
+        frame = TransactionFrame.from_json(ENTITIES)
+
+        assert len(frame) == 5
+        assert frame.ids[1] == "OutgoingPayment:1"
+        assert list(frame.amount_msats) == [100_000, 10_000, 20_000, 30_000, 5_000]
+        assert list(frame.fees_msats) == [0, 1_000, 2_000, 3_000, 0]
+        assert frame.created_at[1] - frame.created_at[0] == 3_600_000_000
+        assert frame.typenames == ["Deposit", "OutgoingPayment"]
+
+    def test_filter_and_sum(self) -> None:
+        frame = TransactionFrame.from_json(ENTITIES)
+
+        payments = frame.filter(
+            statuses=[TransactionStatus.SUCCESS], typenames=["OutgoingPayment"]
+        )
+        assert payments.ids == ["OutgoingPayment:1", "OutgoingPayment:26"]
+        assert payments.sum() == 40_000
+        assert payments.sum("fees_msats") == 4_000
+
+        recent = frame.filter(after_date=START + timedelta(days=1))
+        assert recent.ids == ["OutgoingPayment:25", "OutgoingPayment:26", "Deposit:50"]
+        assert len(frame.filter(typenames=["Withdrawal"])) == 0
+
+    def test_group(self) -> None:
+        frame = TransactionFrame.from_json(ENTITIES)
+
+        assert frame.group_sum("status") == {
+            TransactionStatus.___FUTURE_VALUE___: 5_000,
+            TransactionStatus.SUCCESS: 140_000,
+            TransactionStatus.FAILED: 20_000,
+        }
+        assert frame.group_sum("typename", "fees_msats") == {
+            "Deposit": 0,
+            "OutgoingPayment": 6_000,
+        }
+        assert frame.count_by(timedelta(days=1)) == {
+            START: 2,
+            START + timedelta(days=1): 2,
+            START + timedelta(days=2): 1,
+        }
+        assert TransactionFrame().group_sum("status") == {}
+
+    def test_fetch(self) -> None:
+        client = LightsparkSyncClient("", "")
+        account = Account_from_json(client._requester, ACCOUNT)
+        pages = [ENTITIES[:3], ENTITIES[3:]]
+
+        def execute_graphql(
+            query: str, variables: Mapping[str, Any], signing_key=None, timeout=None
+        ):
+            page = int(variables["after"] or 0)
+            return {
+                "entity": {
+                    "transactions": {
+                        "__typename": "AccountToTransactionsConnection",
+                        "account_to_transactions_connection_page_info": {
+                            "page_info_has_next_page": page + 1 < len(pages),
+                            "page_info_end_cursor": str(page + 1),
+                        },
+                        "account_to_transactions_connection_entities": pages[page],
+                    }
+                }
+            }
+
+        client._requester.execute_graphql = execute_graphql
+        frame = TransactionFrame.fetch(account, page_size=3)
+        assert len(frame) == 5
+        assert frame.sum() == 165_000
@@ -0,0 +1,134 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Mapping
+
+from lightspark import LightsparkSyncClient
+from lightspark.objects.Account import from_json as Account_from_json
+from lightspark.objects.TransactionStatus import TransactionStatus
+from lightspark.transaction_store import TransactionStore
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+ACCOUNT = {
+    "__typename": "Account",
+    "account_id": "Account:1",
+    "account_created_at": START.isoformat(),
+    "account_updated_at": START.isoformat(),
+    "account_name": "Test account",
+}
+
+
+def deposit(index: int, status: str = "SUCCESS", updated_hours: int = 0) -> Dict:
+    created_at = START + timedelta(hours=index)
+    return {
+        "__typename": "Deposit",
+        "deposit_id": f"Deposit:{index}",
+        "deposit_created_at": created_at.isoformat(),
+        "deposit_updated_at": (created_at + timedelta(hours=updated_hours)).isoformat(),
+        "deposit_status": status,
+        "deposit_resolved_at": None,
+        "deposit_amount": {
+            "currency_amount_original_value": index,
+            "currency_amount_original_unit": "SATOSHI",
+            "currency_amount_preferred_currency_unit": "USD",
+            "currency_amount_preferred_currency_value_rounded": 1,
+            "currency_amount_preferred_currency_value_approx": 1.0,
+        },
+        "deposit_transaction_hash": None,
+        "deposit_fees": None,
+        "deposit_block_hash": None,
+        "deposit_block_height": 1,
+        "deposit_destination_addresses": [],
+        "deposit_num_confirmations": None,
+        "deposit_destination": {"id": "LightsparkNode:1"},
+    }
+
+
+class MockServer:
+    def __init__(self, transactions: List[Dict]) -> None:
+        self.transactions = transactions
+        self.returned = 0
+
+    def execute_graphql(
+        self, query: str, variables: Mapping[str, Any], signing_key=None, timeout=None
+    ) -> Mapping[str, Any]:
+        after_date = variables["after_date"]
+        matching = [
+            t
+            for t in reversed(self.transactions)
+            if after_date is None
+            or datetime.fromisoformat(t["deposit_created_at"]) >= after_date
+        ]
+        offset = int(variables["after"] or 0)
+        end = offset + variables["first"]
+        self.returned += len(matching[offset:end])
+        return {
+            "entity": {
+                "transactions": {
+                    "__typename": "AccountToTransactionsConnection",
+                    "account_to_transactions_connection_count": len(matching),
+                    "account_to_transactions_connection_page_info": {
+                        "__typename": "PageInfo",
+                        "page_info_has_next_page": end < len(matching),
+                        "page_info_has_previous_page": offset > 0,
+                        "page_info_start_cursor": str(offset),
+                        "page_info_end_cursor": str(end),
+                    },
+                    "account_to_transactions_connection_profit_loss": None,
+                    "account_to_transactions_connection_average_fee_earned": None,
+                    "account_to_transactions_connection_total_amount_transacted": None,
+                    "account_to_transactions_connection_entities": matching[offset:end],
+                }
+            }
+        }
+
+
+class TestTransactionStore:
+    def test_incremental_sync(self) -> None:
+        client = LightsparkSyncClient("", "")
+        server = MockServer([deposit(i) for i in range(100)])
+        server.transactions[95] = deposit(95, status="PENDING")
+        client._requester.execute_graphql = server.execute_graphql
+        account = Account_from_json(client._requester, ACCOUNT)
+        store = TransactionStore()
+
+        assert store.sync(account, page_size=30, batch_size=40) == 100
+        assert store.count() == 100
+        assert store.high_water_mark(account.id) == START + timedelta(hours=99)
+
+        server.transactions[95] = deposit(95, updated_hours=10)
+        server.transactions += [deposit(100), deposit(101)]
+        server.returned = 0
+        store.sync(account, overlap=timedelta(hours=1))
+
+        # Only the window starting at the pending transaction was fetched again.
+        assert server.returned == 7
+        assert store.count(account.id) == 102
+        pending = list(
+            store.transactions(client._requester, statuses=[TransactionStatus.PENDING])
+        )
+        assert pending == []
+        updated = list(
+            store.transactions(
+                client._requester, updated_after=START + timedelta(hours=100)
+            )
+        )
+        assert [t.id for t in updated] == ["Deposit:95", "Deposit:101"]
+        assert updated[0].status == TransactionStatus.SUCCESS
+
+    def test_query_by_typename(self) -> None:
+        client = LightsparkSyncClient("", "")
+        client._requester.execute_graphql = MockServer(
+            [deposit(i) for i in range(3)]
+        ).execute_graphql
+        account = Account_from_json(client._requester, ACCOUNT)
+        store = TransactionStore()
+        store.sync(account)
+
+        assert (
+            len(list(store.transactions(client._requester, typenames=["Deposit"]))) == 3
+        )
+        assert (
+            list(store.transactions(client._requester, typenames=["Withdrawal"])) == []
+        )
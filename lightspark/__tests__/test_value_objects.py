@@ -0,0 +1,92 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import dataclasses
+import pickle
+import tracemalloc
+from typing import Any, Callable, List
+
+from lightspark.objects.CurrencyAmount import CurrencyAmount
+from lightspark.objects.CurrencyAmount import from_json as CurrencyAmount_from_json
+from lightspark.objects.CurrencyUnit import CurrencyUnit
+from lightspark.objects.NodeAddress import NodeAddress
+from lightspark.objects.PageInfo import PageInfo
+from lightspark.objects.Withdrawal import Withdrawal
+from lightspark.objects.Withdrawal import from_json as Withdrawal_from_json
+
+AMOUNT = {
+    "currency_amount_original_value": 1000,
+    "currency_amount_original_unit": "SATOSHI",
+    "currency_amount_preferred_currency_unit": "USD",
+    "currency_amount_preferred_currency_value_rounded": 30,
+    "currency_amount_preferred_currency_value_approx": 30.5,
+}
+
+# The layout of the value objects before they were slotted.
+DictCurrencyAmount = dataclasses.make_dataclass(
+    "DictCurrencyAmount",
+    [("requester", Any)]
+    + [(field.name, field.type) for field in dataclasses.fields(CurrencyAmount)],
+)
+
+
+def allocated_bytes(build: Callable[[], List[Any]]) -> int:
+    """The memory held by the objects returned by `build`."""
+    tracemalloc.start()
+    try:
+        objects = build()
+        size = tracemalloc.get_traced_memory()[0]
+        del objects
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+class TestValueObjects:
+    def test_values_are_slotted_and_requester_free(self) -> None:
+        for cls in (CurrencyAmount, NodeAddress, PageInfo):
+            assert "requester" not in [field.name for field in dataclasses.fields(cls)]
+            assert not hasattr(cls(*[None] * len(dataclasses.fields(cls))), "__dict__")
+        assert "requester" in [field.name for field in dataclasses.fields(Withdrawal)]
+
+    def test_values_behave_like_dataclasses(self) -> None:
+        amount = CurrencyAmount_from_json(None, AMOUNT)
+        assert pickle.loads(pickle.dumps(amount)) == amount
+        assert dataclasses.replace(amount, original_value=5).original_value == 5
+        assert amount.convert_to(CurrencyUnit.MILLISATOSHI).original_value == 1000
+        assert repr(amount).startswith("CurrencyAmount(original_value=1000,")
+
+    def test_memory(self) -> None:
+        # A page of transactions carries several amounts per row.
+        count = 100_000
+        amount = CurrencyAmount_from_json(None, AMOUNT)
+        values = [getattr(amount, field.name) for field in dataclasses.fields(amount)]
+        slotted = allocated_bytes(
+            lambda: [CurrencyAmount(*values) for _ in range(count)]
+        )
+        with_dict = allocated_bytes(
+            lambda: [DictCurrencyAmount(None, *values) for _ in range(count)]
+        )
+        assert slotted < with_dict * 0.7, (slotted, with_dict)
+
+    def test_decoded_transactions_hold_no_dict_per_amount(self) -> None:
+        withdrawal = Withdrawal_from_json(
+            None,
+            {
+                "__typename": "Withdrawal",
+                "withdrawal_id": "Withdrawal:1",
+                "withdrawal_created_at": "2023-01-01T00:00:00+00:00",
+                "withdrawal_updated_at": "2023-01-01T00:00:05+00:00",
+                "withdrawal_status": "SUCCESS",
+                "withdrawal_resolved_at": None,
+                "withdrawal_amount": AMOUNT,
+                "withdrawal_transaction_hash": None,
+                "withdrawal_fees": AMOUNT,
+                "withdrawal_block_hash": None,
+                "withdrawal_block_height": 800000,
+                "withdrawal_destination_addresses": [],
+                "withdrawal_num_confirmations": None,
+                "withdrawal_origin": {"id": "Wallet:1"},
+            },
+        )
+        assert not hasattr(withdrawal.amount, "__dict__")
+        assert not hasattr(withdrawal.fees, "__dict__")
@@ -0,0 +1,116 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import asyncio
+import json
+import time
+from typing import Any, List, Mapping, Optional
+
+import pytest
+
+from lightspark import LightsparkAsyncClient, LightsparkSyncClient
+from lightspark.__tests__.helpers import graph_node, mock_requester
+from lightspark.entity_cache import EntityCache
+from lightspark.exceptions import LightsparkException
+from lightspark.objects.GraphNode import GraphNode
+from lightspark.webhooks import WebhookEvent
+
+
+def event(event_type: str, entity_id: str, wallet_id: Optional[str] = None):
+    body = {
+        "event_type": event_type,
+        "event_id": "1615c8be5aa44e429eba700db2ed8ca5",
+        "timestamp": "2023-05-17T23:56:47.874449+00:00",
+        "entity_id": entity_id,
+    }
+    if wallet_id:
+        body["wallet_id"] = wallet_id
+    return WebhookEvent.parse(json.dumps(body).encode("utf-8"))
+
+
+def client_with_cache() -> "tuple":
+    client = LightsparkSyncClient("", "", entity_cache=EntityCache())
+    return client, mock_requester(client._requester)
+
+
+class TestWebhookCacheSubscriber:
+    def test_invalidates_the_entity_and_wallet(self) -> None:
+        client, calls = client_with_cache()
+        client.get_entity("Node:1", GraphNode)
+        client.get_entity("Wallet:1", GraphNode)
+        subscriber = client.webhook_subscriber()
+
+        subscriber.handle(event("NODE_STATUS", "Node:1"))
+        assert "Node:1" not in client.entity_cache
+        assert "Wallet:1" in client.entity_cache
+
+        subscriber.handle(
+            event("WALLET_INCOMING_PAYMENT_FINISHED", "Pay:1", "Wallet:1")
+        )
+        assert "Wallet:1" not in client.entity_cache
+        assert len(calls) == 2
+
+    def test_refresh_coalesces_bursts(self) -> None:
+        client, calls = client_with_cache()
+        client.get_entity("Node:1", GraphNode)
+        subscriber = client.webhook_subscriber(refresh=True, coalesce_secs=0.05)
+
+        for _ in range(5):
+            # Reads between the events cache the entity again.
+            client.get_entity("Node:1", GraphNode)
+            subscriber.handle(event("NODE_STATUS", "Node:1"))
+        assert len(calls) == 5
+        time.sleep(0.2)
+
+        # The burst only triggered one refetch.
+        assert len(calls) == 6
+        assert "Node:1" in client.entity_cache
+
+    def test_refresh_without_coalescing(self) -> None:
+        client, calls = client_with_cache()
+        client.get_entity("Node:1", GraphNode)
+        subscriber = client.webhook_subscriber(refresh=True)
+
+        subscriber.handle(event("NODE_STATUS", "Node:1"))
+        assert len(calls) == 2
+        assert "Node:1" in client.entity_cache
+        # Entities which were not cached are not fetched.
+        subscriber.handle(event("PAYMENT_FINISHED", "Pay:1"))
+        assert len(calls) == 2
+
+    def test_requires_a_cache(self) -> None:
+        with pytest.raises(LightsparkException):
+            LightsparkSyncClient("", "").webhook_subscriber()
+
+    async def test_async_client_refreshes_on_its_loop(self) -> None:
+        client = LightsparkAsyncClient("", "", entity_cache=EntityCache())
+        loop = asyncio.get_running_loop()
+        calls: List[Mapping[str, Any]] = []
+
+        async def execute_graphql_async(
+            query: str, variables: Mapping[str, Any], signing_key=None, timeout=None
+        ) -> Mapping[str, Any]:
+            assert asyncio.get_running_loop() is loop
+            calls.append(variables)
+            return {"entity": graph_node(variables["id"])}
+
+        def execute_graphql(*args: Any, **kwargs: Any) -> Mapping[str, Any]:
+            raise AssertionError("Blocking request")
+
+        client._requester.execute_graphql_async = execute_graphql_async
+        client._requester.execute_graphql = execute_graphql
+        await client.get_entity("Node:1", GraphNode)
+        subscriber = client.webhook_subscriber(refresh=True, coalesce_secs=0.01)
+
+        subscriber.handle(event("NODE_STATUS", "Node:1"))
+        for _ in range(100):
+            if len(calls) == 2:
+                break
+            await asyncio.sleep(0.005)
+        assert len(calls) == 2
+        assert "Node:1" in client.entity_cache
+
+    def test_async_refresh_requires_a_loop(self) -> None:
+        client = LightsparkAsyncClient("", "", entity_cache=EntityCache())
+        client.webhook_subscriber()
+        with pytest.raises(LightsparkException):
+            client.webhook_subscriber(refresh=True)
@@ -0,0 +1,435 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import dataclasses
+import importlib
+import re
+import threading
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_type_hints,
+)
+
+from lightspark.exceptions import LightsparkException
+from lightspark.utils.enums import enum_table
+from lightspark.utils.timestamps import TimestampCodec, parse_timestamp
+
+T = TypeVar("T")
+
+Decoder = Callable[[Any, Mapping[str, Any]], T]
+
+_TOKEN = re.compile(r"\.\.\.|[{}:]|\w+")
+
+
+@dataclasses.dataclass(frozen=True)
+class _Field:
+    key: str
+    """The key of the field in the JSON, i.e. its alias in the fragment."""
+    name: str
+    selection: Optional["_Selection"]
+
+
+@dataclasses.dataclass(frozen=True)
+class _Selection:
+    fields: Tuple[_Field, ...]
+    fragments: Tuple[Tuple[str, "_Selection"], ...]
+    """The inline fragments (`... on Type { }`) of an interface, by typename."""
+
+    def is_reference(self) -> bool:
+        return not self.fragments and [field.name for field in self.fields] == ["id"]
+
+
+def _parse_selection(tokens: List[str], position: int) -> Tuple[_Selection, int]:
+    """Parses the selection set starting at `tokens[position] == "{"`."""
+    fields: List[_Field] = []
+    fragments: List[Tuple[str, _Selection]] = []
+    position += 1
+    while tokens[position] != "}":
+        if tokens[position] == "...":
+            # `... on Typename { }`
+            typename = tokens[position + 2]
+            selection, position = _parse_selection(tokens, position + 3)
+            fragments.append((typename, selection))
+            continue
+        key = name = tokens[position]
+        position += 1
+        if tokens[position] == ":":
+            name = tokens[position + 1]
+            position += 2
+        selection = None
+        if tokens[position] == "{":
+            selection, position = _parse_selection(tokens, position)
+        fields.append(_Field(key, name, selection))
+    return _Selection(tuple(fields), tuple(fragments)), position + 1
+
+
+def parse_fragment(fragment: str) -> _Selection:
+    """Parses a `fragment XFragment on X { ... }` definition."""
+    tokens = _TOKEN.findall(fragment)
+    return _parse_selection(tokens, tokens.index("{"))[0]
+
+
+@lru_cache(maxsize=None)
+def _fragment_selection(cls: type) -> _Selection:
+    return parse_fragment(importlib.import_module(cls.__module__).FRAGMENT)
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _unwrap_optional(hint: Any) -> Tuple[bool, Any]:
+    if getattr(hint, "__origin__", None) is Union:
+        args = [arg for arg in hint.__args__ if arg is not type(None)]
+        if len(args) == 1:
+            return True, args[0]
+    return False, hint
+
+
+def _is_list(hint: Any) -> bool:
+    return getattr(hint, "__origin__", None) in (list, List)
+
+
+def _needs_conversion(hint: Any) -> bool:
+    """Whether the loaders convert the JSON value of this type, rather than using it
+    as is."""
+    _, hint = _unwrap_optional(hint)
+    if _is_list(hint):
+        return _needs_conversion(hint.__args__[0])
+    return (
+        hint is datetime
+        or dataclasses.is_dataclass(hint)
+        or (isinstance(hint, type) and issubclass(hint, Enum))
+    )
+
+
+def _field_names(cls: type) -> Set[str]:
+    return {field.name for field in dataclasses.fields(cls)}
+
+
+def _is_date(field: _Field, hint: Any) -> bool:
+    """The loaders only parse `DateTime` scalars, and keep `Date` ones (`date`,
+    `from_date`...) as strings, although both are annotated as datetimes."""
+    return hint is datetime and (field.name == "date" or field.name.endswith("_date"))
+
+
+class _FunctionBuilder:
+    """The source of a decoding function and the globals it references."""
+
+    def __init__(self, compiler: "_Compiler", lazy: bool = False) -> None:
+        self.compiler = compiler
+        self.lazy = lazy
+        self.namespace: Dict[str, Any] = {"_parse_timestamp": compiler.timestamps}
+        self.statements: List[str] = []
+        self._counter = 0
+
+    def name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"_{prefix}{self._counter}"
+
+    def constant(self, prefix: str, value: Any) -> str:
+        name = self.name(prefix)
+        self.namespace[name] = value
+        return name
+
+    def bind(self, source: str, can_bind: bool) -> str:
+        """Returns a variable holding `source`, assigned at the top of the function."""
+        if source.isidentifier():
+            return source
+        if not can_bind:
+            raise _Unsupported(source)
+        variable = self.name("v")
+        self.statements.append(f"    {variable} = {source}")
+        return variable
+
+    def value(self, hint: Any, field: _Field, source: str, can_bind: bool) -> str:
+        """The expression converting the JSON value `source` into an attribute."""
+        # pylint: disable=too-many-return-statements
+        optional, hint = _unwrap_optional(hint)
+        if not _needs_conversion(hint) or _is_date(field, hint):
+            return source
+        if optional:
+            variable = self.bind(source, can_bind)
+            return f"({self.value(hint, field, variable, can_bind)} if {variable} else None)"
+        if _is_list(hint):
+            item = self.name("e")
+            expression = self.value(hint.__args__[0], field, item, False)
+            return f"[{expression} for {item} in {source}]"
+        if hint is datetime:
+            return f"_parse_timestamp({source})"
+        if isinstance(hint, type) and issubclass(hint, Enum):
+            if "___FUTURE_VALUE___" not in hint.__members__:
+                raise _Unsupported(hint)
+            table = self.constant("members", enum_table(hint))
+            return f"{table}[{source}]"
+        selection = field.selection
+        if selection is None or selection.is_reference():
+            # Connections only select the ids of their entities in their fragment: the
+            # queries select the fields of the entity fragment.
+            selection = _fragment_selection(hint)
+        variable = self.bind(source, can_bind)
+        if not selection.fragments:
+            # Objects without nested objects, like CurrencyAmount, are built inline.
+            try:
+                return self.constructor(hint, selection, variable, False)
+            except _Unsupported:
+                pass
+        decoder = self.constant(
+            "decode", self.compiler.decoder(hint, selection, self.lazy)
+        )
+        return f"{decoder}(requester, {variable})"
+
+    def attribute(
+        self, cls: type, field: _Field, source: str, can_bind: bool
+    ) -> Tuple[str, str]:
+        """The name of the attribute of `cls` set from a field of the fragment, and the
+        expression of its value."""
+        hints = get_type_hints(cls)
+        item = f"{source}[{field.key!r}]"
+        reference = f"{field.name}_id"
+        if (
+            field.selection is not None
+            and field.selection.is_reference()
+            and reference in _field_names(cls)
+        ):
+            if _unwrap_optional(hints.get(reference))[0]:
+                variable = self.bind(item, can_bind)
+                return reference, f"({variable}['id'] if {variable} else None)"
+            return reference, f"{item}['id']"
+        if field.name not in hints:
+            raise _Unsupported(field.name)
+        return field.name, self.value(hints[field.name], field, item, can_bind)
+
+    def constructor(
+        self, cls: type, selection: _Selection, source: str, can_bind: bool
+    ) -> str:
+        names = _field_names(cls)
+        arguments = []
+        if "requester" in names:
+            arguments.append("requester=requester")
+        if "typename" in names:
+            arguments.append(f"typename={cls.__name__!r}")
+        for field in selection.fields:
+            if field.name != "__typename":
+                name, expression = self.attribute(cls, field, source, can_bind)
+                arguments.append(f"{name}={expression}")
+        if len(arguments) != len(names):
+            raise _Unsupported(cls)
+        constructor = self.constant("cls", cls)
+        return f"{constructor}({', '.join(arguments)})"
+
+    def build(self, function_name: str, expression: str) -> Callable:
+        source = "\n".join(
+            [
+                f"def {function_name}(requester, obj):",
+                *self.statements,
+                f"    return {expression}",
+            ]
+        )
+        # pylint: disable=exec-used
+        exec(compile(source, f"<{function_name}>", "exec"), self.namespace)
+        function = self.namespace[function_name]
+        function.__source__ = source
+        return function
+
+
+class _LazyAttribute:
+    """Decodes an attribute from the JSON of a lazy object on first access, and stores it
+    on the instance, where the next reads find it without calling the descriptor."""
+
+    def __init__(self, name: str, decoder: Callable) -> None:
+        self._name = name
+        self._decoder = decoder
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+        state = instance.__dict__
+        value = state[self._name] = self._decoder(
+            state["_lazy_requester"], state["_lazy_json"]
+        )
+        return value
+
+
+class _LazyObject:
+    """Base of the lazily decoded classes, which have a `_LazyAttribute` per field."""
+
+    _lazy_base: type
+
+    def __eq__(self, other: Any) -> bool:
+        base = self._lazy_base
+        if other.__class__ is not base and (
+            getattr(other.__class__, "_lazy_base", None) is not base
+        ):
+            return NotImplemented
+        return all(
+            getattr(self, field.name) == getattr(other, field.name)
+            for field in dataclasses.fields(base)
+        )
+
+    __hash__ = None  # type: ignore
+
+
+class _Compiler:
+    def __init__(self, timestamps: TimestampCodec) -> None:
+        self.timestamps = timestamps
+        self._lock = threading.RLock()
+        self._decoders: Dict[Tuple[type, _Selection, bool], Callable] = {}
+
+    def decoder(self, cls: type, selection: _Selection, lazy: bool = False) -> Callable:
+        with self._lock:
+            decoder = self._decoders.get((cls, selection, lazy))
+            if decoder is None:
+                if selection.fragments:
+                    decoder = self._dispatcher(cls, selection, lazy)
+                elif lazy:
+                    decoder = self._compile_lazy(cls, selection)
+                else:
+                    decoder = self._compile(cls, selection)
+                self._decoders[(cls, selection, lazy)] = decoder
+            return decoder
+
+    def _compile(self, cls: type, selection: _Selection) -> Callable:
+        builder = _FunctionBuilder(self)
+        try:
+            expression = builder.constructor(cls, selection, "obj", True)
+        except (_Unsupported, NameError, TypeError):
+            # The generated loader stays correct for the types this does not handle.
+            return importlib.import_module(cls.__module__).from_json
+        return builder.build(f"decode_{cls.__name__}", expression)
+
+    def _compile_lazy(self, cls: type, selection: _Selection) -> Callable:
+        names = _field_names(cls)
+        decoders: Dict[str, Callable] = {}
+        try:
+            for field in selection.fields:
+                if field.name == "__typename":
+                    continue
+                builder = _FunctionBuilder(self, lazy=True)
+                name, expression = builder.attribute(cls, field, "obj", True)
+                decoders[name] = builder.build(
+                    f"decode_{cls.__name__}_{name}", expression
+                )
+        except (_Unsupported, NameError, TypeError):
+            return self.decoder(cls, selection)
+        if len(decoders) != len(names - {"requester", "typename"}):
+            return self.decoder(cls, selection)
+
+        lazy_class = type(
+            cls.__name__,
+            (_LazyObject, cls),
+            {
+                "__module__": cls.__module__,
+                "__qualname__": cls.__qualname__,
+                "_lazy_base": cls,
+                **{
+                    name: _LazyAttribute(name, decoder)
+                    for name, decoder in decoders.items()
+                },
+            },
+        )
+        has_requester = "requester" in names
+        typename = cls.__name__ if "typename" in names else None
+
+        def decode(requester: Any, obj: Mapping[str, Any]) -> Any:
+            instance = object.__new__(lazy_class)
+            state = instance.__dict__
+            state["_lazy_requester"] = requester
+            state["_lazy_json"] = obj
+            if has_requester:
+                state["requester"] = requester
+            if typename is not None:
+                state["typename"] = typename
+            return instance
+
+        return decode
+
+    def _dispatcher(self, cls: type, selection: _Selection, lazy: bool) -> Callable:
+        decoders = {
+            typename: self.decoder(
+                getattr(
+                    importlib.import_module(f"lightspark.objects.{typename}"), typename
+                ),
+                concrete_selection,
+                lazy,
+            )
+            for typename, concrete_selection in selection.fragments
+        }
+        interface = cls.__name__
+
+        def decode(requester: Any, obj: Mapping[str, Any]) -> Any:
+            decoder = decoders.get(obj["__typename"])
+            if decoder is None:
+                graphql_typename = obj["__typename"]
+                raise LightsparkException(
+                    "UNKNOWN_INTERFACE",
+                    f"Couldn't find a concrete type for interface {interface} corresponding to the typename={graphql_typename}",
+                )
+            return decoder(requester, obj)
+
+        return decode
+
+
+_compilers: Dict[TimestampCodec, _Compiler] = {}
+_compilers_lock = threading.Lock()
+
+
+def _compiler(timestamps: TimestampCodec) -> _Compiler:
+    with _compilers_lock:
+        compiler = _compilers.get(timestamps)
+        if compiler is None:
+            compiler = _compilers[timestamps] = _Compiler(timestamps)
+        return compiler
+
+
+@lru_cache(maxsize=None)
+def compile_decoder(
+    cls: Type[T], timestamps: TimestampCodec = parse_timestamp
+) -> Decoder[T]:
+    """Returns a function equivalent to the `from_json` of an object type, generated from
+    the `FRAGMENT` of its module.
+
+    The generated function reads the keys of the fragment directly, looks enums up in
+    precomputed tables and builds small nested objects such as `CurrencyAmount` inline,
+    which makes it faster than the generic loaders on large pages. The function is
+    compiled on the first call and cached:
+
+        decode = compile_decoder(AccountToTransactionsConnection)
+        connection = decode(requester, data["entity"]["transactions"])
+
+    `timestamps` converts the `DateTime` fields, for instance `epoch_micros` to keep them
+    as integers or a codec wrapped with `cached` to convert repeated strings once. See
+    `lightspark.utils.timestamps`.
+    """
+    return _compiler(timestamps).decoder(cls, _fragment_selection(cls))
+
+
+@lru_cache(maxsize=None)
+def compile_lazy_decoder(
+    cls: Type[T], timestamps: TimestampCodec = parse_timestamp
+) -> Decoder[T]:
+    """Like `compile_decoder`, but the returned objects only keep the JSON they are built
+    from, and decode each attribute the first time it is read.
+
+    The objects are instances of a subclass of `cls` (or of the concrete type of an
+    interface) with the same attributes, and compare equal to the objects returned by
+    `from_json`. Decoding a page is then almost free when only a few attributes of its
+    entities are read:
+
+        decode = compile_lazy_decoder(AccountToTransactionsConnection)
+        connection = decode(requester, data["entity"]["transactions"])
+        total = sum(amount_as_msats(t.amount) for t in connection.entities)
+    """
+    return _compiler(timestamps).decoder(cls, _fragment_selection(cls), lazy=True)
@@ -0,0 +1,125 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Mapping, Optional, Tuple, Type, TypeVar
+
+from lightspark.objects.Entity import Entity
+
+ENTITY = TypeVar("ENTITY", bound=Entity)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    """Entries removed to respect the size bound, or because they expired."""
+    invalidations: int = 0
+
+
+class EntityCache:
+    """An identity map of the entities fetched by `get_entity`, keyed by entity id.
+
+    Only `get_entity`, `get_entity_query` and the entity loaders read and fill the cache.
+    The entities decoded from other responses, such as the pages of a connection or the
+    results of a mutation, are built by their `from_json` and are neither cached nor
+    looked up, so a cached entity can be older than the same entity loaded otherwise.
+
+    Entries expire after the TTL of their type: the first class of the entity's MRO found
+    in `ttl_secs`, or `default_ttl_secs`. A TTL of 0 disables caching for a type, and
+    `None` keeps entries until they are evicted. At most `max_size` entities are kept,
+    the least recently used ones being evicted first.
+
+        cache = EntityCache(ttl_secs={Channel: 5, Wallet: 30})
+        client = LightsparkSyncClient(client_id, client_secret, entity_cache=cache)
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        default_ttl_secs: Optional[float] = 60.0,
+        ttl_secs: Optional[Mapping[Type[Entity], Optional[float]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.default_ttl_secs = default_ttl_secs
+        self.ttl_secs = dict(ttl_secs or {})
+        self.stats = CacheStats()
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Maps entity ids to (entity, expiry), the least recently used first.
+        self._entries: "OrderedDict[str, Tuple[Entity, Optional[float]]]" = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, entity_id: str) -> bool:
+        with self._lock:
+            return self._lookup(entity_id) is not None
+
+    def get(
+        self, entity_id: str, entity_class: Type[ENTITY] = Entity
+    ) -> Optional[ENTITY]:
+        """Returns the cached entity if it has not expired and is an `entity_class`."""
+        with self._lock:
+            entity = self._lookup(entity_id)
+            if entity is None or not isinstance(entity, entity_class):
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            self._entries.move_to_end(entity_id)
+            return entity
+
+    def put(self, entity: ENTITY) -> ENTITY:
+        ttl = self._ttl(type(entity))
+        if ttl == 0:
+            return entity
+        with self._lock:
+            self._entries[entity.id] = (
+                entity,
+                None if ttl is None else self._clock() + ttl,
+            )
+            self._entries.move_to_end(entity.id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+        return entity
+
+    def invalidate(self, entity_id: str) -> bool:
+        """Removes an entity from the cache. Returns whether it was cached."""
+        return self.pop(entity_id) is not None
+
+    def pop(self, entity_id: str) -> Optional[Entity]:
+        """Removes an entity from the cache and returns it, even if it expired."""
+        with self._lock:
+            entry = self._entries.pop(entity_id, None)
+            if entry is None:
+                return None
+            self.stats.invalidations += 1
+            return entry[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(self, entity_id: str) -> Optional[Entity]:
+        entry = self._entries.get(entity_id)
+        if entry is None:
+            return None
+        entity, expiry = entry
+        if expiry is not None and self._clock() >= expiry:
+            del self._entries[entity_id]
+            self.stats.evictions += 1
+            return None
+        return entity
+
+    def _ttl(self, entity_class: type) -> Optional[float]:
+        for cls in entity_class.__mro__:
+            if cls in self.ttl_secs:
+                return self.ttl_secs[cls]
+        return self.default_ttl_secs
@@ -0,0 +1,196 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type, TypeVar
+
+from lightspark.objects.all_entities import cached_entity, get_entity_query
+from lightspark.objects.Entity import Entity
+from lightspark.requests.batch import QueryBatch
+from lightspark.requests.requester import Requester
+
+ENTITY = TypeVar("ENTITY", bound=Entity)
+
+_Key = Tuple[Type[Entity], str]
+
+
+def _chunks(keys: List[_Key], size: int) -> Iterable[List[_Key]]:
+    for start in range(0, len(keys), size):
+        yield keys[start : start + size]
+
+
+def _new_batch(requester: Requester, keys: List[_Key]) -> Tuple[QueryBatch, List[Any]]:
+    batch = requester.batch()
+    results = [
+        batch.add(
+            get_entity_query(
+                requester=requester, entity_id=entity_id, entity_class=entity_class
+            )
+        )
+        for entity_class, entity_id in keys
+    ]
+    return batch, results
+
+
+class EntityLoader:
+    """Coalesces the entity lookups made by several threads into a single request.
+
+    The first lookup of a window waits `window_secs` for lookups made by other threads,
+    then fetches all of them with one aliased GraphQL query. Lookups of an entity which
+    is already being fetched share the pending request. `load_many` sends its own
+    lookups, and any pending one, right away. Entities found in the entity cache of the
+    requester are returned without any request.
+    """
+
+    def __init__(
+        self,
+        requester: Requester,
+        window_secs: float = 0.005,
+        max_batch_size: int = 50,
+    ) -> None:
+        self._requester = requester
+        self._window_secs = window_secs
+        self._max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._pending: Dict[_Key, "Future[Any]"] = {}
+        self._dispatch_scheduled = False
+
+    def load(self, entity_id: str, entity_class: Type[ENTITY]) -> Optional[ENTITY]:
+        cached = cached_entity(self._requester, entity_id, entity_class)
+        if cached is not None:
+            return cached
+        (future,), leader = self._enqueue([(entity_class, entity_id)])
+        if leader:
+            time.sleep(self._window_secs)
+            self._dispatch()
+        return future.result()
+
+    def load_many(
+        self, entity_ids: List[str], entity_class: Type[ENTITY]
+    ) -> List[Optional[ENTITY]]:
+        cached = [
+            cached_entity(self._requester, entity_id, entity_class)
+            for entity_id in entity_ids
+        ]
+        missing: List[_Key] = [
+            (entity_class, entity_id)
+            for entity_id, entity in zip(entity_ids, cached)
+            if entity is None
+        ]
+        if not missing:
+            return cached
+        futures, _ = self._enqueue(missing)
+        self._dispatch()
+        results = iter(futures)
+        return [
+            entity if entity is not None else next(results).result()
+            for entity in cached
+        ]
+
+    def _enqueue(self, keys: List[_Key]) -> Tuple[List["Future[Any]"], bool]:
+        with self._lock:
+            futures = []
+            for key in keys:
+                if key not in self._pending:
+                    self._pending[key] = Future()
+                futures.append(self._pending[key])
+            leader = not self._dispatch_scheduled
+            self._dispatch_scheduled = True
+            return futures, leader
+
+    def _dispatch(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._dispatch_scheduled = False
+        for keys in _chunks(list(pending), self._max_batch_size):
+            batch, results = _new_batch(self._requester, keys)
+            try:
+                batch.execute()
+            except Exception:  # pylint: disable=broad-except
+                # The exception is also stored in every result of the batch.
+                pass
+            for key, result in zip(keys, results):
+                try:
+                    pending[key].set_result(result.result())
+                except Exception as e:  # pylint: disable=broad-except
+                    pending[key].set_exception(e)
+
+
+class AsyncEntityLoader:
+    """Coalesces the entity lookups made by coroutines into a single request.
+
+    Lookups made during the same iteration of the event loop, or within `window_secs` of
+    the first one, are fetched with one aliased GraphQL query. Lookups of an entity which
+    is already being fetched share the pending request.
+    """
+
+    def __init__(
+        self,
+        requester: Requester,
+        window_secs: float = 0.0,
+        max_batch_size: int = 50,
+    ) -> None:
+        self._requester = requester
+        self._window_secs = window_secs
+        self._max_batch_size = max_batch_size
+        self._pending: Dict[_Key, "asyncio.Future[Any]"] = {}
+        self._handle: Optional[asyncio.Handle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def load(
+        self, entity_id: str, entity_class: Type[ENTITY]
+    ) -> Optional[ENTITY]:
+        cached = cached_entity(self._requester, entity_id, entity_class)
+        if cached is not None:
+            return cached
+        loop = asyncio.get_running_loop()
+        key = (entity_class, entity_id)
+        future = self._pending.get(key)
+        if future is None:
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self._max_batch_size:
+                self._start_dispatch()
+            elif self._handle is None:
+                self._handle = loop.call_later(self._window_secs, self._start_dispatch)
+        # Shield the shared future so that a cancelled caller does not cancel the others.
+        return await asyncio.shield(future)
+
+    async def load_many(
+        self, entity_ids: List[str], entity_class: Type[ENTITY]
+    ) -> List[Optional[ENTITY]]:
+        return list(
+            await asyncio.gather(
+                *(self.load(entity_id, entity_class) for entity_id in entity_ids)
+            )
+        )
+
+    def _start_dispatch(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        pending, self._pending = self._pending, {}
+        task = asyncio.get_running_loop().create_task(self._dispatch(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, pending: Dict[_Key, "asyncio.Future[Any]"]) -> None:
+        batches = [
+            (keys, *_new_batch(self._requester, keys))
+            for keys in _chunks(list(pending), self._max_batch_size)
+        ]
+        await asyncio.gather(
+            *(batch.execute_async() for _, batch, _ in batches),
+            return_exceptions=True,
+        )
+        for keys, _, results in batches:
+            for key, result in zip(keys, results):
+                future = pending[key]
+                if future.done():
+                    continue
+                try:
+                    future.set_result(result.result())
+                except Exception as e:  # pylint: disable=broad-except
+                    future.set_exception(e)
@@ -4,3 +4,26 @@
 class LightsparkException(Exception):
     def __init__(self, code: str, message: str) -> None:
         pass
+
+
+class LightsparkTimeoutException(LightsparkException):
+    """Raised when a call to the API does not complete within its timeouts."""
+
+    def __init__(self, message: str) -> None:
+        super().__init__("TIMEOUT", message)
+
+
+class LightsparkHTTPException(LightsparkException):
+    """Raised when the API responds with an HTTP error status."""
+
+    def __init__(self, status_code: int, message: str) -> None:
+        super().__init__("HTTP_ERROR", message)
+        self.status_code = status_code
+
+
+class LightsparkConnectionException(LightsparkException):
+    """Raised when the connection to the API fails, or is closed before the response is
+    received."""
+
+    def __init__(self, message: str) -> None:
+        super().__init__("CONNECTION_ERROR", message)
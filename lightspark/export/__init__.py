@@ -0,0 +1,11 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+from lightspark.export.sinks import (
+    TRANSACTION_COLUMNS,
+    CsvSink,
+    NdjsonSink,
+    ParquetSink,
+    TransactionSink,
+    transaction_record,
+)
+from lightspark.export.transactions import TransactionExporter, export_transactions
@@ -0,0 +1,181 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import csv
+import json
+from abc import ABC, abstractmethod
+from datetime import datetime
+from enum import Enum
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from lightspark.exceptions import LightsparkException
+from lightspark.objects.CurrencyAmount import CurrencyAmount
+from lightspark.objects.Transaction import Transaction
+from lightspark.utils.currency_amount import amount_as_msats
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+
+def _msats(name: str) -> Callable[[Transaction], Optional[int]]:
+    def get(transaction: Transaction) -> Optional[int]:
+        amount: Optional[CurrencyAmount] = getattr(transaction, name, None)
+        return amount_as_msats(amount) if amount is not None else None
+
+    return get
+
+
+def _field(name: str) -> Callable[[Transaction], Any]:
+    def get(transaction: Transaction) -> Any:
+        value = getattr(transaction, name, None)
+        return value.value if isinstance(value, Enum) else value
+
+    return get
+
+
+# The columns of an exported transaction: name, getter and kind of value.
+TRANSACTION_COLUMNS: List[Tuple[str, Callable[[Transaction], Any], str]] = [
+    ("id", _field("id"), "string"),
+    ("typename", _field("typename"), "string"),
+    ("created_at", _field("created_at"), "timestamp"),
+    ("updated_at", _field("updated_at"), "timestamp"),
+    ("resolved_at", _field("resolved_at"), "timestamp"),
+    ("status", _field("status"), "string"),
+    ("amount_msats", _msats("amount"), "int"),
+    ("fees_msats", _msats("fees"), "int"),
+    ("transaction_hash", _field("transaction_hash"), "string"),
+    ("origin_id", _field("origin_id"), "string"),
+    ("destination_id", _field("destination_id"), "string"),
+    ("channel_id", _field("channel_id"), "string"),
+    ("incoming_channel_id", _field("incoming_channel_id"), "string"),
+    ("outgoing_channel_id", _field("outgoing_channel_id"), "string"),
+    ("block_height", _field("block_height"), "int"),
+    ("num_confirmations", _field("num_confirmations"), "int"),
+]
+"""The flattened representation of a transaction: amounts are integers in millisatoshis
+and the `typename` column tells the kind of transaction (`OutgoingPayment`, `Deposit`,
+`RoutingTransaction`, ...). Fields that a kind of transaction does not have are empty."""
+
+
+def transaction_record(transaction: Transaction) -> Dict[str, Any]:
+    return {name: get(transaction) for name, get, _ in TRANSACTION_COLUMNS}
+
+
+class TransactionSink(ABC):
+    """Writes transactions to a file in groups of `row_group_size` rows, so that only one
+    group is held in memory however many transactions are written.
+
+    Sinks are context managers which flush the last group on exit. Transactions can be
+    streamed from `iter_transactions` or `export_transactions`:
+
+        with open("transactions.csv", "w", newline="") as file, CsvSink(file) as sink:
+            sink.write_all(account.iter_transactions(page_size=500))
+    """
+
+    def __init__(self, row_group_size: int = 10000) -> None:
+        self.row_group_size = row_group_size
+        self.rows_written = 0
+        self._rows: List[Dict[str, Any]] = []
+
+    def write(self, transaction: Transaction) -> None:
+        self._rows.append(transaction_record(transaction))
+        if len(self._rows) >= self.row_group_size:
+            self.flush()
+
+    def write_all(self, transactions: Iterable[Transaction]) -> int:
+        for transaction in transactions:
+            self.write(transaction)
+        self.flush()
+        return self.rows_written
+
+    def flush(self) -> None:
+        if self._rows:
+            self._write_rows(self._rows)
+            self.rows_written += len(self._rows)
+            self._rows = []
+
+    def close(self) -> None:
+        self.flush()
+
+    @abstractmethod
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        pass
+
+    def __enter__(self) -> "TransactionSink":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def _text(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+class NdjsonSink(TransactionSink):
+    """Writes one JSON object per line to a text file."""
+
+    def __init__(self, file: IO[str], row_group_size: int = 10000) -> None:
+        super().__init__(row_group_size)
+        self._file = file
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        self._file.write(
+            "".join(
+                json.dumps({key: _text(value) for key, value in row.items()}) + "\n"
+                for row in rows
+            )
+        )
+
+
+class CsvSink(TransactionSink):
+    """Writes a CSV file with a header row. The file should be opened with
+    `newline=""`."""
+
+    def __init__(self, file: IO[str], row_group_size: int = 10000) -> None:
+        super().__init__(row_group_size)
+        self._writer = csv.DictWriter(
+            file, fieldnames=[name for name, _, _ in TRANSACTION_COLUMNS]
+        )
+        self._writer.writeheader()
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        self._writer.writerows(
+            {key: _text(value) for key, value in row.items()} for row in rows
+        )
+
+
+class ParquetSink(TransactionSink):
+    """Writes a Parquet file with one row group per `row_group_size` transactions.
+    Requires the pyarrow package."""
+
+    def __init__(self, where: Any, row_group_size: int = 10000) -> None:
+        if pyarrow is None:
+            raise LightsparkException(
+                "MISSING_DEPENDENCY",
+                "Parquet export requires the pyarrow package. Please install it"
+                + " with `pip install lightspark[parquet]`.",
+            )
+        super().__init__(row_group_size)
+        types = {
+            "string": pyarrow.string(),
+            "int": pyarrow.int64(),
+            "timestamp": pyarrow.timestamp("us", tz="UTC"),
+        }
+        self._schema = pyarrow.schema(
+            [(name, types[kind]) for name, _, kind in TRANSACTION_COLUMNS]
+        )
+        self._writer = pyarrow.parquet.ParquetWriter(where, self._schema)
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        columns = {name: [row[name] for row in rows] for name in self._schema.names}
+        self._writer.write_table(
+            pyarrow.Table.from_pydict(columns, schema=self._schema),
+            row_group_size=len(rows),
+        )
+
+    def close(self) -> None:
+        super().close()
+        self._writer.close()
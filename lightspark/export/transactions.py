@@ -0,0 +1,255 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import contextvars
+import dataclasses
+import math
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Iterator, List, Optional, Set, Tuple, Union
+
+from lightspark.decoders import compile_decoder, compile_lazy_decoder
+from lightspark.exceptions import LightsparkException
+from lightspark.objects.Account import Account
+from lightspark.objects.AccountToTransactionsConnection import (
+    AccountToTransactionsConnection,
+)
+from lightspark.objects.Transaction import Transaction
+from lightspark.objects.Wallet import Wallet
+from lightspark.objects.WalletToTransactionsConnection import (
+    WalletToTransactionsConnection,
+)
+from lightspark.requests.pagination import iter_pages
+from lightspark.requests.query import Query
+
+TransactionsOwner = Union[Account, Wallet]
+
+# Builds the query fetching a page of the transactions created in a time range:
+# (after_date, before_date, first, after) -> query.
+ShardQuery = Callable[[datetime, datetime, int, Optional[str]], Query[Any]]
+
+
+class _Shard:
+    def __init__(self, after_date: datetime, before_date: datetime) -> None:
+        self.after_date = after_date
+        self.before_date = before_date
+        self.future: Optional["Future[Tuple[bool, Any]]"] = None
+
+
+def _shard_query(
+    owner: TransactionsOwner,
+    compiled_decoders: bool,
+    lazy_decoders: bool,
+    **filters: Any,
+) -> ShardQuery:
+    query = _owner_shard_query(owner, **filters)
+    if not compiled_decoders and not lazy_decoders:
+        return query
+    connection_class = (
+        WalletToTransactionsConnection
+        if isinstance(owner, Wallet)
+        else AccountToTransactionsConnection
+    )
+    decode = (
+        compile_lazy_decoder(connection_class)
+        if lazy_decoders
+        else compile_decoder(connection_class)
+    )
+
+    def compiled_query(
+        after_date: datetime, before_date: datetime, first: int, after: Optional[str]
+    ) -> Query[Any]:
+        return dataclasses.replace(
+            query(after_date, before_date, first, after),
+            construct_object=lambda json: decode(
+                owner.requester, json["entity"]["transactions"]
+            ),
+        )
+
+    return compiled_query
+
+
+def _owner_shard_query(owner: TransactionsOwner, **filters: Any) -> ShardQuery:
+    if isinstance(owner, Wallet):
+        return (
+            lambda after_date, before_date, first, after: owner.get_transactions_query(
+                first=first,
+                after=after,
+                created_after_date=after_date,
+                created_before_date=before_date,
+                **filters,
+            )
+        )
+    return lambda after_date, before_date, first, after: owner.get_transactions_query(
+        first=first,
+        after=after,
+        after_date=after_date,
+        before_date=before_date,
+        **filters,
+    )
+
+
+def _utc(date: datetime) -> datetime:
+    return date if date.tzinfo is not None else date.replace(tzinfo=timezone.utc)
+
+
+class TransactionExporter:
+    """Fetches every transaction of a time range by paginating several shards of the
+    range concurrently.
+
+    Pages of a single connection have to be fetched one after the other because each of
+    them needs the cursor of the previous one. The exporter splits the range in shards
+    holding about `shard_size` transactions each, using the `count` returned with the
+    first page of a shard to split it further when needed, and paginates up to
+    `max_workers` shards at a time. Transactions are yielded in `created_at` order, and
+    a transaction returned by two adjacent shards is only yielded once.
+
+    Each shard is held in memory until it is yielded, and at most `2 * max_workers`
+    shards are fetched ahead of the one being yielded.
+    """
+
+    def __init__(
+        self,
+        owner: TransactionsOwner,
+        max_workers: int = 4,
+        shard_size: int = 10000,
+        page_size: int = 500,
+        min_shard_duration: timedelta = timedelta(seconds=1),
+        compiled_decoders: bool = False,
+        lazy_decoders: bool = False,
+        **filters: Any,
+    ) -> None:
+        """
+        Args:
+            owner: The account or the wallet whose transactions are exported.
+            max_workers: The number of shards fetched concurrently.
+            shard_size: The maximum number of transactions of a shard. Larger shards
+                are split.
+            page_size: The number of transactions fetched by each request.
+            min_shard_duration: Shards covering a shorter time range are never split.
+            compiled_decoders: Whether to build the transactions with the decoders of
+                `lightspark.decoders.compile_decoder` rather than the `from_json`
+                loaders, which is faster on large exports.
+            lazy_decoders: Whether to build the transactions with the decoders of
+                `lightspark.decoders.compile_lazy_decoder`, which only decode the
+                attributes that are read.
+            filters: Other arguments of the `get_transactions` method of the owner, e.g.
+                `bitcoin_network` or `statuses`.
+        """
+        if owner.requester.raw:
+            raise LightsparkException(
+                "RAW_NOT_SUPPORTED",
+                "Transactions cannot be exported with a raw client, since they are"
+                + " sorted by their creation date. Page through them with the"
+                + " iter_transactions method of the owner instead.",
+            )
+        self._owner = owner
+        self._query = _shard_query(owner, compiled_decoders, lazy_decoders, **filters)
+        self._max_workers = max_workers
+        self._shard_size = shard_size
+        self._page_size = page_size
+        self._min_shard_duration = min_shard_duration
+
+    def iter_transactions(
+        self,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+    ) -> Iterator[Transaction]:
+        """Yields the transactions created between `after_date` (by default, the creation
+        of the owner) and `before_date` (by default, now), oldest first. Dates without a
+        timezone are taken to be in UTC."""
+        shards = [
+            _Shard(
+                _utc(after_date or self._owner.created_at),
+                _utc(before_date or datetime.now(timezone.utc)),
+            )
+        ]
+        boundary_ids: Set[str] = set()
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            try:
+                while shards:
+                    for shard in shards[: 2 * self._max_workers]:
+                        if shard.future is None:
+                            # Keep the timeouts and priority of the caller.
+                            shard.future = executor.submit(
+                                contextvars.copy_context().run, self._load, shard
+                            )
+                    shard = shards.pop(0)
+                    complete, result = shard.future.result()  # pyre-ignore[16]
+                    if not complete:
+                        shards[0:0] = self._split(shard, result)
+                        continue
+
+                    next_ids: Set[str] = set()
+                    for transaction in result:
+                        if transaction.id in boundary_ids:
+                            continue
+                        # Transactions created at the boundary may be part of both shards.
+                        if transaction.created_at >= shard.before_date:
+                            next_ids.add(transaction.id)
+                        yield transaction
+                    boundary_ids = next_ids
+            finally:
+                for shard in shards:
+                    if shard.future is not None:
+                        shard.future.cancel()
+
+    def _load(self, shard: _Shard) -> Tuple[bool, Any]:
+        """Fetches the transactions of a shard, or only returns its count if the shard
+        should be split."""
+        connections = iter_pages(
+            self._owner.requester,
+            lambda after: self._query(
+                shard.after_date, shard.before_date, self._page_size, after
+            ),
+        )
+        first_page = next(connections)
+        if (
+            first_page.count > self._shard_size
+            and shard.before_date - shard.after_date >= 2 * self._min_shard_duration
+        ):
+            connections.close()
+            return False, first_page.count
+
+        transactions: List[Transaction] = list(first_page.entities)
+        for connection in connections:
+            transactions.extend(connection.entities)
+        transactions.sort(
+            key=lambda transaction: (transaction.created_at, transaction.id)
+        )
+        return True, transactions
+
+    def _split(self, shard: _Shard, count: int) -> List[_Shard]:
+        duration = shard.before_date - shard.after_date
+        parts = min(
+            math.ceil(count / self._shard_size),
+            int(duration / self._min_shard_duration),
+        )
+        parts = max(parts, 2)
+        bounds = [shard.after_date + duration * i / parts for i in range(parts)]
+        bounds.append(shard.before_date)
+        return [_Shard(start, end) for start, end in zip(bounds, bounds[1:])]
+
+
+def export_transactions(
+    owner: TransactionsOwner,
+    after_date: Optional[datetime] = None,
+    before_date: Optional[datetime] = None,
+    max_workers: int = 4,
+    shard_size: int = 10000,
+    page_size: int = 500,
+    compiled_decoders: bool = False,
+    lazy_decoders: bool = False,
+    **filters: Any,
+) -> Iterator[Transaction]:
+    """Yields the transactions of an account or a wallet created between `after_date`
+    and `before_date`, oldest first, fetching several time shards concurrently. See
+    `TransactionExporter`."""
+    return TransactionExporter(
+        owner,
+        max_workers=max_workers,
+        shard_size=shard_size,
+        page_size=page_size,
+        compiled_decoders=compiled_decoders,
+        lazy_decoders=lazy_decoders,
+        **filters,
+    ).iter_transactions(after_date, before_date)
@@ -1,11 +1,24 @@
 # Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
 
+import dataclasses
 import logging
 import re
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from hashlib import sha256
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import jwt
 from cryptography.hazmat.primitives.asymmetric.ed448 import Ed448PrivateKey
@@ -15,131 +28,178 @@ from cryptography.hazmat.primitives.serialization import (
     PrivateFormat,
     PublicFormat,
 )
+
+# The modules of the objects and queries are imported when a response is first loaded.
+# Type checkers do not resolve `from lightspark import objects` through the lazy package.
+import lightspark.objects as objects  # pylint: disable=consider-using-from-import
+import lightspark.scripts as scripts  # pylint: disable=consider-using-from-import
+from lightspark.entity_cache import EntityCache
+from lightspark.entity_loader import AsyncEntityLoader, EntityLoader
 from lightspark.exceptions import LightsparkException
-from lightspark.objects.Account import Account
-from lightspark.objects.Account import from_json as Account_from_json
-from lightspark.objects.all_entities import get_entity
-from lightspark.objects.ApiToken import ApiToken
-from lightspark.objects.ApiToken import from_json as ApiToken_from_json
-from lightspark.objects.BitcoinNetwork import BitcoinNetwork
-from lightspark.objects.ComplianceProvider import ComplianceProvider
-from lightspark.objects.CurrencyAmount import CurrencyAmount
-from lightspark.objects.CurrencyAmount import from_json as CurrencyAmount_from_json
+from lightspark.objects.all_entities import cached_entity, get_entity_query
 from lightspark.objects.Entity import Entity
-from lightspark.objects.FeeEstimate import FeeEstimate
-from lightspark.objects.FeeEstimate import from_json as FeeEstimate_from_json
-from lightspark.objects.IncomingPayment import IncomingPayment
-from lightspark.objects.IncomingPayment import from_json as IncomingPayment_from_json
-from lightspark.objects.IncomingPaymentsForInvoiceQueryOutput import (
-    from_json as IncomingPaymentsForInvoiceQueryOutput_from_json,
-)
-from lightspark.objects.Invoice import Invoice
-from lightspark.objects.Invoice import from_json as Invoice_from_json
-from lightspark.objects.InvoiceData import InvoiceData
-from lightspark.objects.InvoiceData import from_json as InvoiceData_from_json
-from lightspark.objects.InvoiceType import InvoiceType
-from lightspark.objects.LightningFeeEstimateOutput import (
-    from_json as LightningFeeEstimateOutput_from_json,
-)
-from lightspark.objects.LightningTransaction import LightningTransaction
-from lightspark.objects.LightningTransaction import (
-    from_json as LightningTransaction_from_json,
-)
-from lightspark.objects.OutgoingPayment import OutgoingPayment
-from lightspark.objects.OutgoingPayment import from_json as OutgoingPayment_from_json
-from lightspark.objects.PaymentDirection import PaymentDirection
 from lightspark.objects.Permission import Permission
-from lightspark.objects.RegionCode import RegionCode
 from lightspark.objects.RiskRating import RiskRating
 from lightspark.objects.TransactionStatus import TransactionStatus
-from lightspark.objects.UmaInvitation import UmaInvitation
-from lightspark.objects.UmaInvitation import from_json as UmaInvitation_from_json
-from lightspark.objects.WithdrawalMode import WithdrawalMode
-from lightspark.objects.WithdrawalRequest import WithdrawalRequest
-from lightspark.objects.WithdrawalRequest import (
-    from_json as WithdrawalRequest_from_json,
+from lightspark.requests.async_requester import AsyncRequester
+from lightspark.requests.batch import QueryBatch
+from lightspark.requests.json_backend import JsonBackend
+from lightspark.requests.pool import PoolConfig, PoolStats
+from lightspark.requests.query import Query
+from lightspark.requests.rate_limit import (
+    Priority,
+    RateLimiter,
+    RateLimitStats,
+    priority_scope,
 )
 from lightspark.requests.requester import Requester
-from lightspark.scripts.bitcoin_fee_estimate import BITCOIN_FEE_ESTIMATE_QUERY
-from lightspark.scripts.cancel_invoice import CANCEL_INVOICE_MUTATION
-from lightspark.scripts.claim_uma_invitation import (
-    CLAIM_UMA_INVITATION_MUTATION,
-    CLAIM_UMA_INVITATION_WITH_INCENTIVES_MUTATION,
-)
-from lightspark.scripts.create_api_token import CREATE_API_TOKEN_MUTATION
-from lightspark.scripts.create_invoice import CREATE_INVOICE_MUTATION
-from lightspark.scripts.create_lnurl_invoice import CREATE_LNURL_INVOICE_MUTATION
-from lightspark.scripts.create_node_address import CREATE_NODE_ADDRESS_MUTATION
-from lightspark.scripts.create_test_mode_invoice import (
-    CREATE_TEST_MODE_INVOICE_MUTATION,
-)
-from lightspark.scripts.create_test_mode_payment import (
-    CREATE_TEST_MODE_PAYMENT_MUTATION,
-)
-from lightspark.scripts.create_uma_invitation import (
-    CREATE_UMA_INVITATION_MUTATION,
-    CREATE_UMA_INVITATION_WITH_INCENTIVES_MUTATION,
-)
-from lightspark.scripts.create_uma_invoice import CREATE_UMA_INVOICE_MUTATION
-from lightspark.scripts.current_account import CURRENT_ACCOUNT_QUERY
-from lightspark.scripts.decoded_payment_request import DECODED_PAYMENT_REQUEST_QUERY
-from lightspark.scripts.delete_api_token import DELETE_API_TOKEN_MUTATION
-from lightspark.scripts.fetch_uma_invitation import FETCH_UMA_INVITATION_QUERY
-from lightspark.scripts.fund_node import FUND_NODE_MUTATION
-from lightspark.scripts.incoming_payments_for_invoice import (
-    INCOMING_PAYMENTS_FOR_INVOICE_QUERY,
-)
-from lightspark.scripts.lightning_fee_estimate_for_invoice import (
-    LIGHTNING_FEE_ESTIMATE_FOR_INVOICE_QUERY,
-)
-from lightspark.scripts.lightning_fee_estimate_for_node import (
-    LIGHTNING_FEE_ESTIMATE_FOR_NODE_QUERY,
-)
-from lightspark.scripts.outgoing_payments_for_invoice import (
-    OUTGOING_PAYMENTS_FOR_INVOICE_QUERY,
-)
-from lightspark.scripts.pay_invoice import PAY_INVOICE_MUTATION
-from lightspark.scripts.pay_uma_invoice import PAY_UMA_INVOICE_MUTATION
-from lightspark.scripts.recover_node_signing_key import RECOVER_NODE_SIGNING_KEY_QUERY
-from lightspark.scripts.register_payment import REGISTER_PAYMENT_MUTATION
-from lightspark.scripts.request_withdrawal import REQUEST_WITHDRAWAL_MUTATION
-from lightspark.scripts.screen_node import SCREEN_NODE_MUTATION
-from lightspark.scripts.send_payment import SEND_PAYMENT_MUTATION
+from lightspark.requests.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from lightspark.requests.timeouts import Timeout, timeout_scope
+from lightspark.requests.transport import Transport
 from lightspark.utils.crypto import decrypt_private_key
 from lightspark.utils.enums import parse_enum
 from lightspark.utils.signing_key import RSASigningKey, Secp256k1SigningKey, SigningKey
+from lightspark.webhook_subscriber import (
+    AsyncWebhookCacheSubscriber,
+    WebhookCacheSubscriber,
+)
+
+if TYPE_CHECKING:
+    # Only used in annotations.
+    from lightspark.objects.Account import Account
+    from lightspark.objects.ApiToken import ApiToken
+    from lightspark.objects.BitcoinNetwork import BitcoinNetwork
+    from lightspark.objects.ComplianceProvider import ComplianceProvider
+    from lightspark.objects.CurrencyAmount import CurrencyAmount
+    from lightspark.objects.FeeEstimate import FeeEstimate
+    from lightspark.objects.IncomingPayment import IncomingPayment
+    from lightspark.objects.Invoice import Invoice
+    from lightspark.objects.InvoiceData import InvoiceData
+    from lightspark.objects.InvoiceType import InvoiceType
+    from lightspark.objects.LightningTransaction import LightningTransaction
+    from lightspark.objects.OutgoingPayment import OutgoingPayment
+    from lightspark.objects.PaymentDirection import PaymentDirection
+    from lightspark.objects.RegionCode import RegionCode
+    from lightspark.objects.UmaInvitation import UmaInvitation
+    from lightspark.objects.WithdrawalMode import WithdrawalMode
+    from lightspark.objects.WithdrawalRequest import WithdrawalRequest
 
 logger = logging.getLogger("lightspark")
 
 ENTITY = TypeVar("ENTITY", bound=Entity)
 
+# How much longer than the `timeout_secs` of a payment the client waits for the response.
+PAYMENT_TIMEOUT_MARGIN_SECS = 5
+
+
+# The statuses of the payments which did not go through and can be attempted again.
+_ENDED_PAYMENT_STATUSES = frozenset(
+    {TransactionStatus.FAILED, TransactionStatus.EXPIRED, TransactionStatus.CANCELLED}
+)
+
+
+def _payment_timeout(timeout_secs: int) -> Timeout:
+    return Timeout(
+        read=timeout_secs + PAYMENT_TIMEOUT_MARGIN_SECS,
+        total=timeout_secs + PAYMENT_TIMEOUT_MARGIN_SECS,
+    )
+
+
+class _LightsparkClientBase:
+    """Holds the node signing keys and builds the `Query` behind every API call, so that
+    the blocking and the asyncio clients share a single definition of each operation."""
 
-@dataclass
-class LightsparkSyncClient:
     _requester: Requester
     _node_private_keys: Dict[str, SigningKey]
 
-    def __init__(
+    def batch(self) -> QueryBatch:
+        """Groups several queries into a single request to the API. Use the `*_query`
+        methods of the client and of the returned objects to build the queries:
+
+            with client.batch() as batch:
+                local_balance = batch.add(account.get_local_balance_query())
+                remote_balance = batch.add(account.get_remote_balance_query())
+            print(local_balance.result(), remote_balance.result())
+
+        With a `LightsparkAsyncClient`, use `async with client.batch() as batch:` instead.
+        """
+        return self._requester.batch()
+
+    def bind(self, entity: ENTITY) -> ENTITY:
+        """Returns a copy of `entity` whose methods call the API through this client.
+
+        This gives the `get_*` and `iter_*` methods of an object loaded by another client
+        the behavior of this one, for instance to page through raw connections:
+
+            raw_client = LightsparkSyncClient(client_id, client_secret, raw=True)
+            account = raw_client.bind(client.get_current_account())
+            data = account.get_transactions(first=100)
+        """
+        return dataclasses.replace(entity, requester=self._requester)
+
+    @property
+    def entity_cache(self) -> Optional[EntityCache]:
+        """The cache of the entities fetched with `get_entity`, if the client has one."""
+        return self._requester.entity_cache
+
+    def timeout(
         self,
-        api_token_client_id: str,
-        api_token_client_secret: str,
-        base_url: Optional[str] = None,
-        http_host: Optional[str] = None,
-    ) -> None:
-        self._requester = Requester(
-            api_token_client_id=api_token_client_id,
-            api_token_client_secret=api_token_client_secret,
-            base_url=base_url,
-            http_host=http_host,
+        connect: Optional[float] = None,
+        read: Optional[float] = None,
+        total: Optional[float] = None,
+    ) -> ContextManager[None]:
+        """Bounds the calls to the API made in the block, including those of the objects
+        loaded by the client, by the given timeouts in seconds:
+
+            with client.timeout(connect=1, total=5):
+                account = client.get_current_account()
+                balance = account.get_local_balance()
+
+        `total` is a deadline for all the calls of the block. Blocks apply to the calls of
+        the thread or asyncio task which enters them, including the pages prefetched by
+        the `iter_*` methods iterated in the block.
+        """
+        return timeout_scope(Timeout(connect=connect, read=read, total=total))
+
+    def priority(self, priority: Priority) -> ContextManager[None]:
+        """Gives `priority` to the calls to the API made in the block, including those of
+        the objects loaded by the client, when they wait for its rate limiter:
+
+            with client.priority(Priority.BATCH):
+                export_transactions(client, account, ...)
+
+        Like `timeout` blocks, it applies to the pages prefetched by the `iter_*` methods
+        iterated in the block.
+        """
+        return priority_scope(priority)
+
+    def rate_limit_stats(self) -> Dict[str, RateLimitStats]:
+        """Returns how many calls went through each limit of the rate limiter of the
+        client, by operation name, and how long they waited for it."""
+        if self._requester.rate_limiter is None:
+            return {}
+        return self._requester.rate_limiter.stats()
+
+    def pool_stats(self) -> PoolStats:
+        """Returns the number of connections to the API in use and idle, and how many
+        were opened and reused so far by the blocking requests of the client."""
+        return self._requester.pool_stats()
+
+    def webhook_subscriber(
+        self, refresh: bool = False, coalesce_secs: float = 0.0
+    ) -> WebhookCacheSubscriber:
+        """Returns a subscriber which updates the entity cache of the client with the
+        webhook events passed to its `handle` method. See `WebhookCacheSubscriber`."""
+        return WebhookCacheSubscriber(
+            self._requester, refresh=refresh, coalesce_secs=coalesce_secs
         )
-        self._node_private_keys = {}
 
-    def create_api_token(
+    def create_api_token_query(
         self,
         name: str,
         transact: bool = True,
         test_mode: bool = False,
-    ) -> Tuple[ApiToken, str]:
+    ) -> Query[Tuple["ApiToken", str]]:
         logger.info('Creating API token "%s".', name)
         permissions = {
             (False, False): (Permission.MAINNET_VIEW,),
@@ -148,24 +208,28 @@ class LightsparkSyncClient:
             (True, True): (Permission.REGTEST_VIEW, Permission.REGTEST_TRANSACT),
         }[(test_mode, transact)]
 
-        json = self._requester.execute_graphql(
-            CREATE_API_TOKEN_MUTATION,
-            {"name": name, "permissions": permissions},
-        )
+        def construct(json: Mapping[str, Any]) -> Tuple["ApiToken", str]:
+            return (
+                objects.ApiToken.from_json(
+                    self._requester, json["create_api_token"]["api_token"]
+                ),
+                json["create_api_token"]["client_secret"],
+            )
 
-        return (
-            ApiToken_from_json(self._requester, json["create_api_token"]["api_token"]),
-            json["create_api_token"]["client_secret"],
+        return Query(
+            scripts.create_api_token.CREATE_API_TOKEN_MUTATION,
+            {"name": name, "permissions": permissions},
+            construct,
         )
 
-    def create_invoice(
+    def create_invoice_query(
         self,
         node_id: str,
         amount_msats: int,
         memo: Optional[str] = None,
-        invoice_type: Optional[InvoiceType] = None,
+        invoice_type: Optional["InvoiceType"] = None,
         expiry_secs: Optional[int] = None,
-    ) -> Invoice:
+    ) -> Query["Invoice"]:
         logger.info("Creating an invoice for node %s.", node_id)
         variables = {
             "amount_msats": amount_msats,
@@ -175,34 +239,25 @@ class LightsparkSyncClient:
         }
         if expiry_secs is not None:
             variables["expiry_secs"] = expiry_secs
-        json = self._requester.execute_graphql(CREATE_INVOICE_MUTATION, variables)
 
-        return Invoice_from_json(self._requester, json["create_invoice"]["invoice"])
+        def construct(json: Mapping[str, Any]) -> "Invoice":
+            return objects.Invoice.from_json(
+                self._requester, json["create_invoice"]["invoice"]
+            )
 
-    def create_lnurl_invoice(
+        return Query(
+            scripts.create_invoice.CREATE_INVOICE_MUTATION,
+            variables,
+            construct,
+        )
+
+    def create_lnurl_invoice_query(
         self,
         node_id: str,
         amount_msats: int,
         metadata: str,
         expiry_secs: Optional[int] = None,
-    ) -> Invoice:
-        """Generates a Lightning Invoice (follows the Bolt 11 specification) to request a payment
-        from another Lightning Node. This should only be used for generating invoices for LNURLs,
-        with `create_invoice` preferred in the general case.
-
-        Args:
-            node_id (str): The ID of the node from which to create the invoice.
-            amount_sats (int): The amount for which the invoice should be created, in millisatoshis.
-            will be added.
-            metadata (str): The LNURL metadata payload field in the initial payreq response. This
-            will be hashed and present in the h-tag (SHA256 purpose of payment) of the resulting
-            Bolt 11 invoice.
-            expiry_secs (int, optional): The number of seconds after which the invoice will expire.
-            Defaults to 1 day.
-
-        Returns:
-            Invoice: An `Invoice` object representing the generated invoice.
-        """
+    ) -> Query["Invoice"]:
         logger.info("Creating an lnurl invoice for node %s.", node_id)
         variables = {
             "amount_msats": amount_msats,
@@ -211,69 +266,79 @@ class LightsparkSyncClient:
         }
         if expiry_secs is not None:
             variables["expiry_secs"] = expiry_secs
-        json = self._requester.execute_graphql(CREATE_LNURL_INVOICE_MUTATION, variables)
 
-        return Invoice_from_json(
-            self._requester, json["create_lnurl_invoice"]["invoice"]
+        def construct(json: Mapping[str, Any]) -> "Invoice":
+            return objects.Invoice.from_json(
+                self._requester, json["create_lnurl_invoice"]["invoice"]
+            )
+
+        return Query(
+            scripts.create_lnurl_invoice.CREATE_LNURL_INVOICE_MUTATION,
+            variables,
+            construct,
         )
 
-    def cancel_invoice(
+    def cancel_invoice_query(
         self,
         invoice_id: str,
-    ) -> Invoice:
-        """Cancels an existing unpaid invoice and returns that invoice. Cancelled invoices cannot be paid.
+    ) -> Query["Invoice"]:
+        logger.info("Canceling an invoice with id %s.", invoice_id)
 
-        Args:
-            invoice_id (str): The ID of the invoice to cancel.
+        def construct(json: Mapping[str, Any]) -> "Invoice":
+            return objects.Invoice.from_json(
+                self._requester, json["cancel_invoice"]["invoice"]
+            )
 
-        Returns:
-            Invoice: An `Invoice` object representing the cancelled invoice.
-        """
-        logger.info("Canceling an invoice with id %s.", invoice_id)
-        json = self._requester.execute_graphql(
-            CANCEL_INVOICE_MUTATION,
+        return Query(
+            scripts.cancel_invoice.CANCEL_INVOICE_MUTATION,
             {"invoice_id": invoice_id},
+            construct,
         )
 
-        return Invoice_from_json(self._requester, json["cancel_invoice"]["invoice"])
-
-    def create_node_wallet_address(
+    def create_node_wallet_address_query(
         self,
         node_id: str,
-    ) -> str:
+    ) -> Query[str]:
         logger.info("Creating a wallet address for node %s.", node_id)
-        json = self._requester.execute_graphql(
-            CREATE_NODE_ADDRESS_MUTATION,
+
+        def construct(json: Mapping[str, Any]) -> str:
+            return json["create_node_wallet_address"]["wallet_address"]
+
+        return Query(
+            scripts.create_node_address.CREATE_NODE_ADDRESS_MUTATION,
             {"node_id": node_id},
+            construct,
         )
-        return json["create_node_wallet_address"]["wallet_address"]
 
-    def create_test_mode_invoice(
+    def create_test_mode_invoice_query(
         self,
         local_node_id: str,
         amount_msats: int,
         memo: Optional[str] = None,
-        invoice_type: Optional[InvoiceType] = None,
-    ) -> str:
+        invoice_type: Optional["InvoiceType"] = None,
+    ) -> Query[str]:
         logger.info("Creating a test invoice for node %s.", local_node_id)
-        json = self._requester.execute_graphql(
-            CREATE_TEST_MODE_INVOICE_MUTATION,
+
+        def construct(json: Mapping[str, Any]) -> str:
+            return json["create_test_mode_invoice"]["encoded_payment_request"]
+
+        return Query(
+            scripts.create_test_mode_invoice.CREATE_TEST_MODE_INVOICE_MUTATION,
             {
                 "amount_msats": amount_msats,
                 "local_node_id": local_node_id,
                 "memo": memo,
                 "invoice_type": invoice_type,
             },
+            construct,
         )
 
-        return json["create_test_mode_invoice"]["encoded_payment_request"]
-
-    def create_test_mode_payment(
+    def create_test_mode_payment_query(
         self,
         local_node_id: str,
         encoded_invoice: str,
         amount_msats: Optional[int] = None,
-    ) -> IncomingPayment:
+    ) -> Query["IncomingPayment"]:
         variables: Dict[str, Any] = {
             "local_node_id": local_node_id,
             "encoded_invoice": encoded_invoice,
@@ -281,67 +346,67 @@ class LightsparkSyncClient:
         if amount_msats is not None:
             variables["amount_msats"] = amount_msats
 
-        json = self._requester.execute_graphql(
-            CREATE_TEST_MODE_PAYMENT_MUTATION,
+        def construct(json: Mapping[str, Any]) -> "IncomingPayment":
+            return objects.IncomingPayment.from_json(
+                self._requester, json["create_test_mode_payment"]["incoming_payment"]
+            )
+
+        return Query(
+            scripts.create_test_mode_payment.CREATE_TEST_MODE_PAYMENT_MUTATION,
             variables,
-        )
-        return IncomingPayment_from_json(
-            self._requester, json["create_test_mode_payment"]["incoming_payment"]
+            construct,
         )
 
-    def create_uma_invoice(
+    def create_uma_invoice_query(
         self,
         node_id: str,
         amount_msats: int,
         metadata: str,
         expiry_secs: Optional[int] = None,
-    ) -> Invoice:
+    ) -> Query["Invoice"]:
         logger.info("Creating an uma invoice for node %s.", node_id)
-        json = self._requester.execute_graphql(
-            CREATE_UMA_INVOICE_MUTATION,
+
+        def construct(json: Mapping[str, Any]) -> "Invoice":
+            return objects.Invoice.from_json(
+                self._requester, json["create_uma_invoice"]["invoice"]
+            )
+
+        return Query(
+            scripts.create_uma_invoice.CREATE_UMA_INVOICE_MUTATION,
             {
                 "amount_msats": amount_msats,
                 "node_id": node_id,
                 "metadata_hash": sha256(metadata.encode("utf-8")).hexdigest(),
                 "expiry_secs": expiry_secs if expiry_secs is not None else 600,
             },
+            construct,
         )
 
-        return Invoice_from_json(self._requester, json["create_uma_invoice"]["invoice"])
-
-    def delete_api_token(self, api_token_id: str) -> None:
+    def delete_api_token_query(self, api_token_id: str) -> Query[None]:
         logger.info("Deleting API token %s.", api_token_id)
-        self._requester.execute_graphql(
-            DELETE_API_TOKEN_MUTATION,
+
+        def construct(_: Mapping[str, Any]) -> None:
+            return None
+
+        return Query(
+            scripts.delete_api_token.DELETE_API_TOKEN_MUTATION,
             {"api_token_id": api_token_id},
+            construct,
         )
 
-    def execute_graphql_request(
+    def execute_graphql_request_query(
         self, document: str, variables: Optional[Mapping[str, Any]] = None
-    ) -> Mapping[str, Any]:
-        """This function can be used to execute a custom GraphQL request against
-        the Lightspark public API. It will take care of the authentication automatically.
-
-        To find the Lightspark API documentation, see https://docs.lightspark.com/api/graphql/2023-01-01
-        To learn more about GraphQL, see https://graphql.org/learn/
+    ) -> Query[Mapping[str, Any]]:
+        logger.info("Executing arbitrary GraphQL request with document=%s", document)
 
-        Args:
-            document:
-                This is the GraphQL document (query or mutation) that will be
-                executed against the API.
-            variables (optional):
-                A dictionary representing a JSON object containing the variables
-                needed to execute the query or mutation in the document. This is
-                optional if your document does not use any variable.
+        def construct(json: Mapping[str, Any]) -> Mapping[str, Any]:
+            return json
 
-        Returns:
-            A dictionary representing the JSON response received from the API.
-            This JSON object can then be used to instantiate some of the python
-            objects defined in the lightspark.objects.* modules, using the `from_json`
-            function defined in each module.
-        """
-        logger.info("Executing arbitrary GraphQL request with document=%s", document)
-        return self._requester.execute_graphql(query=document, variables=variables)
+        return Query(
+            document,
+            variables or {},
+            construct,
+        )
 
     def generate_jwt_key(self) -> Tuple[str, str]:
         key = Ed448PrivateKey.generate()
@@ -371,129 +436,157 @@ class LightsparkSyncClient:
         }
         return jwt.encode(payload, private_key_pem, algorithm)
 
-    def get_current_account(
+    def get_current_account_query(
         self,
-    ) -> Account:
+    ) -> Query["Account"]:
         logger.info("Fetching current account.")
-        json = self._requester.execute_graphql(
-            CURRENT_ACCOUNT_QUERY,
+
+        def construct(json: Mapping[str, Any]) -> "Account":
+            return objects.Account.from_json(self._requester, json["current_account"])
+
+        return Query(
+            scripts.current_account.CURRENT_ACCOUNT_QUERY,
             {},
+            construct,
         )
-        return Account_from_json(self._requester, json["current_account"])
 
-    def get_decoded_payment_request(self, encoded_payment_request: str) -> InvoiceData:
+    def get_decoded_payment_request_query(
+        self, encoded_payment_request: str
+    ) -> Query["InvoiceData"]:
         logger.info(
             "Decoding payment request starting with %s...",
             encoded_payment_request[0:10],
         )
-        json = self._requester.execute_graphql(
-            DECODED_PAYMENT_REQUEST_QUERY,
+
+        def construct(json: Mapping[str, Any]) -> "InvoiceData":
+            data = json["decoded_payment_request"]
+            typename = data["__typename"]
+            if typename != "InvoiceData":
+                raise LightsparkException(
+                    "UNKNOWN_TYPE", f"Unsupported type of payment request: {typename}"
+                )
+            return objects.InvoiceData.from_json(self._requester, data)
+
+        return Query(
+            scripts.decoded_payment_request.DECODED_PAYMENT_REQUEST_QUERY,
             {"encoded_payment_request": encoded_payment_request},
+            construct,
         )
-        data = json["decoded_payment_request"]
-        typename = data["__typename"]
-        if typename != "InvoiceData":
-            raise LightsparkException(
-                "UNKNOWN_TYPE", f"Unsupported type of payment request: {typename}"
-            )
-        return InvoiceData_from_json(self._requester, data)
 
-    def get_entity(
+    def get_entity_query(
         self, entity_id: str, entity_class: Type[ENTITY]
-    ) -> Optional[ENTITY]:
+    ) -> Query[Optional[ENTITY]]:
         logger.info(
             "Fetching entity of type %s with id %s", str(entity_class), entity_id
         )
-        return get_entity(
+        return get_entity_query(
             requester=self._requester, entity_id=entity_id, entity_class=entity_class
         )
 
-    def get_bitcoin_fee_estimate(self, bitcoin_network: BitcoinNetwork) -> FeeEstimate:
+    def get_bitcoin_fee_estimate_query(
+        self, bitcoin_network: "BitcoinNetwork"
+    ) -> Query["FeeEstimate"]:
         logger.info("Querying the fee estimate for network %s.", bitcoin_network)
-        json = self._requester.execute_graphql(
-            BITCOIN_FEE_ESTIMATE_QUERY,
+
+        def construct(json: Mapping[str, Any]) -> "FeeEstimate":
+            return objects.FeeEstimate.from_json(
+                self._requester, json["bitcoin_fee_estimate"]
+            )
+
+        return Query(
+            scripts.bitcoin_fee_estimate.BITCOIN_FEE_ESTIMATE_QUERY,
             {"bitcoin_network": bitcoin_network},
+            construct,
         )
-        return FeeEstimate_from_json(self._requester, json["bitcoin_fee_estimate"])
 
-    def get_lightning_fee_estimate_for_invoice(
+    def get_lightning_fee_estimate_for_invoice_query(
         self,
         node_id: str,
         encoded_payment_request: str,
         amount_msats: Optional[int] = None,
-    ) -> CurrencyAmount:
+    ) -> Query["CurrencyAmount"]:
         variables: Dict[str, Any] = {
             "node_id": node_id,
             "encoded_payment_request": encoded_payment_request,
         }
         if amount_msats is not None:
             variables["amount_msats"] = amount_msats
-        json = self._requester.execute_graphql(
-            LIGHTNING_FEE_ESTIMATE_FOR_INVOICE_QUERY,
+
+        def construct(json: Mapping[str, Any]) -> "CurrencyAmount":
+            return objects.LightningFeeEstimateOutput.from_json(
+                self._requester, json["lightning_fee_estimate_for_invoice"]
+            ).fee_estimate
+
+        return Query(
+            scripts.lightning_fee_estimate_for_invoice.LIGHTNING_FEE_ESTIMATE_FOR_INVOICE_QUERY,
             variables,
+            construct,
         )
-        return LightningFeeEstimateOutput_from_json(
-            self._requester, json["lightning_fee_estimate_for_invoice"]
-        ).fee_estimate
 
-    def get_lightning_fee_estimate_for_node(
+    def get_lightning_fee_estimate_for_node_query(
         self,
         node_id: str,
         destination_node_public_key: str,
         amount_msats: int,
-    ) -> CurrencyAmount:
-        json = self._requester.execute_graphql(
-            LIGHTNING_FEE_ESTIMATE_FOR_NODE_QUERY,
+    ) -> Query["CurrencyAmount"]:
+        def construct(json: Mapping[str, Any]) -> "CurrencyAmount":
+            return objects.LightningFeeEstimateOutput.from_json(
+                self._requester, json["lightning_fee_estimate_for_node"]
+            ).fee_estimate
+
+        return Query(
+            scripts.lightning_fee_estimate_for_node.LIGHTNING_FEE_ESTIMATE_FOR_NODE_QUERY,
             {
                 "node_id": node_id,
                 "destination_node_public_key": destination_node_public_key,
                 "amount_msats": amount_msats,
             },
+            construct,
         )
-        return LightningFeeEstimateOutput_from_json(
-            self._requester, json["lightning_fee_estimate_for_node"]
-        ).fee_estimate
 
     def load_node_signing_key(self, node_id: str, signing_key: SigningKey) -> None:
         logger.info("Loading the signing key for node %s", node_id)
         self._node_private_keys[node_id] = signing_key
 
-    def recover_node_signing_key(self, node_id: str, node_password: str) -> SigningKey:
+    def recover_node_signing_key_query(
+        self, node_id: str, node_password: str
+    ) -> Query[SigningKey]:
         logger.info("Recovering the signing key for node %s", node_id)
-        json = self._requester.execute_graphql(
-            RECOVER_NODE_SIGNING_KEY_QUERY,
-            {"node_id": node_id},
-        )
-        encrypted_key = json["entity"]["encrypted_signing_private_key"][
-            "encrypted_value"
-        ]
-        cipher = json["entity"]["encrypted_signing_private_key"]["cipher"]
 
-        decrypted_private_key = decrypt_private_key(
-            cipher_version=cipher,
-            encrypted_value=encrypted_key,
-            password=node_password,
-        )
-
-        signing_key = RSASigningKey(decrypted_private_key)
+        def construct(json: Mapping[str, Any]) -> SigningKey:
+            encrypted_key = json["entity"]["encrypted_signing_private_key"][
+                "encrypted_value"
+            ]
+            cipher = json["entity"]["encrypted_signing_private_key"]["cipher"]
+            decrypted_private_key = decrypt_private_key(
+                cipher_version=cipher,
+                encrypted_value=encrypted_key,
+                password=node_password,
+            )
+            signing_key = RSASigningKey(decrypted_private_key)
+            self.load_node_signing_key(node_id=node_id, signing_key=signing_key)
+            return signing_key
 
-        self.load_node_signing_key(node_id=node_id, signing_key=signing_key)
-        return signing_key
+        return Query(
+            scripts.recover_node_signing_key.RECOVER_NODE_SIGNING_KEY_QUERY,
+            {"node_id": node_id},
+            construct,
+        )
 
     def provide_node_master_seed(
-        self, node_id: str, master_seed: bytes, bitcoin_network: BitcoinNetwork
+        self, node_id: str, master_seed: bytes, bitcoin_network: "BitcoinNetwork"
     ) -> None:
         signing_key = Secp256k1SigningKey(master_seed, bitcoin_network)
         self.load_node_signing_key(node_id=node_id, signing_key=signing_key)
 
-    def pay_invoice(
+    def pay_invoice_query(
         self,
         node_id: str,
         encoded_invoice: str,
         timeout_secs: int,
         maximum_fees_msats: int,
         amount_msats: Optional[int] = None,
-    ) -> OutgoingPayment:
+    ) -> Query["OutgoingPayment"]:
         variables = {
             "node_id": node_id,
             "encoded_invoice": encoded_invoice,
@@ -502,23 +595,29 @@ class LightsparkSyncClient:
         }
         if amount_msats is not None:
             variables["amount_msats"] = amount_msats
-        json = self._requester.execute_graphql(
-            PAY_INVOICE_MUTATION,
+
+        def construct(json: Mapping[str, Any]) -> "OutgoingPayment":
+            return objects.OutgoingPayment.from_json(
+                self._requester, json["pay_invoice"]["payment"]
+            )
+
+        return Query(
+            scripts.pay_invoice.PAY_INVOICE_MUTATION,
             variables,
-            self.get_signing_key(node_id),
-        )
-        return OutgoingPayment_from_json(
-            self._requester, json["pay_invoice"]["payment"]
+            construct,
+            signing_key=self.get_signing_key(node_id),
+            timeout=_payment_timeout(timeout_secs),
+            retry_check=lambda: self._previous_payment_query(encoded_invoice),
         )
 
-    def pay_uma_invoice(
+    def pay_uma_invoice_query(
         self,
         node_id: str,
         encoded_invoice: str,
         timeout_secs: int,
         maximum_fees_msats: int,
         amount_msats: Optional[int] = None,
-    ) -> OutgoingPayment:
+    ) -> Query["OutgoingPayment"]:
         variables = {
             "node_id": node_id,
             "encoded_invoice": encoded_invoice,
@@ -527,25 +626,36 @@ class LightsparkSyncClient:
         }
         if amount_msats is not None:
             variables["amount_msats"] = amount_msats
-        json = self._requester.execute_graphql(
-            PAY_UMA_INVOICE_MUTATION,
+
+        def construct(json: Mapping[str, Any]) -> "OutgoingPayment":
+            return objects.OutgoingPayment.from_json(
+                self._requester, json["pay_uma_invoice"]["payment"]
+            )
+
+        return Query(
+            scripts.pay_uma_invoice.PAY_UMA_INVOICE_MUTATION,
             variables,
-            self.get_signing_key(node_id),
-        )
-        return OutgoingPayment_from_json(
-            self._requester, json["pay_uma_invoice"]["payment"]
+            construct,
+            signing_key=self.get_signing_key(node_id),
+            timeout=_payment_timeout(timeout_secs),
+            retry_check=lambda: self._previous_payment_query(encoded_invoice),
         )
 
-    def send_payment(
+    def send_payment_query(
         self,
         node_id: str,
         destination_public_key: str,
         amount_msats: int,
         timeout_secs: int,
         maximum_fees_msats: int,
-    ) -> OutgoingPayment:
-        json = self._requester.execute_graphql(
-            SEND_PAYMENT_MUTATION,
+    ) -> Query["OutgoingPayment"]:
+        def construct(json: Mapping[str, Any]) -> "OutgoingPayment":
+            return objects.OutgoingPayment.from_json(
+                self._requester, json["send_payment"]["payment"]
+            )
+
+        return Query(
+            scripts.send_payment.SEND_PAYMENT_MUTATION,
             {
                 "node_id": node_id,
                 "destination_public_key": destination_public_key,
@@ -553,22 +663,22 @@ class LightsparkSyncClient:
                 "timeout_secs": timeout_secs,
                 "maximum_fees_msats": maximum_fees_msats,
             },
-            self.get_signing_key(node_id),
-        )
-        return OutgoingPayment_from_json(
-            self._requester, json["send_payment"]["payment"]
+            construct,
+            signing_key=self.get_signing_key(node_id),
+            timeout=_payment_timeout(timeout_secs),
         )
 
-    def screen_node(self, provider: ComplianceProvider, node_pubkey: str) -> RiskRating:
-        """
-        Screens a lightning node using its public key. In order to call this API,
-        you need to have the API key stored in your account setting page for the selected compliance provider.
-        """
-        json = self._requester.execute_graphql(
-            SCREEN_NODE_MUTATION,
+    def screen_node_query(
+        self, provider: "ComplianceProvider", node_pubkey: str
+    ) -> Query[RiskRating]:
+        def construct(json: Mapping[str, Any]) -> RiskRating:
+            return parse_enum(RiskRating, json["screen_node"]["rating"])
+
+        return Query(
+            scripts.screen_node.SCREEN_NODE_MUTATION,
             {"provider": provider, "node_pubkey": node_pubkey},
+            construct,
         )
-        return parse_enum(RiskRating, json["screen_node"]["rating"])
 
     def get_signing_key(self, node_id: str) -> SigningKey:
         if node_id not in self._node_private_keys:
@@ -579,172 +689,756 @@ class LightsparkSyncClient:
             )
         return self._node_private_keys[node_id]
 
-    def fund_node(
+    def fund_node_query(
         self,
         node_id: str,
         amount_sats: int,
-    ) -> CurrencyAmount:
-        """Adds funds to a Lightspark node on the REGTEST network. If the amount is not specified, 10,000,000 SATOSHI
-        will be added. This API only functions for nodes created on the REGTEST network and will return an error when
-        called for any non-REGTEST node.
-
-        Args:
-            node_id (str): The ID of the node to fund. Must be a REGTEST node.
-            amount_sats (int): The amount of funds to add to the node in SATOSHI. If not specified, 10,000,000 SATOSHI
-            will be added.
+    ) -> Query["CurrencyAmount"]:
+        def construct(json: Mapping[str, Any]) -> "CurrencyAmount":
+            return objects.CurrencyAmount.from_json(
+                self._requester, json["fund_node"]["amount"]
+            )
 
-        Returns:
-            CurrencyAmount: The amount of funds added to the node.
-        """
-        json = self._requester.execute_graphql(
-            FUND_NODE_MUTATION,
+        return Query(
+            scripts.fund_node.FUND_NODE_MUTATION,
             {
                 "node_id": node_id,
                 "amount_sats": amount_sats,
             },
+            construct,
         )
-        return CurrencyAmount_from_json(self._requester, json["fund_node"]["amount"])
 
-    def request_withdrawal(
+    def request_withdrawal_query(
         self,
         node_id: str,
         amount_sats: int,
         bitcoin_address: str,
-        withdrawal_mode: WithdrawalMode,
-    ) -> WithdrawalRequest:
-        """Withdraws funds from the account and sends it to the requested bitcoin address.
-
-        Depending on the chosen mode, it will first take the funds from the wallet, and if applicable, close channels appropriately to recover enough funds and reopen channels with the remaining funds.
-        The process is asynchronous and may take up to a few minutes. You can check the progress by polling the `WithdrawalRequest` that is created, or by subscribing to a webhook.
-        """
+        withdrawal_mode: "WithdrawalMode",
+    ) -> Query["WithdrawalRequest"]:
+        def construct(json: Mapping[str, Any]) -> "WithdrawalRequest":
+            return objects.WithdrawalRequest.from_json(
+                self._requester, json["request_withdrawal"]["request"]
+            )
 
-        json = self._requester.execute_graphql(
-            REQUEST_WITHDRAWAL_MUTATION,
+        return Query(
+            scripts.request_withdrawal.REQUEST_WITHDRAWAL_MUTATION,
             {
                 "node_id": node_id,
                 "amount_sats": amount_sats,
                 "bitcoin_address": bitcoin_address,
                 "withdrawal_mode": withdrawal_mode,
             },
-            self.get_signing_key(node_id),
-        )
-        return WithdrawalRequest_from_json(
-            self._requester, json["request_withdrawal"]["request"]
+            construct,
+            signing_key=self.get_signing_key(node_id),
         )
 
-    def register_payment(
+    def register_payment_query(
         self,
-        provider: ComplianceProvider,
+        provider: "ComplianceProvider",
         payment_id: str,
         node_pubkey: str,
-        direction: PaymentDirection,
-    ) -> LightningTransaction:
-        """
-        Register a successful lightning payment with a selected compliance provider.
-        In order to call this API, you need to have the API key stored in your account
-        setting page for the selected compliance provider.
+        direction: "PaymentDirection",
+    ) -> Query["LightningTransaction"]:
+        def construct(json: Mapping[str, Any]) -> "LightningTransaction":
+            return objects.LightningTransaction.from_json(
+                self._requester, json["register_payment"]["payment"]
+            )
 
-        Args:
-            provider: The external compliance provider you have account with. You need to store the API key in your account seeting.
-            payment_id: The ID of a lightning payment, which can be either an OutgoingPayment or an IncomingPayment.
-            node_pubkey: The public key of the counterparty lightning node, which is the recipient node for an OutgoingPayment or the sender node for an IncomingPayment.
-            direction: Indicates whether this payment is an OutgoingPayment or an IncomingPayment
-        """
-        json = self._requester.execute_graphql(
-            REGISTER_PAYMENT_MUTATION,
+        return Query(
+            scripts.register_payment.REGISTER_PAYMENT_MUTATION,
             {
                 "provider": provider,
                 "node_pubkey": node_pubkey,
                 "payment_id": payment_id,
                 "direction": direction,
             },
-        )
-        return LightningTransaction_from_json(
-            self._requester, json["register_payment"]["payment"]
+            construct,
         )
 
-    def outgoing_payments_for_invoice(
+    def outgoing_payments_for_invoice_query(
         self,
         encoded_invoice: str,
         transaction_statuses: Optional[List[TransactionStatus]] = None,
-    ) -> List[OutgoingPayment]:
-        """
-        Fetches the outgoing payments (if any) which have been made for a given invoice.
-
-        Args:
-            encoded_invoice: The encoded invoice for which to fetch the outgoing payments.
-            transaction_statuses: The statuses of the transactions to fetch. If not specified, all transactions will be fetched.
-        """
-
+    ) -> Query[List["OutgoingPayment"]]:
         variables: Dict[str, Any] = {"encoded_invoice": encoded_invoice}
         if transaction_statuses is not None:
             variables["transaction_statuses"] = transaction_statuses
-        json = self._requester.execute_graphql(
-            OUTGOING_PAYMENTS_FOR_INVOICE_QUERY, variables
-        )
-        if "outgoing_payments_for_invoice" not in json:
-            return []
-        if "payments" not in json["outgoing_payments_for_invoice"]:
-            return []
-        return [
-            OutgoingPayment_from_json(self._requester, payment)
-            for payment in json["outgoing_payments_for_invoice"]["payments"]
-        ]
 
-    def incoming_payments_for_invoice(
+        def construct(json: Mapping[str, Any]) -> List["OutgoingPayment"]:
+            if "outgoing_payments_for_invoice" not in json:
+                return []
+            if "payments" not in json["outgoing_payments_for_invoice"]:
+                return []
+            return [
+                objects.OutgoingPayment.from_json(self._requester, payment)
+                for payment in json["outgoing_payments_for_invoice"]["payments"]
+            ]
+
+        return Query(
+            scripts.outgoing_payments_for_invoice.OUTGOING_PAYMENTS_FOR_INVOICE_QUERY,
+            variables,
+            construct,
+        )
+
+    def _previous_payment_query(
+        self, encoded_invoice: str
+    ) -> Query[Optional["OutgoingPayment"]]:
+        # Before paying an invoice again, look for a payment of it which went through or
+        # is still in flight.
+        payments_query = self.outgoing_payments_for_invoice_query(encoded_invoice)
+
+        def construct(json: Mapping[str, Any]) -> Optional["OutgoingPayment"]:
+            return next(
+                (
+                    payment
+                    for payment in payments_query.construct_object(json)
+                    if payment.status not in _ENDED_PAYMENT_STATUSES
+                ),
+                None,
+            )
+
+        return Query(payments_query.query, payments_query.variables, construct)
+
+    def incoming_payments_for_invoice_query(
         self,
         invoice_id: str,
         transaction_statuses: Optional[List[TransactionStatus]] = None,
-    ) -> List[IncomingPayment]:
-        """
-        Fetches the incoming payments (if any) which have been made for a given invoice.
-
-        Args:
-            invoice_id: The encoded invoice for which to fetch the incoming payments.
-            transaction_statuses: The statuses of the transactions to fetch. If not specified, all transactions will be fetched.
-        """
-
+    ) -> Query[List["IncomingPayment"]]:
         variables: Dict[str, Any] = {"invoice_id": invoice_id}
         if transaction_statuses is not None:
             variables["transaction_statuses"] = transaction_statuses
-        json = self._requester.execute_graphql(
-            INCOMING_PAYMENTS_FOR_INVOICE_QUERY, variables
-        )
-        if "incoming_payments_for_invoice" not in json:
-            return []
-        output = IncomingPaymentsForInvoiceQueryOutput_from_json(
-            self._requester, json["incoming_payments_for_invoice"]
+
+        def construct(json: Mapping[str, Any]) -> List["IncomingPayment"]:
+            if "incoming_payments_for_invoice" not in json:
+                return []
+            output = objects.IncomingPaymentsForInvoiceQueryOutput.from_json(
+                self._requester, json["incoming_payments_for_invoice"]
+            )
+            return output.payments
+
+        return Query(
+            scripts.incoming_payments_for_invoice.INCOMING_PAYMENTS_FOR_INVOICE_QUERY,
+            variables,
+            construct,
         )
-        return output.payments
 
-    def create_uma_invitation(
+    def create_uma_invitation_query(
         self,
         inviter_uma: str,
-    ) -> UmaInvitation:
-        """
-        Creates a new UMA invitation. If you are part of the incentive program, you should use the
-        `create_uma_invitation_with_incentives` method instead.
+    ) -> Query["UmaInvitation"]:
+        def construct(json: Mapping[str, Any]) -> "UmaInvitation":
+            return objects.UmaInvitation.from_json(
+                self._requester, json["create_uma_invitation"]["invitation"]
+            )
 
-        Args:
-            inviter_uma: The UMA of the inviter.
-        """
-        json = self._requester.execute_graphql(
-            CREATE_UMA_INVITATION_MUTATION,
+        return Query(
+            scripts.create_uma_invitation.CREATE_UMA_INVITATION_MUTATION,
             {
                 "inviter_uma": inviter_uma,
             },
-        )
-        return UmaInvitation_from_json(
-            self._requester, json["create_uma_invitation"]["invitation"]
+            construct,
         )
 
-    def create_uma_invitation_with_incentives(
+    def create_uma_invitation_with_incentives_query(
         self,
         inviter_uma: str,
         inviter_phone_number_e164: str,
-        inviter_region: RegionCode,
-    ) -> UmaInvitation:
-        """
+        inviter_region: "RegionCode",
+    ) -> Query["UmaInvitation"]:
+        def construct(json: Mapping[str, Any]) -> "UmaInvitation":
+            return objects.UmaInvitation.from_json(
+                self._requester,
+                json["create_uma_invitation_with_incentives"]["invitation"],
+            )
+
+        return Query(
+            scripts.create_uma_invitation.CREATE_UMA_INVITATION_WITH_INCENTIVES_MUTATION,
+            {
+                "inviter_uma": inviter_uma,
+                "inviter_phone_hash": self._hash_phone_number(
+                    inviter_phone_number_e164
+                ),
+                "inviter_region": inviter_region.name,
+            },
+            construct,
+        )
+
+    def claim_uma_invitation_query(
+        self,
+        invitation_code: str,
+        invitee_uma: str,
+    ) -> Query[None]:
+        def construct(_: Mapping[str, Any]) -> None:
+            return None
+
+        return Query(
+            scripts.claim_uma_invitation.CLAIM_UMA_INVITATION_MUTATION,
+            {
+                "invitation_code": invitation_code,
+                "invitee_uma": invitee_uma,
+            },
+            construct,
+        )
+
+    def claim_uma_invitation_with_incentives_query(
+        self,
+        invitation_code: str,
+        invitee_uma: str,
+        invitee_phone_number_e164: str,
+        invitee_region: "RegionCode",
+    ) -> Query[None]:
+        def construct(_: Mapping[str, Any]) -> None:
+            return None
+
+        return Query(
+            scripts.claim_uma_invitation.CLAIM_UMA_INVITATION_WITH_INCENTIVES_MUTATION,
+            {
+                "invitation_code": invitation_code,
+                "invitee_uma": invitee_uma,
+                "invitee_phone_hash": self._hash_phone_number(
+                    invitee_phone_number_e164
+                ),
+                "invitee_region": invitee_region,
+            },
+            construct,
+        )
+
+    def fetch_uma_invitation_query(
+        self,
+        invitation_code: str,
+    ) -> Query[Optional["UmaInvitation"]]:
+        def construct(json: Mapping[str, Any]) -> Optional["UmaInvitation"]:
+            return (
+                objects.UmaInvitation.from_json(
+                    self._requester, json["uma_invitation_by_code"]
+                )
+                if json["uma_invitation_by_code"]
+                else None
+            )
+
+        return Query(
+            scripts.fetch_uma_invitation.FETCH_UMA_INVITATION_QUERY,
+            {
+                "invitation_code": invitation_code,
+            },
+            construct,
+        )
+
+    def _hash_phone_number(self, phone_number_e164_format: str) -> str:
+        match = E614_REGEX.search(phone_number_e164_format)
+        if not match:
+            raise LightsparkException(
+                "InvalidPhoneNumber", "The phone number must follow the E.164 format."
+            )
+        return sha256(phone_number_e164_format.encode()).hexdigest()
+
+
+@dataclass
+class LightsparkSyncClient(_LightsparkClientBase):
+    """The client of the Lightspark API.
+
+    With `raw=True`, the methods of the client, and those of the objects it loads, return
+    the `data` mapping of each GraphQL response as is, without building any object from
+    it. The operations and their pagination are unchanged, but the entity cache is not
+    used and `recover_node_signing_key` does not load the key it fetches.
+
+    Requests and responses are encoded with orjson, simdjson or ujson when one of them is
+    installed, or with a `json_backend` chosen by name. See
+    `lightspark.requests.json_backend`.
+
+    The connections to the API are kept open and reused across requests. Size their pools
+    with a `pool_config` matching the number of threads using the client, and check how
+    they are used with `pool_stats`.
+
+    Requests are sent over HTTP/1.1 by default. With `transport="http2"`, concurrent
+    requests are multiplexed over a few HTTP/2 connections instead, which requires the
+    `http2` extra (`pip install lightspark[http2]`). Other transports can be plugged in
+    by passing a `lightspark.requests.transport.Transport`.
+
+    Calls wait for the API indefinitely unless the client has a default `timeout`, or
+    the call is made in a `timeout` block. Payments wait until a few seconds after their
+    `timeout_secs`. A call which times out raises `LightsparkTimeoutException`.
+
+    Queries which fail with a transient error, such as a 503 response or a reset
+    connection, are retried according to the `retry_policy` of the client, which is
+    disabled with None. `pay_invoice` and `pay_uma_invoice` are retried only after
+    checking that no payment of their invoice went through. See `RetryPolicy`.
+
+    A `rate_limiter` bounds the rate and the concurrency of the calls of the client, by
+    operation, letting the calls made in a `priority(Priority.BATCH)` block wait behind
+    the others. See `RateLimiter`.
+    """
+
+    _requester: Requester
+    _node_private_keys: Dict[str, SigningKey]
+
+    def __init__(
+        self,
+        api_token_client_id: str,
+        api_token_client_secret: str,
+        base_url: Optional[str] = None,
+        http_host: Optional[str] = None,
+        persisted_queries: bool = False,
+        entity_cache: Optional[EntityCache] = None,
+        raw: bool = False,
+        json_backend: Union[str, JsonBackend, None] = None,
+        pool_config: Optional[PoolConfig] = None,
+        transport: Union[str, Transport, None] = None,
+        timeout: Optional[Timeout] = None,
+        retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        self._requester = Requester(
+            api_token_client_id=api_token_client_id,
+            api_token_client_secret=api_token_client_secret,
+            base_url=base_url,
+            http_host=http_host,
+            persisted_queries=persisted_queries,
+            raw=raw,
+            json_backend=json_backend,
+            pool_config=pool_config,
+            transport=transport,
+            timeout=timeout,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+        )
+        self._requester.entity_cache = entity_cache
+        self._node_private_keys = {}
+
+    def entity_loader(
+        self, window_secs: float = 0.005, max_batch_size: int = 50
+    ) -> EntityLoader:
+        """Returns a loader which fetches the entities requested by several threads within
+        `window_secs` of each other with a single request. See `EntityLoader`."""
+        return EntityLoader(
+            self._requester, window_secs=window_secs, max_batch_size=max_batch_size
+        )
+
+    def create_api_token(
+        self,
+        name: str,
+        transact: bool = True,
+        test_mode: bool = False,
+    ) -> Tuple["ApiToken", str]:
+        return self._requester.execute_query(
+            self.create_api_token_query(
+                name=name, transact=transact, test_mode=test_mode
+            )
+        )
+
+    def create_invoice(
+        self,
+        node_id: str,
+        amount_msats: int,
+        memo: Optional[str] = None,
+        invoice_type: Optional["InvoiceType"] = None,
+        expiry_secs: Optional[int] = None,
+    ) -> "Invoice":
+        return self._requester.execute_query(
+            self.create_invoice_query(
+                node_id=node_id,
+                amount_msats=amount_msats,
+                memo=memo,
+                invoice_type=invoice_type,
+                expiry_secs=expiry_secs,
+            )
+        )
+
+    def create_lnurl_invoice(
+        self,
+        node_id: str,
+        amount_msats: int,
+        metadata: str,
+        expiry_secs: Optional[int] = None,
+    ) -> "Invoice":
+        """Generates a Lightning Invoice (follows the Bolt 11 specification) to request a payment
+        from another Lightning Node. This should only be used for generating invoices for LNURLs,
+        with `create_invoice` preferred in the general case.
+
+        Args:
+            node_id (str): The ID of the node from which to create the invoice.
+            amount_sats (int): The amount for which the invoice should be created, in millisatoshis.
+            will be added.
+            metadata (str): The LNURL metadata payload field in the initial payreq response. This
+            will be hashed and present in the h-tag (SHA256 purpose of payment) of the resulting
+            Bolt 11 invoice.
+            expiry_secs (int, optional): The number of seconds after which the invoice will expire.
+            Defaults to 1 day.
+
+        Returns:
+            Invoice: An `Invoice` object representing the generated invoice.
+        """
+        return self._requester.execute_query(
+            self.create_lnurl_invoice_query(
+                node_id=node_id,
+                amount_msats=amount_msats,
+                metadata=metadata,
+                expiry_secs=expiry_secs,
+            )
+        )
+
+    def cancel_invoice(
+        self,
+        invoice_id: str,
+    ) -> "Invoice":
+        """Cancels an existing unpaid invoice and returns that invoice. Cancelled invoices cannot be paid.
+
+        Args:
+            invoice_id (str): The ID of the invoice to cancel.
+
+        Returns:
+            Invoice: An `Invoice` object representing the cancelled invoice.
+        """
+        return self._requester.execute_query(
+            self.cancel_invoice_query(invoice_id=invoice_id)
+        )
+
+    def create_node_wallet_address(
+        self,
+        node_id: str,
+    ) -> str:
+        return self._requester.execute_query(
+            self.create_node_wallet_address_query(node_id=node_id)
+        )
+
+    def create_test_mode_invoice(
+        self,
+        local_node_id: str,
+        amount_msats: int,
+        memo: Optional[str] = None,
+        invoice_type: Optional["InvoiceType"] = None,
+    ) -> str:
+        return self._requester.execute_query(
+            self.create_test_mode_invoice_query(
+                local_node_id=local_node_id,
+                amount_msats=amount_msats,
+                memo=memo,
+                invoice_type=invoice_type,
+            )
+        )
+
+    def create_test_mode_payment(
+        self,
+        local_node_id: str,
+        encoded_invoice: str,
+        amount_msats: Optional[int] = None,
+    ) -> "IncomingPayment":
+        return self._requester.execute_query(
+            self.create_test_mode_payment_query(
+                local_node_id=local_node_id,
+                encoded_invoice=encoded_invoice,
+                amount_msats=amount_msats,
+            )
+        )
+
+    def create_uma_invoice(
+        self,
+        node_id: str,
+        amount_msats: int,
+        metadata: str,
+        expiry_secs: Optional[int] = None,
+    ) -> "Invoice":
+        return self._requester.execute_query(
+            self.create_uma_invoice_query(
+                node_id=node_id,
+                amount_msats=amount_msats,
+                metadata=metadata,
+                expiry_secs=expiry_secs,
+            )
+        )
+
+    def delete_api_token(self, api_token_id: str) -> None:
+        return self._requester.execute_query(
+            self.delete_api_token_query(api_token_id=api_token_id)
+        )
+
+    def execute_graphql_request(
+        self, document: str, variables: Optional[Mapping[str, Any]] = None
+    ) -> Mapping[str, Any]:
+        """This function can be used to execute a custom GraphQL request against
+        the Lightspark public API. It will take care of the authentication automatically.
+
+        To find the Lightspark API documentation, see https://docs.lightspark.com/api/graphql/2023-01-01
+        To learn more about GraphQL, see https://graphql.org/learn/
+
+        Args:
+            document:
+                This is the GraphQL document (query or mutation) that will be
+                executed against the API.
+            variables (optional):
+                A dictionary representing a JSON object containing the variables
+                needed to execute the query or mutation in the document. This is
+                optional if your document does not use any variable.
+
+        Returns:
+            A dictionary representing the JSON response received from the API.
+            This JSON object can then be used to instantiate some of the python
+            objects defined in the lightspark.objects.* modules, using the `from_json`
+            function defined in each module.
+        """
+        return self._requester.execute_query(
+            self.execute_graphql_request_query(document=document, variables=variables)
+        )
+
+    def get_current_account(
+        self,
+    ) -> "Account":
+        return self._requester.execute_query(self.get_current_account_query())
+
+    def get_decoded_payment_request(
+        self, encoded_payment_request: str
+    ) -> "InvoiceData":
+        return self._requester.execute_query(
+            self.get_decoded_payment_request_query(
+                encoded_payment_request=encoded_payment_request
+            )
+        )
+
+    def get_entity(
+        self, entity_id: str, entity_class: Type[ENTITY]
+    ) -> Optional[ENTITY]:
+        cached = cached_entity(self._requester, entity_id, entity_class)
+        if cached is not None:
+            return cached
+        return self._requester.execute_query(
+            self.get_entity_query(entity_id=entity_id, entity_class=entity_class)
+        )
+
+    def get_bitcoin_fee_estimate(
+        self, bitcoin_network: "BitcoinNetwork"
+    ) -> "FeeEstimate":
+        return self._requester.execute_query(
+            self.get_bitcoin_fee_estimate_query(bitcoin_network=bitcoin_network)
+        )
+
+    def get_lightning_fee_estimate_for_invoice(
+        self,
+        node_id: str,
+        encoded_payment_request: str,
+        amount_msats: Optional[int] = None,
+    ) -> "CurrencyAmount":
+        return self._requester.execute_query(
+            self.get_lightning_fee_estimate_for_invoice_query(
+                node_id=node_id,
+                encoded_payment_request=encoded_payment_request,
+                amount_msats=amount_msats,
+            )
+        )
+
+    def get_lightning_fee_estimate_for_node(
+        self,
+        node_id: str,
+        destination_node_public_key: str,
+        amount_msats: int,
+    ) -> "CurrencyAmount":
+        return self._requester.execute_query(
+            self.get_lightning_fee_estimate_for_node_query(
+                node_id=node_id,
+                destination_node_public_key=destination_node_public_key,
+                amount_msats=amount_msats,
+            )
+        )
+
+    def recover_node_signing_key(self, node_id: str, node_password: str) -> SigningKey:
+        return self._requester.execute_query(
+            self.recover_node_signing_key_query(
+                node_id=node_id, node_password=node_password
+            )
+        )
+
+    def pay_invoice(
+        self,
+        node_id: str,
+        encoded_invoice: str,
+        timeout_secs: int,
+        maximum_fees_msats: int,
+        amount_msats: Optional[int] = None,
+    ) -> "OutgoingPayment":
+        return self._requester.execute_query(
+            self.pay_invoice_query(
+                node_id=node_id,
+                encoded_invoice=encoded_invoice,
+                timeout_secs=timeout_secs,
+                maximum_fees_msats=maximum_fees_msats,
+                amount_msats=amount_msats,
+            )
+        )
+
+    def pay_uma_invoice(
+        self,
+        node_id: str,
+        encoded_invoice: str,
+        timeout_secs: int,
+        maximum_fees_msats: int,
+        amount_msats: Optional[int] = None,
+    ) -> "OutgoingPayment":
+        return self._requester.execute_query(
+            self.pay_uma_invoice_query(
+                node_id=node_id,
+                encoded_invoice=encoded_invoice,
+                timeout_secs=timeout_secs,
+                maximum_fees_msats=maximum_fees_msats,
+                amount_msats=amount_msats,
+            )
+        )
+
+    def send_payment(
+        self,
+        node_id: str,
+        destination_public_key: str,
+        amount_msats: int,
+        timeout_secs: int,
+        maximum_fees_msats: int,
+    ) -> "OutgoingPayment":
+        return self._requester.execute_query(
+            self.send_payment_query(
+                node_id=node_id,
+                destination_public_key=destination_public_key,
+                amount_msats=amount_msats,
+                timeout_secs=timeout_secs,
+                maximum_fees_msats=maximum_fees_msats,
+            )
+        )
+
+    def screen_node(
+        self, provider: "ComplianceProvider", node_pubkey: str
+    ) -> RiskRating:
+        """
+        Screens a lightning node using its public key. In order to call this API,
+        you need to have the API key stored in your account setting page for the selected compliance provider.
+        """
+        return self._requester.execute_query(
+            self.screen_node_query(provider=provider, node_pubkey=node_pubkey)
+        )
+
+    def fund_node(
+        self,
+        node_id: str,
+        amount_sats: int,
+    ) -> "CurrencyAmount":
+        """Adds funds to a Lightspark node on the REGTEST network. If the amount is not specified, 10,000,000 SATOSHI
+        will be added. This API only functions for nodes created on the REGTEST network and will return an error when
+        called for any non-REGTEST node.
+
+        Args:
+            node_id (str): The ID of the node to fund. Must be a REGTEST node.
+            amount_sats (int): The amount of funds to add to the node in SATOSHI. If not specified, 10,000,000 SATOSHI
+            will be added.
+
+        Returns:
+            CurrencyAmount: The amount of funds added to the node.
+        """
+        return self._requester.execute_query(
+            self.fund_node_query(node_id=node_id, amount_sats=amount_sats)
+        )
+
+    def request_withdrawal(
+        self,
+        node_id: str,
+        amount_sats: int,
+        bitcoin_address: str,
+        withdrawal_mode: "WithdrawalMode",
+    ) -> "WithdrawalRequest":
+        """Withdraws funds from the account and sends it to the requested bitcoin address.
+
+        Depending on the chosen mode, it will first take the funds from the wallet, and if applicable, close channels appropriately to recover enough funds and reopen channels with the remaining funds.
+        The process is asynchronous and may take up to a few minutes. You can check the progress by polling the `WithdrawalRequest` that is created, or by subscribing to a webhook.
+        """
+        return self._requester.execute_query(
+            self.request_withdrawal_query(
+                node_id=node_id,
+                amount_sats=amount_sats,
+                bitcoin_address=bitcoin_address,
+                withdrawal_mode=withdrawal_mode,
+            )
+        )
+
+    def register_payment(
+        self,
+        provider: "ComplianceProvider",
+        payment_id: str,
+        node_pubkey: str,
+        direction: "PaymentDirection",
+    ) -> "LightningTransaction":
+        """
+        Register a successful lightning payment with a selected compliance provider.
+        In order to call this API, you need to have the API key stored in your account
+        setting page for the selected compliance provider.
+
+        Args:
+            provider: The external compliance provider you have account with. You need to store the API key in your account seeting.
+            payment_id: The ID of a lightning payment, which can be either an OutgoingPayment or an IncomingPayment.
+            node_pubkey: The public key of the counterparty lightning node, which is the recipient node for an OutgoingPayment or the sender node for an IncomingPayment.
+            direction: Indicates whether this payment is an OutgoingPayment or an IncomingPayment
+        """
+        return self._requester.execute_query(
+            self.register_payment_query(
+                provider=provider,
+                payment_id=payment_id,
+                node_pubkey=node_pubkey,
+                direction=direction,
+            )
+        )
+
+    def outgoing_payments_for_invoice(
+        self,
+        encoded_invoice: str,
+        transaction_statuses: Optional[List[TransactionStatus]] = None,
+    ) -> List["OutgoingPayment"]:
+        """
+        Fetches the outgoing payments (if any) which have been made for a given invoice.
+
+        Args:
+            encoded_invoice: The encoded invoice for which to fetch the outgoing payments.
+            transaction_statuses: The statuses of the transactions to fetch. If not specified, all transactions will be fetched.
+        """
+        return self._requester.execute_query(
+            self.outgoing_payments_for_invoice_query(
+                encoded_invoice=encoded_invoice,
+                transaction_statuses=transaction_statuses,
+            )
+        )
+
+    def incoming_payments_for_invoice(
+        self,
+        invoice_id: str,
+        transaction_statuses: Optional[List[TransactionStatus]] = None,
+    ) -> List["IncomingPayment"]:
+        """
+        Fetches the incoming payments (if any) which have been made for a given invoice.
+
+        Args:
+            invoice_id: The encoded invoice for which to fetch the incoming payments.
+            transaction_statuses: The statuses of the transactions to fetch. If not specified, all transactions will be fetched.
+        """
+        return self._requester.execute_query(
+            self.incoming_payments_for_invoice_query(
+                invoice_id=invoice_id, transaction_statuses=transaction_statuses
+            )
+        )
+
+    def create_uma_invitation(
+        self,
+        inviter_uma: str,
+    ) -> "UmaInvitation":
+        """
+        Creates a new UMA invitation. If you are part of the incentive program, you should use the
+        `create_uma_invitation_with_incentives` method instead.
+
+        Args:
+            inviter_uma: The UMA of the inviter.
+        """
+        return self._requester.execute_query(
+            self.create_uma_invitation_query(inviter_uma=inviter_uma)
+        )
+
+    def create_uma_invitation_with_incentives(
+        self,
+        inviter_uma: str,
+        inviter_phone_number_e164: str,
+        inviter_region: "RegionCode",
+    ) -> "UmaInvitation":
+        """
         Creates a new UMA invitation with incentives. If you are not part of the incentive program, you should use the
         `create_uma_invitation` method instead.
 
@@ -753,18 +1447,12 @@ class LightsparkSyncClient:
             inviter_phone_number_e164: The E.164 formatted phone number of the inviter.
             inviter_region: The region of the inviter.
         """
-        json = self._requester.execute_graphql(
-            CREATE_UMA_INVITATION_WITH_INCENTIVES_MUTATION,
-            {
-                "inviter_uma": inviter_uma,
-                "inviter_phone_hash": self._hash_phone_number(
-                    inviter_phone_number_e164
-                ),
-                "inviter_region": inviter_region.name,
-            },
-        )
-        return UmaInvitation_from_json(
-            self._requester, json["create_uma_invitation_with_incentives"]["invitation"]
+        return self._requester.execute_query(
+            self.create_uma_invitation_with_incentives_query(
+                inviter_uma=inviter_uma,
+                inviter_phone_number_e164=inviter_phone_number_e164,
+                inviter_region=inviter_region,
+            )
         )
 
     def claim_uma_invitation(
@@ -780,12 +1468,10 @@ class LightsparkSyncClient:
             invitation_code: The invitation code of the invitation to claim.
             invitee_uma: The new UMA of the invitee.
         """
-        self._requester.execute_graphql(
-            CLAIM_UMA_INVITATION_MUTATION,
-            {
-                "invitation_code": invitation_code,
-                "invitee_uma": invitee_uma,
-            },
+        return self._requester.execute_query(
+            self.claim_uma_invitation_query(
+                invitation_code=invitation_code, invitee_uma=invitee_uma
+            )
         )
 
     def claim_uma_invitation_with_incentives(
@@ -793,7 +1479,7 @@ class LightsparkSyncClient:
         invitation_code: str,
         invitee_uma: str,
         invitee_phone_number_e164: str,
-        invitee_region: RegionCode,
+        invitee_region: "RegionCode",
     ) -> None:
         """
         Claims a UMA invitation with incentives. If you are not part of the incentive program, you should use the
@@ -805,48 +1491,477 @@ class LightsparkSyncClient:
             invitee_phone_number_e164: The E.164 formatted phone number of the invitee.
             invitee_region: The region of the invitee.
         """
-        self._requester.execute_graphql(
-            CLAIM_UMA_INVITATION_WITH_INCENTIVES_MUTATION,
-            {
-                "invitation_code": invitation_code,
-                "invitee_uma": invitee_uma,
-                "invitee_phone_hash": self._hash_phone_number(
-                    invitee_phone_number_e164
-                ),
-                "invitee_region": invitee_region,
-            },
+        return self._requester.execute_query(
+            self.claim_uma_invitation_with_incentives_query(
+                invitation_code=invitation_code,
+                invitee_uma=invitee_uma,
+                invitee_phone_number_e164=invitee_phone_number_e164,
+                invitee_region=invitee_region,
+            )
         )
 
     def fetch_uma_invitation(
         self,
         invitation_code: str,
-    ) -> Optional[UmaInvitation]:
+    ) -> Optional["UmaInvitation"]:
         """
         Fetches a UMA invitation by its invitation code.
 
         Args:
             invitation_code: The invitation code of the invitation to fetch.
         """
-        json = self._requester.execute_graphql(
-            FETCH_UMA_INVITATION_QUERY,
-            {
-                "invitation_code": invitation_code,
-            },
+        return self._requester.execute_query(
+            self.fetch_uma_invitation_query(invitation_code=invitation_code)
         )
 
-        return (
-            UmaInvitation_from_json(self._requester, json["uma_invitation_by_code"])
-            if json["uma_invitation_by_code"]
-            else None
+
+@dataclass
+class LightsparkAsyncClient(_LightsparkClientBase):
+    """The asyncio counterpart of `LightsparkSyncClient`. Every method which calls the
+    Lightspark API is a coroutine with the same arguments and return value as its blocking
+    equivalent. Objects returned by this client expose `*_async` variants of their methods.
+
+    The client should be closed once it is no longer needed, either explicitly with `close`
+    or by using it as an async context manager. Like the blocking client, it returns the
+    `data` of the responses as is when created with `raw=True`.
+    """
+
+    _requester: AsyncRequester
+    _node_private_keys: Dict[str, SigningKey]
+
+    def __init__(
+        self,
+        api_token_client_id: str,
+        api_token_client_secret: str,
+        base_url: Optional[str] = None,
+        http_host: Optional[str] = None,
+        persisted_queries: bool = False,
+        entity_cache: Optional[EntityCache] = None,
+        raw: bool = False,
+        json_backend: Union[str, JsonBackend, None] = None,
+        pool_config: Optional[PoolConfig] = None,
+        transport: Union[str, Transport, None] = None,
+        timeout: Optional[Timeout] = None,
+        retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        self._requester = AsyncRequester(
+            api_token_client_id=api_token_client_id,
+            api_token_client_secret=api_token_client_secret,
+            base_url=base_url,
+            http_host=http_host,
+            persisted_queries=persisted_queries,
+            raw=raw,
+            json_backend=json_backend,
+            pool_config=pool_config,
+            transport=transport,
+            timeout=timeout,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
         )
+        self._requester.entity_cache = entity_cache
+        self._node_private_keys = {}
 
-    def _hash_phone_number(self, phone_number_e164_format: str) -> str:
-        match = E614_REGEX.search(phone_number_e164_format)
-        if not match:
-            raise LightsparkException(
-                "InvalidPhoneNumber", "The phone number must follow the E.164 format."
+    def entity_loader(
+        self, window_secs: float = 0.0, max_batch_size: int = 50
+    ) -> AsyncEntityLoader:
+        """Returns a loader which fetches the entities requested during the same event
+        loop iteration, or within `window_secs`, with a single request. See
+        `AsyncEntityLoader`."""
+        return AsyncEntityLoader(
+            self._requester, window_secs=window_secs, max_batch_size=max_batch_size
+        )
+
+    def webhook_subscriber(
+        self, refresh: bool = False, coalesce_secs: float = 0.0
+    ) -> AsyncWebhookCacheSubscriber:
+        """Returns a subscriber which updates the entity cache of the client with the
+        webhook events passed to its `handle` method, refetching entities on the running
+        event loop. See `AsyncWebhookCacheSubscriber`."""
+        return AsyncWebhookCacheSubscriber(
+            self._requester, refresh=refresh, coalesce_secs=coalesce_secs
+        )
+
+    async def create_api_token(
+        self,
+        name: str,
+        transact: bool = True,
+        test_mode: bool = False,
+    ) -> Tuple["ApiToken", str]:
+        return await self._requester.execute_query_async(
+            self.create_api_token_query(
+                name=name, transact=transact, test_mode=test_mode
             )
-        return sha256(phone_number_e164_format.encode()).hexdigest()
+        )
+
+    async def create_invoice(
+        self,
+        node_id: str,
+        amount_msats: int,
+        memo: Optional[str] = None,
+        invoice_type: Optional["InvoiceType"] = None,
+        expiry_secs: Optional[int] = None,
+    ) -> "Invoice":
+        return await self._requester.execute_query_async(
+            self.create_invoice_query(
+                node_id=node_id,
+                amount_msats=amount_msats,
+                memo=memo,
+                invoice_type=invoice_type,
+                expiry_secs=expiry_secs,
+            )
+        )
+
+    async def create_lnurl_invoice(
+        self,
+        node_id: str,
+        amount_msats: int,
+        metadata: str,
+        expiry_secs: Optional[int] = None,
+    ) -> "Invoice":
+        return await self._requester.execute_query_async(
+            self.create_lnurl_invoice_query(
+                node_id=node_id,
+                amount_msats=amount_msats,
+                metadata=metadata,
+                expiry_secs=expiry_secs,
+            )
+        )
+
+    async def cancel_invoice(
+        self,
+        invoice_id: str,
+    ) -> "Invoice":
+        return await self._requester.execute_query_async(
+            self.cancel_invoice_query(invoice_id=invoice_id)
+        )
+
+    async def create_node_wallet_address(
+        self,
+        node_id: str,
+    ) -> str:
+        return await self._requester.execute_query_async(
+            self.create_node_wallet_address_query(node_id=node_id)
+        )
+
+    async def create_test_mode_invoice(
+        self,
+        local_node_id: str,
+        amount_msats: int,
+        memo: Optional[str] = None,
+        invoice_type: Optional["InvoiceType"] = None,
+    ) -> str:
+        return await self._requester.execute_query_async(
+            self.create_test_mode_invoice_query(
+                local_node_id=local_node_id,
+                amount_msats=amount_msats,
+                memo=memo,
+                invoice_type=invoice_type,
+            )
+        )
+
+    async def create_test_mode_payment(
+        self,
+        local_node_id: str,
+        encoded_invoice: str,
+        amount_msats: Optional[int] = None,
+    ) -> "IncomingPayment":
+        return await self._requester.execute_query_async(
+            self.create_test_mode_payment_query(
+                local_node_id=local_node_id,
+                encoded_invoice=encoded_invoice,
+                amount_msats=amount_msats,
+            )
+        )
+
+    async def create_uma_invoice(
+        self,
+        node_id: str,
+        amount_msats: int,
+        metadata: str,
+        expiry_secs: Optional[int] = None,
+    ) -> "Invoice":
+        return await self._requester.execute_query_async(
+            self.create_uma_invoice_query(
+                node_id=node_id,
+                amount_msats=amount_msats,
+                metadata=metadata,
+                expiry_secs=expiry_secs,
+            )
+        )
+
+    async def delete_api_token(self, api_token_id: str) -> None:
+        return await self._requester.execute_query_async(
+            self.delete_api_token_query(api_token_id=api_token_id)
+        )
+
+    async def execute_graphql_request(
+        self, document: str, variables: Optional[Mapping[str, Any]] = None
+    ) -> Mapping[str, Any]:
+        return await self._requester.execute_query_async(
+            self.execute_graphql_request_query(document=document, variables=variables)
+        )
+
+    async def get_current_account(
+        self,
+    ) -> "Account":
+        return await self._requester.execute_query_async(
+            self.get_current_account_query()
+        )
+
+    async def get_decoded_payment_request(
+        self, encoded_payment_request: str
+    ) -> "InvoiceData":
+        return await self._requester.execute_query_async(
+            self.get_decoded_payment_request_query(
+                encoded_payment_request=encoded_payment_request
+            )
+        )
+
+    async def get_entity(
+        self, entity_id: str, entity_class: Type[ENTITY]
+    ) -> Optional[ENTITY]:
+        cached = cached_entity(self._requester, entity_id, entity_class)
+        if cached is not None:
+            return cached
+        return await self._requester.execute_query_async(
+            self.get_entity_query(entity_id=entity_id, entity_class=entity_class)
+        )
+
+    async def get_bitcoin_fee_estimate(
+        self, bitcoin_network: "BitcoinNetwork"
+    ) -> "FeeEstimate":
+        return await self._requester.execute_query_async(
+            self.get_bitcoin_fee_estimate_query(bitcoin_network=bitcoin_network)
+        )
+
+    async def get_lightning_fee_estimate_for_invoice(
+        self,
+        node_id: str,
+        encoded_payment_request: str,
+        amount_msats: Optional[int] = None,
+    ) -> "CurrencyAmount":
+        return await self._requester.execute_query_async(
+            self.get_lightning_fee_estimate_for_invoice_query(
+                node_id=node_id,
+                encoded_payment_request=encoded_payment_request,
+                amount_msats=amount_msats,
+            )
+        )
+
+    async def get_lightning_fee_estimate_for_node(
+        self,
+        node_id: str,
+        destination_node_public_key: str,
+        amount_msats: int,
+    ) -> "CurrencyAmount":
+        return await self._requester.execute_query_async(
+            self.get_lightning_fee_estimate_for_node_query(
+                node_id=node_id,
+                destination_node_public_key=destination_node_public_key,
+                amount_msats=amount_msats,
+            )
+        )
+
+    async def recover_node_signing_key(
+        self, node_id: str, node_password: str
+    ) -> SigningKey:
+        return await self._requester.execute_query_async(
+            self.recover_node_signing_key_query(
+                node_id=node_id, node_password=node_password
+            )
+        )
+
+    async def pay_invoice(
+        self,
+        node_id: str,
+        encoded_invoice: str,
+        timeout_secs: int,
+        maximum_fees_msats: int,
+        amount_msats: Optional[int] = None,
+    ) -> "OutgoingPayment":
+        return await self._requester.execute_query_async(
+            self.pay_invoice_query(
+                node_id=node_id,
+                encoded_invoice=encoded_invoice,
+                timeout_secs=timeout_secs,
+                maximum_fees_msats=maximum_fees_msats,
+                amount_msats=amount_msats,
+            )
+        )
+
+    async def pay_uma_invoice(
+        self,
+        node_id: str,
+        encoded_invoice: str,
+        timeout_secs: int,
+        maximum_fees_msats: int,
+        amount_msats: Optional[int] = None,
+    ) -> "OutgoingPayment":
+        return await self._requester.execute_query_async(
+            self.pay_uma_invoice_query(
+                node_id=node_id,
+                encoded_invoice=encoded_invoice,
+                timeout_secs=timeout_secs,
+                maximum_fees_msats=maximum_fees_msats,
+                amount_msats=amount_msats,
+            )
+        )
+
+    async def send_payment(
+        self,
+        node_id: str,
+        destination_public_key: str,
+        amount_msats: int,
+        timeout_secs: int,
+        maximum_fees_msats: int,
+    ) -> "OutgoingPayment":
+        return await self._requester.execute_query_async(
+            self.send_payment_query(
+                node_id=node_id,
+                destination_public_key=destination_public_key,
+                amount_msats=amount_msats,
+                timeout_secs=timeout_secs,
+                maximum_fees_msats=maximum_fees_msats,
+            )
+        )
+
+    async def screen_node(
+        self, provider: "ComplianceProvider", node_pubkey: str
+    ) -> RiskRating:
+        return await self._requester.execute_query_async(
+            self.screen_node_query(provider=provider, node_pubkey=node_pubkey)
+        )
+
+    async def fund_node(
+        self,
+        node_id: str,
+        amount_sats: int,
+    ) -> "CurrencyAmount":
+        return await self._requester.execute_query_async(
+            self.fund_node_query(node_id=node_id, amount_sats=amount_sats)
+        )
+
+    async def request_withdrawal(
+        self,
+        node_id: str,
+        amount_sats: int,
+        bitcoin_address: str,
+        withdrawal_mode: "WithdrawalMode",
+    ) -> "WithdrawalRequest":
+        return await self._requester.execute_query_async(
+            self.request_withdrawal_query(
+                node_id=node_id,
+                amount_sats=amount_sats,
+                bitcoin_address=bitcoin_address,
+                withdrawal_mode=withdrawal_mode,
+            )
+        )
+
+    async def register_payment(
+        self,
+        provider: "ComplianceProvider",
+        payment_id: str,
+        node_pubkey: str,
+        direction: "PaymentDirection",
+    ) -> "LightningTransaction":
+        return await self._requester.execute_query_async(
+            self.register_payment_query(
+                provider=provider,
+                payment_id=payment_id,
+                node_pubkey=node_pubkey,
+                direction=direction,
+            )
+        )
+
+    async def outgoing_payments_for_invoice(
+        self,
+        encoded_invoice: str,
+        transaction_statuses: Optional[List[TransactionStatus]] = None,
+    ) -> List["OutgoingPayment"]:
+        return await self._requester.execute_query_async(
+            self.outgoing_payments_for_invoice_query(
+                encoded_invoice=encoded_invoice,
+                transaction_statuses=transaction_statuses,
+            )
+        )
+
+    async def incoming_payments_for_invoice(
+        self,
+        invoice_id: str,
+        transaction_statuses: Optional[List[TransactionStatus]] = None,
+    ) -> List["IncomingPayment"]:
+        return await self._requester.execute_query_async(
+            self.incoming_payments_for_invoice_query(
+                invoice_id=invoice_id, transaction_statuses=transaction_statuses
+            )
+        )
+
+    async def create_uma_invitation(
+        self,
+        inviter_uma: str,
+    ) -> "UmaInvitation":
+        return await self._requester.execute_query_async(
+            self.create_uma_invitation_query(inviter_uma=inviter_uma)
+        )
+
+    async def create_uma_invitation_with_incentives(
+        self,
+        inviter_uma: str,
+        inviter_phone_number_e164: str,
+        inviter_region: "RegionCode",
+    ) -> "UmaInvitation":
+        return await self._requester.execute_query_async(
+            self.create_uma_invitation_with_incentives_query(
+                inviter_uma=inviter_uma,
+                inviter_phone_number_e164=inviter_phone_number_e164,
+                inviter_region=inviter_region,
+            )
+        )
+
+    async def claim_uma_invitation(
+        self,
+        invitation_code: str,
+        invitee_uma: str,
+    ) -> None:
+        return await self._requester.execute_query_async(
+            self.claim_uma_invitation_query(
+                invitation_code=invitation_code, invitee_uma=invitee_uma
+            )
+        )
+
+    async def claim_uma_invitation_with_incentives(
+        self,
+        invitation_code: str,
+        invitee_uma: str,
+        invitee_phone_number_e164: str,
+        invitee_region: "RegionCode",
+    ) -> None:
+        return await self._requester.execute_query_async(
+            self.claim_uma_invitation_with_incentives_query(
+                invitation_code=invitation_code,
+                invitee_uma=invitee_uma,
+                invitee_phone_number_e164=invitee_phone_number_e164,
+                invitee_region=invitee_region,
+            )
+        )
+
+    async def fetch_uma_invitation(
+        self,
+        invitation_code: str,
+    ) -> Optional["UmaInvitation"]:
+        return await self._requester.execute_query_async(
+            self.fetch_uma_invitation_query(invitation_code=invitation_code)
+        )
+
+    async def close(self) -> None:
+        await self._requester.close()
+
+    async def __aenter__(self) -> "LightsparkAsyncClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
 
 
 # pylint: disable=anomalous-backslash-in-string
@@ -2,8 +2,10 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, List, Mapping, Optional
+from typing import Any, AsyncIterator, Iterator, List, Mapping, Optional
 
+from lightspark.requests.pagination import iter_connection, iter_connection_async
+from lightspark.requests.query import Query
 from lightspark.requests.requester import Requester
 
 from .AccountToApiTokensConnection import AccountToApiTokensConnection
@@ -32,16 +34,23 @@ from .AccountToWithdrawalRequestsConnection import AccountToWithdrawalRequestsCo
 from .AccountToWithdrawalRequestsConnection import (
     from_json as AccountToWithdrawalRequestsConnection_from_json,
 )
+from .ApiToken import ApiToken
 from .BitcoinNetwork import BitcoinNetwork
 from .BlockchainBalance import BlockchainBalance
 from .BlockchainBalance import from_json as BlockchainBalance_from_json
+from .Channel import Channel
 from .CurrencyAmount import CurrencyAmount
 from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
+from .LightsparkNode import LightsparkNode
 from .LightsparkNodeOwner import LightsparkNodeOwner
+from .PaymentRequest import PaymentRequest
+from .Transaction import Transaction
 from .TransactionFailures import TransactionFailures
 from .TransactionStatus import TransactionStatus
 from .TransactionType import TransactionType
+from .Wallet import Wallet
+from .WithdrawalRequest import WithdrawalRequest
 from .WithdrawalRequestStatus import WithdrawalRequestStatus
 
 
@@ -67,7 +76,25 @@ class Account(LightsparkNodeOwner, Entity):
     def get_api_tokens(
         self, first: Optional[int] = None, after: Optional[str] = None
     ) -> AccountToApiTokensConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_api_tokens_query(first=first, after=after)
+        )
+
+    async def get_api_tokens_async(
+        self, first: Optional[int] = None, after: Optional[str] = None
+    ) -> AccountToApiTokensConnection:
+        return await self.requester.execute_query_async(
+            self.get_api_tokens_query(first=first, after=after)
+        )
+
+    def get_api_tokens_query(
+        self, first: Optional[int] = None, after: Optional[str] = None
+    ) -> Query[AccountToApiTokensConnection]:
+        def construct(json: Mapping[str, Any]) -> AccountToApiTokensConnection:
+            connection = json["entity"]["api_tokens"]
+            return AccountToApiTokensConnection_from_json(self.requester, connection)
+
+        return Query(
             """
 query FetchAccountToApiTokensConnection($entity_id: ID!, $first: Int, $after: String) {
     entity(id: $entity_id) {
@@ -98,16 +125,67 @@ query FetchAccountToApiTokensConnection($entity_id: ID!, $first: Int, $after: St
 }
             """,
             {"entity_id": self.id, "first": first, "after": after},
+            construct,
+        )
+
+    def iter_api_tokens(
+        self,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> Iterator[ApiToken]:
+        return iter_connection(
+            self.requester,
+            lambda after: self.get_api_tokens_query(first=page_size, after=after),
+            prefetch,
+        )
+
+    def iter_api_tokens_async(
+        self,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> AsyncIterator[ApiToken]:
+        return iter_connection_async(
+            self.requester,
+            lambda after: self.get_api_tokens_query(first=page_size, after=after),
+            prefetch,
         )
-        connection = json["entity"]["api_tokens"]
-        return AccountToApiTokensConnection_from_json(self.requester, connection)
 
     def get_blockchain_balance(
         self,
         bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
         node_ids: Optional[List[str]] = None,
     ) -> Optional[BlockchainBalance]:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_blockchain_balance_query(
+                bitcoin_networks=bitcoin_networks, node_ids=node_ids
+            )
+        )
+
+    async def get_blockchain_balance_async(
+        self,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+    ) -> Optional[BlockchainBalance]:
+        return await self.requester.execute_query_async(
+            self.get_blockchain_balance_query(
+                bitcoin_networks=bitcoin_networks, node_ids=node_ids
+            )
+        )
+
+    def get_blockchain_balance_query(
+        self,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+    ) -> Query[Optional[BlockchainBalance]]:
+        def construct(json: Mapping[str, Any]) -> Optional[BlockchainBalance]:
+            connection = json["entity"]["blockchain_balance"]
+            return (
+                BlockchainBalance_from_json(self.requester, connection)
+                if connection
+                else None
+            )
+
+        return Query(
             """
 query FetchAccountBlockchainBalance($entity_id: ID!, $bitcoin_networks: [BitcoinNetwork!], $node_ids: [ID!]) {
     entity(id: $entity_id) {
@@ -172,12 +250,7 @@ query FetchAccountBlockchainBalance($entity_id: ID!, $bitcoin_networks: [Bitcoin
                 "bitcoin_networks": bitcoin_networks,
                 "node_ids": node_ids,
             },
-        )
-        connection = json["entity"]["blockchain_balance"]
-        return (
-            BlockchainBalance_from_json(self.requester, connection)
-            if connection
-            else None
+            construct,
         )
 
     def get_conductivity(
@@ -185,7 +258,33 @@ query FetchAccountBlockchainBalance($entity_id: ID!, $bitcoin_networks: [Bitcoin
         bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
         node_ids: Optional[List[str]] = None,
     ) -> Optional[int]:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_conductivity_query(
+                bitcoin_networks=bitcoin_networks, node_ids=node_ids
+            )
+        )
+
+    async def get_conductivity_async(
+        self,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+    ) -> Optional[int]:
+        return await self.requester.execute_query_async(
+            self.get_conductivity_query(
+                bitcoin_networks=bitcoin_networks, node_ids=node_ids
+            )
+        )
+
+    def get_conductivity_query(
+        self,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+    ) -> Query[Optional[int]]:
+        def construct(json: Mapping[str, Any]) -> Optional[int]:
+            connection = json["entity"]["conductivity"]
+            return connection
+
+        return Query(
             """
 query FetchAccountConductivity($entity_id: ID!, $bitcoin_networks: [BitcoinNetwork!], $node_ids: [ID!]) {
     entity(id: $entity_id) {
@@ -200,16 +299,45 @@ query FetchAccountConductivity($entity_id: ID!, $bitcoin_networks: [BitcoinNetwo
                 "bitcoin_networks": bitcoin_networks,
                 "node_ids": node_ids,
             },
+            construct,
         )
-        connection = json["entity"]["conductivity"]
-        return connection
 
     def get_local_balance(
         self,
         bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
         node_ids: Optional[List[str]] = None,
     ) -> Optional[CurrencyAmount]:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_local_balance_query(
+                bitcoin_networks=bitcoin_networks, node_ids=node_ids
+            )
+        )
+
+    async def get_local_balance_async(
+        self,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+    ) -> Optional[CurrencyAmount]:
+        return await self.requester.execute_query_async(
+            self.get_local_balance_query(
+                bitcoin_networks=bitcoin_networks, node_ids=node_ids
+            )
+        )
+
+    def get_local_balance_query(
+        self,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+    ) -> Query[Optional[CurrencyAmount]]:
+        def construct(json: Mapping[str, Any]) -> Optional[CurrencyAmount]:
+            connection = json["entity"]["local_balance"]
+            return (
+                CurrencyAmount_from_json(self.requester, connection)
+                if connection
+                else None
+            )
+
+        return Query(
             """
 query FetchAccountLocalBalance($entity_id: ID!, $bitcoin_networks: [BitcoinNetwork!], $node_ids: [ID!]) {
     entity(id: $entity_id) {
@@ -231,10 +359,7 @@ query FetchAccountLocalBalance($entity_id: ID!, $bitcoin_networks: [BitcoinNetwo
                 "bitcoin_networks": bitcoin_networks,
                 "node_ids": node_ids,
             },
-        )
-        connection = json["entity"]["local_balance"]
-        return (
-            CurrencyAmount_from_json(self.requester, connection) if connection else None
+            construct,
         )
 
     def get_nodes(
@@ -244,7 +369,43 @@ query FetchAccountLocalBalance($entity_id: ID!, $bitcoin_networks: [BitcoinNetwo
         node_ids: Optional[List[str]] = None,
         after: Optional[str] = None,
     ) -> AccountToNodesConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_nodes_query(
+                first=first,
+                bitcoin_networks=bitcoin_networks,
+                node_ids=node_ids,
+                after=after,
+            )
+        )
+
+    async def get_nodes_async(
+        self,
+        first: Optional[int] = None,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+        after: Optional[str] = None,
+    ) -> AccountToNodesConnection:
+        return await self.requester.execute_query_async(
+            self.get_nodes_query(
+                first=first,
+                bitcoin_networks=bitcoin_networks,
+                node_ids=node_ids,
+                after=after,
+            )
+        )
+
+    def get_nodes_query(
+        self,
+        first: Optional[int] = None,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+        after: Optional[str] = None,
+    ) -> Query[AccountToNodesConnection]:
+        def construct(json: Mapping[str, Any]) -> AccountToNodesConnection:
+            connection = json["entity"]["nodes"]
+            return AccountToNodesConnection_from_json(self.requester, connection)
+
+        return Query(
             """
 query FetchAccountToNodesConnection($entity_id: ID!, $first: Int, $bitcoin_networks: [BitcoinNetwork!], $node_ids: [ID!], $after: String) {
     entity(id: $entity_id) {
@@ -533,16 +694,81 @@ query FetchAccountToNodesConnection($entity_id: ID!, $first: Int, $bitcoin_netwo
                 "node_ids": node_ids,
                 "after": after,
             },
+            construct,
+        )
+
+    def iter_nodes(
+        self,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> Iterator[LightsparkNode]:
+        return iter_connection(
+            self.requester,
+            lambda after: self.get_nodes_query(
+                first=page_size,
+                after=after,
+                bitcoin_networks=bitcoin_networks,
+                node_ids=node_ids,
+            ),
+            prefetch,
+        )
+
+    def iter_nodes_async(
+        self,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> AsyncIterator[LightsparkNode]:
+        return iter_connection_async(
+            self.requester,
+            lambda after: self.get_nodes_query(
+                first=page_size,
+                after=after,
+                bitcoin_networks=bitcoin_networks,
+                node_ids=node_ids,
+            ),
+            prefetch,
         )
-        connection = json["entity"]["nodes"]
-        return AccountToNodesConnection_from_json(self.requester, connection)
 
     def get_remote_balance(
         self,
         bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
         node_ids: Optional[List[str]] = None,
     ) -> Optional[CurrencyAmount]:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_remote_balance_query(
+                bitcoin_networks=bitcoin_networks, node_ids=node_ids
+            )
+        )
+
+    async def get_remote_balance_async(
+        self,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+    ) -> Optional[CurrencyAmount]:
+        return await self.requester.execute_query_async(
+            self.get_remote_balance_query(
+                bitcoin_networks=bitcoin_networks, node_ids=node_ids
+            )
+        )
+
+    def get_remote_balance_query(
+        self,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+    ) -> Query[Optional[CurrencyAmount]]:
+        def construct(json: Mapping[str, Any]) -> Optional[CurrencyAmount]:
+            connection = json["entity"]["remote_balance"]
+            return (
+                CurrencyAmount_from_json(self.requester, connection)
+                if connection
+                else None
+            )
+
+        return Query(
             """
 query FetchAccountRemoteBalance($entity_id: ID!, $bitcoin_networks: [BitcoinNetwork!], $node_ids: [ID!]) {
     entity(id: $entity_id) {
@@ -564,10 +790,7 @@ query FetchAccountRemoteBalance($entity_id: ID!, $bitcoin_networks: [BitcoinNetw
                 "bitcoin_networks": bitcoin_networks,
                 "node_ids": node_ids,
             },
-        )
-        connection = json["entity"]["remote_balance"]
-        return (
-            CurrencyAmount_from_json(self.requester, connection) if connection else None
+            construct,
         )
 
     def get_uptime_percentage(
@@ -577,7 +800,43 @@ query FetchAccountRemoteBalance($entity_id: ID!, $bitcoin_networks: [BitcoinNetw
         bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
         node_ids: Optional[List[str]] = None,
     ) -> Optional[int]:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_uptime_percentage_query(
+                after_date=after_date,
+                before_date=before_date,
+                bitcoin_networks=bitcoin_networks,
+                node_ids=node_ids,
+            )
+        )
+
+    async def get_uptime_percentage_async(
+        self,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+    ) -> Optional[int]:
+        return await self.requester.execute_query_async(
+            self.get_uptime_percentage_query(
+                after_date=after_date,
+                before_date=before_date,
+                bitcoin_networks=bitcoin_networks,
+                node_ids=node_ids,
+            )
+        )
+
+    def get_uptime_percentage_query(
+        self,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        node_ids: Optional[List[str]] = None,
+    ) -> Query[Optional[int]]:
+        def construct(json: Mapping[str, Any]) -> Optional[int]:
+            connection = json["entity"]["uptime_percentage"]
+            return connection
+
+        return Query(
             """
 query FetchAccountUptimePercentage($entity_id: ID!, $after_date: DateTime, $before_date: DateTime, $bitcoin_networks: [BitcoinNetwork!], $node_ids: [ID!]) {
     entity(id: $entity_id) {
@@ -594,9 +853,8 @@ query FetchAccountUptimePercentage($entity_id: ID!, $after_date: DateTime, $befo
                 "bitcoin_networks": bitcoin_networks,
                 "node_ids": node_ids,
             },
+            construct,
         )
-        connection = json["entity"]["uptime_percentage"]
-        return connection
 
     def get_channels(
         self,
@@ -607,7 +865,51 @@ query FetchAccountUptimePercentage($entity_id: ID!, $after_date: DateTime, $befo
         first: Optional[int] = None,
         after: Optional[str] = None,
     ) -> AccountToChannelsConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_channels_query(
+                bitcoin_network=bitcoin_network,
+                lightning_node_id=lightning_node_id,
+                after_date=after_date,
+                before_date=before_date,
+                first=first,
+                after=after,
+            )
+        )
+
+    async def get_channels_async(
+        self,
+        bitcoin_network: BitcoinNetwork,
+        lightning_node_id: Optional[str] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> AccountToChannelsConnection:
+        return await self.requester.execute_query_async(
+            self.get_channels_query(
+                bitcoin_network=bitcoin_network,
+                lightning_node_id=lightning_node_id,
+                after_date=after_date,
+                before_date=before_date,
+                first=first,
+                after=after,
+            )
+        )
+
+    def get_channels_query(
+        self,
+        bitcoin_network: BitcoinNetwork,
+        lightning_node_id: Optional[str] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> Query[AccountToChannelsConnection]:
+        def construct(json: Mapping[str, Any]) -> AccountToChannelsConnection:
+            connection = json["entity"]["channels"]
+            return AccountToChannelsConnection_from_json(self.requester, connection)
+
+        return Query(
             """
 query FetchAccountToChannelsConnection($entity_id: ID!, $bitcoin_network: BitcoinNetwork!, $lightning_node_id: ID, $after_date: DateTime, $before_date: DateTime, $first: Int, $after: String) {
     entity(id: $entity_id) {
@@ -730,9 +1032,52 @@ query FetchAccountToChannelsConnection($entity_id: ID!, $bitcoin_network: Bitcoi
                 "first": first,
                 "after": after,
             },
+            construct,
+        )
+
+    def iter_channels(
+        self,
+        bitcoin_network: BitcoinNetwork,
+        lightning_node_id: Optional[str] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> Iterator[Channel]:
+        return iter_connection(
+            self.requester,
+            lambda after: self.get_channels_query(
+                first=page_size,
+                after=after,
+                bitcoin_network=bitcoin_network,
+                lightning_node_id=lightning_node_id,
+                after_date=after_date,
+                before_date=before_date,
+            ),
+            prefetch,
+        )
+
+    def iter_channels_async(
+        self,
+        bitcoin_network: BitcoinNetwork,
+        lightning_node_id: Optional[str] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> AsyncIterator[Channel]:
+        return iter_connection_async(
+            self.requester,
+            lambda after: self.get_channels_query(
+                first=page_size,
+                after=after,
+                bitcoin_network=bitcoin_network,
+                lightning_node_id=lightning_node_id,
+                after_date=after_date,
+                before_date=before_date,
+            ),
+            prefetch,
         )
-        connection = json["entity"]["channels"]
-        return AccountToChannelsConnection_from_json(self.requester, connection)
 
     def get_transactions(
         self,
@@ -746,7 +1091,63 @@ query FetchAccountToChannelsConnection($entity_id: ID!, $bitcoin_network: Bitcoi
         statuses: Optional[List[TransactionStatus]] = None,
         exclude_failures: Optional[TransactionFailures] = None,
     ) -> AccountToTransactionsConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_transactions_query(
+                first=first,
+                after=after,
+                types=types,
+                after_date=after_date,
+                before_date=before_date,
+                bitcoin_network=bitcoin_network,
+                lightning_node_id=lightning_node_id,
+                statuses=statuses,
+                exclude_failures=exclude_failures,
+            )
+        )
+
+    async def get_transactions_async(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        types: Optional[List[TransactionType]] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        bitcoin_network: Optional[BitcoinNetwork] = None,
+        lightning_node_id: Optional[str] = None,
+        statuses: Optional[List[TransactionStatus]] = None,
+        exclude_failures: Optional[TransactionFailures] = None,
+    ) -> AccountToTransactionsConnection:
+        return await self.requester.execute_query_async(
+            self.get_transactions_query(
+                first=first,
+                after=after,
+                types=types,
+                after_date=after_date,
+                before_date=before_date,
+                bitcoin_network=bitcoin_network,
+                lightning_node_id=lightning_node_id,
+                statuses=statuses,
+                exclude_failures=exclude_failures,
+            )
+        )
+
+    def get_transactions_query(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        types: Optional[List[TransactionType]] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        bitcoin_network: Optional[BitcoinNetwork] = None,
+        lightning_node_id: Optional[str] = None,
+        statuses: Optional[List[TransactionStatus]] = None,
+        exclude_failures: Optional[TransactionFailures] = None,
+    ) -> Query[AccountToTransactionsConnection]:
+        def construct(json: Mapping[str, Any]) -> AccountToTransactionsConnection:
+            connection = json["entity"]["transactions"]
+            return AccountToTransactionsConnection_from_json(self.requester, connection)
+
+        return Query(
             """
 query FetchAccountToTransactionsConnection($entity_id: ID!, $first: Int, $after: String, $types: [TransactionType!], $after_date: DateTime, $before_date: DateTime, $bitcoin_network: BitcoinNetwork, $lightning_node_id: ID, $statuses: [TransactionStatus!], $exclude_failures: TransactionFailures) {
     entity(id: $entity_id) {
@@ -1351,9 +1752,64 @@ query FetchAccountToTransactionsConnection($entity_id: ID!, $first: Int, $after:
                 "statuses": statuses,
                 "exclude_failures": exclude_failures,
             },
+            construct,
+        )
+
+    def iter_transactions(
+        self,
+        types: Optional[List[TransactionType]] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        bitcoin_network: Optional[BitcoinNetwork] = None,
+        lightning_node_id: Optional[str] = None,
+        statuses: Optional[List[TransactionStatus]] = None,
+        exclude_failures: Optional[TransactionFailures] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> Iterator[Transaction]:
+        return iter_connection(
+            self.requester,
+            lambda after: self.get_transactions_query(
+                first=page_size,
+                after=after,
+                types=types,
+                after_date=after_date,
+                before_date=before_date,
+                bitcoin_network=bitcoin_network,
+                lightning_node_id=lightning_node_id,
+                statuses=statuses,
+                exclude_failures=exclude_failures,
+            ),
+            prefetch,
+        )
+
+    def iter_transactions_async(
+        self,
+        types: Optional[List[TransactionType]] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        bitcoin_network: Optional[BitcoinNetwork] = None,
+        lightning_node_id: Optional[str] = None,
+        statuses: Optional[List[TransactionStatus]] = None,
+        exclude_failures: Optional[TransactionFailures] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> AsyncIterator[Transaction]:
+        return iter_connection_async(
+            self.requester,
+            lambda after: self.get_transactions_query(
+                first=page_size,
+                after=after,
+                types=types,
+                after_date=after_date,
+                before_date=before_date,
+                bitcoin_network=bitcoin_network,
+                lightning_node_id=lightning_node_id,
+                statuses=statuses,
+                exclude_failures=exclude_failures,
+            ),
+            prefetch,
         )
-        connection = json["entity"]["transactions"]
-        return AccountToTransactionsConnection_from_json(self.requester, connection)
 
     def get_payment_requests(
         self,
@@ -1364,7 +1820,53 @@ query FetchAccountToTransactionsConnection($entity_id: ID!, $first: Int, $after:
         bitcoin_network: Optional[BitcoinNetwork] = None,
         lightning_node_id: Optional[str] = None,
     ) -> AccountToPaymentRequestsConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_payment_requests_query(
+                first=first,
+                after=after,
+                after_date=after_date,
+                before_date=before_date,
+                bitcoin_network=bitcoin_network,
+                lightning_node_id=lightning_node_id,
+            )
+        )
+
+    async def get_payment_requests_async(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        bitcoin_network: Optional[BitcoinNetwork] = None,
+        lightning_node_id: Optional[str] = None,
+    ) -> AccountToPaymentRequestsConnection:
+        return await self.requester.execute_query_async(
+            self.get_payment_requests_query(
+                first=first,
+                after=after,
+                after_date=after_date,
+                before_date=before_date,
+                bitcoin_network=bitcoin_network,
+                lightning_node_id=lightning_node_id,
+            )
+        )
+
+    def get_payment_requests_query(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        bitcoin_network: Optional[BitcoinNetwork] = None,
+        lightning_node_id: Optional[str] = None,
+    ) -> Query[AccountToPaymentRequestsConnection]:
+        def construct(json: Mapping[str, Any]) -> AccountToPaymentRequestsConnection:
+            connection = json["entity"]["payment_requests"]
+            return AccountToPaymentRequestsConnection_from_json(
+                self.requester, connection
+            )
+
+        return Query(
             """
 query FetchAccountToPaymentRequestsConnection($entity_id: ID!, $first: Int, $after: String, $after_date: DateTime, $before_date: DateTime, $bitcoin_network: BitcoinNetwork, $lightning_node_id: ID) {
     entity(id: $entity_id) {
@@ -1702,9 +2204,52 @@ query FetchAccountToPaymentRequestsConnection($entity_id: ID!, $first: Int, $aft
                 "bitcoin_network": bitcoin_network,
                 "lightning_node_id": lightning_node_id,
             },
+            construct,
+        )
+
+    def iter_payment_requests(
+        self,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        bitcoin_network: Optional[BitcoinNetwork] = None,
+        lightning_node_id: Optional[str] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> Iterator[PaymentRequest]:
+        return iter_connection(
+            self.requester,
+            lambda after: self.get_payment_requests_query(
+                first=page_size,
+                after=after,
+                after_date=after_date,
+                before_date=before_date,
+                bitcoin_network=bitcoin_network,
+                lightning_node_id=lightning_node_id,
+            ),
+            prefetch,
+        )
+
+    def iter_payment_requests_async(
+        self,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        bitcoin_network: Optional[BitcoinNetwork] = None,
+        lightning_node_id: Optional[str] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> AsyncIterator[PaymentRequest]:
+        return iter_connection_async(
+            self.requester,
+            lambda after: self.get_payment_requests_query(
+                first=page_size,
+                after=after,
+                after_date=after_date,
+                before_date=before_date,
+                bitcoin_network=bitcoin_network,
+                lightning_node_id=lightning_node_id,
+            ),
+            prefetch,
         )
-        connection = json["entity"]["payment_requests"]
-        return AccountToPaymentRequestsConnection_from_json(self.requester, connection)
 
     def get_withdrawal_requests(
         self,
@@ -1716,7 +2261,57 @@ query FetchAccountToPaymentRequestsConnection($entity_id: ID!, $first: Int, $aft
         after_date: Optional[datetime] = None,
         before_date: Optional[datetime] = None,
     ) -> AccountToWithdrawalRequestsConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_withdrawal_requests_query(
+                first=first,
+                after=after,
+                bitcoin_networks=bitcoin_networks,
+                statuses=statuses,
+                node_ids=node_ids,
+                after_date=after_date,
+                before_date=before_date,
+            )
+        )
+
+    async def get_withdrawal_requests_async(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        statuses: Optional[List[WithdrawalRequestStatus]] = None,
+        node_ids: Optional[List[str]] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+    ) -> AccountToWithdrawalRequestsConnection:
+        return await self.requester.execute_query_async(
+            self.get_withdrawal_requests_query(
+                first=first,
+                after=after,
+                bitcoin_networks=bitcoin_networks,
+                statuses=statuses,
+                node_ids=node_ids,
+                after_date=after_date,
+                before_date=before_date,
+            )
+        )
+
+    def get_withdrawal_requests_query(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        statuses: Optional[List[WithdrawalRequestStatus]] = None,
+        node_ids: Optional[List[str]] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+    ) -> Query[AccountToWithdrawalRequestsConnection]:
+        def construct(json: Mapping[str, Any]) -> AccountToWithdrawalRequestsConnection:
+            connection = json["entity"]["withdrawal_requests"]
+            return AccountToWithdrawalRequestsConnection_from_json(
+                self.requester, connection
+            )
+
+        return Query(
             """
 query FetchAccountToWithdrawalRequestsConnection($entity_id: ID!, $first: Int, $after: String, $bitcoin_networks: [BitcoinNetwork!], $statuses: [WithdrawalRequestStatus!], $node_ids: [ID!], $after_date: DateTime, $before_date: DateTime) {
     entity(id: $entity_id) {
@@ -1791,10 +2386,55 @@ query FetchAccountToWithdrawalRequestsConnection($entity_id: ID!, $first: Int, $
                 "after_date": after_date,
                 "before_date": before_date,
             },
+            construct,
+        )
+
+    def iter_withdrawal_requests(
+        self,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        statuses: Optional[List[WithdrawalRequestStatus]] = None,
+        node_ids: Optional[List[str]] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> Iterator[WithdrawalRequest]:
+        return iter_connection(
+            self.requester,
+            lambda after: self.get_withdrawal_requests_query(
+                first=page_size,
+                after=after,
+                bitcoin_networks=bitcoin_networks,
+                statuses=statuses,
+                node_ids=node_ids,
+                after_date=after_date,
+                before_date=before_date,
+            ),
+            prefetch,
         )
-        connection = json["entity"]["withdrawal_requests"]
-        return AccountToWithdrawalRequestsConnection_from_json(
-            self.requester, connection
+
+    def iter_withdrawal_requests_async(
+        self,
+        bitcoin_networks: Optional[List[BitcoinNetwork]] = None,
+        statuses: Optional[List[WithdrawalRequestStatus]] = None,
+        node_ids: Optional[List[str]] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> AsyncIterator[WithdrawalRequest]:
+        return iter_connection_async(
+            self.requester,
+            lambda after: self.get_withdrawal_requests_query(
+                first=page_size,
+                after=after,
+                bitcoin_networks=bitcoin_networks,
+                statuses=statuses,
+                node_ids=node_ids,
+                after_date=after_date,
+                before_date=before_date,
+            ),
+            prefetch,
         )
 
     def get_wallets(
@@ -1803,7 +2443,35 @@ query FetchAccountToWithdrawalRequestsConnection($entity_id: ID!, $first: Int, $
         after: Optional[str] = None,
         third_party_ids: Optional[List[str]] = None,
     ) -> AccountToWalletsConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_wallets_query(
+                first=first, after=after, third_party_ids=third_party_ids
+            )
+        )
+
+    async def get_wallets_async(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        third_party_ids: Optional[List[str]] = None,
+    ) -> AccountToWalletsConnection:
+        return await self.requester.execute_query_async(
+            self.get_wallets_query(
+                first=first, after=after, third_party_ids=third_party_ids
+            )
+        )
+
+    def get_wallets_query(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        third_party_ids: Optional[List[str]] = None,
+    ) -> Query[AccountToWalletsConnection]:
+        def construct(json: Mapping[str, Any]) -> AccountToWalletsConnection:
+            connection = json["entity"]["wallets"]
+            return AccountToWalletsConnection_from_json(self.requester, connection)
+
+        return Query(
             """
 query FetchAccountToWalletsConnection($entity_id: ID!, $first: Int, $after: String, $third_party_ids: [String!]) {
     entity(id: $entity_id) {
@@ -1868,9 +2536,36 @@ query FetchAccountToWalletsConnection($entity_id: ID!, $first: Int, $after: Stri
                 "after": after,
                 "third_party_ids": third_party_ids,
             },
+            construct,
+        )
+
+    def iter_wallets(
+        self,
+        third_party_ids: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> Iterator[Wallet]:
+        return iter_connection(
+            self.requester,
+            lambda after: self.get_wallets_query(
+                first=page_size, after=after, third_party_ids=third_party_ids
+            ),
+            prefetch,
+        )
+
+    def iter_wallets_async(
+        self,
+        third_party_ids: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> AsyncIterator[Wallet]:
+        return iter_connection_async(
+            self.requester,
+            lambda after: self.get_wallets_query(
+                first=page_size, after=after, third_party_ids=third_party_ids
+            ),
+            prefetch,
         )
-        connection = json["entity"]["wallets"]
-        return AccountToWalletsConnection_from_json(self.requester, connection)
 
     def to_json(self) -> Mapping[str, Any]:
         return {
@@ -4,12 +4,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Mapping
 
-from lightspark.exceptions import LightsparkException
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum_list
+from lightspark.utils.interfaces import InterfaceLoader
 
 from .Entity import Entity
-from .Permission import Permission
 
 
 @dataclass
@@ -54,24 +52,11 @@ fragment AuditLogActorFragment on AuditLogActor {
 """
 
 
+_from_json: InterfaceLoader[AuditLogActor] = InterfaceLoader(
+    "AuditLogActor",
+    ("ApiToken",),
+)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> AuditLogActor:
-    if obj["__typename"] == "ApiToken":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.ApiToken import ApiToken
-
-        return ApiToken(
-            requester=requester,
-            typename="ApiToken",
-            id=obj["api_token_id"],
-            created_at=datetime.fromisoformat(obj["api_token_created_at"]),
-            updated_at=datetime.fromisoformat(obj["api_token_updated_at"]),
-            client_id=obj["api_token_client_id"],
-            name=obj["api_token_name"],
-            permissions=parse_enum_list(Permission, obj["api_token_permissions"]),
-            is_deleted=obj["api_token_is_deleted"],
-        )
-    graphql_typename = obj["__typename"]
-    raise LightsparkException(
-        "UNKNOWN_INTERFACE",
-        f"Couldn't find a concrete type for interface AuditLogActor corresponding to the typename={graphql_typename}",
-    )
+    return _from_json(requester, obj)
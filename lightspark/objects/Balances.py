@@ -13,7 +13,11 @@ from .CurrencyAmount import from_json as CurrencyAmount_from_json
 class Balances:
     """This is an object representing the balance associated with your Lightspark account. You can retrieve this object to see your balance, which can be broken down into several different categorizations."""
 
-    requester: Requester
+    __slots__ = (
+        "owned_balance",
+        "available_to_send_balance",
+        "available_to_withdraw_balance",
+    )
 
     owned_balance: CurrencyAmount
     """This represents the balance that should be displayed when asked "how much do I own right now?".
@@ -71,7 +75,6 @@ fragment BalancesFragment on Balances {
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> Balances:
     return Balances(
-        requester=requester,
         owned_balance=CurrencyAmount_from_json(
             requester, obj["balances_owned_balance"]
         ),
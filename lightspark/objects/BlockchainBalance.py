@@ -13,7 +13,14 @@ from .CurrencyAmount import from_json as CurrencyAmount_from_json
 class BlockchainBalance:
     """This is an object representing a detailed breakdown of the balance for a Lightspark Node."""
 
-    requester: Requester
+    __slots__ = (
+        "total_balance",
+        "confirmed_balance",
+        "unconfirmed_balance",
+        "locked_balance",
+        "required_reserve",
+        "available_balance",
+    )
 
     total_balance: Optional[CurrencyAmount]
     """The total wallet balance, including unconfirmed UTXOs."""
@@ -113,7 +120,6 @@ fragment BlockchainBalanceFragment on BlockchainBalance {
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> BlockchainBalance:
     return BlockchainBalance(
-        requester=requester,
         total_balance=CurrencyAmount_from_json(
             requester, obj["blockchain_balance_total_balance"]
         )
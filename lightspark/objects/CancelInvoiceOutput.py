@@ -10,7 +10,7 @@ from lightspark.requests.requester import Requester
 class CancelInvoiceOutput:
     """The Invoice that was cancelled. If the invoice was already cancelled, the same invoice is returned."""
 
-    requester: Requester
+    __slots__ = ("invoice_id",)
 
     invoice_id: str
 
@@ -31,7 +31,7 @@ fragment CancelInvoiceOutputFragment on CancelInvoiceOutput {
 
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> CancelInvoiceOutput:
+    # pylint: disable=unused-argument
     return CancelInvoiceOutput(
-        requester=requester,
         invoice_id=obj["cancel_invoice_output_invoice"]["id"],
     )
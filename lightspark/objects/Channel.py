@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Any, List, Mapping, Optional
 
 from lightspark.objects.ChannelStatus import ChannelStatus
+from lightspark.requests.query import Query
 from lightspark.requests.requester import Requester
 from lightspark.utils.enums import parse_enum_optional
 
@@ -87,7 +88,33 @@ class Channel(Entity):
         after_date: Optional[datetime] = None,
         before_date: Optional[datetime] = None,
     ) -> Optional[int]:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_uptime_percentage_query(
+                after_date=after_date, before_date=before_date
+            )
+        )
+
+    async def get_uptime_percentage_async(
+        self,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+    ) -> Optional[int]:
+        return await self.requester.execute_query_async(
+            self.get_uptime_percentage_query(
+                after_date=after_date, before_date=before_date
+            )
+        )
+
+    def get_uptime_percentage_query(
+        self,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+    ) -> Query[Optional[int]]:
+        def construct(json: Mapping[str, Any]) -> Optional[int]:
+            connection = json["entity"]["uptime_percentage"]
+            return connection
+
+        return Query(
             """
 query FetchChannelUptimePercentage($entity_id: ID!, $after_date: DateTime, $before_date: DateTime) {
     entity(id: $entity_id) {
@@ -102,9 +129,8 @@ query FetchChannelUptimePercentage($entity_id: ID!, $after_date: DateTime, $befo
                 "after_date": after_date,
                 "before_date": before_date,
             },
+            construct,
         )
-        connection = json["entity"]["uptime_percentage"]
-        return connection
 
     def get_transactions(
         self,
@@ -112,7 +138,35 @@ query FetchChannelUptimePercentage($entity_id: ID!, $after_date: DateTime, $befo
         after_date: Optional[datetime] = None,
         before_date: Optional[datetime] = None,
     ) -> ChannelToTransactionsConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_transactions_query(
+                types=types, after_date=after_date, before_date=before_date
+            )
+        )
+
+    async def get_transactions_async(
+        self,
+        types: Optional[List[TransactionType]] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+    ) -> ChannelToTransactionsConnection:
+        return await self.requester.execute_query_async(
+            self.get_transactions_query(
+                types=types, after_date=after_date, before_date=before_date
+            )
+        )
+
+    def get_transactions_query(
+        self,
+        types: Optional[List[TransactionType]] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+    ) -> Query[ChannelToTransactionsConnection]:
+        def construct(json: Mapping[str, Any]) -> ChannelToTransactionsConnection:
+            connection = json["entity"]["transactions"]
+            return ChannelToTransactionsConnection_from_json(self.requester, connection)
+
+        return Query(
             """
 query FetchChannelToTransactionsConnection($entity_id: ID!, $types: [TransactionType!], $after_date: DateTime, $before_date: DateTime) {
     entity(id: $entity_id) {
@@ -155,9 +209,8 @@ query FetchChannelToTransactionsConnection($entity_id: ID!, $types: [Transaction
                 "after_date": after_date,
                 "before_date": before_date,
             },
+            construct,
         )
-        connection = json["entity"]["transactions"]
-        return ChannelToTransactionsConnection_from_json(self.requester, connection)
 
     def to_json(self) -> Mapping[str, Any]:
         return {
@@ -13,7 +13,7 @@ from .CurrencyAmount import from_json as CurrencyAmount_from_json
 class ChannelFees:
     """This represents the fee policies set for a channel on the Lightning Network."""
 
-    requester: Requester
+    __slots__ = ("base_fee", "fee_rate_per_mil")
 
     base_fee: Optional[CurrencyAmount]
 
@@ -44,7 +44,6 @@ fragment ChannelFeesFragment on ChannelFees {
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> ChannelFees:
     return ChannelFees(
-        requester=requester,
         base_fee=CurrencyAmount_from_json(requester, obj["channel_fees_base_fee"])
         if obj["channel_fees_base_fee"]
         else None,
@@ -11,7 +11,7 @@ from .CurrencyAmount import from_json as CurrencyAmount_from_json
 
 @dataclass
 class ChannelToTransactionsConnection:
-    requester: Requester
+    __slots__ = ("count", "average_fee", "total_amount_transacted", "total_fees")
 
     count: int
     """The total count of objects in this connection, using the current filters. It is different from the number of objects returned in the current page (in the `entities` field)."""
@@ -76,7 +76,6 @@ def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> ChannelToTransactionsConnection:
     return ChannelToTransactionsConnection(
-        requester=requester,
         count=obj["channel_to_transactions_connection_count"],
         average_fee=CurrencyAmount_from_json(
             requester, obj["channel_to_transactions_connection_average_fee"]
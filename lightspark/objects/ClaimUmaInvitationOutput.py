@@ -8,7 +8,7 @@ from lightspark.requests.requester import Requester
 
 @dataclass
 class ClaimUmaInvitationOutput:
-    requester: Requester
+    __slots__ = ("invitation_id",)
 
     invitation_id: str
     """An UMA.ME invitation object."""
@@ -30,7 +30,7 @@ fragment ClaimUmaInvitationOutputFragment on ClaimUmaInvitationOutput {
 
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> ClaimUmaInvitationOutput:
+    # pylint: disable=unused-argument
     return ClaimUmaInvitationOutput(
-        requester=requester,
         invitation_id=obj["claim_uma_invitation_output_invitation"]["id"],
     )
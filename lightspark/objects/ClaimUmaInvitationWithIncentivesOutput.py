@@ -8,7 +8,7 @@ from lightspark.requests.requester import Requester
 
 @dataclass
 class ClaimUmaInvitationWithIncentivesOutput:
-    requester: Requester
+    __slots__ = ("invitation_id",)
 
     invitation_id: str
     """An UMA.ME invitation object."""
@@ -34,8 +34,8 @@ fragment ClaimUmaInvitationWithIncentivesOutputFragment on ClaimUmaInvitationWit
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> ClaimUmaInvitationWithIncentivesOutput:
+    # pylint: disable=unused-argument
     return ClaimUmaInvitationWithIncentivesOutput(
-        requester=requester,
         invitation_id=obj["claim_uma_invitation_with_incentives_output_invitation"][
             "id"
         ],
@@ -8,7 +8,7 @@ from lightspark.requests.requester import Requester
 
 @dataclass
 class CreateInvitationWithIncentivesOutput:
-    requester: Requester
+    __slots__ = ("invitation_id",)
 
     invitation_id: str
     """The created invitation in the form of a string identifier."""
@@ -34,7 +34,7 @@ fragment CreateInvitationWithIncentivesOutputFragment on CreateInvitationWithInc
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> CreateInvitationWithIncentivesOutput:
+    # pylint: disable=unused-argument
     return CreateInvitationWithIncentivesOutput(
-        requester=requester,
         invitation_id=obj["create_invitation_with_incentives_output_invitation"]["id"],
     )
@@ -8,7 +8,7 @@ from lightspark.requests.requester import Requester
 
 @dataclass
 class CreateInvoiceOutput:
-    requester: Requester
+    __slots__ = ("invoice_id",)
 
     invoice_id: str
 
@@ -29,7 +29,7 @@ fragment CreateInvoiceOutputFragment on CreateInvoiceOutput {
 
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> CreateInvoiceOutput:
+    # pylint: disable=unused-argument
     return CreateInvoiceOutput(
-        requester=requester,
         invoice_id=obj["create_invoice_output_invoice"]["id"],
     )
@@ -13,7 +13,11 @@ from .MultiSigAddressValidationParameters import (
 
 @dataclass
 class CreateNodeWalletAddressOutput:
-    requester: Requester
+    __slots__ = (
+        "node_id",
+        "wallet_address",
+        "multisig_wallet_address_validation_parameters",
+    )
 
     node_id: str
 
@@ -54,7 +58,6 @@ def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> CreateNodeWalletAddressOutput:
     return CreateNodeWalletAddressOutput(
-        requester=requester,
         node_id=obj["create_node_wallet_address_output_node"]["id"],
         wallet_address=obj["create_node_wallet_address_output_wallet_address"],
         multisig_wallet_address_validation_parameters=MultiSigAddressValidationParameters_from_json(
@@ -8,7 +8,7 @@ from lightspark.requests.requester import Requester
 
 @dataclass
 class CreateTestModeInvoiceOutput:
-    requester: Requester
+    __slots__ = ("encoded_payment_request",)
 
     encoded_payment_request: str
 
@@ -29,8 +29,8 @@ fragment CreateTestModeInvoiceOutputFragment on CreateTestModeInvoiceOutput {
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> CreateTestModeInvoiceOutput:
+    # pylint: disable=unused-argument
     return CreateTestModeInvoiceOutput(
-        requester=requester,
         encoded_payment_request=obj[
             "create_test_mode_invoice_output_encoded_payment_request"
         ],
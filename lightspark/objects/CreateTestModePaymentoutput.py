@@ -10,7 +10,7 @@ from lightspark.requests.requester import Requester
 class CreateTestModePaymentoutput:
     """This is an object identifying the output of a test mode payment. This object can be used to retrieve the associated payment made from a Test Mode Payment call."""
 
-    requester: Requester
+    __slots__ = ("payment_id", "incoming_payment_id")
 
     payment_id: str
     """The payment that has been sent."""
@@ -43,8 +43,8 @@ fragment CreateTestModePaymentoutputFragment on CreateTestModePaymentoutput {
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> CreateTestModePaymentoutput:
+    # pylint: disable=unused-argument
     return CreateTestModePaymentoutput(
-        requester=requester,
         payment_id=obj["create_test_mode_paymentoutput_payment"]["id"],
         incoming_payment_id=obj["create_test_mode_paymentoutput_incoming_payment"][
             "id"
@@ -8,7 +8,7 @@ from lightspark.requests.requester import Requester
 
 @dataclass
 class CreateUmaInvitationOutput:
-    requester: Requester
+    __slots__ = ("invitation_id",)
 
     invitation_id: str
     """The created invitation in the form of a string identifier."""
@@ -32,7 +32,7 @@ fragment CreateUmaInvitationOutputFragment on CreateUmaInvitationOutput {
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> CreateUmaInvitationOutput:
+    # pylint: disable=unused-argument
     return CreateUmaInvitationOutput(
-        requester=requester,
         invitation_id=obj["create_uma_invitation_output_invitation"]["id"],
     )
@@ -15,7 +15,13 @@ from .CurrencyUnit import CurrencyUnit
 class CurrencyAmount:
     """This object represents the value and unit for an amount of currency."""
 
-    requester: Requester
+    __slots__ = (
+        "original_value",
+        "original_unit",
+        "preferred_currency_unit",
+        "preferred_currency_value_rounded",
+        "preferred_currency_value_approx",
+    )
 
     original_value: int
     """The original numeric value for this CurrencyAmount."""
@@ -101,7 +107,6 @@ class CurrencyAmount:
                 f"Cannot convert from {self.original_unit} to {unit}",
             ) from e
         return CurrencyAmount(
-            requester=self.requester,
             original_unit=self.original_unit,
             original_value=self.original_value,
             preferred_currency_value_rounded=conversion_fn(self.original_value),
@@ -123,8 +128,8 @@ fragment CurrencyAmountFragment on CurrencyAmount {
 
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> CurrencyAmount:
+    # pylint: disable=unused-argument
     return CurrencyAmount(
-        requester=requester,
         original_value=obj["currency_amount_original_value"],
         original_unit=parse_enum(CurrencyUnit, obj["currency_amount_original_unit"]),
         preferred_currency_unit=parse_enum(
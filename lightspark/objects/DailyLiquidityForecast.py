@@ -15,7 +15,7 @@ from .LightningPaymentDirection import LightningPaymentDirection
 
 @dataclass
 class DailyLiquidityForecast:
-    requester: Requester
+    __slots__ = ("date", "direction", "amount")
 
     date: datetime
     """The date for which this forecast was generated."""
@@ -53,7 +53,6 @@ fragment DailyLiquidityForecastFragment on DailyLiquidityForecast {
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> DailyLiquidityForecast:
     return DailyLiquidityForecast(
-        requester=requester,
         date=obj["daily_liquidity_forecast_date"],
         direction=parse_enum(
             LightningPaymentDirection, obj["daily_liquidity_forecast_direction"]
@@ -8,7 +8,7 @@ from lightspark.requests.requester import Requester
 
 @dataclass
 class DeleteApiTokenOutput:
-    requester: Requester
+    __slots__ = ("account_id",)
 
     account_id: str
 
@@ -29,7 +29,7 @@ fragment DeleteApiTokenOutputFragment on DeleteApiTokenOutput {
 
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> DeleteApiTokenOutput:
+    # pylint: disable=unused-argument
     return DeleteApiTokenOutput(
-        requester=requester,
         account_id=obj["delete_api_token_output_account"]["id"],
     )
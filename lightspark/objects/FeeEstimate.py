@@ -13,7 +13,7 @@ from .CurrencyAmount import from_json as CurrencyAmount_from_json
 class FeeEstimate:
     """This object represents the estimated L1 transaction fees for the Bitcoin network. Fee estimates are separated by potential confirmation speeds for settlement."""
 
-    requester: Requester
+    __slots__ = ("fee_fast", "fee_min")
 
     fee_fast: CurrencyAmount
 
@@ -51,7 +51,6 @@ fragment FeeEstimateFragment on FeeEstimate {
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> FeeEstimate:
     return FeeEstimate(
-        requester=requester,
         fee_fast=CurrencyAmount_from_json(requester, obj["fee_estimate_fee_fast"]),
         fee_min=CurrencyAmount_from_json(requester, obj["fee_estimate_fee_min"]),
     )
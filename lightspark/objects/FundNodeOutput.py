@@ -11,7 +11,7 @@ from .CurrencyAmount import from_json as CurrencyAmount_from_json
 
 @dataclass
 class FundNodeOutput:
-    requester: Requester
+    __slots__ = ("amount",)
 
     amount: CurrencyAmount
 
@@ -38,6 +38,5 @@ fragment FundNodeOutputFragment on FundNodeOutput {
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> FundNodeOutput:
     return FundNodeOutput(
-        requester=requester,
         amount=CurrencyAmount_from_json(requester, obj["fund_node_output_amount"]),
     )
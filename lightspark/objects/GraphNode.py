@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Any, List, Mapping, Optional
 
 from lightspark.objects.BitcoinNetwork import BitcoinNetwork
+from lightspark.requests.query import Query
 from lightspark.requests.requester import Requester
 from lightspark.utils.enums import parse_enum
 
@@ -53,7 +54,25 @@ class GraphNode(Node, Entity):
     def get_addresses(
         self, first: Optional[int] = None, types: Optional[List[NodeAddressType]] = None
     ) -> NodeToAddressesConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_addresses_query(first=first, types=types)
+        )
+
+    async def get_addresses_async(
+        self, first: Optional[int] = None, types: Optional[List[NodeAddressType]] = None
+    ) -> NodeToAddressesConnection:
+        return await self.requester.execute_query_async(
+            self.get_addresses_query(first=first, types=types)
+        )
+
+    def get_addresses_query(
+        self, first: Optional[int] = None, types: Optional[List[NodeAddressType]] = None
+    ) -> Query[NodeToAddressesConnection]:
+        def construct(json: Mapping[str, Any]) -> NodeToAddressesConnection:
+            connection = json["entity"]["addresses"]
+            return NodeToAddressesConnection_from_json(self.requester, connection)
+
+        return Query(
             """
 query FetchNodeToAddressesConnection($entity_id: ID!, $first: Int, $types: [NodeAddressType!]) {
     entity(id: $entity_id) {
@@ -72,9 +91,8 @@ query FetchNodeToAddressesConnection($entity_id: ID!, $first: Int, $types: [Node
 }
             """,
             {"entity_id": self.id, "first": first, "types": types},
+            construct,
         )
-        connection = json["entity"]["addresses"]
-        return NodeToAddressesConnection_from_json(self.requester, connection)
 
     def to_json(self) -> Mapping[str, Any]:
         return {
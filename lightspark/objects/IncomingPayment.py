@@ -2,15 +2,18 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, List, Mapping, Optional
+from typing import Any, AsyncIterator, Iterator, List, Mapping, Optional
 
 from lightspark.objects.TransactionStatus import TransactionStatus
+from lightspark.requests.pagination import iter_connection, iter_connection_async
+from lightspark.requests.query import Query
 from lightspark.requests.requester import Requester
 from lightspark.utils.enums import parse_enum
 
 from .CurrencyAmount import CurrencyAmount
 from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
+from .IncomingPaymentAttempt import IncomingPaymentAttempt
 from .IncomingPaymentAttemptStatus import IncomingPaymentAttemptStatus
 from .IncomingPaymentToAttemptsConnection import IncomingPaymentToAttemptsConnection
 from .IncomingPaymentToAttemptsConnection import (
@@ -72,7 +75,33 @@ class IncomingPayment(LightningTransaction, Transaction, Entity):
         statuses: Optional[List[IncomingPaymentAttemptStatus]] = None,
         after: Optional[str] = None,
     ) -> IncomingPaymentToAttemptsConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_attempts_query(first=first, statuses=statuses, after=after)
+        )
+
+    async def get_attempts_async(
+        self,
+        first: Optional[int] = None,
+        statuses: Optional[List[IncomingPaymentAttemptStatus]] = None,
+        after: Optional[str] = None,
+    ) -> IncomingPaymentToAttemptsConnection:
+        return await self.requester.execute_query_async(
+            self.get_attempts_query(first=first, statuses=statuses, after=after)
+        )
+
+    def get_attempts_query(
+        self,
+        first: Optional[int] = None,
+        statuses: Optional[List[IncomingPaymentAttemptStatus]] = None,
+        after: Optional[str] = None,
+    ) -> Query[IncomingPaymentToAttemptsConnection]:
+        def construct(json: Mapping[str, Any]) -> IncomingPaymentToAttemptsConnection:
+            connection = json["entity"]["attempts"]
+            return IncomingPaymentToAttemptsConnection_from_json(
+                self.requester, connection
+            )
+
+        return Query(
             """
 query FetchIncomingPaymentToAttemptsConnection($entity_id: ID!, $first: Int, $statuses: [IncomingPaymentAttemptStatus!], $after: String) {
     entity(id: $entity_id) {
@@ -117,9 +146,36 @@ query FetchIncomingPaymentToAttemptsConnection($entity_id: ID!, $first: Int, $st
                 "statuses": statuses,
                 "after": after,
             },
+            construct,
+        )
+
+    def iter_attempts(
+        self,
+        statuses: Optional[List[IncomingPaymentAttemptStatus]] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> Iterator[IncomingPaymentAttempt]:
+        return iter_connection(
+            self.requester,
+            lambda after: self.get_attempts_query(
+                first=page_size, after=after, statuses=statuses
+            ),
+            prefetch,
+        )
+
+    def iter_attempts_async(
+        self,
+        statuses: Optional[List[IncomingPaymentAttemptStatus]] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> AsyncIterator[IncomingPaymentAttempt]:
+        return iter_connection_async(
+            self.requester,
+            lambda after: self.get_attempts_query(
+                first=page_size, after=after, statuses=statuses
+            ),
+            prefetch,
         )
-        connection = json["entity"]["attempts"]
-        return IncomingPaymentToAttemptsConnection_from_json(self.requester, connection)
 
     def to_json(self) -> Mapping[str, Any]:
         return {
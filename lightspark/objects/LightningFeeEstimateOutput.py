@@ -11,7 +11,7 @@ from .CurrencyAmount import from_json as CurrencyAmount_from_json
 
 @dataclass
 class LightningFeeEstimateOutput:
-    requester: Requester
+    __slots__ = ("fee_estimate",)
 
     fee_estimate: CurrencyAmount
     """The estimated fees for the payment."""
@@ -41,7 +41,6 @@ def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> LightningFeeEstimateOutput:
     return LightningFeeEstimateOutput(
-        requester=requester,
         fee_estimate=CurrencyAmount_from_json(
             requester, obj["lightning_fee_estimate_output_fee_estimate"]
         ),
@@ -2,22 +2,21 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, List, Mapping, Optional
+from typing import Any, AsyncIterator, Iterator, List, Mapping, Optional
 
-from lightspark.exceptions import LightsparkException
 from lightspark.objects.BitcoinNetwork import BitcoinNetwork
 from lightspark.objects.LightsparkNodeStatus import LightsparkNodeStatus
+from lightspark.requests.pagination import iter_connection, iter_connection_async
+from lightspark.requests.query import Query
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum, parse_enum_optional
+from lightspark.utils.interfaces import InterfaceLoader
 
 from .Balances import Balances
-from .Balances import from_json as Balances_from_json
 from .BitcoinNetwork import BitcoinNetwork
 from .BlockchainBalance import BlockchainBalance
-from .BlockchainBalance import from_json as BlockchainBalance_from_json
+from .Channel import Channel
 from .ChannelStatus import ChannelStatus
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
 from .LightningPaymentDirection import LightningPaymentDirection
 from .LightsparkNodeStatus import LightsparkNodeStatus
@@ -35,7 +34,6 @@ from .Node import Node
 from .NodeAddressType import NodeAddressType
 from .NodeToAddressesConnection import NodeToAddressesConnection
 from .NodeToAddressesConnection import from_json as NodeToAddressesConnection_from_json
-from .Secret import from_json as Secret_from_json
 
 
 @dataclass
@@ -102,7 +100,25 @@ class LightsparkNode(Node, Entity):
     def get_addresses(
         self, first: Optional[int] = None, types: Optional[List[NodeAddressType]] = None
     ) -> NodeToAddressesConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_addresses_query(first=first, types=types)
+        )
+
+    async def get_addresses_async(
+        self, first: Optional[int] = None, types: Optional[List[NodeAddressType]] = None
+    ) -> NodeToAddressesConnection:
+        return await self.requester.execute_query_async(
+            self.get_addresses_query(first=first, types=types)
+        )
+
+    def get_addresses_query(
+        self, first: Optional[int] = None, types: Optional[List[NodeAddressType]] = None
+    ) -> Query[NodeToAddressesConnection]:
+        def construct(json: Mapping[str, Any]) -> NodeToAddressesConnection:
+            connection = json["entity"]["addresses"]
+            return NodeToAddressesConnection_from_json(self.requester, connection)
+
+        return Query(
             """
 query FetchNodeToAddressesConnection($entity_id: ID!, $first: Int, $types: [NodeAddressType!]) {
     entity(id: $entity_id) {
@@ -121,9 +137,8 @@ query FetchNodeToAddressesConnection($entity_id: ID!, $first: Int, $types: [Node
 }
             """,
             {"entity_id": self.id, "first": first, "types": types},
+            construct,
         )
-        connection = json["entity"]["addresses"]
-        return NodeToAddressesConnection_from_json(self.requester, connection)
 
     def get_channels(
         self,
@@ -131,7 +146,33 @@ query FetchNodeToAddressesConnection($entity_id: ID!, $first: Int, $types: [Node
         statuses: Optional[List[ChannelStatus]] = None,
         after: Optional[str] = None,
     ) -> LightsparkNodeToChannelsConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_channels_query(first=first, statuses=statuses, after=after)
+        )
+
+    async def get_channels_async(
+        self,
+        first: Optional[int] = None,
+        statuses: Optional[List[ChannelStatus]] = None,
+        after: Optional[str] = None,
+    ) -> LightsparkNodeToChannelsConnection:
+        return await self.requester.execute_query_async(
+            self.get_channels_query(first=first, statuses=statuses, after=after)
+        )
+
+    def get_channels_query(
+        self,
+        first: Optional[int] = None,
+        statuses: Optional[List[ChannelStatus]] = None,
+        after: Optional[str] = None,
+    ) -> Query[LightsparkNodeToChannelsConnection]:
+        def construct(json: Mapping[str, Any]) -> LightsparkNodeToChannelsConnection:
+            connection = json["entity"]["channels"]
+            return LightsparkNodeToChannelsConnection_from_json(
+                self.requester, connection
+            )
+
+        return Query(
             """
 query FetchLightsparkNodeToChannelsConnection($entity_id: ID!, $first: Int, $statuses: [ChannelStatus!], $after: String) {
     entity(id: $entity_id) {
@@ -251,9 +292,36 @@ query FetchLightsparkNodeToChannelsConnection($entity_id: ID!, $first: Int, $sta
                 "statuses": statuses,
                 "after": after,
             },
+            construct,
+        )
+
+    def iter_channels(
+        self,
+        statuses: Optional[List[ChannelStatus]] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> Iterator[Channel]:
+        return iter_connection(
+            self.requester,
+            lambda after: self.get_channels_query(
+                first=page_size, after=after, statuses=statuses
+            ),
+            prefetch,
+        )
+
+    def iter_channels_async(
+        self,
+        statuses: Optional[List[ChannelStatus]] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> AsyncIterator[Channel]:
+        return iter_connection_async(
+            self.requester,
+            lambda after: self.get_channels_query(
+                first=page_size, after=after, statuses=statuses
+            ),
+            prefetch,
         )
-        connection = json["entity"]["channels"]
-        return LightsparkNodeToChannelsConnection_from_json(self.requester, connection)
 
     def get_daily_liquidity_forecasts(
         self,
@@ -261,7 +329,39 @@ query FetchLightsparkNodeToChannelsConnection($entity_id: ID!, $first: Int, $sta
         to_date: datetime,
         direction: LightningPaymentDirection,
     ) -> LightsparkNodeToDailyLiquidityForecastsConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_daily_liquidity_forecasts_query(
+                from_date=from_date, to_date=to_date, direction=direction
+            )
+        )
+
+    async def get_daily_liquidity_forecasts_async(
+        self,
+        from_date: datetime,
+        to_date: datetime,
+        direction: LightningPaymentDirection,
+    ) -> LightsparkNodeToDailyLiquidityForecastsConnection:
+        return await self.requester.execute_query_async(
+            self.get_daily_liquidity_forecasts_query(
+                from_date=from_date, to_date=to_date, direction=direction
+            )
+        )
+
+    def get_daily_liquidity_forecasts_query(
+        self,
+        from_date: datetime,
+        to_date: datetime,
+        direction: LightningPaymentDirection,
+    ) -> Query[LightsparkNodeToDailyLiquidityForecastsConnection]:
+        def construct(
+            json: Mapping[str, Any]
+        ) -> LightsparkNodeToDailyLiquidityForecastsConnection:
+            connection = json["entity"]["daily_liquidity_forecasts"]
+            return LightsparkNodeToDailyLiquidityForecastsConnection_from_json(
+                self.requester, connection
+            )
+
+        return Query(
             """
 query FetchLightsparkNodeToDailyLiquidityForecastsConnection($entity_id: ID!, $from_date: Date!, $to_date: Date!, $direction: LightningPaymentDirection!) {
     entity(id: $entity_id) {
@@ -295,10 +395,7 @@ query FetchLightsparkNodeToDailyLiquidityForecastsConnection($entity_id: ID!, $f
                 "to_date": to_date,
                 "direction": direction,
             },
-        )
-        connection = json["entity"]["daily_liquidity_forecasts"]
-        return LightsparkNodeToDailyLiquidityForecastsConnection_from_json(
-            self.requester, connection
+            construct,
         )
 
     def to_json(self) -> Mapping[str, Any]:
@@ -603,139 +700,14 @@ fragment LightsparkNodeFragment on LightsparkNode {
 """
 
 
-def from_json(requester: Requester, obj: Mapping[str, Any]) -> LightsparkNode:
-    if obj["__typename"] == "LightsparkNodeWithOSK":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.LightsparkNodeWithOSK import LightsparkNodeWithOSK
-
-        return LightsparkNodeWithOSK(
-            requester=requester,
-            typename="LightsparkNodeWithOSK",
-            id=obj["lightspark_node_with_o_s_k_id"],
-            created_at=datetime.fromisoformat(
-                obj["lightspark_node_with_o_s_k_created_at"]
-            ),
-            updated_at=datetime.fromisoformat(
-                obj["lightspark_node_with_o_s_k_updated_at"]
-            ),
-            alias=obj["lightspark_node_with_o_s_k_alias"],
-            bitcoin_network=parse_enum(
-                BitcoinNetwork, obj["lightspark_node_with_o_s_k_bitcoin_network"]
-            ),
-            color=obj["lightspark_node_with_o_s_k_color"],
-            conductivity=obj["lightspark_node_with_o_s_k_conductivity"],
-            display_name=obj["lightspark_node_with_o_s_k_display_name"],
-            public_key=obj["lightspark_node_with_o_s_k_public_key"],
-            owner_id=obj["lightspark_node_with_o_s_k_owner"]["id"],
-            status=parse_enum_optional(
-                LightsparkNodeStatus, obj["lightspark_node_with_o_s_k_status"]
-            ),
-            total_balance=CurrencyAmount_from_json(
-                requester, obj["lightspark_node_with_o_s_k_total_balance"]
-            )
-            if obj["lightspark_node_with_o_s_k_total_balance"]
-            else None,
-            total_local_balance=CurrencyAmount_from_json(
-                requester, obj["lightspark_node_with_o_s_k_total_local_balance"]
-            )
-            if obj["lightspark_node_with_o_s_k_total_local_balance"]
-            else None,
-            local_balance=CurrencyAmount_from_json(
-                requester, obj["lightspark_node_with_o_s_k_local_balance"]
-            )
-            if obj["lightspark_node_with_o_s_k_local_balance"]
-            else None,
-            remote_balance=CurrencyAmount_from_json(
-                requester, obj["lightspark_node_with_o_s_k_remote_balance"]
-            )
-            if obj["lightspark_node_with_o_s_k_remote_balance"]
-            else None,
-            blockchain_balance=BlockchainBalance_from_json(
-                requester, obj["lightspark_node_with_o_s_k_blockchain_balance"]
-            )
-            if obj["lightspark_node_with_o_s_k_blockchain_balance"]
-            else None,
-            uma_prescreening_utxos=obj[
-                "lightspark_node_with_o_s_k_uma_prescreening_utxos"
-            ],
-            balances=Balances_from_json(
-                requester, obj["lightspark_node_with_o_s_k_balances"]
-            )
-            if obj["lightspark_node_with_o_s_k_balances"]
-            else None,
-            encrypted_signing_private_key=Secret_from_json(
-                requester,
-                obj["lightspark_node_with_o_s_k_encrypted_signing_private_key"],
-            )
-            if obj["lightspark_node_with_o_s_k_encrypted_signing_private_key"]
-            else None,
-        )
-    if obj["__typename"] == "LightsparkNodeWithRemoteSigning":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.LightsparkNodeWithRemoteSigning import (
-            LightsparkNodeWithRemoteSigning,
-        )
+_from_json: InterfaceLoader[LightsparkNode] = InterfaceLoader(
+    "LightsparkNode",
+    (
+        "LightsparkNodeWithOSK",
+        "LightsparkNodeWithRemoteSigning",
+    ),
+)
 
-        return LightsparkNodeWithRemoteSigning(
-            requester=requester,
-            typename="LightsparkNodeWithRemoteSigning",
-            id=obj["lightspark_node_with_remote_signing_id"],
-            created_at=datetime.fromisoformat(
-                obj["lightspark_node_with_remote_signing_created_at"]
-            ),
-            updated_at=datetime.fromisoformat(
-                obj["lightspark_node_with_remote_signing_updated_at"]
-            ),
-            alias=obj["lightspark_node_with_remote_signing_alias"],
-            bitcoin_network=parse_enum(
-                BitcoinNetwork,
-                obj["lightspark_node_with_remote_signing_bitcoin_network"],
-            ),
-            color=obj["lightspark_node_with_remote_signing_color"],
-            conductivity=obj["lightspark_node_with_remote_signing_conductivity"],
-            display_name=obj["lightspark_node_with_remote_signing_display_name"],
-            public_key=obj["lightspark_node_with_remote_signing_public_key"],
-            owner_id=obj["lightspark_node_with_remote_signing_owner"]["id"],
-            status=parse_enum_optional(
-                LightsparkNodeStatus, obj["lightspark_node_with_remote_signing_status"]
-            ),
-            total_balance=CurrencyAmount_from_json(
-                requester, obj["lightspark_node_with_remote_signing_total_balance"]
-            )
-            if obj["lightspark_node_with_remote_signing_total_balance"]
-            else None,
-            total_local_balance=CurrencyAmount_from_json(
-                requester,
-                obj["lightspark_node_with_remote_signing_total_local_balance"],
-            )
-            if obj["lightspark_node_with_remote_signing_total_local_balance"]
-            else None,
-            local_balance=CurrencyAmount_from_json(
-                requester, obj["lightspark_node_with_remote_signing_local_balance"]
-            )
-            if obj["lightspark_node_with_remote_signing_local_balance"]
-            else None,
-            remote_balance=CurrencyAmount_from_json(
-                requester, obj["lightspark_node_with_remote_signing_remote_balance"]
-            )
-            if obj["lightspark_node_with_remote_signing_remote_balance"]
-            else None,
-            blockchain_balance=BlockchainBalance_from_json(
-                requester, obj["lightspark_node_with_remote_signing_blockchain_balance"]
-            )
-            if obj["lightspark_node_with_remote_signing_blockchain_balance"]
-            else None,
-            uma_prescreening_utxos=obj[
-                "lightspark_node_with_remote_signing_uma_prescreening_utxos"
-            ],
-            balances=Balances_from_json(
-                requester, obj["lightspark_node_with_remote_signing_balances"]
-            )
-            if obj["lightspark_node_with_remote_signing_balances"]
-            else None,
-        )
-    graphql_typename = obj["__typename"]
-    raise LightsparkException(
-        "UNKNOWN_INTERFACE",
-        f"Couldn't find a concrete type for interface LightsparkNode corresponding to the typename={graphql_typename}",
-    )
+
+def from_json(requester: Requester, obj: Mapping[str, Any]) -> LightsparkNode:
+    return _from_json(requester, obj)
@@ -4,12 +4,9 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Mapping
 
-from lightspark.exceptions import LightsparkException
-from lightspark.objects.WalletStatus import WalletStatus
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum
+from lightspark.utils.interfaces import InterfaceLoader
 
-from .Balances import from_json as Balances_from_json
 from .Entity import Entity
 
 
@@ -91,41 +88,14 @@ fragment LightsparkNodeOwnerFragment on LightsparkNodeOwner {
 """
 
 
+_from_json: InterfaceLoader[LightsparkNodeOwner] = InterfaceLoader(
+    "LightsparkNodeOwner",
+    (
+        "Account",
+        "Wallet",
+    ),
+)
+
+
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> LightsparkNodeOwner:
-    if obj["__typename"] == "Account":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.Account import Account
-
-        return Account(
-            requester=requester,
-            typename="Account",
-            id=obj["account_id"],
-            created_at=datetime.fromisoformat(obj["account_created_at"]),
-            updated_at=datetime.fromisoformat(obj["account_updated_at"]),
-            name=obj["account_name"],
-        )
-    if obj["__typename"] == "Wallet":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.Wallet import Wallet
-
-        return Wallet(
-            requester=requester,
-            typename="Wallet",
-            id=obj["wallet_id"],
-            created_at=datetime.fromisoformat(obj["wallet_created_at"]),
-            updated_at=datetime.fromisoformat(obj["wallet_updated_at"]),
-            last_login_at=datetime.fromisoformat(obj["wallet_last_login_at"])
-            if obj["wallet_last_login_at"]
-            else None,
-            balances=Balances_from_json(requester, obj["wallet_balances"])
-            if obj["wallet_balances"]
-            else None,
-            third_party_identifier=obj["wallet_third_party_identifier"],
-            account_id=obj["wallet_account"]["id"] if obj["wallet_account"] else None,
-            status=parse_enum(WalletStatus, obj["wallet_status"]),
-        )
-    graphql_typename = obj["__typename"]
-    raise LightsparkException(
-        "UNKNOWN_INTERFACE",
-        f"Couldn't find a concrete type for interface LightsparkNodeOwner corresponding to the typename={graphql_typename}",
-    )
+    return _from_json(requester, obj)
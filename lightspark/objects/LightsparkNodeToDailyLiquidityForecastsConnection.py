@@ -15,7 +15,7 @@ from .LightningPaymentDirection import LightningPaymentDirection
 
 @dataclass
 class LightsparkNodeToDailyLiquidityForecastsConnection:
-    requester: Requester
+    __slots__ = ("from_date", "to_date", "direction", "entities")
 
     from_date: datetime
 
@@ -64,7 +64,6 @@ def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> LightsparkNodeToDailyLiquidityForecastsConnection:
     return LightsparkNodeToDailyLiquidityForecastsConnection(
-        requester=requester,
         from_date=obj[
             "lightspark_node_to_daily_liquidity_forecasts_connection_from_date"
         ],
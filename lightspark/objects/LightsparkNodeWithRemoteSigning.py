@@ -2,10 +2,12 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, List, Mapping, Optional
+from typing import Any, AsyncIterator, Iterator, List, Mapping, Optional
 
 from lightspark.objects.BitcoinNetwork import BitcoinNetwork
 from lightspark.objects.LightsparkNodeStatus import LightsparkNodeStatus
+from lightspark.requests.pagination import iter_connection, iter_connection_async
+from lightspark.requests.query import Query
 from lightspark.requests.requester import Requester
 from lightspark.utils.enums import parse_enum, parse_enum_optional
 
@@ -14,6 +16,7 @@ from .Balances import from_json as Balances_from_json
 from .BitcoinNetwork import BitcoinNetwork
 from .BlockchainBalance import BlockchainBalance
 from .BlockchainBalance import from_json as BlockchainBalance_from_json
+from .Channel import Channel
 from .ChannelStatus import ChannelStatus
 from .CurrencyAmount import CurrencyAmount
 from .CurrencyAmount import from_json as CurrencyAmount_from_json
@@ -101,7 +104,25 @@ class LightsparkNodeWithRemoteSigning(LightsparkNode, Node, Entity):
     def get_addresses(
         self, first: Optional[int] = None, types: Optional[List[NodeAddressType]] = None
     ) -> NodeToAddressesConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_addresses_query(first=first, types=types)
+        )
+
+    async def get_addresses_async(
+        self, first: Optional[int] = None, types: Optional[List[NodeAddressType]] = None
+    ) -> NodeToAddressesConnection:
+        return await self.requester.execute_query_async(
+            self.get_addresses_query(first=first, types=types)
+        )
+
+    def get_addresses_query(
+        self, first: Optional[int] = None, types: Optional[List[NodeAddressType]] = None
+    ) -> Query[NodeToAddressesConnection]:
+        def construct(json: Mapping[str, Any]) -> NodeToAddressesConnection:
+            connection = json["entity"]["addresses"]
+            return NodeToAddressesConnection_from_json(self.requester, connection)
+
+        return Query(
             """
 query FetchNodeToAddressesConnection($entity_id: ID!, $first: Int, $types: [NodeAddressType!]) {
     entity(id: $entity_id) {
@@ -120,9 +141,8 @@ query FetchNodeToAddressesConnection($entity_id: ID!, $first: Int, $types: [Node
 }
             """,
             {"entity_id": self.id, "first": first, "types": types},
+            construct,
         )
-        connection = json["entity"]["addresses"]
-        return NodeToAddressesConnection_from_json(self.requester, connection)
 
     def get_channels(
         self,
@@ -130,7 +150,33 @@ query FetchNodeToAddressesConnection($entity_id: ID!, $first: Int, $types: [Node
         statuses: Optional[List[ChannelStatus]] = None,
         after: Optional[str] = None,
     ) -> LightsparkNodeToChannelsConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_channels_query(first=first, statuses=statuses, after=after)
+        )
+
+    async def get_channels_async(
+        self,
+        first: Optional[int] = None,
+        statuses: Optional[List[ChannelStatus]] = None,
+        after: Optional[str] = None,
+    ) -> LightsparkNodeToChannelsConnection:
+        return await self.requester.execute_query_async(
+            self.get_channels_query(first=first, statuses=statuses, after=after)
+        )
+
+    def get_channels_query(
+        self,
+        first: Optional[int] = None,
+        statuses: Optional[List[ChannelStatus]] = None,
+        after: Optional[str] = None,
+    ) -> Query[LightsparkNodeToChannelsConnection]:
+        def construct(json: Mapping[str, Any]) -> LightsparkNodeToChannelsConnection:
+            connection = json["entity"]["channels"]
+            return LightsparkNodeToChannelsConnection_from_json(
+                self.requester, connection
+            )
+
+        return Query(
             """
 query FetchLightsparkNodeToChannelsConnection($entity_id: ID!, $first: Int, $statuses: [ChannelStatus!], $after: String) {
     entity(id: $entity_id) {
@@ -250,9 +296,36 @@ query FetchLightsparkNodeToChannelsConnection($entity_id: ID!, $first: Int, $sta
                 "statuses": statuses,
                 "after": after,
             },
+            construct,
+        )
+
+    def iter_channels(
+        self,
+        statuses: Optional[List[ChannelStatus]] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> Iterator[Channel]:
+        return iter_connection(
+            self.requester,
+            lambda after: self.get_channels_query(
+                first=page_size, after=after, statuses=statuses
+            ),
+            prefetch,
+        )
+
+    def iter_channels_async(
+        self,
+        statuses: Optional[List[ChannelStatus]] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> AsyncIterator[Channel]:
+        return iter_connection_async(
+            self.requester,
+            lambda after: self.get_channels_query(
+                first=page_size, after=after, statuses=statuses
+            ),
+            prefetch,
         )
-        connection = json["entity"]["channels"]
-        return LightsparkNodeToChannelsConnection_from_json(self.requester, connection)
 
     def get_daily_liquidity_forecasts(
         self,
@@ -260,7 +333,39 @@ query FetchLightsparkNodeToChannelsConnection($entity_id: ID!, $first: Int, $sta
         to_date: datetime,
         direction: LightningPaymentDirection,
     ) -> LightsparkNodeToDailyLiquidityForecastsConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_daily_liquidity_forecasts_query(
+                from_date=from_date, to_date=to_date, direction=direction
+            )
+        )
+
+    async def get_daily_liquidity_forecasts_async(
+        self,
+        from_date: datetime,
+        to_date: datetime,
+        direction: LightningPaymentDirection,
+    ) -> LightsparkNodeToDailyLiquidityForecastsConnection:
+        return await self.requester.execute_query_async(
+            self.get_daily_liquidity_forecasts_query(
+                from_date=from_date, to_date=to_date, direction=direction
+            )
+        )
+
+    def get_daily_liquidity_forecasts_query(
+        self,
+        from_date: datetime,
+        to_date: datetime,
+        direction: LightningPaymentDirection,
+    ) -> Query[LightsparkNodeToDailyLiquidityForecastsConnection]:
+        def construct(
+            json: Mapping[str, Any]
+        ) -> LightsparkNodeToDailyLiquidityForecastsConnection:
+            connection = json["entity"]["daily_liquidity_forecasts"]
+            return LightsparkNodeToDailyLiquidityForecastsConnection_from_json(
+                self.requester, connection
+            )
+
+        return Query(
             """
 query FetchLightsparkNodeToDailyLiquidityForecastsConnection($entity_id: ID!, $from_date: Date!, $to_date: Date!, $direction: LightningPaymentDirection!) {
     entity(id: $entity_id) {
@@ -294,10 +399,7 @@ query FetchLightsparkNodeToDailyLiquidityForecastsConnection($entity_id: ID!, $f
                 "to_date": to_date,
                 "direction": direction,
             },
-        )
-        connection = json["entity"]["daily_liquidity_forecasts"]
-        return LightsparkNodeToDailyLiquidityForecastsConnection_from_json(
-            self.requester, connection
+            construct,
         )
 
     def to_json(self) -> Mapping[str, Any]:
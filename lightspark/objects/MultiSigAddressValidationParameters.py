@@ -8,7 +8,7 @@ from lightspark.requests.requester import Requester
 
 @dataclass
 class MultiSigAddressValidationParameters:
-    requester: Requester
+    __slots__ = ("counterparty_funding_pubkey", "funding_pubkey_derivation_path")
 
     counterparty_funding_pubkey: str
     """The counterparty funding public key used to create the 2-of-2 multisig for the address."""
@@ -35,8 +35,8 @@ fragment MultiSigAddressValidationParametersFragment on MultiSigAddressValidatio
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> MultiSigAddressValidationParameters:
+    # pylint: disable=unused-argument
     return MultiSigAddressValidationParameters(
-        requester=requester,
         counterparty_funding_pubkey=obj[
             "multi_sig_address_validation_parameters_counterparty_funding_pubkey"
         ],
@@ -4,21 +4,16 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, List, Mapping, Optional
 
-from lightspark.exceptions import LightsparkException
 from lightspark.objects.BitcoinNetwork import BitcoinNetwork
-from lightspark.objects.LightsparkNodeStatus import LightsparkNodeStatus
+from lightspark.requests.query import Query
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum, parse_enum_optional
+from lightspark.utils.interfaces import InterfaceLoader
 
-from .Balances import from_json as Balances_from_json
 from .BitcoinNetwork import BitcoinNetwork
-from .BlockchainBalance import from_json as BlockchainBalance_from_json
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
 from .NodeAddressType import NodeAddressType
 from .NodeToAddressesConnection import NodeToAddressesConnection
 from .NodeToAddressesConnection import from_json as NodeToAddressesConnection_from_json
-from .Secret import from_json as Secret_from_json
 
 
 @dataclass
@@ -58,7 +53,25 @@ class Node(Entity):
     def get_addresses(
         self, first: Optional[int] = None, types: Optional[List[NodeAddressType]] = None
     ) -> NodeToAddressesConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_addresses_query(first=first, types=types)
+        )
+
+    async def get_addresses_async(
+        self, first: Optional[int] = None, types: Optional[List[NodeAddressType]] = None
+    ) -> NodeToAddressesConnection:
+        return await self.requester.execute_query_async(
+            self.get_addresses_query(first=first, types=types)
+        )
+
+    def get_addresses_query(
+        self, first: Optional[int] = None, types: Optional[List[NodeAddressType]] = None
+    ) -> Query[NodeToAddressesConnection]:
+        def construct(json: Mapping[str, Any]) -> NodeToAddressesConnection:
+            connection = json["entity"]["addresses"]
+            return NodeToAddressesConnection_from_json(self.requester, connection)
+
+        return Query(
             """
 query FetchNodeToAddressesConnection($entity_id: ID!, $first: Int, $types: [NodeAddressType!]) {
     entity(id: $entity_id) {
@@ -77,9 +90,8 @@ query FetchNodeToAddressesConnection($entity_id: ID!, $first: Int, $types: [Node
 }
             """,
             {"entity_id": self.id, "first": first, "types": types},
+            construct,
         )
-        connection = json["entity"]["addresses"]
-        return NodeToAddressesConnection_from_json(self.requester, connection)
 
     def to_json(self) -> Mapping[str, Any]:
         return {
@@ -374,158 +386,15 @@ fragment NodeFragment on Node {
 """
 
 
-def from_json(requester: Requester, obj: Mapping[str, Any]) -> Node:
-    if obj["__typename"] == "GraphNode":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.GraphNode import GraphNode
+_from_json: InterfaceLoader[Node] = InterfaceLoader(
+    "Node",
+    (
+        "GraphNode",
+        "LightsparkNodeWithOSK",
+        "LightsparkNodeWithRemoteSigning",
+    ),
+)
 
-        return GraphNode(
-            requester=requester,
-            typename="GraphNode",
-            id=obj["graph_node_id"],
-            created_at=datetime.fromisoformat(obj["graph_node_created_at"]),
-            updated_at=datetime.fromisoformat(obj["graph_node_updated_at"]),
-            alias=obj["graph_node_alias"],
-            bitcoin_network=parse_enum(
-                BitcoinNetwork, obj["graph_node_bitcoin_network"]
-            ),
-            color=obj["graph_node_color"],
-            conductivity=obj["graph_node_conductivity"],
-            display_name=obj["graph_node_display_name"],
-            public_key=obj["graph_node_public_key"],
-        )
-    if obj["__typename"] == "LightsparkNodeWithOSK":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.LightsparkNodeWithOSK import LightsparkNodeWithOSK
 
-        return LightsparkNodeWithOSK(
-            requester=requester,
-            typename="LightsparkNodeWithOSK",
-            id=obj["lightspark_node_with_o_s_k_id"],
-            created_at=datetime.fromisoformat(
-                obj["lightspark_node_with_o_s_k_created_at"]
-            ),
-            updated_at=datetime.fromisoformat(
-                obj["lightspark_node_with_o_s_k_updated_at"]
-            ),
-            alias=obj["lightspark_node_with_o_s_k_alias"],
-            bitcoin_network=parse_enum(
-                BitcoinNetwork, obj["lightspark_node_with_o_s_k_bitcoin_network"]
-            ),
-            color=obj["lightspark_node_with_o_s_k_color"],
-            conductivity=obj["lightspark_node_with_o_s_k_conductivity"],
-            display_name=obj["lightspark_node_with_o_s_k_display_name"],
-            public_key=obj["lightspark_node_with_o_s_k_public_key"],
-            owner_id=obj["lightspark_node_with_o_s_k_owner"]["id"],
-            status=parse_enum_optional(
-                LightsparkNodeStatus, obj["lightspark_node_with_o_s_k_status"]
-            ),
-            total_balance=CurrencyAmount_from_json(
-                requester, obj["lightspark_node_with_o_s_k_total_balance"]
-            )
-            if obj["lightspark_node_with_o_s_k_total_balance"]
-            else None,
-            total_local_balance=CurrencyAmount_from_json(
-                requester, obj["lightspark_node_with_o_s_k_total_local_balance"]
-            )
-            if obj["lightspark_node_with_o_s_k_total_local_balance"]
-            else None,
-            local_balance=CurrencyAmount_from_json(
-                requester, obj["lightspark_node_with_o_s_k_local_balance"]
-            )
-            if obj["lightspark_node_with_o_s_k_local_balance"]
-            else None,
-            remote_balance=CurrencyAmount_from_json(
-                requester, obj["lightspark_node_with_o_s_k_remote_balance"]
-            )
-            if obj["lightspark_node_with_o_s_k_remote_balance"]
-            else None,
-            blockchain_balance=BlockchainBalance_from_json(
-                requester, obj["lightspark_node_with_o_s_k_blockchain_balance"]
-            )
-            if obj["lightspark_node_with_o_s_k_blockchain_balance"]
-            else None,
-            uma_prescreening_utxos=obj[
-                "lightspark_node_with_o_s_k_uma_prescreening_utxos"
-            ],
-            balances=Balances_from_json(
-                requester, obj["lightspark_node_with_o_s_k_balances"]
-            )
-            if obj["lightspark_node_with_o_s_k_balances"]
-            else None,
-            encrypted_signing_private_key=Secret_from_json(
-                requester,
-                obj["lightspark_node_with_o_s_k_encrypted_signing_private_key"],
-            )
-            if obj["lightspark_node_with_o_s_k_encrypted_signing_private_key"]
-            else None,
-        )
-    if obj["__typename"] == "LightsparkNodeWithRemoteSigning":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.LightsparkNodeWithRemoteSigning import (
-            LightsparkNodeWithRemoteSigning,
-        )
-
-        return LightsparkNodeWithRemoteSigning(
-            requester=requester,
-            typename="LightsparkNodeWithRemoteSigning",
-            id=obj["lightspark_node_with_remote_signing_id"],
-            created_at=datetime.fromisoformat(
-                obj["lightspark_node_with_remote_signing_created_at"]
-            ),
-            updated_at=datetime.fromisoformat(
-                obj["lightspark_node_with_remote_signing_updated_at"]
-            ),
-            alias=obj["lightspark_node_with_remote_signing_alias"],
-            bitcoin_network=parse_enum(
-                BitcoinNetwork,
-                obj["lightspark_node_with_remote_signing_bitcoin_network"],
-            ),
-            color=obj["lightspark_node_with_remote_signing_color"],
-            conductivity=obj["lightspark_node_with_remote_signing_conductivity"],
-            display_name=obj["lightspark_node_with_remote_signing_display_name"],
-            public_key=obj["lightspark_node_with_remote_signing_public_key"],
-            owner_id=obj["lightspark_node_with_remote_signing_owner"]["id"],
-            status=parse_enum_optional(
-                LightsparkNodeStatus, obj["lightspark_node_with_remote_signing_status"]
-            ),
-            total_balance=CurrencyAmount_from_json(
-                requester, obj["lightspark_node_with_remote_signing_total_balance"]
-            )
-            if obj["lightspark_node_with_remote_signing_total_balance"]
-            else None,
-            total_local_balance=CurrencyAmount_from_json(
-                requester,
-                obj["lightspark_node_with_remote_signing_total_local_balance"],
-            )
-            if obj["lightspark_node_with_remote_signing_total_local_balance"]
-            else None,
-            local_balance=CurrencyAmount_from_json(
-                requester, obj["lightspark_node_with_remote_signing_local_balance"]
-            )
-            if obj["lightspark_node_with_remote_signing_local_balance"]
-            else None,
-            remote_balance=CurrencyAmount_from_json(
-                requester, obj["lightspark_node_with_remote_signing_remote_balance"]
-            )
-            if obj["lightspark_node_with_remote_signing_remote_balance"]
-            else None,
-            blockchain_balance=BlockchainBalance_from_json(
-                requester, obj["lightspark_node_with_remote_signing_blockchain_balance"]
-            )
-            if obj["lightspark_node_with_remote_signing_blockchain_balance"]
-            else None,
-            uma_prescreening_utxos=obj[
-                "lightspark_node_with_remote_signing_uma_prescreening_utxos"
-            ],
-            balances=Balances_from_json(
-                requester, obj["lightspark_node_with_remote_signing_balances"]
-            )
-            if obj["lightspark_node_with_remote_signing_balances"]
-            else None,
-        )
-    graphql_typename = obj["__typename"]
-    raise LightsparkException(
-        "UNKNOWN_INTERFACE",
-        f"Couldn't find a concrete type for interface Node corresponding to the typename={graphql_typename}",
-    )
+def from_json(requester: Requester, obj: Mapping[str, Any]) -> Node:
+    return _from_json(requester, obj)
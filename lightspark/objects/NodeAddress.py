@@ -14,7 +14,7 @@ from .NodeAddressType import NodeAddressType
 class NodeAddress:
     """This object represents the address of a node on the Lightning Network."""
 
-    requester: Requester
+    __slots__ = ("address", "type")
 
     address: str
     """The string representation of the address."""
@@ -39,8 +39,8 @@ fragment NodeAddressFragment on NodeAddress {
 
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> NodeAddress:
+    # pylint: disable=unused-argument
     return NodeAddress(
-        requester=requester,
         address=obj["node_address_address"],
         type=parse_enum(NodeAddressType, obj["node_address_type"]),
     )
@@ -13,7 +13,7 @@ from .NodeAddress import from_json as NodeAddress_from_json
 class NodeToAddressesConnection:
     """A connection between a node and the addresses it has announced for itself on Lightning Network."""
 
-    requester: Requester
+    __slots__ = ("count", "entities")
 
     count: int
     """The total count of objects in this connection, using the current filters. It is different from the number of objects returned in the current page (in the `entities` field)."""
@@ -47,7 +47,6 @@ def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> NodeToAddressesConnection:
     return NodeToAddressesConnection(
-        requester=requester,
         count=obj["node_to_addresses_connection_count"],
         entities=list(
             map(
@@ -4,13 +4,11 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, List, Mapping, Optional
 
-from lightspark.exceptions import LightsparkException
 from lightspark.objects.TransactionStatus import TransactionStatus
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum
+from lightspark.utils.interfaces import InterfaceLoader
 
 from .CurrencyAmount import CurrencyAmount
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
 from .Transaction import Transaction
 from .TransactionStatus import TransactionStatus
@@ -214,145 +212,16 @@ fragment OnChainTransactionFragment on OnChainTransaction {
 """
 
 
-def from_json(requester: Requester, obj: Mapping[str, Any]) -> OnChainTransaction:
-    if obj["__typename"] == "ChannelClosingTransaction":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.ChannelClosingTransaction import (
-            ChannelClosingTransaction,
-        )
-
-        return ChannelClosingTransaction(
-            requester=requester,
-            typename="ChannelClosingTransaction",
-            id=obj["channel_closing_transaction_id"],
-            created_at=datetime.fromisoformat(
-                obj["channel_closing_transaction_created_at"]
-            ),
-            updated_at=datetime.fromisoformat(
-                obj["channel_closing_transaction_updated_at"]
-            ),
-            status=parse_enum(
-                TransactionStatus, obj["channel_closing_transaction_status"]
-            ),
-            resolved_at=datetime.fromisoformat(
-                obj["channel_closing_transaction_resolved_at"]
-            )
-            if obj["channel_closing_transaction_resolved_at"]
-            else None,
-            amount=CurrencyAmount_from_json(
-                requester, obj["channel_closing_transaction_amount"]
-            ),
-            transaction_hash=obj["channel_closing_transaction_transaction_hash"],
-            fees=CurrencyAmount_from_json(
-                requester, obj["channel_closing_transaction_fees"]
-            )
-            if obj["channel_closing_transaction_fees"]
-            else None,
-            block_hash=obj["channel_closing_transaction_block_hash"],
-            block_height=obj["channel_closing_transaction_block_height"],
-            destination_addresses=obj[
-                "channel_closing_transaction_destination_addresses"
-            ],
-            num_confirmations=obj["channel_closing_transaction_num_confirmations"],
-            channel_id=obj["channel_closing_transaction_channel"]["id"]
-            if obj["channel_closing_transaction_channel"]
-            else None,
-        )
-    if obj["__typename"] == "ChannelOpeningTransaction":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.ChannelOpeningTransaction import (
-            ChannelOpeningTransaction,
-        )
-
-        return ChannelOpeningTransaction(
-            requester=requester,
-            typename="ChannelOpeningTransaction",
-            id=obj["channel_opening_transaction_id"],
-            created_at=datetime.fromisoformat(
-                obj["channel_opening_transaction_created_at"]
-            ),
-            updated_at=datetime.fromisoformat(
-                obj["channel_opening_transaction_updated_at"]
-            ),
-            status=parse_enum(
-                TransactionStatus, obj["channel_opening_transaction_status"]
-            ),
-            resolved_at=datetime.fromisoformat(
-                obj["channel_opening_transaction_resolved_at"]
-            )
-            if obj["channel_opening_transaction_resolved_at"]
-            else None,
-            amount=CurrencyAmount_from_json(
-                requester, obj["channel_opening_transaction_amount"]
-            ),
-            transaction_hash=obj["channel_opening_transaction_transaction_hash"],
-            fees=CurrencyAmount_from_json(
-                requester, obj["channel_opening_transaction_fees"]
-            )
-            if obj["channel_opening_transaction_fees"]
-            else None,
-            block_hash=obj["channel_opening_transaction_block_hash"],
-            block_height=obj["channel_opening_transaction_block_height"],
-            destination_addresses=obj[
-                "channel_opening_transaction_destination_addresses"
-            ],
-            num_confirmations=obj["channel_opening_transaction_num_confirmations"],
-            channel_id=obj["channel_opening_transaction_channel"]["id"]
-            if obj["channel_opening_transaction_channel"]
-            else None,
-        )
-    if obj["__typename"] == "Deposit":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.Deposit import Deposit
+_from_json: InterfaceLoader[OnChainTransaction] = InterfaceLoader(
+    "OnChainTransaction",
+    (
+        "ChannelClosingTransaction",
+        "ChannelOpeningTransaction",
+        "Deposit",
+        "Withdrawal",
+    ),
+)
 
-        return Deposit(
-            requester=requester,
-            typename="Deposit",
-            id=obj["deposit_id"],
-            created_at=datetime.fromisoformat(obj["deposit_created_at"]),
-            updated_at=datetime.fromisoformat(obj["deposit_updated_at"]),
-            status=parse_enum(TransactionStatus, obj["deposit_status"]),
-            resolved_at=datetime.fromisoformat(obj["deposit_resolved_at"])
-            if obj["deposit_resolved_at"]
-            else None,
-            amount=CurrencyAmount_from_json(requester, obj["deposit_amount"]),
-            transaction_hash=obj["deposit_transaction_hash"],
-            fees=CurrencyAmount_from_json(requester, obj["deposit_fees"])
-            if obj["deposit_fees"]
-            else None,
-            block_hash=obj["deposit_block_hash"],
-            block_height=obj["deposit_block_height"],
-            destination_addresses=obj["deposit_destination_addresses"],
-            num_confirmations=obj["deposit_num_confirmations"],
-            destination_id=obj["deposit_destination"]["id"],
-        )
-    if obj["__typename"] == "Withdrawal":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.Withdrawal import Withdrawal
 
-        return Withdrawal(
-            requester=requester,
-            typename="Withdrawal",
-            id=obj["withdrawal_id"],
-            created_at=datetime.fromisoformat(obj["withdrawal_created_at"]),
-            updated_at=datetime.fromisoformat(obj["withdrawal_updated_at"]),
-            status=parse_enum(TransactionStatus, obj["withdrawal_status"]),
-            resolved_at=datetime.fromisoformat(obj["withdrawal_resolved_at"])
-            if obj["withdrawal_resolved_at"]
-            else None,
-            amount=CurrencyAmount_from_json(requester, obj["withdrawal_amount"]),
-            transaction_hash=obj["withdrawal_transaction_hash"],
-            fees=CurrencyAmount_from_json(requester, obj["withdrawal_fees"])
-            if obj["withdrawal_fees"]
-            else None,
-            block_hash=obj["withdrawal_block_hash"],
-            block_height=obj["withdrawal_block_height"],
-            destination_addresses=obj["withdrawal_destination_addresses"],
-            num_confirmations=obj["withdrawal_num_confirmations"],
-            origin_id=obj["withdrawal_origin"]["id"],
-        )
-    graphql_typename = obj["__typename"]
-    raise LightsparkException(
-        "UNKNOWN_INTERFACE",
-        f"Couldn't find a concrete type for interface OnChainTransaction corresponding to the typename={graphql_typename}",
-    )
+def from_json(requester: Requester, obj: Mapping[str, Any]) -> OnChainTransaction:
+    return _from_json(requester, obj)
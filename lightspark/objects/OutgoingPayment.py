@@ -2,10 +2,12 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, List, Mapping, Optional
+from typing import Any, AsyncIterator, Iterator, List, Mapping, Optional
 
 from lightspark.objects.PaymentFailureReason import PaymentFailureReason
 from lightspark.objects.TransactionStatus import TransactionStatus
+from lightspark.requests.pagination import iter_connection, iter_connection_async
+from lightspark.requests.query import Query
 from lightspark.requests.requester import Requester
 from lightspark.utils.enums import parse_enum, parse_enum_optional
 
@@ -13,6 +15,7 @@ from .CurrencyAmount import CurrencyAmount
 from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
 from .LightningTransaction import LightningTransaction
+from .OutgoingPaymentAttempt import OutgoingPaymentAttempt
 from .OutgoingPaymentToAttemptsConnection import OutgoingPaymentToAttemptsConnection
 from .OutgoingPaymentToAttemptsConnection import (
     from_json as OutgoingPaymentToAttemptsConnection_from_json,
@@ -89,7 +92,27 @@ class OutgoingPayment(LightningTransaction, Transaction, Entity):
     def get_attempts(
         self, first: Optional[int] = None, after: Optional[str] = None
     ) -> OutgoingPaymentToAttemptsConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_attempts_query(first=first, after=after)
+        )
+
+    async def get_attempts_async(
+        self, first: Optional[int] = None, after: Optional[str] = None
+    ) -> OutgoingPaymentToAttemptsConnection:
+        return await self.requester.execute_query_async(
+            self.get_attempts_query(first=first, after=after)
+        )
+
+    def get_attempts_query(
+        self, first: Optional[int] = None, after: Optional[str] = None
+    ) -> Query[OutgoingPaymentToAttemptsConnection]:
+        def construct(json: Mapping[str, Any]) -> OutgoingPaymentToAttemptsConnection:
+            connection = json["entity"]["attempts"]
+            return OutgoingPaymentToAttemptsConnection_from_json(
+                self.requester, connection
+            )
+
+        return Query(
             """
 query FetchOutgoingPaymentToAttemptsConnection($entity_id: ID!, $first: Int, $after: String) {
     entity(id: $entity_id) {
@@ -143,9 +166,30 @@ query FetchOutgoingPaymentToAttemptsConnection($entity_id: ID!, $first: Int, $af
 }
             """,
             {"entity_id": self.id, "first": first, "after": after},
+            construct,
+        )
+
+    def iter_attempts(
+        self,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> Iterator[OutgoingPaymentAttempt]:
+        return iter_connection(
+            self.requester,
+            lambda after: self.get_attempts_query(first=page_size, after=after),
+            prefetch,
+        )
+
+    def iter_attempts_async(
+        self,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> AsyncIterator[OutgoingPaymentAttempt]:
+        return iter_connection_async(
+            self.requester,
+            lambda after: self.get_attempts_query(first=page_size, after=after),
+            prefetch,
         )
-        connection = json["entity"]["attempts"]
-        return OutgoingPaymentToAttemptsConnection_from_json(self.requester, connection)
 
     def to_json(self) -> Mapping[str, Any]:
         return {
@@ -2,16 +2,19 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Mapping, Optional
+from typing import Any, AsyncIterator, Iterator, Mapping, Optional
 
 from lightspark.objects.HtlcAttemptFailureCode import HtlcAttemptFailureCode
 from lightspark.objects.OutgoingPaymentAttemptStatus import OutgoingPaymentAttemptStatus
+from lightspark.requests.pagination import iter_connection, iter_connection_async
+from lightspark.requests.query import Query
 from lightspark.requests.requester import Requester
 from lightspark.utils.enums import parse_enum, parse_enum_optional
 
 from .CurrencyAmount import CurrencyAmount
 from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
+from .Hop import Hop
 from .HtlcAttemptFailureCode import HtlcAttemptFailureCode
 from .OutgoingPaymentAttemptStatus import OutgoingPaymentAttemptStatus
 from .OutgoingPaymentAttemptToHopsConnection import (
@@ -68,7 +71,29 @@ class OutgoingPaymentAttempt(Entity):
     def get_hops(
         self, first: Optional[int] = None, after: Optional[str] = None
     ) -> OutgoingPaymentAttemptToHopsConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_hops_query(first=first, after=after)
+        )
+
+    async def get_hops_async(
+        self, first: Optional[int] = None, after: Optional[str] = None
+    ) -> OutgoingPaymentAttemptToHopsConnection:
+        return await self.requester.execute_query_async(
+            self.get_hops_query(first=first, after=after)
+        )
+
+    def get_hops_query(
+        self, first: Optional[int] = None, after: Optional[str] = None
+    ) -> Query[OutgoingPaymentAttemptToHopsConnection]:
+        def construct(
+            json: Mapping[str, Any]
+        ) -> OutgoingPaymentAttemptToHopsConnection:
+            connection = json["entity"]["hops"]
+            return OutgoingPaymentAttemptToHopsConnection_from_json(
+                self.requester, connection
+            )
+
+        return Query(
             """
 query FetchOutgoingPaymentAttemptToHopsConnection($entity_id: ID!, $first: Int, $after: String) {
     entity(id: $entity_id) {
@@ -117,10 +142,29 @@ query FetchOutgoingPaymentAttemptToHopsConnection($entity_id: ID!, $first: Int,
 }
             """,
             {"entity_id": self.id, "first": first, "after": after},
+            construct,
         )
-        connection = json["entity"]["hops"]
-        return OutgoingPaymentAttemptToHopsConnection_from_json(
-            self.requester, connection
+
+    def iter_hops(
+        self,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> Iterator[Hop]:
+        return iter_connection(
+            self.requester,
+            lambda after: self.get_hops_query(first=page_size, after=after),
+            prefetch,
+        )
+
+    def iter_hops_async(
+        self,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> AsyncIterator[Hop]:
+        return iter_connection_async(
+            self.requester,
+            lambda after: self.get_hops_query(first=page_size, after=after),
+            prefetch,
         )
 
     def to_json(self) -> Mapping[str, Any]:
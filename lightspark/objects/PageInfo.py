@@ -10,7 +10,7 @@ from lightspark.requests.requester import Requester
 class PageInfo:
     """This is an object representing information about a page returned by the Lightspark API. For more information, please see the “Pagination” section of our API docs for more information about its usage."""
 
-    requester: Requester
+    __slots__ = ("has_next_page", "has_previous_page", "start_cursor", "end_cursor")
 
     has_next_page: Optional[bool]
 
@@ -41,8 +41,8 @@ fragment PageInfoFragment on PageInfo {
 
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> PageInfo:
+    # pylint: disable=unused-argument
     return PageInfo(
-        requester=requester,
         has_next_page=obj["page_info_has_next_page"],
         has_previous_page=obj["page_info_has_previous_page"],
         start_cursor=obj["page_info_start_cursor"],
@@ -8,7 +8,7 @@ from lightspark.requests.requester import Requester
 
 @dataclass
 class PayInvoiceOutput:
-    requester: Requester
+    __slots__ = ("payment_id",)
 
     payment_id: str
     """The payment that has been sent."""
@@ -30,7 +30,7 @@ fragment PayInvoiceOutputFragment on PayInvoiceOutput {
 
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> PayInvoiceOutput:
+    # pylint: disable=unused-argument
     return PayInvoiceOutput(
-        requester=requester,
         payment_id=obj["pay_invoice_output_payment"]["id"],
     )
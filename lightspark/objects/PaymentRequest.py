@@ -4,14 +4,11 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Mapping
 
-from lightspark.exceptions import LightsparkException
 from lightspark.objects.PaymentRequestStatus import PaymentRequestStatus
 from lightspark.requests.requester import Requester
-from lightspark.utils.enums import parse_enum
+from lightspark.utils.interfaces import InterfaceLoader
 
-from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
-from .InvoiceData import from_json as InvoiceData_from_json
 from .PaymentRequestData import PaymentRequestData
 from .PaymentRequestStatus import PaymentRequestStatus
 
@@ -362,25 +359,11 @@ fragment PaymentRequestFragment on PaymentRequest {
 """
 
 
-def from_json(requester: Requester, obj: Mapping[str, Any]) -> PaymentRequest:
-    if obj["__typename"] == "Invoice":
-        # pylint: disable=import-outside-toplevel
-        from lightspark.objects.Invoice import Invoice
+_from_json: InterfaceLoader[PaymentRequest] = InterfaceLoader(
+    "PaymentRequest",
+    ("Invoice",),
+)
+
 
-        return Invoice(
-            requester=requester,
-            typename="Invoice",
-            id=obj["invoice_id"],
-            created_at=datetime.fromisoformat(obj["invoice_created_at"]),
-            updated_at=datetime.fromisoformat(obj["invoice_updated_at"]),
-            data=InvoiceData_from_json(requester, obj["invoice_data"]),
-            status=parse_enum(PaymentRequestStatus, obj["invoice_status"]),
-            amount_paid=CurrencyAmount_from_json(requester, obj["invoice_amount_paid"])
-            if obj["invoice_amount_paid"]
-            else None,
-        )
-    graphql_typename = obj["__typename"]
-    raise LightsparkException(
-        "UNKNOWN_INTERFACE",
-        f"Couldn't find a concrete type for interface PaymentRequest corresponding to the typename={graphql_typename}",
-    )
+def from_json(requester: Requester, obj: Mapping[str, Any]) -> PaymentRequest:
+    return _from_json(requester, obj)
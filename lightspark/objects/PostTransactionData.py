@@ -13,7 +13,7 @@ from .CurrencyAmount import from_json as CurrencyAmount_from_json
 class PostTransactionData:
     """This object represents post-transaction data that could be used to register payment for KYT."""
 
-    requester: Requester
+    __slots__ = ("utxo", "amount")
 
     utxo: str
     """The utxo of the channel over which the payment went through in the format of <transaction_hash>:<output_index>."""
@@ -46,7 +46,6 @@ fragment PostTransactionDataFragment on PostTransactionData {
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> PostTransactionData:
     return PostTransactionData(
-        requester=requester,
         utxo=obj["post_transaction_data_utxo"],
         amount=CurrencyAmount_from_json(requester, obj["post_transaction_data_amount"]),
     )
@@ -8,7 +8,7 @@ from lightspark.requests.requester import Requester
 
 @dataclass
 class RegisterPaymentOutput:
-    requester: Requester
+    __slots__ = ("payment_id",)
 
     payment_id: str
 
@@ -29,7 +29,7 @@ fragment RegisterPaymentOutputFragment on RegisterPaymentOutput {
 
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> RegisterPaymentOutput:
+    # pylint: disable=unused-argument
     return RegisterPaymentOutput(
-        requester=requester,
         payment_id=obj["register_payment_output_payment"]["id"],
     )
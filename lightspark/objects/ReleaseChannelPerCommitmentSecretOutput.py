@@ -8,7 +8,7 @@ from lightspark.requests.requester import Requester
 
 @dataclass
 class ReleaseChannelPerCommitmentSecretOutput:
-    requester: Requester
+    __slots__ = ("channel_id",)
 
     channel_id: str
     """The channel object after the per-commitment secret release operation."""
@@ -34,7 +34,7 @@ fragment ReleaseChannelPerCommitmentSecretOutputFragment on ReleaseChannelPerCom
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> ReleaseChannelPerCommitmentSecretOutput:
+    # pylint: disable=unused-argument
     return ReleaseChannelPerCommitmentSecretOutput(
-        requester=requester,
         channel_id=obj["release_channel_per_commitment_secret_output_channel"]["id"],
     )
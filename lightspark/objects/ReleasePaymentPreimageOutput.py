@@ -8,7 +8,7 @@ from lightspark.requests.requester import Requester
 
 @dataclass
 class ReleasePaymentPreimageOutput:
-    requester: Requester
+    __slots__ = ("invoice_id",)
 
     invoice_id: str
     """The invoice of the transaction."""
@@ -32,7 +32,7 @@ fragment ReleasePaymentPreimageOutputFragment on ReleasePaymentPreimageOutput {
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> ReleasePaymentPreimageOutput:
+    # pylint: disable=unused-argument
     return ReleasePaymentPreimageOutput(
-        requester=requester,
         invoice_id=obj["release_payment_preimage_output_invoice"]["id"],
     )
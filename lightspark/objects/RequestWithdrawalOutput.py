@@ -8,7 +8,7 @@ from lightspark.requests.requester import Requester
 
 @dataclass
 class RequestWithdrawalOutput:
-    requester: Requester
+    __slots__ = ("request_id",)
 
     request_id: str
     """The request that is created for this withdrawal."""
@@ -30,7 +30,7 @@ fragment RequestWithdrawalOutputFragment on RequestWithdrawalOutput {
 
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> RequestWithdrawalOutput:
+    # pylint: disable=unused-argument
     return RequestWithdrawalOutput(
-        requester=requester,
         request_id=obj["request_withdrawal_output_request"]["id"],
     )
@@ -8,7 +8,7 @@ from lightspark.requests.requester import Requester
 
 @dataclass
 class RichText:
-    requester: Requester
+    __slots__ = ("text",)
 
     text: str
 
@@ -27,7 +27,7 @@ fragment RichTextFragment on RichText {
 
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> RichText:
+    # pylint: disable=unused-argument
     return RichText(
-        requester=requester,
         text=obj["rich_text_text"],
     )
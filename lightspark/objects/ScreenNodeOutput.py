@@ -12,7 +12,7 @@ from .RiskRating import RiskRating
 
 @dataclass
 class ScreenNodeOutput:
-    requester: Requester
+    __slots__ = ("rating",)
 
     rating: RiskRating
 
@@ -31,7 +31,7 @@ fragment ScreenNodeOutputFragment on ScreenNodeOutput {
 
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> ScreenNodeOutput:
+    # pylint: disable=unused-argument
     return ScreenNodeOutput(
-        requester=requester,
         rating=parse_enum(RiskRating, obj["screen_node_output_rating"]),
     )
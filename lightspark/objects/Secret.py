@@ -8,7 +8,7 @@ from lightspark.requests.requester import Requester
 
 @dataclass
 class Secret:
-    requester: Requester
+    __slots__ = ("encrypted_value", "cipher")
 
     encrypted_value: str
 
@@ -31,8 +31,8 @@ fragment SecretFragment on Secret {
 
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> Secret:
+    # pylint: disable=unused-argument
     return Secret(
-        requester=requester,
         encrypted_value=obj["secret_encrypted_value"],
         cipher=obj["secret_cipher"],
     )
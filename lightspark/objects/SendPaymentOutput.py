@@ -8,7 +8,7 @@ from lightspark.requests.requester import Requester
 
 @dataclass
 class SendPaymentOutput:
-    requester: Requester
+    __slots__ = ("payment_id",)
 
     payment_id: str
     """The payment that has been sent."""
@@ -30,7 +30,7 @@ fragment SendPaymentOutputFragment on SendPaymentOutput {
 
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> SendPaymentOutput:
+    # pylint: disable=unused-argument
     return SendPaymentOutput(
-        requester=requester,
         payment_id=obj["send_payment_output_payment"]["id"],
     )
@@ -8,7 +8,7 @@ from lightspark.requests.requester import Requester
 
 @dataclass
 class SetInvoicePaymentHashOutput:
-    requester: Requester
+    __slots__ = ("invoice_id",)
 
     invoice_id: str
 
@@ -31,7 +31,7 @@ fragment SetInvoicePaymentHashOutputFragment on SetInvoicePaymentHashOutput {
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> SetInvoicePaymentHashOutput:
+    # pylint: disable=unused-argument
     return SetInvoicePaymentHashOutput(
-        requester=requester,
         invoice_id=obj["set_invoice_payment_hash_output_invoice"]["id"],
     )
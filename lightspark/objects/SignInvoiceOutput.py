@@ -8,7 +8,7 @@ from lightspark.requests.requester import Requester
 
 @dataclass
 class SignInvoiceOutput:
-    requester: Requester
+    __slots__ = ("invoice_id",)
 
     invoice_id: str
     """ The signed invoice object."""
@@ -30,7 +30,7 @@ fragment SignInvoiceOutputFragment on SignInvoiceOutput {
 
 
 def from_json(requester: Requester, obj: Mapping[str, Any]) -> SignInvoiceOutput:
+    # pylint: disable=unused-argument
     return SignInvoiceOutput(
-        requester=requester,
         invoice_id=obj["sign_invoice_output_invoice"]["id"],
     )
@@ -8,7 +8,7 @@ from lightspark.requests.requester import Requester
 
 @dataclass
 class UpdateChannelPerCommitmentPointOutput:
-    requester: Requester
+    __slots__ = ("channel_id",)
 
     channel_id: str
 
@@ -33,7 +33,7 @@ fragment UpdateChannelPerCommitmentPointOutputFragment on UpdateChannelPerCommit
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> UpdateChannelPerCommitmentPointOutput:
+    # pylint: disable=unused-argument
     return UpdateChannelPerCommitmentPointOutput(
-        requester=requester,
         channel_id=obj["update_channel_per_commitment_point_output_channel"]["id"],
     )
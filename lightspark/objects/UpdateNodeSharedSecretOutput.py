@@ -8,7 +8,7 @@ from lightspark.requests.requester import Requester
 
 @dataclass
 class UpdateNodeSharedSecretOutput:
-    requester: Requester
+    __slots__ = ("node_id",)
 
     node_id: str
 
@@ -31,7 +31,7 @@ fragment UpdateNodeSharedSecretOutputFragment on UpdateNodeSharedSecretOutput {
 def from_json(
     requester: Requester, obj: Mapping[str, Any]
 ) -> UpdateNodeSharedSecretOutput:
+    # pylint: disable=unused-argument
     return UpdateNodeSharedSecretOutput(
-        requester=requester,
         node_id=obj["update_node_shared_secret_output_node"]["id"],
     )
@@ -2,9 +2,11 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, List, Mapping, Optional
+from typing import Any, AsyncIterator, Iterator, List, Mapping, Optional
 
 from lightspark.objects.WalletStatus import WalletStatus
+from lightspark.requests.pagination import iter_connection, iter_connection_async
+from lightspark.requests.query import Query
 from lightspark.requests.requester import Requester
 from lightspark.utils.enums import parse_enum
 
@@ -14,6 +16,8 @@ from .CurrencyAmount import CurrencyAmount
 from .CurrencyAmount import from_json as CurrencyAmount_from_json
 from .Entity import Entity
 from .LightsparkNodeOwner import LightsparkNodeOwner
+from .PaymentRequest import PaymentRequest
+from .Transaction import Transaction
 from .TransactionStatus import TransactionStatus
 from .TransactionType import TransactionType
 from .WalletStatus import WalletStatus
@@ -29,6 +33,7 @@ from .WalletToWithdrawalRequestsConnection import WalletToWithdrawalRequestsConn
 from .WalletToWithdrawalRequestsConnection import (
     from_json as WalletToWithdrawalRequestsConnection_from_json,
 )
+from .WithdrawalRequest import WithdrawalRequest
 from .WithdrawalRequestStatus import WithdrawalRequestStatus
 
 
@@ -72,7 +77,51 @@ class Wallet(LightsparkNodeOwner, Entity):
         statuses: Optional[List[TransactionStatus]] = None,
         types: Optional[List[TransactionType]] = None,
     ) -> WalletToTransactionsConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_transactions_query(
+                first=first,
+                after=after,
+                created_after_date=created_after_date,
+                created_before_date=created_before_date,
+                statuses=statuses,
+                types=types,
+            )
+        )
+
+    async def get_transactions_async(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+        statuses: Optional[List[TransactionStatus]] = None,
+        types: Optional[List[TransactionType]] = None,
+    ) -> WalletToTransactionsConnection:
+        return await self.requester.execute_query_async(
+            self.get_transactions_query(
+                first=first,
+                after=after,
+                created_after_date=created_after_date,
+                created_before_date=created_before_date,
+                statuses=statuses,
+                types=types,
+            )
+        )
+
+    def get_transactions_query(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+        statuses: Optional[List[TransactionStatus]] = None,
+        types: Optional[List[TransactionType]] = None,
+    ) -> Query[WalletToTransactionsConnection]:
+        def construct(json: Mapping[str, Any]) -> WalletToTransactionsConnection:
+            connection = json["entity"]["transactions"]
+            return WalletToTransactionsConnection_from_json(self.requester, connection)
+
+        return Query(
             """
 query FetchWalletToTransactionsConnection($entity_id: ID!, $first: Int, $after: ID, $created_after_date: DateTime, $created_before_date: DateTime, $statuses: [TransactionStatus!], $types: [TransactionType!]) {
     entity(id: $entity_id) {
@@ -650,9 +699,52 @@ query FetchWalletToTransactionsConnection($entity_id: ID!, $first: Int, $after:
                 "statuses": statuses,
                 "types": types,
             },
+            construct,
+        )
+
+    def iter_transactions(
+        self,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+        statuses: Optional[List[TransactionStatus]] = None,
+        types: Optional[List[TransactionType]] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> Iterator[Transaction]:
+        return iter_connection(
+            self.requester,
+            lambda after: self.get_transactions_query(
+                first=page_size,
+                after=after,
+                created_after_date=created_after_date,
+                created_before_date=created_before_date,
+                statuses=statuses,
+                types=types,
+            ),
+            prefetch,
+        )
+
+    def iter_transactions_async(
+        self,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+        statuses: Optional[List[TransactionStatus]] = None,
+        types: Optional[List[TransactionType]] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> AsyncIterator[Transaction]:
+        return iter_connection_async(
+            self.requester,
+            lambda after: self.get_transactions_query(
+                first=page_size,
+                after=after,
+                created_after_date=created_after_date,
+                created_before_date=created_before_date,
+                statuses=statuses,
+                types=types,
+            ),
+            prefetch,
         )
-        connection = json["entity"]["transactions"]
-        return WalletToTransactionsConnection_from_json(self.requester, connection)
 
     def get_payment_requests(
         self,
@@ -661,7 +753,45 @@ query FetchWalletToTransactionsConnection($entity_id: ID!, $first: Int, $after:
         created_after_date: Optional[datetime] = None,
         created_before_date: Optional[datetime] = None,
     ) -> WalletToPaymentRequestsConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_payment_requests_query(
+                first=first,
+                after=after,
+                created_after_date=created_after_date,
+                created_before_date=created_before_date,
+            )
+        )
+
+    async def get_payment_requests_async(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+    ) -> WalletToPaymentRequestsConnection:
+        return await self.requester.execute_query_async(
+            self.get_payment_requests_query(
+                first=first,
+                after=after,
+                created_after_date=created_after_date,
+                created_before_date=created_before_date,
+            )
+        )
+
+    def get_payment_requests_query(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+    ) -> Query[WalletToPaymentRequestsConnection]:
+        def construct(json: Mapping[str, Any]) -> WalletToPaymentRequestsConnection:
+            connection = json["entity"]["payment_requests"]
+            return WalletToPaymentRequestsConnection_from_json(
+                self.requester, connection
+            )
+
+        return Query(
             """
 query FetchWalletToPaymentRequestsConnection($entity_id: ID!, $first: Int, $after: ID, $created_after_date: DateTime, $created_before_date: DateTime) {
     entity(id: $entity_id) {
@@ -997,16 +1127,79 @@ query FetchWalletToPaymentRequestsConnection($entity_id: ID!, $first: Int, $afte
                 "created_after_date": created_after_date,
                 "created_before_date": created_before_date,
             },
+            construct,
+        )
+
+    def iter_payment_requests(
+        self,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> Iterator[PaymentRequest]:
+        return iter_connection(
+            self.requester,
+            lambda after: self.get_payment_requests_query(
+                first=page_size,
+                after=after,
+                created_after_date=created_after_date,
+                created_before_date=created_before_date,
+            ),
+            prefetch,
+        )
+
+    def iter_payment_requests_async(
+        self,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> AsyncIterator[PaymentRequest]:
+        return iter_connection_async(
+            self.requester,
+            lambda after: self.get_payment_requests_query(
+                first=page_size,
+                after=after,
+                created_after_date=created_after_date,
+                created_before_date=created_before_date,
+            ),
+            prefetch,
         )
-        connection = json["entity"]["payment_requests"]
-        return WalletToPaymentRequestsConnection_from_json(self.requester, connection)
 
     def get_total_amount_received(
         self,
         created_after_date: Optional[datetime] = None,
         created_before_date: Optional[datetime] = None,
     ) -> CurrencyAmount:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_total_amount_received_query(
+                created_after_date=created_after_date,
+                created_before_date=created_before_date,
+            )
+        )
+
+    async def get_total_amount_received_async(
+        self,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+    ) -> CurrencyAmount:
+        return await self.requester.execute_query_async(
+            self.get_total_amount_received_query(
+                created_after_date=created_after_date,
+                created_before_date=created_before_date,
+            )
+        )
+
+    def get_total_amount_received_query(
+        self,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+    ) -> Query[CurrencyAmount]:
+        def construct(json: Mapping[str, Any]) -> CurrencyAmount:
+            connection = json["entity"]["total_amount_received"]
+            return CurrencyAmount_from_json(self.requester, connection)
+
+        return Query(
             """
 query FetchWalletTotalAmountReceived($entity_id: ID!, $created_after_date: DateTime, $created_before_date: DateTime) {
     entity(id: $entity_id) {
@@ -1028,9 +1221,8 @@ query FetchWalletTotalAmountReceived($entity_id: ID!, $created_after_date: DateT
                 "created_after_date": created_after_date,
                 "created_before_date": created_before_date,
             },
+            construct,
         )
-        connection = json["entity"]["total_amount_received"]
-        return CurrencyAmount_from_json(self.requester, connection)
 
     def get_withdrawal_requests(
         self,
@@ -1040,7 +1232,49 @@ query FetchWalletTotalAmountReceived($entity_id: ID!, $created_after_date: DateT
         created_after_date: Optional[datetime] = None,
         created_before_date: Optional[datetime] = None,
     ) -> WalletToWithdrawalRequestsConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_withdrawal_requests_query(
+                first=first,
+                after=after,
+                statuses=statuses,
+                created_after_date=created_after_date,
+                created_before_date=created_before_date,
+            )
+        )
+
+    async def get_withdrawal_requests_async(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        statuses: Optional[List[WithdrawalRequestStatus]] = None,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+    ) -> WalletToWithdrawalRequestsConnection:
+        return await self.requester.execute_query_async(
+            self.get_withdrawal_requests_query(
+                first=first,
+                after=after,
+                statuses=statuses,
+                created_after_date=created_after_date,
+                created_before_date=created_before_date,
+            )
+        )
+
+    def get_withdrawal_requests_query(
+        self,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+        statuses: Optional[List[WithdrawalRequestStatus]] = None,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+    ) -> Query[WalletToWithdrawalRequestsConnection]:
+        def construct(json: Mapping[str, Any]) -> WalletToWithdrawalRequestsConnection:
+            connection = json["entity"]["withdrawal_requests"]
+            return WalletToWithdrawalRequestsConnection_from_json(
+                self.requester, connection
+            )
+
+        return Query(
             """
 query FetchWalletToWithdrawalRequestsConnection($entity_id: ID!, $first: Int, $after: ID, $statuses: [WithdrawalRequestStatus!], $created_after_date: DateTime, $created_before_date: DateTime) {
     entity(id: $entity_id) {
@@ -1113,10 +1347,47 @@ query FetchWalletToWithdrawalRequestsConnection($entity_id: ID!, $first: Int, $a
                 "created_after_date": created_after_date,
                 "created_before_date": created_before_date,
             },
+            construct,
+        )
+
+    def iter_withdrawal_requests(
+        self,
+        statuses: Optional[List[WithdrawalRequestStatus]] = None,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> Iterator[WithdrawalRequest]:
+        return iter_connection(
+            self.requester,
+            lambda after: self.get_withdrawal_requests_query(
+                first=page_size,
+                after=after,
+                statuses=statuses,
+                created_after_date=created_after_date,
+                created_before_date=created_before_date,
+            ),
+            prefetch,
         )
-        connection = json["entity"]["withdrawal_requests"]
-        return WalletToWithdrawalRequestsConnection_from_json(
-            self.requester, connection
+
+    def iter_withdrawal_requests_async(
+        self,
+        statuses: Optional[List[WithdrawalRequestStatus]] = None,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+        page_size: Optional[int] = None,
+        prefetch: int = 1,
+    ) -> AsyncIterator[WithdrawalRequest]:
+        return iter_connection_async(
+            self.requester,
+            lambda after: self.get_withdrawal_requests_query(
+                first=page_size,
+                after=after,
+                statuses=statuses,
+                created_after_date=created_after_date,
+                created_before_date=created_before_date,
+            ),
+            prefetch,
         )
 
     def get_total_amount_sent(
@@ -1124,7 +1395,35 @@ query FetchWalletToWithdrawalRequestsConnection($entity_id: ID!, $first: Int, $a
         created_after_date: Optional[datetime] = None,
         created_before_date: Optional[datetime] = None,
     ) -> CurrencyAmount:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_total_amount_sent_query(
+                created_after_date=created_after_date,
+                created_before_date=created_before_date,
+            )
+        )
+
+    async def get_total_amount_sent_async(
+        self,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+    ) -> CurrencyAmount:
+        return await self.requester.execute_query_async(
+            self.get_total_amount_sent_query(
+                created_after_date=created_after_date,
+                created_before_date=created_before_date,
+            )
+        )
+
+    def get_total_amount_sent_query(
+        self,
+        created_after_date: Optional[datetime] = None,
+        created_before_date: Optional[datetime] = None,
+    ) -> Query[CurrencyAmount]:
+        def construct(json: Mapping[str, Any]) -> CurrencyAmount:
+            connection = json["entity"]["total_amount_sent"]
+            return CurrencyAmount_from_json(self.requester, connection)
+
+        return Query(
             """
 query FetchWalletTotalAmountSent($entity_id: ID!, $created_after_date: DateTime, $created_before_date: DateTime) {
     entity(id: $entity_id) {
@@ -1146,9 +1445,8 @@ query FetchWalletTotalAmountSent($entity_id: ID!, $created_after_date: DateTime,
                 "created_after_date": created_after_date,
                 "created_before_date": created_before_date,
             },
+            construct,
         )
-        connection = json["entity"]["total_amount_sent"]
-        return CurrencyAmount_from_json(self.requester, connection)
 
     def to_json(self) -> Mapping[str, Any]:
         return {
@@ -6,6 +6,7 @@ from typing import Any, Mapping, Optional
 
 from lightspark.objects.WithdrawalMode import WithdrawalMode
 from lightspark.objects.WithdrawalRequestStatus import WithdrawalRequestStatus
+from lightspark.requests.query import Query
 from lightspark.requests.requester import Requester
 from lightspark.utils.enums import parse_enum
 
@@ -74,7 +75,29 @@ class WithdrawalRequest(Entity):
     def get_channel_closing_transactions(
         self, first: Optional[int] = None
     ) -> WithdrawalRequestToChannelClosingTransactionsConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_channel_closing_transactions_query(first=first)
+        )
+
+    async def get_channel_closing_transactions_async(
+        self, first: Optional[int] = None
+    ) -> WithdrawalRequestToChannelClosingTransactionsConnection:
+        return await self.requester.execute_query_async(
+            self.get_channel_closing_transactions_query(first=first)
+        )
+
+    def get_channel_closing_transactions_query(
+        self, first: Optional[int] = None
+    ) -> Query[WithdrawalRequestToChannelClosingTransactionsConnection]:
+        def construct(
+            json: Mapping[str, Any]
+        ) -> WithdrawalRequestToChannelClosingTransactionsConnection:
+            connection = json["entity"]["channel_closing_transactions"]
+            return WithdrawalRequestToChannelClosingTransactionsConnection_from_json(
+                self.requester, connection
+            )
+
+        return Query(
             """
 query FetchWithdrawalRequestToChannelClosingTransactionsConnection($entity_id: ID!, $first: Int) {
     entity(id: $entity_id) {
@@ -127,16 +150,35 @@ query FetchWithdrawalRequestToChannelClosingTransactionsConnection($entity_id: I
 }
             """,
             {"entity_id": self.id, "first": first},
-        )
-        connection = json["entity"]["channel_closing_transactions"]
-        return WithdrawalRequestToChannelClosingTransactionsConnection_from_json(
-            self.requester, connection
+            construct,
         )
 
     def get_channel_opening_transactions(
         self, first: Optional[int] = None
     ) -> WithdrawalRequestToChannelOpeningTransactionsConnection:
-        json = self.requester.execute_graphql(
+        return self.requester.execute_query(
+            self.get_channel_opening_transactions_query(first=first)
+        )
+
+    async def get_channel_opening_transactions_async(
+        self, first: Optional[int] = None
+    ) -> WithdrawalRequestToChannelOpeningTransactionsConnection:
+        return await self.requester.execute_query_async(
+            self.get_channel_opening_transactions_query(first=first)
+        )
+
+    def get_channel_opening_transactions_query(
+        self, first: Optional[int] = None
+    ) -> Query[WithdrawalRequestToChannelOpeningTransactionsConnection]:
+        def construct(
+            json: Mapping[str, Any]
+        ) -> WithdrawalRequestToChannelOpeningTransactionsConnection:
+            connection = json["entity"]["channel_opening_transactions"]
+            return WithdrawalRequestToChannelOpeningTransactionsConnection_from_json(
+                self.requester, connection
+            )
+
+        return Query(
             """
 query FetchWithdrawalRequestToChannelOpeningTransactionsConnection($entity_id: ID!, $first: Int) {
     entity(id: $entity_id) {
@@ -189,10 +231,7 @@ query FetchWithdrawalRequestToChannelOpeningTransactionsConnection($entity_id: I
 }
             """,
             {"entity_id": self.id, "first": first},
-        )
-        connection = json["entity"]["channel_opening_transactions"]
-        return WithdrawalRequestToChannelOpeningTransactionsConnection_from_json(
-            self.requester, connection
+            construct,
         )
 
     def to_json(self) -> Mapping[str, Any]:
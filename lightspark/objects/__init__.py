@@ -1 +1,20 @@
 # Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Object modules are only imported when they are first used (PEP 562). Type checkers
+# resolve them as submodules, which a module `__getattr__` would hide.
+if not TYPE_CHECKING:
+
+    def __getattr__(name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
@@ -0,0 +1,207 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import asyncio
+import logging
+from typing import Any, Mapping, Optional, TypeVar, Union
+
+from lightspark.exceptions import LightsparkException
+from lightspark.requests.json_backend import JsonBackend
+from lightspark.requests.pool import PoolConfig
+from lightspark.requests.query import Query
+from lightspark.requests.rate_limit import RateLimiter
+from lightspark.requests.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from lightspark.requests.requester import Requester
+from lightspark.requests.timeouts import Deadline, Timeout
+from lightspark.requests.transport import (
+    Transport,
+    TransportResponse,
+    httpx_limits,
+    post_httpx_async,
+)
+from lightspark.utils.signing_key import SigningKey
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+logger = logging.getLogger("lightspark")
+
+T = TypeVar("T")
+
+
+class AsyncRequester(Requester):
+    """A Requester which can also execute GraphQL operations on an asyncio event loop.
+
+    The blocking methods inherited from `Requester` keep working, so the objects loaded
+    through this requester support both the blocking and the `*_async` variants of their
+    methods. Asynchronous requests go through the transport of the requester when it
+    supports asyncio, and through an httpx client otherwise.
+    """
+
+    def __init__(
+        self,
+        api_token_client_id: str,
+        api_token_client_secret: str,
+        base_url: Optional[str] = None,
+        http_host: Optional[str] = None,
+        persisted_queries: bool = False,
+        raw: bool = False,
+        json_backend: Union[str, JsonBackend, None] = None,
+        pool_config: Optional[PoolConfig] = None,
+        transport: Union[str, Transport, None] = None,
+        timeout: Optional[Timeout] = None,
+        retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        if httpx is None:
+            raise LightsparkException(
+                "MISSING_DEPENDENCY",
+                "The asyncio client requires the httpx package. Please install it"
+                + " with `pip install lightspark[async]`.",
+            )
+        super().__init__(
+            api_token_client_id=api_token_client_id,
+            api_token_client_secret=api_token_client_secret,
+            base_url=base_url,
+            http_host=http_host,
+            persisted_queries=persisted_queries,
+            raw=raw,
+            json_backend=json_backend,
+            pool_config=pool_config,
+            transport=transport,
+            timeout=timeout,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+        )
+        self.http_host = http_host
+        self.graphql_async_session = httpx.AsyncClient(
+            auth=(api_token_client_id, api_token_client_secret),
+            headers={"Host": http_host} if http_host else None,
+            # Like the blocking session, let the server decide when to give up.
+            timeout=None,
+            limits=httpx_limits(self.pool_config),
+        )
+
+    async def execute_graphql_async(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey] = None,
+        timeout: Optional[Timeout] = None,
+    ) -> Mapping[str, Any]:
+        deadline = Deadline.start(timeout, self.timeout)
+        if self.retrier is not None:
+            self.retrier.record_call()
+        return await self._execute_graphql_retried_async(
+            query, variables, signing_key, deadline
+        )
+
+    async def _execute_graphql_retried_async(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey],
+        deadline: Deadline,
+    ) -> Mapping[str, Any]:
+        attempt = 0
+        while True:
+            try:
+                return await self._execute_graphql_once_async(
+                    query, variables, signing_key, deadline
+                )
+            except LightsparkException as e:
+                delay = self._retry_delay(query, e, attempt, deadline)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _execute_checked_mutation_async(self, query: Query[T]) -> T:
+        deadline = Deadline.start(query.timeout, self.timeout)
+        if self.retrier is not None:
+            self.retrier.record_call()
+        attempt = 0
+        while True:
+            try:
+                return query.construct_object(
+                    await self._execute_graphql_once_async(
+                        query.query, query.variables, query.signing_key, deadline
+                    )
+                )
+            except LightsparkException as e:
+                delay = self._retry_delay(None, e, attempt, deadline)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                check = query.retry_check()  # pyre-ignore[29]
+                previous = check.construct_object(
+                    await self._execute_graphql_retried_async(
+                        check.query, check.variables, check.signing_key, deadline
+                    )
+                )
+                if previous is not None:
+                    return previous
+            attempt += 1
+
+    async def _execute_graphql_once_async(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey],
+        deadline: Deadline,
+    ) -> Mapping[str, Any]:
+        r = None
+        if self.persisted_queries:
+            r = await self._post_async(query, variables, signing_key, False, deadline)
+            if self._should_resend_document(r.status_code, r.content):
+                r = None
+        if r is None:
+            r = await self._post_async(query, variables, signing_key, True, deadline)
+        return self._handle_response(r)
+
+    async def _post_async(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey],
+        send_document: bool,
+        deadline: Deadline,
+    ) -> TransportResponse:
+        payload, headers = self._build_request(
+            query, variables, signing_key, send_document
+        )
+        logger.debug(
+            "Sending request to GraphQL with query = %s, payload = %s}", query, payload
+        )
+        if self.rate_limiter is None:
+            return await self._send_async(payload, headers, deadline)
+        release_permits = await self.rate_limiter.acquire_async(
+            headers["X-GraphQL-Operation"], deadline.time_left()
+        )
+        try:
+            return await self._send_async(payload, headers, deadline)
+        finally:
+            release_permits()
+
+    async def _send_async(
+        self, payload: bytes, headers: Mapping[str, Any], deadline: Deadline
+    ) -> TransportResponse:
+        timeout = deadline.remaining()
+        if self.transport.supports_async:
+            return await self.transport.post_async(
+                self.base_url, payload, headers, timeout
+            )
+        return await post_httpx_async(
+            self.graphql_async_session,
+            url=self.base_url,
+            content=payload,
+            headers={key: value for key, value in headers.items() if value is not None},
+            extensions={"sni_hostname": self.http_host} if self.http_host else None,
+            timeout=timeout,
+        )
+
+    async def close(self) -> None:
+        await self.graphql_async_session.aclose()
+        await self.transport.aclose()
+        self.graphql_session.close()
@@ -0,0 +1,388 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import re
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from lightspark.exceptions import LightsparkException
+from lightspark.requests.query import Query
+from lightspark.requests.timeouts import Timeout
+from lightspark.utils.signing_key import SigningKey
+
+if TYPE_CHECKING:
+    from lightspark.requests.requester import Requester
+
+T = TypeVar("T")
+
+# For each batched query, maps the prefixed root fields of the merged response back to
+# the response keys its constructor expects.
+_ResponseKeys = Optional[List[Dict[str, str]]]
+
+_TOKEN_REGEX = re.compile(
+    r"""
+    (?P<ignored>[\s,\ufeff]+|\#[^\n\r]*)
+    | (?P<string>\"\"\"(?:\\\"\"\"|[^\"]|\"(?!\"\"))*\"\"\"|"(?:\\.|[^"\\\n])*")
+    | (?P<variable>\$[_A-Za-z][_0-9A-Za-z]*)
+    | (?P<name>[_A-Za-z][_0-9A-Za-z]*)
+    | (?P<spread>\.\.\.)
+    | (?P<number>-?[0-9][0-9.eE+-]*)
+    | (?P<punctuator>[!():=@\[\]{}|&])
+    """,
+    re.VERBOSE,
+)
+
+
+class _Token:
+    def __init__(self, kind: str, value: str, start: int, end: int) -> None:
+        self.kind = kind
+        self.value = value
+        self.start = start
+        self.end = end
+
+
+def _tokenize(document: str) -> List[_Token]:
+    tokens = []
+    position = 0
+    while position < len(document):
+        match = _TOKEN_REGEX.match(document, position)
+        if not match:
+            raise LightsparkException(
+                "BATCH_ERROR",
+                f"Unexpected character in GraphQL document at position {position}.",
+            )
+        kind = match.lastgroup
+        if kind != "ignored":
+            tokens.append(_Token(kind, match.group(), match.start(), match.end()))
+        position = match.end()
+    return tokens
+
+
+def _matching(tokens: List[_Token], index: int, opening: str, closing: str) -> int:
+    depth = 0
+    for i in range(index, len(tokens)):
+        if tokens[i].value == opening:
+            depth += 1
+        elif tokens[i].value == closing:
+            depth -= 1
+            if depth == 0:
+                return i
+    raise LightsparkException("BATCH_ERROR", f"Unbalanced '{opening}' in document.")
+
+
+class _ParsedOperation:
+    """An operation split into the pieces needed to merge it with other operations."""
+
+    def __init__(self, document: str) -> None:
+        self.document = document
+        self.tokens = _tokenize(document)
+        self.operation_type = "query"
+        self.variables_range: Optional[range] = None
+        self.selections_range: Optional[range] = None
+        self.fragments: Dict[str, str] = {}
+
+        i = 0
+        while i < len(self.tokens):
+            token = self.tokens[i]
+            if token.value == "fragment":
+                close = _matching(self.tokens, self._next_brace(i), "{", "}")
+                self.fragments[self.tokens[i + 1].value] = document[
+                    token.start : self.tokens[close].end
+                ]
+                i = close + 1
+                continue
+            if self.selections_range is not None:
+                raise LightsparkException(
+                    "BATCH_ERROR",
+                    "Only documents with a single operation can be batched.",
+                )
+            if token.value in ("query", "mutation", "subscription"):
+                self.operation_type = token.value
+                i += 1
+                if self.tokens[i].kind == "name":
+                    i += 1
+                if self.tokens[i].value == "(":
+                    close = _matching(self.tokens, i, "(", ")")
+                    self.variables_range = range(i + 1, close)
+                    i = close + 1
+                i = self._next_brace(i)
+            elif token.value != "{":
+                raise LightsparkException(
+                    "BATCH_ERROR", f"Unexpected token '{token.value}' in document."
+                )
+            close = _matching(self.tokens, i, "{", "}")
+            self.selections_range = range(i + 1, close)
+            i = close + 1
+
+        if self.selections_range is None:
+            raise LightsparkException("BATCH_ERROR", "The document has no operation.")
+
+    def _next_brace(self, index: int) -> int:
+        while self.tokens[index].value != "{":
+            index += 1
+        return index
+
+    def rename(self, prefix: str) -> Tuple[str, str, Dict[str, str]]:
+        """Returns the variable definitions and root selections of the operation with
+        every variable and root field prefixed, together with a mapping from the
+        prefixed response keys to the original ones."""
+        response_keys: Dict[str, str] = {}
+        replacements: Dict[int, str] = {}
+        for i in list(self.variables_range or []) + list(self.selections_range or []):
+            if self.tokens[i].kind == "variable":
+                replacements[i] = f"${prefix}{self.tokens[i].value[1:]}"
+
+        depth = 0
+        previous: Optional[_Token] = None
+        for i in self.selections_range or []:
+            token = self.tokens[i]
+            if token.value in ("{", "("):
+                depth += 1
+            elif token.value in ("}", ")"):
+                depth -= 1
+            elif depth == 0 and token.kind == "spread":
+                raise LightsparkException(
+                    "BATCH_ERROR", "Fragments on the root type cannot be batched."
+                )
+            elif (
+                depth == 0
+                and token.kind == "name"
+                and (previous is None or previous.value not in (":", "@"))
+            ):
+                has_alias = i + 1 < len(self.tokens) and self.tokens[i + 1].value == ":"
+                response_keys[prefix + token.value] = token.value
+                replacements[i] = (
+                    prefix + token.value
+                    if has_alias
+                    else f"{prefix}{token.value}: {token.value}"
+                )
+            previous = token
+
+        return (
+            self._render(self.variables_range, replacements),
+            self._render(self.selections_range, replacements),
+            response_keys,
+        )
+
+    def _render(
+        self, token_range: Optional[range], replacements: Dict[int, str]
+    ) -> str:
+        if not token_range:
+            return ""
+        parts = []
+        for i in token_range:
+            if i != token_range.start:
+                parts.append(
+                    self.document[self.tokens[i - 1].end : self.tokens[i].start]
+                )
+            parts.append(replacements.get(i, self.tokens[i].value))
+        return "".join(parts)
+
+
+class BatchResult(Generic[T]):
+    """The result of a query added to a `QueryBatch`, available once the batch ran."""
+
+    def __init__(self) -> None:
+        self._done = False
+        self._value: Optional[T] = None
+        self._exception: Optional[BaseException] = None
+
+    def done(self) -> bool:
+        return self._done
+
+    def result(self) -> T:
+        if not self._done:
+            raise LightsparkException(
+                "BATCH_ERROR", "The batch containing this query has not been executed."
+            )
+        if self._exception is not None:
+            raise self._exception
+        return self._value  # pyre-ignore[7]
+
+    def _set_result(self, value: T) -> None:
+        self._value = value
+        self._done = True
+
+    def _set_exception(self, exception: BaseException) -> None:
+        self._exception = exception
+        self._done = True
+
+
+class QueryBatch:
+    """Collects several queries and sends them to the API as a single GraphQL request.
+
+    The operations are merged into one document in which every root field and variable is
+    prefixed, and the response is split back so that each query builds its own result:
+
+        with client.batch() as batch:
+            local_balance = batch.add(account.get_local_balance_query())
+            remote_balance = batch.add(account.get_remote_balance_query())
+        print(local_balance.result(), remote_balance.result())
+
+    All the queries of a batch must be of the same operation type and use the same signing
+    key. The batch is sent when the `with` (or `async with`) block exits without an error,
+    or explicitly with `execute` (or `execute_async`).
+    """
+
+    def __init__(self, requester: "Requester") -> None:
+        self._requester = requester
+        self._queries: List[Query[Any]] = []
+        self._results: List[BatchResult[Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def add(self, query: Query[T]) -> BatchResult[T]:
+        result: BatchResult[T] = BatchResult()
+        self._queries.append(query)
+        self._results.append(result)
+        return result
+
+    def execute(self) -> None:
+        queries, results = self._take()
+        if not queries:
+            return
+        try:
+            document, variables, signing_key, response_keys = self._prepare(queries)
+            data = self._requester.execute_graphql(
+                document, variables, signing_key, self._timeout(queries)
+            )
+        except Exception as e:
+            self._fail(results, e)
+            raise
+        self._dispatch(queries, results, response_keys, data, self._requester.raw)
+
+    async def execute_async(self) -> None:
+        queries, results = self._take()
+        if not queries:
+            return
+        try:
+            document, variables, signing_key, response_keys = self._prepare(queries)
+            data = await self._requester.execute_graphql_async(
+                document, variables, signing_key, self._timeout(queries)
+            )
+        except Exception as e:
+            self._fail(results, e)
+            raise
+        self._dispatch(queries, results, response_keys, data, self._requester.raw)
+
+    def __enter__(self) -> "QueryBatch":
+        return self
+
+    def __exit__(self, exc_type: Any, *args: Any) -> None:
+        if exc_type is None:
+            self.execute()
+
+    async def __aenter__(self) -> "QueryBatch":
+        return self
+
+    async def __aexit__(self, exc_type: Any, *args: Any) -> None:
+        if exc_type is None:
+            await self.execute_async()
+
+    def _take(self) -> Tuple[List[Query[Any]], List[BatchResult[Any]]]:
+        queries, results = self._queries, self._results
+        self._queries, self._results = [], []
+        return queries, results
+
+    @staticmethod
+    def _timeout(queries: List[Query[Any]]) -> Optional[Timeout]:
+        # The timeouts of merged queries are left to the client.
+        return queries[0].timeout if len(queries) == 1 else None
+
+    @staticmethod
+    def _prepare(
+        queries: List[Query[Any]],
+    ) -> Tuple[str, Mapping[str, Any], Optional[SigningKey], _ResponseKeys]:
+        if len(queries) == 1:
+            # A single operation does not need to be rewritten.
+            query = queries[0]
+            return query.query, query.variables, query.signing_key, None
+        return QueryBatch._merge(queries)
+
+    @staticmethod
+    def _fail(results: List[BatchResult[Any]], exception: BaseException) -> None:
+        for result in results:
+            result._set_exception(exception)  # pylint: disable=protected-access
+
+    @staticmethod
+    def _merge(
+        queries: List[Query[Any]],
+    ) -> Tuple[str, Mapping[str, Any], Optional[SigningKey], _ResponseKeys]:
+        operation_type: Optional[str] = None
+        signing_key = queries[0].signing_key
+        variable_definitions: List[str] = []
+        selections: List[str] = []
+        fragments: Dict[str, str] = {}
+        variables: Dict[str, Any] = {}
+        response_keys: List[Dict[str, str]] = []
+
+        for index, query in enumerate(queries):
+            operation = _ParsedOperation(query.query)
+            if operation_type not in (None, operation.operation_type):
+                raise LightsparkException(
+                    "BATCH_ERROR", "Queries and mutations cannot be batched together."
+                )
+            if query.signing_key is not signing_key:
+                raise LightsparkException(
+                    "BATCH_ERROR",
+                    "All the operations of a batch must use the same signing key.",
+                )
+            operation_type = operation.operation_type
+
+            prefix = f"b{index}_"
+            definitions, selection, keys = operation.rename(prefix)
+            if definitions.strip():
+                variable_definitions.append(definitions.strip())
+            selections.append(selection.strip())
+            response_keys.append(keys)
+            for name, value in (query.variables or {}).items():
+                variables[prefix + name] = value
+            for name, fragment in operation.fragments.items():
+                if fragments.setdefault(name, fragment) != fragment:
+                    raise LightsparkException(
+                        "BATCH_ERROR",
+                        f"The batched operations define different fragments named {name}.",
+                    )
+
+        header = f"{operation_type} Batch"
+        if variable_definitions:
+            header += "(" + ", ".join(variable_definitions) + ")"
+        document = "\n".join(
+            [header + " {"]
+            + ["    " + selection for selection in selections]
+            + ["}", ""]
+            + list(fragments.values())
+        )
+        return document, variables, signing_key, response_keys
+
+    @staticmethod
+    def _dispatch(
+        queries: List[Query[Any]],
+        results: List[BatchResult[Any]],
+        response_keys: _ResponseKeys,
+        data: Mapping[str, Any],
+        raw: bool,
+    ) -> None:
+        # pylint: disable=protected-access
+        for index, (query, result) in enumerate(zip(queries, results)):
+            try:
+                json = (
+                    {
+                        key: data.get(alias)
+                        for alias, key in response_keys[index].items()
+                    }
+                    if response_keys is not None
+                    else data
+                )
+                result._set_result(json if raw else query.construct_object(json))
+            except Exception as e:  # pylint: disable=broad-except
+                result._set_exception(e)
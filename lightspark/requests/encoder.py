@@ -3,12 +3,21 @@
 import json
 from datetime import datetime, timezone
 from enum import Enum
+from typing import Any
+
+
+def encode_default(o: Any) -> Any:
+    """Converts the values which JSON does not support: enums are sent by name and
+    datetimes in ISO 8601, in UTC."""
+    if isinstance(o, Enum):
+        return o.name
+    if isinstance(o, datetime):
+        return o.replace(tzinfo=timezone.utc).isoformat()
+    raise TypeError(f"Object of type {o.__class__.__name__} is not JSON serializable")
 
 
 class Encoder(json.JSONEncoder):
     def default(self, o):
-        if isinstance(o, Enum):
-            return o.name
-        if isinstance(o, datetime):
-            return o.replace(tzinfo=timezone.utc).isoformat()
+        if isinstance(o, (Enum, datetime)):
+            return encode_default(o)
         return json.JSONEncoder.default(self, o)
@@ -0,0 +1,103 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+from lightspark.exceptions import LightsparkException
+from lightspark.requests.encoder import Encoder, encode_default
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover
+    simdjson = None
+
+
+class JsonBackend:
+    """Serializes the requests sent to the API and parses its responses.
+
+    `dumps` returns the UTF-8 encoded JSON of a value, with enums and datetimes converted
+    like `Encoder` does, and `loads` parses JSON from bytes or a string.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dumps: Callable[[Any], bytes],
+        loads: Callable[[Union[bytes, str]], Any],
+    ) -> None:
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        return f"JsonBackend({self.name!r})"
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value, cls=Encoder).encode("utf8")
+
+
+def _orjson_dumps(value: Any) -> bytes:
+    # orjson writes enums by value, which is their name for the enums of the SDK.
+    return orjson.dumps(
+        value,
+        default=encode_default,
+        option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS,
+    )
+
+
+def _ujson_dumps(value: Any) -> bytes:
+    return ujson.dumps(
+        value, default=encode_default, escape_forward_slashes=False
+    ).encode("utf8")
+
+
+_BACKENDS: Dict[str, JsonBackend] = {
+    "json": JsonBackend("json", _json_dumps, json.loads)
+}
+if orjson is not None:
+    _BACKENDS["orjson"] = JsonBackend("orjson", _orjson_dumps, orjson.loads)
+if ujson is not None:
+    _BACKENDS["ujson"] = JsonBackend("ujson", _ujson_dumps, ujson.loads)
+if simdjson is not None:
+    # simdjson only parses.
+    _BACKENDS["simdjson"] = JsonBackend("simdjson", _json_dumps, simdjson.loads)
+
+# The backends by order of preference, and the packages providing them.
+_PACKAGES = {
+    "orjson": "orjson",
+    "simdjson": "pysimdjson",
+    "ujson": "ujson",
+    "json": None,
+}
+
+
+def get_json_backend(name: Optional[str] = None) -> JsonBackend:
+    """Returns the JSON backend with the given name, `orjson`, `simdjson`, `ujson` or
+    `json`, or by default the first one of them which is installed. The standard library `json` module
+    is always available."""
+    if name is None:
+        name = next(name for name in _PACKAGES if name in _BACKENDS)
+    backend = _BACKENDS.get(name)
+    if backend is None:
+        if name in _PACKAGES:
+            raise LightsparkException(
+                "MISSING_DEPENDENCY",
+                f"The {name} JSON backend requires the {_PACKAGES[name]} package."
+                + f" Please install it with `pip install {_PACKAGES[name]}`.",
+            )
+        raise LightsparkException(
+            "UNKNOWN_JSON_BACKEND",
+            f"Unknown JSON backend {name}. Expected one of {', '.join(_PACKAGES)}.",
+        )
+    return backend
@@ -0,0 +1,208 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import asyncio
+import contextvars
+import queue
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from lightspark.requests.query import Query
+
+if TYPE_CHECKING:
+    from lightspark.requests.requester import Requester
+
+# Builds the query fetching the page which starts after the given cursor.
+PageQuery = Callable[[Optional[str]], Query[Any]]
+
+
+class _Done:
+    pass
+
+
+class _Failure:
+    def __init__(self, exception: BaseException) -> None:
+        self.exception = exception
+
+
+_DONE = _Done()
+
+_Item = Union[Any, _Done, _Failure]
+
+
+def _raw_connection(data: Mapping[str, Any]) -> Optional[Tuple[Mapping[str, Any], str]]:
+    """Finds the connection in the `data` of a raw page, together with the prefix of its
+    keys (such as `account_to_transactions_connection_`)."""
+    for key in data:
+        if key.endswith("_page_info"):
+            return data, key[: -len("page_info")]
+    for value in data.values():
+        if isinstance(value, Mapping):
+            found = _raw_connection(value)
+            if found is not None:
+                return found
+    return None
+
+
+def _entities(connection: Any) -> Sequence[Any]:
+    if not isinstance(connection, Mapping):
+        return connection.entities
+    found = _raw_connection(connection)
+    if found is None:
+        return []
+    raw_connection, prefix = found
+    return raw_connection[prefix + "entities"]
+
+
+def _next_cursor(connection: Any, after: Optional[str]) -> Optional[str]:
+    if isinstance(connection, Mapping):
+        found = _raw_connection(connection)
+        page_info = found[0][found[1] + "page_info"] if found is not None else None
+        if page_info is None or not page_info["page_info_has_next_page"]:
+            return None
+        end_cursor = page_info["page_info_end_cursor"]
+    else:
+        page_info = connection.page_info
+        if page_info is None or not page_info.has_next_page:
+            return None
+        end_cursor = page_info.end_cursor
+    # Stop rather than loop forever if the server does not move the cursor forward.
+    if not end_cursor or end_cursor == after:
+        return None
+    return end_cursor
+
+
+def iter_pages(requester: "Requester", page_query: PageQuery) -> Iterator[Any]:
+    """Yields the pages of a connection one after the other, fetching each page once
+    the previous one has been consumed.
+
+    With a raw requester, each page is the `data` of its response.
+    """
+    after: Optional[str] = None
+    while True:
+        connection = requester.execute_query(page_query(after))
+        yield connection
+        after = _next_cursor(connection, after)
+        if after is None:
+            return
+
+
+async def iter_pages_async(
+    requester: "Requester", page_query: PageQuery
+) -> AsyncIterator[Any]:
+    after: Optional[str] = None
+    while True:
+        connection = await requester.execute_query_async(page_query(after))
+        yield connection
+        after = _next_cursor(connection, after)
+        if after is None:
+            return
+
+
+def iter_connection(
+    requester: "Requester", page_query: PageQuery, prefetch: int = 1
+) -> Iterator[Any]:
+    """Yields the entities of every page of a connection.
+
+    Up to `prefetch` pages are fetched by a background thread while the entities of the
+    current page are consumed, so at most `prefetch + 1` pages are held in memory. With
+    `prefetch=0` each page is fetched when the previous one is exhausted.
+
+    With a raw requester, the entities are yielded as the JSON mappings of the response.
+    """
+    if prefetch <= 0:
+        for connection in iter_pages(requester, page_query):
+            yield from _entities(connection)
+        return
+
+    pages: "queue.Queue[_Item]" = queue.Queue()
+    # The page being consumed and the prefetched ones each hold a slot.
+    slots = threading.Semaphore(prefetch + 1)
+    stopped = threading.Event()
+
+    def produce() -> None:
+        try:
+            connections = iter_pages(requester, page_query)
+            while True:
+                slots.acquire()  # pylint: disable=consider-using-with
+                if stopped.is_set():
+                    return
+                connection = next(connections, _DONE)
+                pages.put(connection)
+                if connection is _DONE:
+                    return
+        except Exception as e:  # pylint: disable=broad-except
+            pages.put(_Failure(e))
+
+    # The pages are fetched with the timeouts and priority of the caller.
+    threading.Thread(
+        target=contextvars.copy_context().run, args=(produce,), daemon=True
+    ).start()
+    try:
+        while True:
+            item = pages.get()
+            if isinstance(item, _Done):
+                return
+            if isinstance(item, _Failure):
+                raise item.exception
+            yield from _entities(item)
+            slots.release()
+    finally:
+        stopped.set()
+        slots.release()
+
+
+async def iter_connection_async(
+    requester: "Requester", page_query: PageQuery, prefetch: int = 1
+) -> AsyncIterator[Any]:
+    """Yields the entities of every page of a connection, fetching up to `prefetch`
+    pages in a background task while the current page is consumed."""
+    if prefetch <= 0:
+        async for connection in iter_pages_async(requester, page_query):
+            for entity in _entities(connection):
+                yield entity
+        return
+
+    pages: "asyncio.Queue[_Item]" = asyncio.Queue()
+    slots = asyncio.Semaphore(prefetch + 1)
+
+    async def produce() -> None:
+        try:
+            connections = iter_pages_async(requester, page_query)
+            while True:
+                await slots.acquire()
+                try:
+                    # The anext builtin is not available before Python 3.10.
+                    connection = (
+                        await connections.__anext__()
+                    )  # pylint: disable=unnecessary-dunder-call
+                except StopAsyncIteration:
+                    await pages.put(_DONE)
+                    return
+                await pages.put(connection)
+        except Exception as e:  # pylint: disable=broad-except
+            await pages.put(_Failure(e))
+
+    task = asyncio.get_running_loop().create_task(produce())
+    try:
+        while True:
+            item = await pages.get()
+            if isinstance(item, _Done):
+                return
+            if isinstance(item, _Failure):
+                raise item.exception
+            for entity in _entities(item):
+                yield entity
+            slots.release()
+    finally:
+        task.cancel()
@@ -0,0 +1,204 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import requests
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.poolmanager import PoolManager
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """The sizing of the pools of HTTP connections kept alive by a client.
+
+    A connection is kept open after a request to be reused by the next requests to the
+    same host, which saves a TCP connection and a TLS handshake each time.
+    """
+
+    max_connections_per_host: int = 10
+    """The number of connections kept open to each host. It should be at least the
+    number of threads sending requests concurrently."""
+
+    max_hosts: int = 10
+    """The number of hosts for which connections are kept open."""
+
+    block: bool = False
+    """When all the connections to a host are in use, whether to wait for one to be
+    released rather than opening an extra connection which is closed after its request."""
+
+    idle_timeout_secs: Optional[float] = None
+    """How long an unused connection is kept open before it is closed and replaced by a
+    new one, so that no request is sent on a connection that the server or a load
+    balancer already dropped. Connections are kept open indefinitely by default."""
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """A snapshot of the connections of a client."""
+
+    in_use: int
+    """The connections sending a request or being read."""
+
+    idle: int
+    """The open connections waiting in the pools for the next request."""
+
+    created: int
+    """The connections opened since the client was created, including the ones which
+    replaced dropped or expired connections."""
+
+    reused: int
+    """The requests sent on a connection which was already open."""
+
+    def __add__(self, other: "PoolStats") -> "PoolStats":
+        return PoolStats(
+            in_use=self.in_use + other.in_use,
+            idle=self.idle + other.idle,
+            created=self.created + other.created,
+            reused=self.reused + other.reused,
+        )
+
+
+class _PoolTracker:
+    def __init__(self, idle_timeout_secs: Optional[float]) -> None:
+        self.idle_timeout_secs = idle_timeout_secs
+        self.lock = threading.Lock()
+        # The pool manager closes and drops the pools of the least recently used hosts
+        # past its `num_pools`, which must not be kept alive here.
+        self.pools: "weakref.WeakSet[HTTPConnectionPool]" = weakref.WeakSet()
+        self.in_use = 0
+        self.created = 0
+        self.reused = 0
+
+    def stats(self) -> PoolStats:
+        with self.lock:
+            pools = list(self.pools)
+            in_use, created, reused = self.in_use, self.created, self.reused
+        idle = 0
+        for pool in pools:
+            queue = pool.pool
+            if queue is not None:
+                # The queue of a pool is filled with None placeholders.
+                idle += sum(
+                    1
+                    for conn in list(queue.queue)
+                    if conn is not None and conn.sock is not None
+                )
+        return PoolStats(in_use=in_use, idle=idle, created=created, reused=reused)
+
+
+class _TrackedPoolMixin:
+    """Counts the connections of a pool and closes the ones left idle for too long."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Replaced by the tracker of the pool manager which creates the pool.
+        self.tracker = _PoolTracker(None)
+
+    def _get_conn(self, timeout: Optional[float] = None) -> Any:
+        conn = super()._get_conn(timeout)  # pyre-ignore[16]
+        tracker = self.tracker
+        idle_timeout_secs = tracker.idle_timeout_secs
+        released_at = getattr(conn, "lightspark_released_at", None)
+        if (
+            conn.sock is not None
+            and released_at is not None
+            and idle_timeout_secs is not None
+            and time.monotonic() - released_at > idle_timeout_secs
+        ):
+            conn.close()
+        with tracker.lock:
+            tracker.in_use += 1
+            if conn.sock is None:
+                tracker.created += 1
+            else:
+                tracker.reused += 1
+        return conn
+
+    def _put_conn(self, conn: Any) -> None:
+        if conn is not None:
+            conn.lightspark_released_at = time.monotonic()
+        with self.tracker.lock:
+            self.tracker.in_use -= 1
+        super()._put_conn(conn)  # pyre-ignore[16]
+
+
+class _TrackedHTTPConnectionPool(_TrackedPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _TrackedHTTPSConnectionPool(_TrackedPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class _TrackedPoolManager(PoolManager):
+    def __init__(self, tracker: _PoolTracker, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.tracker = tracker
+        self.pool_classes_by_scheme = {
+            "http": _TrackedHTTPConnectionPool,
+            "https": _TrackedHTTPSConnectionPool,
+        }
+
+    def _new_pool(self, *args: Any, **kwargs: Any) -> HTTPConnectionPool:
+        pool = super()._new_pool(*args, **kwargs)
+        pool.tracker = self.tracker  # pyre-ignore[16]
+        with self.tracker.lock:
+            self.tracker.pools.add(pool)
+        return pool
+
+
+# The positional arguments of `requests.adapters.HTTPAdapter`.
+_ADAPTER_ARGS = ("pool_connections", "pool_maxsize", "max_retries", "pool_block")
+
+
+class PooledHTTPAdapter(requests.adapters.HTTPAdapter):
+    """An adapter whose connection pools are sized by a `PoolConfig`, and which counts
+    the connections it opens and reuses.
+
+    The arguments of `requests.adapters.HTTPAdapter`, such as `max_retries`, are
+    forwarded to it, and the pool sizes given that way override those of `pool_config`.
+    """
+
+    def __init__(
+        self, *args: Any, pool_config: Optional[PoolConfig] = None, **kwargs: Any
+    ) -> None:
+        self.pool_config = pool_config or PoolConfig()
+        self._tracker = _PoolTracker(self.pool_config.idle_timeout_secs)
+        adapter_kwargs = {
+            "pool_connections": self.pool_config.max_hosts,
+            "pool_maxsize": self.pool_config.max_connections_per_host,
+            "pool_block": self.pool_config.block,
+        }
+        adapter_kwargs.update(zip(_ADAPTER_ARGS, args))
+        adapter_kwargs.update(kwargs)
+        # Set again by `init_poolmanager`, which the adapter calls with these values.
+        self._pool_connections: int = adapter_kwargs["pool_connections"]
+        self._pool_maxsize: int = adapter_kwargs["pool_maxsize"]
+        self._pool_block: bool = adapter_kwargs["pool_block"]
+        super().__init__(**adapter_kwargs)
+
+    def init_poolmanager(
+        self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any
+    ) -> None:
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _TrackedPoolManager(
+            self._tracker,
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs,
+        )
+
+    def close(self) -> None:
+        super().close()
+        with self._tracker.lock:
+            self._tracker.pools.clear()
+
+    def pool_stats(self) -> PoolStats:
+        return self._tracker.stats()
@@ -0,0 +1,35 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Mapping, Optional, TypeVar
+
+from lightspark.requests.timeouts import Timeout
+from lightspark.utils.signing_key import SigningKey
+
+T = TypeVar("T")
+
+
+@dataclass
+class Query(Generic[T]):
+    """A GraphQL document together with its variables and the function that
+    builds the returned object from the `data` field of the response. The same
+    Query can be executed by a blocking or an asyncio requester."""
+
+    query: str
+    """The GraphQL document (query or mutation) to send."""
+
+    variables: Mapping[str, Any]
+    """The variables referenced by the document."""
+
+    construct_object: Callable[[Mapping[str, Any]], T]
+    """Converts the `data` field of the GraphQL response into the result."""
+
+    signing_key: Optional[SigningKey] = None
+    """The key used to sign the request, for operations that require it."""
+
+    timeout: Optional[Timeout] = None
+    """The timeouts of the call, overriding those of the client."""
+
+    retry_check: Optional[Callable[[], "Query[Optional[T]]"]] = None
+    """For a mutation which can be retried, builds a query returning the result of an
+    earlier attempt which took effect, or None if the mutation can be sent again."""
@@ -0,0 +1,312 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import asyncio
+import functools
+import heapq
+import itertools
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Callable, Dict, Iterator, List, Mapping, Optional
+
+from lightspark.exceptions import LightsparkException, LightsparkTimeoutException
+
+# The key of the limit shared by all the operations.
+ALL_OPERATIONS = "*"
+
+
+class Priority(IntEnum):
+    """The priority class of a call. Calls waiting for the same limit are let through by
+    order of priority, then in the order they arrived."""
+
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+_priority: ContextVar[Priority] = ContextVar(
+    "lightspark_priority", default=Priority(Priority.INTERACTIVE)
+)
+
+
+@contextmanager
+def priority_scope(priority: Priority) -> Iterator[None]:
+    """Gives `priority` to the calls to the API made in the block, by this thread or
+    asyncio task."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+@dataclass(frozen=True)
+class OperationLimit:
+    """Limits the calls of an operation. None means no limit."""
+
+    rate: Optional[float] = None
+    """The number of calls per second, on average."""
+
+    burst: Optional[float] = None
+    """The number of calls which can be made at once after some time without any, by
+    default the `rate` or 1 if it is lower."""
+
+    max_in_flight: Optional[int] = None
+    """The number of calls waiting for their response at the same time."""
+
+
+@dataclass(frozen=True)
+class RateLimitStats:
+    """The calls which went through a limit, and how long they waited for it."""
+
+    calls: int
+    """The calls let through since the client was created."""
+
+    in_flight: int
+    """The calls let through which are waiting for their response."""
+
+    waiting: int
+    """The calls waiting to be let through."""
+
+    total_wait_secs: float
+    """The time spent waiting by the calls let through."""
+
+    max_wait_secs: float
+    """The longest time a call waited."""
+
+    @property
+    def mean_wait_secs(self) -> float:
+        return self.total_wait_secs / self.calls if self.calls else 0.0
+
+
+class _Waiter:
+    __slots__ = ("priority", "sequence", "wake")
+
+    def __init__(self, priority: Priority, sequence: int) -> None:
+        self.priority = priority
+        self.sequence = sequence
+        self.wake: Callable[[], object] = lambda: None
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.priority, self.sequence) < (other.priority, other.sequence)
+
+
+class _Governor:
+    """A token bucket and a count of the calls in flight, with the calls waiting for them
+    ordered by priority."""
+
+    def __init__(self, limit: OperationLimit) -> None:
+        self.rate = limit.rate
+        self.burst = (
+            limit.burst
+            if limit.burst is not None
+            else max(limit.rate, 1.0)
+            if limit.rate is not None
+            else 0.0
+        )
+        self.max_in_flight = limit.max_in_flight
+        self.lock = threading.Lock()
+        self.tokens = self.burst
+        self.refilled_at = time.monotonic()
+        self.in_flight = 0
+        self.waiters: List[_Waiter] = []
+        self.sequence = itertools.count()
+        self.calls = 0
+        self.total_wait_secs = 0.0
+        self.max_wait_secs = 0.0
+
+    def acquire(self, timeout: Optional[float]) -> None:
+        start = time.monotonic()
+        waiter = self._enqueue()
+        event = threading.Event()
+        waiter.wake = event.set
+        try:
+            while True:
+                with self.lock:
+                    wait = self._take(waiter, start)
+                    if wait is None:
+                        return
+                    event.clear()
+                event.wait(_bounded(wait, start, timeout))
+        except BaseException:
+            self._dequeue(waiter)
+            raise
+
+    async def acquire_async(self, timeout: Optional[float]) -> None:
+        start = time.monotonic()
+        loop = asyncio.get_running_loop()
+        waiter = self._enqueue()
+        try:
+            while True:
+                with self.lock:
+                    wait = self._take(waiter, start)
+                    if wait is None:
+                        return
+                    woken = loop.create_future()
+                    waiter.wake = functools.partial(
+                        loop.call_soon_threadsafe, _resolve, woken
+                    )
+                try:
+                    await asyncio.wait_for(woken, _bounded(wait, start, timeout))
+                except asyncio.TimeoutError:
+                    pass
+        except BaseException:
+            self._dequeue(waiter)
+            raise
+
+    def release(self) -> None:
+        with self.lock:
+            self.in_flight -= 1
+            self._wake_head()
+
+    def stats(self) -> RateLimitStats:
+        with self.lock:
+            return RateLimitStats(
+                calls=self.calls,
+                in_flight=self.in_flight,
+                waiting=len(self.waiters),
+                total_wait_secs=self.total_wait_secs,
+                max_wait_secs=self.max_wait_secs,
+            )
+
+    def _enqueue(self) -> _Waiter:
+        with self.lock:
+            waiter = _Waiter(_priority.get(), next(self.sequence))
+            heapq.heappush(self.waiters, waiter)
+            return waiter
+
+    def _dequeue(self, waiter: _Waiter) -> None:
+        with self.lock:
+            if waiter in self.waiters:
+                self.waiters.remove(waiter)
+                heapq.heapify(self.waiters)
+                self._wake_head()
+
+    def _take(self, waiter: _Waiter, start: float) -> Optional[float]:
+        """Lets `waiter` through if it is the first in line and the limits allow it, and
+        returns None. Otherwise returns how long it should wait before trying again."""
+        if self.waiters[0] is not waiter:
+            return math.inf
+        if self.max_in_flight is not None and self.in_flight >= self.max_in_flight:
+            return math.inf
+        now = time.monotonic()
+        if self.rate is not None:
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.refilled_at) * self.rate
+            )
+            self.refilled_at = now
+            if self.tokens < 1:
+                return (1 - self.tokens) / self.rate
+            self.tokens -= 1
+        heapq.heappop(self.waiters)
+        self.in_flight += 1
+        self.calls += 1
+        self.total_wait_secs += now - start
+        self.max_wait_secs = max(self.max_wait_secs, now - start)
+        self._wake_head()
+        return None
+
+    def _wake_head(self) -> None:
+        if self.waiters:
+            self.waiters[0].wake()
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def _bounded(wait: float, start: float, timeout: Optional[float]) -> Optional[float]:
+    if timeout is not None:
+        left = start + timeout - time.monotonic()
+        if left <= 0:
+            raise LightsparkTimeoutException(
+                "The deadline of the call passed while waiting for its rate limit."
+            )
+        wait = min(wait, left)
+    return None if wait == math.inf else wait
+
+
+class RateLimiter:
+    """Limits the rate and the concurrency of the calls to the API made by a client.
+
+    `limits` maps operation names, such as `PayInvoice`, to the limits of their calls,
+    and `ALL_OPERATIONS` to a limit shared by every call:
+
+        limiter = RateLimiter({
+            ALL_OPERATIONS: OperationLimit(rate=50),
+            "FetchAccountToTransactionsConnection": OperationLimit(max_in_flight=4),
+        })
+
+    Calls over a limit wait for it, interactive calls before batch ones. The deadline of
+    a call bounds its wait. Each HTTP request counts as a call, including retries.
+    """
+
+    def __init__(self, limits: Mapping[str, OperationLimit]) -> None:
+        for limit in limits.values():
+            if limit.rate is not None and limit.rate <= 0:
+                raise LightsparkException(
+                    "INVALID_RATE_LIMIT", "The rate of a limit must be positive."
+                )
+        self._governors = {
+            operation: _Governor(limit) for operation, limit in limits.items()
+        }
+
+    def _governors_of(self, operation: Optional[str]) -> List[_Governor]:
+        # The shared limit is taken last, so that calls waiting for the limit of their
+        # operation do not hold it.
+        governors = []
+        if operation is not None and operation in self._governors:
+            governors.append(self._governors[operation])
+        if ALL_OPERATIONS in self._governors:
+            governors.append(self._governors[ALL_OPERATIONS])
+        return governors
+
+    def acquire(
+        self, operation: Optional[str], timeout: Optional[float] = None
+    ) -> Callable[[], None]:
+        """Waits until a call of `operation` is allowed and returns the function to call
+        once its response is received."""
+        start = time.monotonic()
+        acquired: List[_Governor] = []
+        try:
+            for governor in self._governors_of(operation):
+                governor.acquire(_left(start, timeout))
+                acquired.append(governor)
+        except BaseException:
+            _release(acquired)
+            raise
+        return lambda: _release(acquired)
+
+    async def acquire_async(
+        self, operation: Optional[str], timeout: Optional[float] = None
+    ) -> Callable[[], None]:
+        start = time.monotonic()
+        acquired: List[_Governor] = []
+        try:
+            for governor in self._governors_of(operation):
+                await governor.acquire_async(_left(start, timeout))
+                acquired.append(governor)
+        except BaseException:
+            _release(acquired)
+            raise
+        return lambda: _release(acquired)
+
+    def stats(self) -> Dict[str, RateLimitStats]:
+        """Returns the statistics of each limit, by operation name."""
+        return {
+            operation: governor.stats()
+            for operation, governor in self._governors.items()
+        }
+
+
+def _left(start: float, timeout: Optional[float]) -> Optional[float]:
+    return None if timeout is None else start + timeout - time.monotonic()
+
+
+def _release(governors: List[_Governor]) -> None:
+    for governor in governors:
+        governor.release()
@@ -1,27 +1,49 @@
 # Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
 
-import json
 import logging
 import re
 import secrets
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from hashlib import sha256
 from platform import python_version, release, system
-from typing import Any, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Tuple, TypeVar, Union
 from urllib.parse import urlparse
 
 import requests
 from requests.auth import HTTPBasicAuth
 from requests.utils import default_user_agent
 
-from lightspark.exceptions import LightsparkException
-from lightspark.requests.encoder import Encoder
+from lightspark.exceptions import LightsparkException, LightsparkHTTPException
+from lightspark.requests.batch import QueryBatch
+from lightspark.requests.json_backend import JsonBackend, get_json_backend
+from lightspark.requests.pool import PoolConfig, PooledHTTPAdapter, PoolStats
+from lightspark.requests.query import Query
+from lightspark.requests.rate_limit import RateLimiter
+from lightspark.requests.retry import DEFAULT_RETRY_POLICY, Retrier, RetryPolicy
+from lightspark.requests.timeouts import Deadline, Timeout
+from lightspark.requests.transport import (
+    HttpxTransport,
+    RequestsTransport,
+    Transport,
+    TransportResponse,
+)
 from lightspark.utils.signing_key import SigningKey
 from lightspark.version import __version__
 
+if TYPE_CHECKING:
+    from lightspark.entity_cache import EntityCache
+
 DEFAULT_BASE_URL = "https://api.lightspark.com/graphql/server/2023-09-13"
 
 logger = logging.getLogger("lightspark")
 
+T = TypeVar("T")
+
+# The type and the name of the operation of a GraphQL document.
+_OPERATION = re.compile(r"\s*(query|mutation)\s+(\w+)", re.IGNORECASE)
+
 
 class Requester:
     def __init__(
@@ -30,28 +52,278 @@ class Requester:
         api_token_client_secret: str,
         base_url: Optional[str] = None,
         http_host: Optional[str] = None,
+        persisted_queries: bool = False,
+        raw: bool = False,
+        json_backend: Union[str, JsonBackend, None] = None,
+        pool_config: Optional[PoolConfig] = None,
+        transport: Union[str, Transport, None] = None,
+        timeout: Optional[Timeout] = None,
+        retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+        rate_limiter: Optional[RateLimiter] = None,
     ) -> None:
         self.base_url = base_url or DEFAULT_BASE_URL
+        # The timeouts of the calls whose query and `timeout_scope` do not set them.
+        self.timeout = timeout
+        self.retrier = Retrier(retry_policy) if retry_policy is not None else None
+        self.rate_limiter = rate_limiter
+        self.persisted_queries = persisted_queries
+        self.json_backend = (
+            json_backend
+            if isinstance(json_backend, JsonBackend)
+            else get_json_backend(json_backend)
+        )
+        # Whether `execute_query` returns the `data` of the response instead of building
+        # the result of the query from it.
+        self.raw = raw
+        self.entity_cache: Optional["EntityCache"] = None
         self.graphql_session = requests.Session()
         self.graphql_session.auth = HTTPBasicAuth(
             api_token_client_id, api_token_client_secret
         )
 
+        self.pool_config = pool_config or PoolConfig()
+        self.graphql_session.mount(
+            "https://",
+            HTTPSAdapter(http_host, pool_config=self.pool_config)
+            if http_host
+            else PooledHTTPAdapter(pool_config=self.pool_config),
+        )
+        self.graphql_session.mount(
+            "http://", PooledHTTPAdapter(pool_config=self.pool_config)
+        )
         if http_host:
-            self.graphql_session.mount("https://", HTTPSAdapter(http_host))
             self.graphql_session.headers.update({"Host": http_host})
 
+        if transport is None or transport == "http1":
+            self.transport: Transport = RequestsTransport(self.graphql_session)
+        elif transport == "http2":
+            self.transport = HttpxTransport(
+                auth=(api_token_client_id, api_token_client_secret),
+                http2=True,
+                http_host=http_host,
+                pool_config=self.pool_config,
+            )
+        elif isinstance(transport, Transport):
+            self.transport = transport
+        else:
+            raise LightsparkException(
+                "UNKNOWN_TRANSPORT",
+                f"Unknown transport {transport}. Expected http1, http2 or a Transport.",
+            )
+
     def execute_graphql(
         self,
         query: str,
         variables: Optional[Mapping[str, Any]],
         signing_key: Optional[SigningKey] = None,
+        timeout: Optional[Timeout] = None,
     ) -> Mapping[str, Any]:
-        operation = re.match(r"\s*(?:query|mutation)\s+(\w+)", query, re.IGNORECASE)
-        payload = json.dumps(
+        deadline = Deadline.start(timeout, self.timeout)
+        if self.retrier is not None:
+            self.retrier.record_call()
+        return self._execute_graphql_retried(query, variables, signing_key, deadline)
+
+    def _execute_graphql_retried(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey],
+        deadline: Deadline,
+    ) -> Mapping[str, Any]:
+        attempt = 0
+        while True:
+            try:
+                return self._execute_graphql_once(
+                    query, variables, signing_key, deadline
+                )
+            except LightsparkException as e:
+                delay = self._retry_delay(query, e, attempt, deadline)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    def _execute_graphql_once(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey],
+        deadline: Deadline,
+    ) -> Mapping[str, Any]:
+        r = None
+        if self.persisted_queries:
+            r = self._post(query, variables, signing_key, False, deadline)
+            if self._should_resend_document(r.status_code, r.content):
+                r = None
+        if r is None:
+            r = self._post(query, variables, signing_key, True, deadline)
+        return self._handle_response(r)
+
+    def _handle_response(self, r: TransportResponse) -> Mapping[str, Any]:
+        if r.status_code >= 400:
+            logger.error("HTTP request error. Status code: %d", r.status_code)
+            raise LightsparkHTTPException(
+                r.status_code, f"{r.status_code} Error for url: {self.base_url}"
+            )
+        try:
+            return self._parse_result(self.json_backend.loads(r.content))
+        except Exception as e:
+            logger.exception(e)
+            logger.error(r.text)
+            raise e
+
+    def _post(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey],
+        send_document: bool,
+        deadline: Deadline,
+    ) -> TransportResponse:
+        payload, headers = self._build_request(
+            query, variables, signing_key, send_document
+        )
+        logger.debug(
+            "Sending request to GraphQL with query = %s, payload = %s}", query, payload
+        )
+        if self.rate_limiter is None:
+            return self.transport.post(
+                self.base_url, payload, headers, deadline.remaining()
+            )
+        release_permits = self.rate_limiter.acquire(
+            headers["X-GraphQL-Operation"], deadline.time_left()
+        )
+        try:
+            return self.transport.post(
+                self.base_url, payload, headers, deadline.remaining()
+            )
+        finally:
+            release_permits()
+
+    def _retry_delay(
+        self,
+        query: Optional[str],
+        error: Exception,
+        attempt: int,
+        deadline: Optional[Deadline] = None,
+    ) -> Optional[float]:
+        """How long to wait before retrying a call which failed with `error`, or None if
+        it is not retried. Only queries are retried, unless `query` is None because the
+        caller made sure that retrying is safe."""
+        if self.retrier is None:
+            return None
+        if query is not None:
+            operation = _OPERATION.match(query)
+            if operation is None or operation.group(1).lower() != "query":
+                return None
+        delay = self.retrier.delay(error, attempt, deadline)
+        if delay is not None:
+            logger.warning(
+                "Retrying a call to the API in %.3fs after an error: %s", delay, error
+            )
+        return delay
+
+    def execute_query(self, query: Query[T]) -> T:
+        if query.retry_check is not None and not self.raw:
+            return self._execute_checked_mutation(query)
+        data = self.execute_graphql(
+            query.query, query.variables, query.signing_key, query.timeout
+        )
+        if self.raw:
+            return data  # pyre-ignore[7]
+        return query.construct_object(data)
+
+    async def execute_graphql_async(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey] = None,
+        timeout: Optional[Timeout] = None,
+    ) -> Mapping[str, Any]:
+        raise LightsparkException(
+            "ASYNC_NOT_SUPPORTED",
+            "This requester only supports blocking calls. Use a LightsparkAsyncClient"
+            + " to make asynchronous requests.",
+        )
+
+    def _execute_checked_mutation(self, query: Query[T]) -> T:
+        # The checks made between the attempts are part of the call: they share its
+        # deadline and are not counted as calls in the retry budget.
+        deadline = Deadline.start(query.timeout, self.timeout)
+        if self.retrier is not None:
+            self.retrier.record_call()
+        attempt = 0
+        while True:
+            try:
+                return query.construct_object(
+                    self._execute_graphql_once(
+                        query.query, query.variables, query.signing_key, deadline
+                    )
+                )
+            except LightsparkException as e:
+                delay = self._retry_delay(None, e, attempt, deadline)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                check = query.retry_check()  # pyre-ignore[29]
+                previous = check.construct_object(
+                    self._execute_graphql_retried(
+                        check.query, check.variables, check.signing_key, deadline
+                    )
+                )
+                if previous is not None:
+                    return previous
+            attempt += 1
+
+    async def execute_query_async(self, query: Query[T]) -> T:
+        if query.retry_check is not None and not self.raw:
+            return await self._execute_checked_mutation_async(query)
+        data = await self.execute_graphql_async(
+            query.query, query.variables, query.signing_key, query.timeout
+        )
+        if self.raw:
+            return data  # pyre-ignore[7]
+        return query.construct_object(data)
+
+    async def _execute_checked_mutation_async(self, query: Query[T]) -> T:
+        return query.construct_object(
+            await self.execute_graphql_async(
+                query.query, query.variables, query.signing_key, query.timeout
+            )
+        )
+
+    def batch(self) -> QueryBatch:
+        """Returns a QueryBatch which sends the queries added to it as a single request."""
+        return QueryBatch(self)
+
+    def pool_stats(self) -> PoolStats:
+        """Returns the current state of the pools of connections to the API."""
+        stats = PoolStats(in_use=0, idle=0, created=0, reused=0)
+        for adapter in self.graphql_session.adapters.values():
+            if isinstance(adapter, PooledHTTPAdapter):
+                stats += adapter.pool_stats()
+        return stats
+
+    def _build_request(
+        self,
+        query: str,
+        variables: Optional[Mapping[str, Any]],
+        signing_key: Optional[SigningKey],
+        send_document: bool = True,
+    ) -> Tuple[bytes, Dict[str, Any]]:
+        operation = _OPERATION.match(query)
+        body: Dict[str, Any] = {
+            "operationName": operation.group(2) if operation else None,
+        }
+        if send_document:
+            body["query"] = query
+        if self.persisted_queries:
+            body["extensions"] = {
+                "persistedQuery": {"version": 1, "sha256Hash": document_sha256(query)}
+            }
+        payload = self.json_backend.dumps(
             {
-                "operationName": operation.group(1) if operation else None,
-                "query": query,
+                **body,
                 "variables": variables or {},
                 "nonce": secrets.randbits(64) if signing_key else None,
                 "expires_at": (datetime.utcnow() + timedelta(hours=1))
@@ -59,61 +331,83 @@ class Requester:
                 .isoformat()
                 if signing_key
                 else None,
-            },
-            cls=Encoder,
-        ).encode("utf8")
+            }
+        )
 
         signing = signing_key.sign_payload(payload) if signing_key else None
 
         user_agent = self.user_agent_string()
-        logger.debug(
-            "Sending request to GraphQL with query = %s, payload = %s}", query, payload
-        )
-        r = self.graphql_session.post(
-            url=self.base_url,
-            data=payload,
-            headers={
-                "Content-Type": "application/json",
-                "X-GraphQL-Operation": operation.group(1) if operation else None,
-                "X-Lightspark-Signing": signing,
-                "User-Agent": user_agent + f" {default_user_agent()}",
-                "X-Lightspark-SDK": user_agent,
-            },
-        )
+        headers = {
+            "Content-Type": "application/json",
+            "X-GraphQL-Operation": operation.group(2) if operation else None,
+            "X-Lightspark-Signing": signing,
+            "User-Agent": user_agent + f" {default_user_agent()}",
+            "X-Lightspark-SDK": user_agent,
+        }
+        return payload, headers
+
+    def _should_resend_document(self, status_code: int, content: bytes) -> bool:
+        """Whether the response to a request sent with only the hash of its document
+        asks for the full document, as described by the automatic persisted queries
+        protocol. Servers which do not support the protocol disable it."""
+        if status_code not in (200, 400) or b"PersistedQuery" not in content:
+            return False
         try:
-            r.raise_for_status()
-            result = r.json()
-            if "errors" in result:
-                errors = result["errors"]
-                raise LightsparkException(
-                    "GRAPHQL_ERROR", f"A GraphQL error occurred: {errors}"
-                )  # TODO better error handling
-            return result["data"]
-        except requests.HTTPError as e:
-            logger.error("HTTP request error. Status code: %d", r.status_code)
-            raise LightsparkException("HTTP_ERROR", str(e)) from e
-        except Exception as e:
-            logger.exception(e)
+            errors = self.json_backend.loads(content).get("errors") or []
+        except ValueError:
+            return False
+        codes = {
+            error.get("extensions", {}).get("code") or error.get("message")
+            for error in errors
+        }
+        if codes & {"PERSISTED_QUERY_NOT_SUPPORTED", "PersistedQueryNotSupported"}:
+            logger.warning("The server does not support persisted queries.")
+            self.persisted_queries = False
+            return True
+        return bool(codes & {"PERSISTED_QUERY_NOT_FOUND", "PersistedQueryNotFound"})
 
-            try:
-                logger.error(r.text)
-            # TODO pylint is right here... let's make it better.
-            except Exception:  # pylint: disable=broad-except
-                pass
-            raise e
+    def _parse_result(self, result: Mapping[str, Any]) -> Mapping[str, Any]:
+        if "errors" in result:
+            errors = result["errors"]
+            raise LightsparkException(
+                "GRAPHQL_ERROR", f"A GraphQL error occurred: {errors}"
+            )  # TODO better error handling
+        return result["data"]
 
     def user_agent_string(self):
         # Will produce something like: 	lightspark-python-sdk/0.5.1 python/3.11.2 Darwin/22.1.0
         return f"lightspark-python-sdk/{__version__} python/{python_version()} {system()}/{release()}"
 
 
-class HTTPSAdapter(requests.adapters.HTTPAdapter):
-    def __init__(self, server_hostname: str, *args, **kwargs):
+@lru_cache(maxsize=1024)
+def document_sha256(document: str) -> str:
+    """The hash identifying a document in the automatic persisted queries protocol.
+    Documents are mostly module-level constants, so each hash is computed once."""
+    return sha256(document.encode("utf8")).hexdigest()
+
+
+class HTTPSAdapter(PooledHTTPAdapter):
+    def __init__(
+        self,
+        server_hostname: str,
+        *args: Any,
+        pool_config: Optional[PoolConfig] = None,
+        **kwargs: Any,
+    ) -> None:
         self.server_hostname = server_hostname
-        super().__init__(*args, **kwargs)
+        super().__init__(*args, pool_config=pool_config, **kwargs)
 
     def get_connection(self, url, proxies=None):
         url = urlparse(url).geturl()
         return self.poolmanager.connection_from_url(
             url, pool_kwargs={"server_hostname": self.server_hostname}
         )
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        # Recent versions of requests get their connections from the pool keyed by
+        # these attributes instead of calling `get_connection`.
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(
+            request, verify, cert
+        )
+        pool_kwargs["server_hostname"] = self.server_hostname
+        return host_params, pool_kwargs
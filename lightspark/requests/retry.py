@@ -0,0 +1,96 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import FrozenSet, Optional
+
+from lightspark.exceptions import LightsparkConnectionException, LightsparkHTTPException
+from lightspark.requests.timeouts import Deadline
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How the calls to the API which fail with a transient error are retried.
+
+    Queries are retried when the API responds with one of `retry_statuses`, or when the
+    connection fails or is reset. Mutations are only retried when the client can check
+    that the failed attempt had no effect, such as `pay_invoice` finding no payment for
+    its invoice. Timeouts are never retried.
+
+    The attempts are spaced by an exponential backoff, of which `jitter` is randomized so
+    that clients failing together do not retry together. Each retry also spends a token
+    of a budget shared by the calls of the client, which every call refills by
+    `budget_ratio`, so that an outage does not multiply the load on the API.
+    """
+
+    max_attempts: int = 3
+    """The number of attempts of a call, including the first one."""
+
+    initial_backoff_secs: float = 0.1
+    """The wait before the first retry."""
+
+    max_backoff_secs: float = 2.0
+    """The longest wait between two attempts."""
+
+    multiplier: float = 2.0
+    """The factor applied to the wait after each attempt."""
+
+    jitter: float = 1.0
+    """The fraction of each wait which is random, between 0 and 1."""
+
+    retry_statuses: FrozenSet[int] = frozenset({502, 503, 504})
+    """The HTTP statuses which are retried."""
+
+    budget_ratio: float = 0.1
+    """The number of retries earned by each call."""
+
+    budget_max_tokens: float = 10.0
+    """The number of retries which can be spent in a row."""
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+class Retrier:
+    """Decides whether the failed attempts of the calls of a requester are retried, and
+    holds their retry budget."""
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        self.policy = policy
+        self._lock = threading.Lock()
+        self._tokens = policy.budget_max_tokens
+
+    def record_call(self) -> None:
+        with self._lock:
+            self._tokens = min(
+                self._tokens + self.policy.budget_ratio, self.policy.budget_max_tokens
+            )
+
+    def delay(
+        self, error: Exception, attempt: int, deadline: Optional[Deadline] = None
+    ) -> Optional[float]:
+        """Returns how long to wait before retrying a call whose `attempt`-th attempt,
+        counted from 0, failed with `error`, or None if the call is not retried."""
+        policy = self.policy
+        if attempt + 1 >= policy.max_attempts or not self.is_transient(error):
+            return None
+        backoff = min(
+            policy.initial_backoff_secs * policy.multiplier**attempt,
+            policy.max_backoff_secs,
+        )
+        delay = backoff * (1 - policy.jitter * random.random())
+        expires_at = deadline.expires_at if deadline is not None else None
+        if expires_at is not None and time.monotonic() + delay >= expires_at:
+            return None
+        with self._lock:
+            if self._tokens < 1:
+                return None
+            self._tokens -= 1
+        return delay
+
+    def is_transient(self, error: Exception) -> bool:
+        if isinstance(error, LightsparkHTTPException):
+            return error.status_code in self.policy.retry_statuses
+        return isinstance(error, LightsparkConnectionException)
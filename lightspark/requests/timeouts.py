@@ -0,0 +1,118 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple
+
+from lightspark.exceptions import LightsparkTimeoutException
+
+
+@dataclass(frozen=True)
+class Timeout:
+    """The timeouts of a call to the API, in seconds. None means no timeout.
+
+    `connect` bounds the time to open a connection, and `read` the time waiting for each
+    part of the response. `total` bounds the whole call, including the request sent
+    again with its document when the server does not know a persisted query.
+    """
+
+    connect: Optional[float] = None
+    read: Optional[float] = None
+    total: Optional[float] = None
+
+    def or_else(self, fallback: Optional["Timeout"]) -> "Timeout":
+        """Returns these timeouts, with the ones which are not set taken from `fallback`."""
+        if fallback is None:
+            return self
+        return Timeout(
+            connect=self.connect if self.connect is not None else fallback.connect,
+            read=self.read if self.read is not None else fallback.read,
+            total=self.total if self.total is not None else fallback.total,
+        )
+
+
+# The timeouts set with `timeout_scope`, and the time at which the total one expires.
+_scope: ContextVar[Tuple[Timeout, Optional[float]]] = ContextVar(
+    "lightspark_timeout_scope"
+)
+
+
+@contextmanager
+def timeout_scope(timeout: Timeout) -> Iterator[None]:
+    """Applies `timeout` to the calls to the API made in the block, by this thread or
+    asyncio task. The total timeout is a deadline for all the calls of the block rather
+    than for each of them. Nested scopes cannot extend the deadline of outer ones."""
+    outer = _scope.get(None)
+    expires_at = time.monotonic() + timeout.total if timeout.total is not None else None
+    if outer is not None:
+        timeout = timeout.or_else(outer[0])
+        expires_at = _earliest(expires_at, outer[1])
+    token = _scope.set((timeout, expires_at))
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+class Deadline:
+    """The timeouts of a single call to the API, started when the call is."""
+
+    __slots__ = ("connect", "read", "expires_at")
+
+    def __init__(
+        self,
+        connect: Optional[float],
+        read: Optional[float],
+        expires_at: Optional[float],
+    ) -> None:
+        self.connect = connect
+        self.read = read
+        self.expires_at = expires_at
+
+    @classmethod
+    def start(
+        cls, timeout: Optional[Timeout], default: Optional[Timeout]
+    ) -> "Deadline":
+        """The deadline of a call with the timeouts of its query, those of the current
+        `timeout_scope` and the default timeouts of the client, in this order."""
+        scope = _scope.get(None)
+        query = timeout or Timeout()
+        resolved = query.or_else(scope[0] if scope else None).or_else(default)
+        total = query.or_else(default).total
+        expires_at = time.monotonic() + total if total is not None else None
+        if scope is not None:
+            expires_at = _earliest(expires_at, scope[1])
+        return cls(resolved.connect, resolved.read, expires_at)
+
+    def time_left(self) -> Optional[float]:
+        if self.expires_at is None:
+            return None
+        return self.expires_at - time.monotonic()
+
+    def remaining(self) -> Optional[Timeout]:
+        """The timeouts of the next request of the call, whose `total` is the time left.
+
+        Raises LightsparkTimeoutException once the deadline has passed.
+        """
+        if self.expires_at is None:
+            if self.connect is None and self.read is None:
+                return None
+            return Timeout(connect=self.connect, read=self.read)
+        left = self.expires_at - time.monotonic()
+        if left <= 0:
+            raise LightsparkTimeoutException("The deadline of the call has passed.")
+        return Timeout(
+            connect=_earliest(self.connect, left),
+            read=_earliest(self.read, left),
+            total=left,
+        )
+
+
+def _earliest(first: Optional[float], second: Optional[float]) -> Optional[float]:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return min(first, second)
@@ -0,0 +1,327 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import asyncio
+import ssl
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Union, cast
+
+import requests
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+from lightspark.exceptions import (
+    LightsparkConnectionException,
+    LightsparkException,
+    LightsparkTimeoutException,
+)
+from lightspark.requests.pool import PoolConfig
+from lightspark.requests.timeouts import Timeout
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+class TransportResponse:
+    """The status, headers and body of the response to a request sent by a `Transport`."""
+
+    __slots__ = ("status_code", "headers", "content")
+
+    def __init__(
+        self, status_code: int, headers: Mapping[str, str], content: bytes
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf8", errors="replace")
+
+
+class Transport(ABC):
+    """Sends the GraphQL requests of a `Requester` over HTTP.
+
+    The payload is sent as is, since the `X-Lightspark-Signing` header holds its
+    signature. Headers whose value is None are left out. A transport authenticates its
+    requests itself, with the API token it was created with.
+
+    `timeout` holds the connect and read timeouts of the request, and as `total` the time
+    left before the deadline of the call. A transport raises LightsparkTimeoutException
+    when one of them expires, and LightsparkConnectionException when the connection
+    fails or is closed before the response is received.
+    """
+
+    # Whether `post_async` is implemented.
+    supports_async = False
+
+    @abstractmethod
+    def post(
+        self,
+        url: str,
+        payload: bytes,
+        headers: Mapping[str, Optional[str]],
+        timeout: Optional[Timeout] = None,
+    ) -> TransportResponse:
+        pass
+
+    async def post_async(
+        self,
+        url: str,
+        payload: bytes,
+        headers: Mapping[str, Optional[str]],
+        timeout: Optional[Timeout] = None,
+    ) -> TransportResponse:
+        raise LightsparkException(
+            "ASYNC_NOT_SUPPORTED",
+            f"{type(self).__name__} only supports blocking requests.",
+        )
+
+    def close(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        self.close()
+
+
+class RequestsTransport(Transport):
+    """Sends requests over HTTP/1.1 with a `requests.Session`, whose adapters keep a pool
+    of connections open to the API. This is the default transport."""
+
+    def __init__(self, session: requests.Session) -> None:
+        self.session = session
+
+    def post(
+        self,
+        url: str,
+        payload: bytes,
+        headers: Mapping[str, Optional[str]],
+        timeout: Optional[Timeout] = None,
+    ) -> TransportResponse:
+        try:
+            if timeout is None:
+                r = self.session.post(url=url, data=payload, headers=headers)
+                return TransportResponse(r.status_code, r.headers, r.content)
+            expires_at = _expires_at(timeout)
+            r = self.session.post(
+                url=url,
+                data=payload,
+                headers=headers,
+                # requests accepts None for either timeout, which its stubs do not.
+                timeout=cast(Tuple[float, float], (timeout.connect, timeout.read)),
+                stream=True,
+            )
+            with r:
+                content = _read_before(_body_chunks(r), expires_at)
+                return TransportResponse(r.status_code, r.headers, content)
+        except (requests.Timeout, ReadTimeoutError) as e:
+            raise LightsparkTimeoutException(str(e)) from e
+        except requests.ConnectionError as e:
+            # requests reports the read timeouts of the body as connection errors.
+            if e.args and isinstance(e.args[0], ReadTimeoutError):
+                raise LightsparkTimeoutException(str(e)) from e
+            raise LightsparkConnectionException(str(e)) from e
+        except (requests.exceptions.ChunkedEncodingError, ProtocolError) as e:
+            raise LightsparkConnectionException(str(e)) from e
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class HttpxTransport(Transport):
+    """Sends requests with httpx, which supports both blocking and asyncio callers.
+
+    With `http2=True`, the requests to the API are multiplexed as concurrent streams over
+    a few HTTP/2 connections instead of taking a connection each, which requires the h2
+    package (`pip install lightspark[http2]`). HTTP/1.1 is still used with servers which
+    do not negotiate HTTP/2, unless `http1` is False, in which case HTTP/2 is also spoken
+    without TLS.
+
+    Like `http_host` for the `requests` session, the `Host` header and the TLS server
+    name of the requests can be overridden with `http_host`. `verify` is passed to httpx.
+    """
+
+    supports_async = True
+
+    def __init__(
+        self,
+        auth: Optional[Tuple[str, str]] = None,
+        http2: bool = True,
+        http1: bool = True,
+        http_host: Optional[str] = None,
+        pool_config: Optional[PoolConfig] = None,
+        verify: Union[bool, ssl.SSLContext] = True,
+    ) -> None:
+        if httpx is None:
+            raise LightsparkException(
+                "MISSING_DEPENDENCY",
+                "The httpx transport requires the httpx package. Please install it"
+                + " with `pip install lightspark[http2]`.",
+            )
+        self._options: Dict[str, Any] = {
+            "auth": auth,
+            "http1": http1,
+            "http2": http2,
+            "headers": {"Host": http_host} if http_host else None,
+            "limits": httpx_limits(pool_config or PoolConfig()),
+            "verify": verify,
+            # Like the `requests` session, let the server decide when to give up.
+            "timeout": None,
+        }
+        self._extensions = {"sni_hostname": http_host} if http_host else None
+        self._lock = threading.Lock()
+        self._client: Optional["httpx.Client"] = None
+        self._async_client: Optional["httpx.AsyncClient"] = None
+        # Fail now rather than on the first request when h2 is missing.
+        self.client()
+
+    def client(self) -> "httpx.Client":
+        with self._lock:
+            if self._client is None:
+                self._client = self._create(httpx.Client)
+            return self._client
+
+    def async_client(self) -> "httpx.AsyncClient":
+        with self._lock:
+            if self._async_client is None:
+                self._async_client = self._create(httpx.AsyncClient)
+            return self._async_client
+
+    def _create(self, client_class: Any) -> Any:
+        try:
+            return client_class(**self._options)
+        except ImportError as e:
+            raise LightsparkException(
+                "MISSING_DEPENDENCY",
+                "HTTP/2 requires the h2 package. Please install it with"
+                + " `pip install lightspark[http2]`.",
+            ) from e
+
+    def post(
+        self,
+        url: str,
+        payload: bytes,
+        headers: Mapping[str, Optional[str]],
+        timeout: Optional[Timeout] = None,
+    ) -> TransportResponse:
+        expires_at = _expires_at(timeout)
+        try:
+            with self.client().stream(
+                "POST",
+                url=url,
+                content=payload,
+                headers={
+                    key: value for key, value in headers.items() if value is not None
+                },
+                extensions=self._extensions,
+                timeout=httpx_timeout(timeout),
+            ) as r:
+                content = _read_before(r.iter_bytes(), expires_at)
+                return TransportResponse(r.status_code, r.headers, content)
+        except httpx.TimeoutException as e:
+            raise LightsparkTimeoutException(str(e)) from e
+        except httpx.TransportError as e:
+            raise LightsparkConnectionException(str(e)) from e
+
+    async def post_async(
+        self,
+        url: str,
+        payload: bytes,
+        headers: Mapping[str, Optional[str]],
+        timeout: Optional[Timeout] = None,
+    ) -> TransportResponse:
+        return await post_httpx_async(
+            self.async_client(),
+            url=url,
+            content=payload,
+            headers={key: value for key, value in headers.items() if value is not None},
+            extensions=self._extensions,
+            timeout=timeout,
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        with self._lock:
+            async_client, self._async_client = self._async_client, None
+        if async_client is not None:
+            await async_client.aclose()
+        self.close()
+
+
+def httpx_limits(pool_config: PoolConfig) -> "httpx.Limits":
+    # httpx pools the connections to all the hosts together, and always waits for a
+    # connection to be released once its limit is reached.
+    return httpx.Limits(
+        max_connections=pool_config.max_hosts * pool_config.max_connections_per_host
+        if pool_config.block
+        else None,
+        max_keepalive_connections=pool_config.max_connections_per_host,
+        keepalive_expiry=pool_config.idle_timeout_secs,
+    )
+
+
+def httpx_timeout(timeout: Optional[Timeout]) -> "httpx.Timeout":
+    if timeout is None:
+        return httpx.Timeout(None)
+    return httpx.Timeout(
+        connect=timeout.connect,
+        read=timeout.read,
+        write=timeout.read,
+        pool=timeout.total,
+    )
+
+
+async def post_httpx_async(
+    client: "httpx.AsyncClient",
+    timeout: Optional[Timeout],
+    **kwargs: Any,
+) -> TransportResponse:
+    """Sends a POST request with an httpx client, which on asyncio can be cancelled once
+    the total timeout expires."""
+    try:
+        request = client.post(timeout=httpx_timeout(timeout), **kwargs)
+        if timeout is not None and timeout.total is not None:
+            r = await asyncio.wait_for(request, timeout.total)
+        else:
+            r = await request
+    except asyncio.TimeoutError as e:
+        raise LightsparkTimeoutException("The call timed out.") from e
+    except httpx.TimeoutException as e:
+        raise LightsparkTimeoutException(str(e)) from e
+    except httpx.TransportError as e:
+        raise LightsparkConnectionException(str(e)) from e
+    return TransportResponse(r.status_code, r.headers, r.content)
+
+
+def _expires_at(timeout: Optional[Timeout]) -> Optional[float]:
+    if timeout is None or timeout.total is None:
+        return None
+    return time.monotonic() + timeout.total
+
+
+def _body_chunks(response: requests.Response) -> Iterable[bytes]:
+    # The `read1` of urllib3 2 returns the body as it arrives, where `iter_content` waits
+    # for whole chunks.
+    read1 = getattr(response.raw, "read1", None)
+    if read1 is None:
+        return response.iter_content(chunk_size=65536)
+    return iter(lambda: read1(65536, decode_content=True), b"")
+
+
+def _read_before(chunks: Iterable[bytes], expires_at: Optional[float]) -> bytes:
+    # Each read is bounded by the read timeout, and the time left is checked after each.
+    content = []
+    for chunk in chunks:
+        content.append(chunk)
+        if expires_at is not None and time.monotonic() > expires_at:
+            raise LightsparkTimeoutException(
+                "The deadline of the call passed while reading the response."
+            )
+    return b"".join(content)
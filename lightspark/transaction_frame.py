@@ -0,0 +1,279 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import re
+from array import array
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+from lightspark.exceptions import LightsparkException
+from lightspark.objects.Account import Account
+from lightspark.objects.TransactionStatus import TransactionStatus
+from lightspark.objects.Wallet import Wallet
+from lightspark.utils.currency_amount import MSATS_PER_UNIT
+from lightspark.utils.timestamps import (
+    MICROSECOND,
+    epoch_micros,
+    from_epoch_micros,
+    to_epoch_micros,
+)
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+_STATUSES = list(TransactionStatus)
+_STATUS_CODES = {status.value: code for code, status in enumerate(_STATUSES)}
+_FUTURE_STATUS_CODE = _STATUS_CODES[TransactionStatus.___FUTURE_VALUE___.value]
+_MSATS_PER_UNIT = {unit.value: msats for unit, msats in MSATS_PER_UNIT.items()}
+
+# The columns which can be summed.
+NUMERIC_COLUMNS = ("amount_msats", "fees_msats", "created_at")
+
+GroupBy = Union[str, timedelta]
+
+
+@lru_cache(maxsize=None)
+def _prefix(typename: str) -> str:
+    """The prefix of the fields of an object in the GraphQL fragments, e.g.
+    `outgoing_payment` for `OutgoingPayment`."""
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", typename).lower()
+
+
+def _msats(amount: Optional[Mapping[str, Any]]) -> int:
+    if not amount:
+        return 0
+    unit = amount["currency_amount_original_unit"]
+    msats_per_unit = _MSATS_PER_UNIT.get(unit)
+    if msats_per_unit is None:
+        raise LightsparkException(
+            "UNEXPECTED_CURRENCY", f"Expect a bitcoin currency unit, but found {unit}"
+        )
+    return amount["currency_amount_original_value"] * msats_per_unit
+
+
+class TransactionFrame:
+    """The transactions of a connection stored column by column.
+
+    The frame is built from the JSON returned by the API without creating any
+    `Transaction` object. Amounts and fees are stored in millisatoshis (0 for transactions
+    without fees), creation dates in microseconds since the epoch, and statuses and
+    typenames as small integer codes, all in `array` buffers. Filters and aggregations
+    are vectorized with NumPy when it is installed, and computed in Python otherwise.
+    """
+
+    def __init__(self) -> None:
+        self.ids: List[str] = []
+        self.typenames: List[str] = []
+        """The typenames which `typename_codes` refer to."""
+        self.typename_codes = array("b")
+        self.status_codes = array("b")
+        self.created_at = array("q")
+        self.amount_msats = array("q")
+        self.fees_msats = array("q")
+        self._typename_codes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_json(cls, entities: Iterable[Mapping[str, Any]]) -> "TransactionFrame":
+        return cls().extend(entities)
+
+    @classmethod
+    def fetch(
+        cls,
+        owner: Union[Account, Wallet],
+        page_size: int = 500,
+        **filters: Any,
+    ) -> "TransactionFrame":
+        """Fetches every page of the transactions of an account or a wallet into a frame.
+        `filters` are other arguments of the `get_transactions` method of the owner."""
+        frame = cls()
+        after: Optional[str] = None
+        while True:
+            query = owner.get_transactions_query(
+                first=page_size, after=after, **filters
+            )
+            data = owner.requester.execute_graphql(
+                query.query, query.variables, query.signing_key
+            )
+            connection = data["entity"]["transactions"]
+            prefix = _prefix(connection["__typename"])
+            frame.extend(connection[f"{prefix}_entities"])
+            page_info = connection[f"{prefix}_page_info"]
+            if (
+                not page_info["page_info_has_next_page"]
+                or not page_info["page_info_end_cursor"]
+                or page_info["page_info_end_cursor"] == after
+            ):
+                return frame
+            after = page_info["page_info_end_cursor"]
+
+    def extend(self, entities: Iterable[Mapping[str, Any]]) -> "TransactionFrame":
+        for obj in entities:
+            typename = obj["__typename"]
+            prefix = _prefix(typename)
+            self.ids.append(obj[f"{prefix}_id"])
+            self.typename_codes.append(self._typename_code(typename))
+            self.status_codes.append(
+                _STATUS_CODES.get(obj[f"{prefix}_status"], _FUTURE_STATUS_CODE)
+            )
+            self.created_at.append(epoch_micros(obj[f"{prefix}_created_at"]))
+            self.amount_msats.append(_msats(obj[f"{prefix}_amount"]))
+            self.fees_msats.append(_msats(obj.get(f"{prefix}_fees")))
+        return self
+
+    def _typename_code(self, typename: str) -> int:
+        code = self._typename_codes.get(typename)
+        if code is None:
+            code = len(self.typenames)
+            self.typenames.append(typename)
+            self._typename_codes[typename] = code
+        return code
+
+    def filter(
+        self,
+        statuses: Optional[Sequence[TransactionStatus]] = None,
+        typenames: Optional[Sequence[str]] = None,
+        after_date: Optional[datetime] = None,
+        before_date: Optional[datetime] = None,
+    ) -> "TransactionFrame":
+        """Returns the transactions with one of the given statuses and typenames, created
+        in [`after_date`, `before_date`)."""
+        status_codes = (
+            None
+            if statuses is None
+            else [_STATUS_CODES[status.value] for status in statuses]
+        )
+        typename_codes = (
+            None
+            if typenames is None
+            else [
+                self._typename_codes[t] for t in typenames if t in self._typename_codes
+            ]
+        )
+        after = None if after_date is None else to_epoch_micros(after_date)
+        before = None if before_date is None else to_epoch_micros(before_date)
+
+        if numpy is not None:
+            mask = numpy.ones(len(self), dtype=bool)
+            if status_codes is not None:
+                mask &= numpy.isin(self._column("status_codes"), status_codes)
+            if typename_codes is not None:
+                mask &= numpy.isin(self._column("typename_codes"), typename_codes)
+            if after is not None:
+                mask &= self._column("created_at") >= after
+            if before is not None:
+                mask &= self._column("created_at") < before
+            return self._take(numpy.flatnonzero(mask))
+
+        status_set = None if status_codes is None else set(status_codes)
+        typename_set = None if typename_codes is None else set(typename_codes)
+        return self._take(
+            [
+                i
+                for i in range(len(self))
+                if (status_set is None or self.status_codes[i] in status_set)
+                and (typename_set is None or self.typename_codes[i] in typename_set)
+                and (after is None or self.created_at[i] >= after)
+                and (before is None or self.created_at[i] < before)
+            ]
+        )
+
+    def sum(self, column: str = "amount_msats") -> int:
+        if numpy is not None:
+            return int(self._column(column).sum(dtype=numpy.int64))
+        return sum(self._numeric(column))
+
+    def group_sum(self, by: GroupBy, column: str = "amount_msats") -> Dict[Any, int]:
+        """Sums a column by `"status"`, by `"typename"`, or by buckets of `created_at`
+        when `by` is a timedelta. Keys are statuses, typenames, or the start of each
+        bucket."""
+        return self._group(by, self._numeric(column))
+
+    def count_by(self, by: GroupBy) -> Dict[Any, int]:
+        return self._group(by, None)
+
+    def _group_key(self, by: GroupBy, code: int) -> Any:
+        if isinstance(by, timedelta):
+            return from_epoch_micros(code * (by // MICROSECOND))
+        if by == "status":
+            return _STATUSES[code]
+        return self.typenames[code]
+
+    def _group(self, by: GroupBy, values: Optional[array]) -> Dict[Any, int]:
+        if not isinstance(by, timedelta) and by not in ("status", "typename"):
+            raise LightsparkException("INVALID_ARGUMENT", f"Cannot group by {by}.")
+        bucket = by // MICROSECOND if isinstance(by, timedelta) else 1
+
+        if numpy is not None:
+            if isinstance(by, timedelta):
+                codes = self._column("created_at") // bucket
+            else:
+                codes = self._column(f"{by}_codes")
+            order = numpy.argsort(codes, kind="stable")
+            unique, starts = numpy.unique(codes[order], return_index=True)
+            if values is None:
+                totals = numpy.diff(numpy.append(starts, len(codes)))
+            else:
+                weights = numpy.frombuffer(values, dtype=numpy.int64)[order]
+                totals = (
+                    numpy.add.reduceat(weights, starts)
+                    if len(weights)
+                    else numpy.zeros(0, dtype=numpy.int64)
+                )
+            return {
+                self._group_key(by, int(code)): int(total)
+                for code, total in zip(unique, totals)
+            }
+
+        if isinstance(by, timedelta):
+            codes_list: Iterable[int] = (t // bucket for t in self.created_at)
+        else:
+            codes_list = getattr(self, f"{by}_codes")
+        totals_by_code: Dict[int, int] = {}
+        for i, code in enumerate(codes_list):
+            totals_by_code[code] = totals_by_code.get(code, 0) + (
+                1 if values is None else values[i]
+            )
+        return {
+            self._group_key(by, code): total
+            for code, total in sorted(totals_by_code.items())
+        }
+
+    def _numeric(self, column: str) -> array:
+        if column not in NUMERIC_COLUMNS:
+            raise LightsparkException(
+                "INVALID_ARGUMENT", f"Cannot sum the {column} column."
+            )
+        return getattr(self, column)
+
+    def _column(self, name: str) -> Any:
+        buffer = getattr(self, name)
+        return numpy.frombuffer(
+            buffer, dtype=numpy.int8 if buffer.typecode == "b" else numpy.int64
+        )
+
+    def _take(self, indices: Any) -> "TransactionFrame":
+        frame = TransactionFrame()
+        frame.typenames = list(self.typenames)
+        frame._typename_codes = dict(  # pylint: disable=protected-access
+            self._typename_codes
+        )
+        frame.ids = [self.ids[i] for i in indices]
+        for name in (
+            "typename_codes",
+            "status_codes",
+            "created_at",
+            "amount_msats",
+            "fees_msats",
+        ):
+            column = getattr(self, name)
+            if numpy is not None:
+                taken = array(column.typecode, self._column(name)[indices].tobytes())
+            else:
+                taken = array(column.typecode, (column[i] for i in indices))
+            setattr(frame, name, taken)
+        return frame
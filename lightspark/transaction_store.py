@@ -0,0 +1,214 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Iterator, List, Optional, Sequence, Union
+
+from lightspark.objects.Account import Account
+from lightspark.objects.Transaction import Transaction
+from lightspark.objects.Transaction import from_json as Transaction_from_json
+from lightspark.objects.TransactionStatus import TransactionStatus
+from lightspark.objects.Wallet import Wallet
+from lightspark.requests.requester import Requester
+from lightspark.utils.currency_amount import amount_as_msats
+from lightspark.utils.timestamps import from_epoch_micros, to_epoch_micros
+
+TransactionsOwner = Union[Account, Wallet]
+
+# Transactions with these statuses may still change and are fetched again on each sync.
+UNSETTLED_STATUSES = (TransactionStatus.PENDING, TransactionStatus.NOT_STARTED)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id TEXT PRIMARY KEY,
+    owner_id TEXT NOT NULL,
+    typename TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL,
+    amount_msats INTEGER,
+    json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transactions_updated_at
+    ON transactions (owner_id, updated_at);
+CREATE INDEX IF NOT EXISTS transactions_created_at
+    ON transactions (owner_id, created_at);
+CREATE INDEX IF NOT EXISTS transactions_status ON transactions (owner_id, status);
+CREATE INDEX IF NOT EXISTS transactions_typename
+    ON transactions (owner_id, typename);
+CREATE TABLE IF NOT EXISTS sync_state (
+    owner_id TEXT PRIMARY KEY,
+    high_water_mark INTEGER NOT NULL
+);
+"""
+
+
+class TransactionStore:
+    """Keeps the transactions of accounts and wallets in a local SQLite database.
+
+    The first `sync` of an owner fetches its whole history. Later ones only fetch the
+    transactions created since the most recent one already stored (minus `overlap`) or
+    since the oldest stored transaction which was still pending, and upsert them:
+
+        store = TransactionStore("transactions.db")
+        store.sync(account)
+        failed = store.transactions(
+            account.requester, statuses=[TransactionStatus.FAILED]
+        )
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def high_water_mark(self, owner_id: str) -> Optional[datetime]:
+        """The creation date of the most recent transaction synced for an owner."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT high_water_mark FROM sync_state WHERE owner_id = ?", (owner_id,)
+            ).fetchone()
+        return from_epoch_micros(row[0]) if row else None
+
+    def sync(
+        self,
+        owner: TransactionsOwner,
+        overlap: timedelta = timedelta(minutes=5),
+        page_size: int = 500,
+        batch_size: int = 1000,
+    ) -> int:
+        """Fetches the transactions of an account or a wallet created since the last sync
+        and stores them. Returns the number of transactions fetched."""
+        after_date = self._sync_start(owner.id, overlap)
+        if isinstance(owner, Wallet):
+            transactions = owner.iter_transactions(
+                created_after_date=after_date, page_size=page_size
+            )
+        else:
+            transactions = owner.iter_transactions(
+                after_date=after_date, page_size=page_size
+            )
+
+        count = 0
+        high_water_mark: Optional[int] = None
+        batch: List[Transaction] = []
+        for transaction in transactions:
+            batch.append(transaction)
+            created_at = to_epoch_micros(transaction.created_at)
+            if high_water_mark is None or created_at > high_water_mark:
+                high_water_mark = created_at
+            if len(batch) >= batch_size:
+                count += self._upsert(owner.id, batch)
+                batch = []
+        count += self._upsert(owner.id, batch)
+
+        # Pages are not ordered by creation date, so the mark only moves once every
+        # page has been stored.
+        if high_water_mark is not None:
+            with self._lock, self._connection:
+                self._connection.execute(
+                    "INSERT INTO sync_state VALUES (?, ?) ON CONFLICT (owner_id)"
+                    + " DO UPDATE SET high_water_mark ="
+                    + " MAX(high_water_mark, excluded.high_water_mark)",
+                    (owner.id, high_water_mark),
+                )
+        return count
+
+    def _sync_start(self, owner_id: str, overlap: timedelta) -> Optional[datetime]:
+        high_water_mark = self.high_water_mark(owner_id)
+        if high_water_mark is None:
+            return None
+        start = to_epoch_micros(high_water_mark - overlap)
+        with self._lock:
+            placeholders = ", ".join("?" * len(UNSETTLED_STATUSES))
+            row = self._connection.execute(
+                "SELECT MIN(created_at) FROM transactions"
+                + f" WHERE owner_id = ? AND status IN ({placeholders})",
+                [owner_id] + [status.value for status in UNSETTLED_STATUSES],
+            ).fetchone()
+        if row[0] is not None:
+            start = min(start, row[0])
+        return from_epoch_micros(start)
+
+    def _upsert(self, owner_id: str, transactions: List[Transaction]) -> int:
+        if not transactions:
+            return 0
+        rows = [
+            (
+                transaction.id,
+                owner_id,
+                transaction.typename,
+                transaction.status.value,
+                to_epoch_micros(transaction.created_at),
+                to_epoch_micros(transaction.updated_at),
+                amount_as_msats(transaction.amount),
+                json.dumps(transaction.to_json()),
+            )
+            for transaction in transactions
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO transactions VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+                + " ON CONFLICT (id) DO UPDATE SET status = excluded.status,"
+                + " updated_at = excluded.updated_at,"
+                + " amount_msats = excluded.amount_msats, json = excluded.json"
+                + " WHERE excluded.updated_at >= transactions.updated_at",
+                rows,
+            )
+        return len(rows)
+
+    def transactions(
+        self,
+        requester: Requester,
+        owner_id: Optional[str] = None,
+        statuses: Optional[Sequence[TransactionStatus]] = None,
+        typenames: Optional[Sequence[str]] = None,
+        updated_after: Optional[datetime] = None,
+    ) -> Iterator[Transaction]:
+        """Yields the stored transactions matching the filters, oldest first, without
+        any request to the API. `requester` is attached to the returned objects."""
+        conditions: List[str] = []
+        parameters: List[Any] = []
+        if owner_id is not None:
+            conditions.append("owner_id = ?")
+            parameters.append(owner_id)
+        if statuses is not None:
+            conditions.append(f"status IN ({', '.join('?' * len(statuses))})")
+            parameters.extend(status.value for status in statuses)
+        if typenames is not None:
+            conditions.append(f"typename IN ({', '.join('?' * len(typenames))})")
+            parameters.extend(typenames)
+        if updated_after is not None:
+            conditions.append("updated_at > ?")
+            parameters.append(to_epoch_micros(updated_after))
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock:
+            cursor = self._connection.execute(
+                f"SELECT json FROM transactions{where} ORDER BY created_at, id",
+                parameters,
+            )
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(500)
+            if not rows:
+                return
+            for (obj,) in rows:
+                yield Transaction_from_json(requester, json.loads(obj))
+
+    def count(self, owner_id: Optional[str] = None) -> int:
+        with self._lock:
+            if owner_id is None:
+                row = self._connection.execute(
+                    "SELECT COUNT(*) FROM transactions"
+                ).fetchone()
+            else:
+                row = self._connection.execute(
+                    "SELECT COUNT(*) FROM transactions WHERE owner_id = ?", (owner_id,)
+                ).fetchone()
+        return row[0]
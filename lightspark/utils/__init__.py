@@ -1,3 +1,17 @@
 # Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
 
-from lightspark.utils.currency_amount import amount_as_msats
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from lightspark.utils.currency_amount import amount_as_msats
+else:
+
+    def __getattr__(name: str) -> Any:
+        # Imported on first use: `currency_amount` depends on the objects, which
+        # themselves import the utils through the requester.
+        if name == "amount_as_msats":
+            # pylint: disable=import-outside-toplevel
+            from lightspark.utils.currency_amount import amount_as_msats
+
+            return amount_as_msats
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
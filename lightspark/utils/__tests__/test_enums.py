@@ -0,0 +1,70 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import timeit
+from enum import Enum
+
+import pytest
+
+from lightspark.objects.TransactionStatus import TransactionStatus
+from lightspark.utils.enums import (
+    enum_table,
+    parse_enum,
+    parse_enum_list,
+    parse_list_of_optional_enums,
+)
+
+
+class Color(Enum):
+    RED = "RED"
+
+
+def parse_enum_with_exceptions(enum_type, value):
+    try:
+        return enum_type[value]
+    except KeyError:
+        return enum_type["___FUTURE_VALUE___"]
+
+
+class TestEnums:
+    def test_parse_enum(self):
+        assert parse_enum(TransactionStatus, "SUCCESS") is TransactionStatus.SUCCESS
+        assert (
+            parse_enum(TransactionStatus, "ON_FIRE")
+            is TransactionStatus.___FUTURE_VALUE___
+        )
+        assert enum_table(TransactionStatus) is enum_table(TransactionStatus)
+
+    def test_enum_without_future_value(self):
+        assert parse_enum(Color, "RED") is Color.RED
+        with pytest.raises(KeyError):
+            parse_enum(Color, "BLUE")
+
+    def test_columns(self):
+        statuses = ["SUCCESS", "PENDING", "ON_FIRE"]
+        assert parse_enum_list(TransactionStatus, statuses) == [
+            TransactionStatus.SUCCESS,
+            TransactionStatus.PENDING,
+            TransactionStatus.___FUTURE_VALUE___,
+        ]
+        assert parse_list_of_optional_enums(TransactionStatus, ["FAILED", None]) == [
+            TransactionStatus.FAILED,
+            None,
+        ]
+
+    def test_cost(self):
+        # Every row parses several enums, and unknown values used to raise internally.
+        values = ["SUCCESS", "PENDING", "ON_FIRE"] * 1000
+
+        def micros(parse) -> float:
+            seconds = min(
+                timeit.repeat(
+                    lambda: [parse(TransactionStatus, value) for value in values],
+                    number=3,
+                    repeat=5,
+                )
+            )
+            return seconds / 3 / len(values) * 1e6
+
+        table = min(micros(parse_enum) for _ in range(2))
+        exceptions = min(micros(parse_enum_with_exceptions) for _ in range(2))
+        assert table * 1.2 < exceptions, (table, exceptions)
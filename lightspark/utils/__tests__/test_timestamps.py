@@ -0,0 +1,29 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+from datetime import datetime, timedelta, timezone
+
+from lightspark.utils.timestamps import cached, epoch_micros, parse_timestamp
+
+
+class TestTimestamps:
+    def test_parse_timestamp(self):
+        value = "2023-07-30T06:18:07.162759+00:00"
+        assert parse_timestamp(value) == datetime.fromisoformat(value)
+        assert parse_timestamp("2023-07-30T06:18:07+02:00").utcoffset() == timedelta(
+            hours=2
+        )
+
+    def test_epoch_micros(self):
+        assert epoch_micros("1970-01-01T00:00:01.000002+00:00") == 1_000_002
+        assert epoch_micros("1970-01-01T01:00:00+01:00") == 0
+        assert epoch_micros("1970-01-01T00:00:00") == 0
+        timestamp = datetime(2023, 7, 30, 6, 18, 7, 162759, tzinfo=timezone.utc)
+        assert epoch_micros(timestamp.isoformat()) == int(timestamp.timestamp() * 1e6)
+
+    def test_cached(self):
+        codec = cached(parse_timestamp, maxsize=2)
+        first = codec("2023-07-30T06:18:07+00:00")
+        assert codec("2023-07-30T06:18:07+00:00") is first
+        for second in range(5):
+            codec(f"2023-07-30T06:18:0{second}+00:00")
+        assert codec.cache_info().currsize == 2
@@ -3,20 +3,20 @@
 from lightspark.exceptions import LightsparkException
 from lightspark.objects.CurrencyAmount import CurrencyAmount, CurrencyUnit
 
+MSATS_PER_UNIT = {
+    CurrencyUnit.MILLISATOSHI: 1,
+    CurrencyUnit.SATOSHI: 1_000,
+    CurrencyUnit.BITCOIN: 100_000_000_000,
+    CurrencyUnit.MICROBITCOIN: 100_000,
+    CurrencyUnit.MILLIBITCOIN: 100_000_000,
+    CurrencyUnit.NANOBITCOIN: 100,
+}
+
 
 def amount_as_msats(currency_amount: CurrencyAmount) -> int:
-    if currency_amount.original_unit == CurrencyUnit.MILLISATOSHI:
-        return currency_amount.original_value
-    if currency_amount.original_unit == CurrencyUnit.SATOSHI:
-        return currency_amount.original_value * 1_000
-    if currency_amount.original_unit == CurrencyUnit.BITCOIN:
-        return currency_amount.original_value * 100_000_000_000
-    if currency_amount.original_unit == CurrencyUnit.MICROBITCOIN:
-        return currency_amount.original_value * 100_000
-    if currency_amount.original_unit == CurrencyUnit.MILLIBITCOIN:
-        return currency_amount.original_value * 100_000_000
-    if currency_amount.original_unit == CurrencyUnit.NANOBITCOIN:
-        return currency_amount.original_value * 100
+    msats_per_unit = MSATS_PER_UNIT.get(currency_amount.original_unit)
+    if msats_per_unit is not None:
+        return currency_amount.original_value * msats_per_unit
 
     raise LightsparkException(
         "UNEXPECTED_CURRENCY",
@@ -1,18 +1,50 @@
 from enum import Enum
-from typing import List, Optional, TypeVar, Type
+from typing import Any, Dict, List, Mapping, Optional, TypeVar, Type
 
 T = TypeVar("T", bound=Enum)
 
+_FUTURE_VALUE = "___FUTURE_VALUE___"
+
+
+class _EnumTable(Dict[str, T]):
+    """Maps the names of the members of an enum to the members, and any other name to
+    its `___FUTURE_VALUE___` member, without raising."""
+
+    def __init__(self, enum_type: Type[T]) -> None:
+        super().__init__(enum_type.__members__)
+        self._future = enum_type.__members__.get(_FUTURE_VALUE)
+
+    def __missing__(self, value: str) -> T:
+        if self._future is None:
+            raise KeyError(_FUTURE_VALUE)
+        return self._future
+
+
+_TABLES: Dict[type, "_EnumTable[Any]"] = {}
+
+
+def enum_table(enum_type: Type[T]) -> Mapping[str, T]:
+    """Returns the table used to parse the values of `enum_type`, built on the first call.
+
+    Look values up with `table[value]`: unknown values resolve to `___FUTURE_VALUE___`,
+    which `table.get(value)` does not do.
+    """
+    table = _TABLES.get(enum_type)
+    if table is None:
+        table = _TABLES[enum_type] = _EnumTable(enum_type)
+    return table
+
 
 def parse_enum(enum_type: Type[T], value: str) -> T:
-    try:
-        return enum_type[value]
-    except KeyError:
-        return enum_type["___FUTURE_VALUE___"]
+    table = _TABLES.get(enum_type)
+    if table is None:
+        table = enum_table(enum_type)
+    return table[value]
 
 
 def parse_enum_list(enum_type: Type[T], values: List[str]) -> List[T]:
-    return list(map(lambda value: parse_enum(enum_type, value), values))
+    """Parses a whole column of values, such as the statuses of a page of transactions."""
+    return list(map(enum_table(enum_type).__getitem__, values))
 
 
 def parse_enum_optional(enum_type: Type[T], value: Optional[str]) -> Optional[T]:
@@ -28,7 +60,9 @@ def parse_optional_list_of_enums(
 def parse_list_of_optional_enums(
     enum_type: Type[T], values: List[Optional[str]]
 ) -> List[Optional[T]]:
-    return list(map(lambda value: parse_enum_optional(enum_type, value), values))
+    """Parses a column of values which may be null."""
+    table = enum_table(enum_type)
+    return [table[value] if value else None for value in values]
 
 
 def parse_optional_list_of_optional_enums(
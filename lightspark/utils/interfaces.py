@@ -0,0 +1,39 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import importlib
+from typing import Any, Callable, Dict, Generic, Mapping, Optional, Sequence, TypeVar
+
+from lightspark.exceptions import LightsparkException
+
+T = TypeVar("T")
+
+
+class InterfaceLoader(Generic[T]):
+    """Loads an interface from its JSON with the `from_json` of its concrete type.
+
+    The `__typename` to loader table is built on the first call, since the modules of the
+    concrete types import the module of their interface.
+    """
+
+    def __init__(self, interface: str, typenames: Sequence[str]) -> None:
+        self._interface = interface
+        self._typenames = typenames
+        self._loaders: Optional[Dict[str, Callable[[Any, Mapping[str, Any]], T]]] = None
+
+    def __call__(self, requester: Any, obj: Mapping[str, Any]) -> T:
+        loaders = self._loaders
+        if loaders is None:
+            loaders = self._loaders = {
+                typename: importlib.import_module(
+                    f"lightspark.objects.{typename}"
+                ).from_json
+                for typename in self._typenames
+            }
+        loader = loaders.get(obj["__typename"])
+        if loader is None:
+            graphql_typename = obj["__typename"]
+            raise LightsparkException(
+                "UNKNOWN_INTERFACE",
+                f"Couldn't find a concrete type for interface {self._interface} corresponding to the typename={graphql_typename}",
+            )
+        return loader(requester, obj)
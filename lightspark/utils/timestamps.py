@@ -0,0 +1,52 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Callable
+
+try:
+    import ciso8601
+except ImportError:  # pragma: no cover
+    ciso8601 = None
+
+# Converts the ISO 8601 strings of the `DateTime` scalars to the values stored in the
+# decoded objects.
+TimestampCodec = Callable[[str], Any]
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+
+# Parses a timestamp like `datetime.fromisoformat`, with the C parser of the `ciso8601`
+# package when it is installed (`pip install lightspark[timestamps]`).
+parse_timestamp: Callable[[str], datetime] = (
+    ciso8601.parse_datetime if ciso8601 is not None else datetime.fromisoformat
+)
+
+
+def epoch_micros(value: str) -> int:
+    """Converts a timestamp to the number of microseconds since the epoch, for columnar
+    consumers. Timestamps without a timezone are taken to be in UTC."""
+    return to_epoch_micros(parse_timestamp(value))
+
+
+def to_epoch_micros(timestamp: datetime) -> int:
+    """The number of microseconds since the epoch of `timestamp`, which is taken to be in
+    UTC when it has no timezone."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return (timestamp - EPOCH) // MICROSECOND
+
+
+def from_epoch_micros(micros: int) -> datetime:
+    return EPOCH + timedelta(microseconds=micros)
+
+
+def cached(codec: TimestampCodec, maxsize: int = 1024) -> TimestampCodec:
+    """Wraps `codec` with a bounded cache of the last strings it converted.
+
+    The timestamps of a page repeat a lot, such as the `created_at` and `updated_at` of
+    objects which were never updated. Create the cached codec once and reuse it, since
+    the decoders are compiled for each codec.
+    """
+    return lru_cache(maxsize=maxsize)(codec)
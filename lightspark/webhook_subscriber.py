@@ -0,0 +1,150 @@
+# Copyright ©, 2022-present, Lightspark Group, Inc. - All Rights Reserved
+
+import asyncio
+import logging
+import threading
+from typing import Dict, List, Optional, Set, Type
+
+from lightspark.exceptions import LightsparkException
+from lightspark.objects.all_entities import get_entity, get_entity_async
+from lightspark.objects.Entity import Entity
+from lightspark.requests.requester import Requester
+from lightspark.webhooks import WebhookEvent
+
+logger = logging.getLogger("lightspark")
+
+
+class WebhookCacheSubscriber:
+    """Keeps the entity cache of a requester up to date with the webhook events.
+
+    Each event invalidates the cached entity it is about (the payment, withdrawal request,
+    node or wallet whose `entity_id` it carries) and, for wallet events, the cached
+    wallet. With `refresh=True`, the entities which were cached are fetched again, so
+    that the next reads hit the cache. Events received for the same entity within
+    `coalesce_secs` of each other only trigger one refetch, from a background timer.
+
+        subscriber = client.webhook_subscriber(refresh=True, coalesce_secs=1)
+
+        @app.route("/webhook", methods=["POST"])
+        def webhook():
+            subscriber.handle(WebhookEvent.verify_and_parse(...))
+    """
+
+    def __init__(
+        self,
+        requester: Requester,
+        refresh: bool = False,
+        coalesce_secs: float = 0.0,
+    ) -> None:
+        if requester.entity_cache is None:
+            raise LightsparkException(
+                "MISSING_ENTITY_CACHE",
+                "Webhook events can only update a client created with an entity_cache.",
+            )
+        self._requester = requester
+        self._cache = requester.entity_cache
+        self._refresh = refresh
+        self._coalesce_secs = coalesce_secs
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Type[Entity]] = {}
+        self._timer: Optional[threading.Timer] = None
+
+    def handle(self, event: WebhookEvent) -> None:
+        for entity_id in self._affected_ids(event):
+            entity = self._cache.pop(entity_id)
+            if entity is not None and self._refresh:
+                self._schedule_refresh(entity_id, type(entity))
+
+    def flush(self) -> None:
+        """Refetches the entities waiting for the end of their coalescing window now."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        for entity_id, entity_class in pending.items():
+            self._refetch(entity_id, entity_class)
+
+    def close(self) -> None:
+        with self._lock:
+            self._pending = {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    @staticmethod
+    def _affected_ids(event: WebhookEvent) -> List[str]:
+        ids = [event.entity_id]
+        if event.wallet_id and event.wallet_id != event.entity_id:
+            ids.append(event.wallet_id)
+        return ids
+
+    def _refetch(self, entity_id: str, entity_class: Type[Entity]) -> None:
+        try:
+            get_entity(self._requester, entity_id, entity_class)
+        except Exception:  # pylint: disable=broad-except
+            # The entity stays out of the cache and is fetched on the next read.
+            logger.exception("Failed to refresh entity %s", entity_id)
+
+    def _schedule_refresh(self, entity_id: str, entity_class: Type[Entity]) -> None:
+        if self._coalesce_secs <= 0:
+            self._refetch(entity_id, entity_class)
+            return
+        with self._lock:
+            self._pending[entity_id] = entity_class
+            if self._timer is None:
+                self._timer = threading.Timer(self._coalesce_secs, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+
+class AsyncWebhookCacheSubscriber(WebhookCacheSubscriber):
+    """The `WebhookCacheSubscriber` of a `LightsparkAsyncClient`, which refetches the
+    entities with the asynchronous requests of the client, on its event loop.
+
+    `handle` can be called from the event loop or from another thread. With
+    `refresh=True`, the subscriber must be created on the event loop of the client, or
+    be given it as `loop`.
+    """
+
+    def __init__(
+        self,
+        requester: Requester,
+        refresh: bool = False,
+        coalesce_secs: float = 0.0,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> None:
+        super().__init__(requester, refresh=refresh, coalesce_secs=coalesce_secs)
+        if refresh and loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError as e:
+                raise LightsparkException(
+                    "NO_EVENT_LOOP",
+                    "A refreshing subscriber of an async client must be created on its"
+                    + " event loop, or be given the loop.",
+                ) from e
+        self._loop = loop
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    def _refetch(self, entity_id: str, entity_class: Type[Entity]) -> None:
+        # The refetches of coalesced events are started from the timer thread.
+        try:
+            self._loop.call_soon_threadsafe(  # pyre-ignore[16]
+                self._start_refetch, entity_id, entity_class
+            )
+        except RuntimeError:
+            logger.warning("Not refreshing entity %s: the loop is closed", entity_id)
+
+    def _start_refetch(self, entity_id: str, entity_class: Type[Entity]) -> None:
+        task = asyncio.get_running_loop().create_task(
+            self._refetch_async(entity_id, entity_class)
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refetch_async(self, entity_id: str, entity_class: Type[Entity]) -> None:
+        try:
+            await get_entity_async(self._requester, entity_id, entity_class)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Failed to refresh entity %s", entity_id)
@@ -2,12 +2,12 @@
 
 import hashlib
 import hmac
-import json
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
 from lightspark.objects.WebhookEventType import WebhookEventType
+from lightspark.requests.json_backend import get_json_backend
 
 SIGNATURE_HEADER = "lightspark-signature"
 
@@ -67,7 +67,7 @@ class WebhookEvent:
         if not isinstance(data, bytes):
             raise TypeError(f"'data' should be bytes, got {type(data)}")
 
-        event = json.loads(data.decode("utf-8"))
+        event = get_json_backend().loads(data)
         return cls(
             event_type=WebhookEventType[event["event_type"]],
             event_id=event["event_id"],